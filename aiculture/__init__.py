@@ -12,8 +12,17 @@ __version__ = "0.1.0"
 __author__ = "AICultureKit Contributors"
 __email__ = "demo@placeholder.local"
 
-from .cli import main
-from .core import CultureConfig, ProjectTemplate, QualityTools
+import importlib
+from typing import Any
+
+# 公开名称 -> 所在模块；首次访问时才导入，``import aiculture`` 不再加载
+# core（GitPython、jinja2、yaml）及各命令组的依赖
+_LAZY_ATTRIBUTES = {
+    "CultureConfig": ".core",
+    "ProjectTemplate": ".core",
+    "QualityTools": ".core",
+    "main": ".cli",
+}
 
 __all__ = [
     "ProjectTemplate",
@@ -21,3 +30,17 @@ __all__ = [
     "CultureConfig",
     "main",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """按需导入公开的类和入口函数"""
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -9,13 +9,27 @@
 5. 自动化可访问性测试
 """
 
+import hashlib
 import json
+import os
 import re
 import time
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
 from enum import Enum
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from .cache_manager import CheckerSignature, SmartCacheManager, config_fingerprint
+from .file_index import ProjectFileIndex
+from .line_index import LineIndex
+from .markup_scanner import MarkupScan, MarkupScanner, MarkupTag
+from .process_pool import map_batches
+
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
+# 无需可见标签的 input 类型
+UNLABELLED_INPUT_TYPES = ('hidden', 'submit', 'button')
 
 
 class AccessibilityLevel(Enum):
@@ -92,10 +106,10 @@ class AccessibilityChecker:
 
     def __init__(self):
         """__init__函数"""
-        # HTML可访问性规则
+        # HTML可访问性规则：没有 pattern 的规则由标签回调按属性检查，
+        # 有 pattern 的规则在样式文本（style 属性和 <style> 元素）中匹配
         self.html_rules = {
             'missing_alt_text': {
-                'pattern': r'<img(?![^>]*alt=)[^>]*>',
                 'severity': 'error',
                 'category': AccessibilityCategory.PERCEIVABLE,
                 'level': AccessibilityLevel.A,
@@ -104,7 +118,6 @@ class AccessibilityChecker:
                 'wcag_reference': 'WCAG 2.1 SC 1.1.1',
             },
             'missing_form_labels': {
-                'pattern': r'<input(?![^>]*(?:aria-label|aria-labelledby))(?![^>]*id="[^"]*")(?![^>]*type="(?:hidden|submit|button)")[^>]*>',
                 'severity': 'error',
                 'category': AccessibilityCategory.PERCEIVABLE,
                 'level': AccessibilityLevel.A,
@@ -113,11 +126,10 @@ class AccessibilityChecker:
                 'wcag_reference': 'WCAG 2.1 SC 1.3.1',
             },
             'missing_heading_structure': {
-                'pattern': r'<h([1-6])[^>]*>',
                 'severity': 'warning',
                 'category': AccessibilityCategory.PERCEIVABLE,
                 'level': AccessibilityLevel.AA,
-                'description': '标题结构可能不正确',
+                'description': '标题结构可能不正确：首个标题不是h1',
                 'recommendation': '确保标题按层级顺序使用',
                 'wcag_reference': 'WCAG 2.1 SC 1.3.1',
             },
@@ -140,7 +152,6 @@ class AccessibilityChecker:
                 'wcag_reference': 'WCAG 2.1 SC 2.4.7',
             },
             'missing_skip_links': {
-                'pattern': r'<nav[^>]*>',
                 'severity': 'warning',
                 'category': AccessibilityCategory.OPERABLE,
                 'level': AccessibilityLevel.A,
@@ -148,12 +159,19 @@ class AccessibilityChecker:
                 'recommendation': '添加跳转到主内容的链接',
                 'wcag_reference': 'WCAG 2.1 SC 2.4.1',
             },
+            'heading_hierarchy_skip': {
+                'severity': 'warning',
+                'category': AccessibilityCategory.PERCEIVABLE,
+                'level': AccessibilityLevel.AA,
+                'description': '标题层级跳跃',
+                'recommendation': '按顺序使用标题层级，不要跳级',
+                'wcag_reference': 'WCAG 2.1 SC 1.3.1',
+            },
         }
 
         # React/JSX特定规则
         self.jsx_rules = {
             'missing_jsx_alt': {
-                'pattern': r'<img(?![^>]*alt=)[^/>]*(?:/>|>[^<]*</img>)',
                 'severity': 'error',
                 'category': AccessibilityCategory.PERCEIVABLE,
                 'level': AccessibilityLevel.A,
@@ -162,7 +180,6 @@ class AccessibilityChecker:
                 'wcag_reference': 'WCAG 2.1 SC 1.1.1',
             },
             'missing_jsx_labels': {
-                'pattern': r'<input(?![^>]*(?:aria-label|aria-labelledby))[^/>]*(?:/>|>[^<]*</input>)',
                 'severity': 'error',
                 'category': AccessibilityCategory.PERCEIVABLE,
                 'level': AccessibilityLevel.A,
@@ -172,6 +189,33 @@ class AccessibilityChecker:
             },
         }
 
+        self._html_scanner = MarkupScanner()
+        self.register_html_rules(self._html_scanner)
+        self._jsx_scanner = MarkupScanner(jsx=True)
+        self.register_jsx_rules(self._jsx_scanner)
+
+    def register_html_rules(self, scanner: MarkupScanner) -> None:
+        """把HTML可访问性规则注册到扫描器，可与其他检查器共用同一次扫描"""
+        scanner.on_start_tag(('img',), partial(self._check_img_alt, 'missing_alt_text'))
+        self._register_label_rule(scanner, 'missing_form_labels')
+        scanner.on_start_tag(HEADING_TAGS, self._check_heading)
+        scanner.on_start_tag(('a',), self._track_skip_link)
+        scanner.on_start_tag(('nav',), self._check_skip_link)
+        scanner.on_style(self._check_style)
+
+    def register_jsx_rules(self, scanner: MarkupScanner) -> None:
+        """把JSX可访问性规则注册到扫描器"""
+        scanner.on_start_tag(('img',), partial(self._check_img_alt, 'missing_jsx_alt'))
+        self._register_label_rule(scanner, 'missing_jsx_labels')
+
+    def html_issues(self, scan: MarkupScan) -> List[AccessibilityIssue]:
+        """从扫描结果中取出HTML可访问性问题，按规则顺序排列"""
+        return scan.rule_issues(self.html_rules)
+
+    def jsx_issues(self, scan: MarkupScan) -> List[AccessibilityIssue]:
+        """从扫描结果中取出JSX可访问性问题，按规则顺序排列"""
+        return scan.rule_issues(self.jsx_rules)
+
     def check_html_file(self, file_path: Path) -> List[AccessibilityIssue]:
         """检查HTML文件的可访问性"""
         issues = []
@@ -180,31 +224,7 @@ class AccessibilityChecker:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            lines = content.split('\n')
-
-            # 检查HTML规则
-            for rule_id, rule in self.html_rules.items():
-                matches = re.finditer(rule['pattern'], content, re.IGNORECASE | re.MULTILINE)
-
-                for match in matches:
-                    line_num = content[: match.start()].count('\n') + 1
-
-                    issue = AccessibilityIssue(
-                        rule_id=rule_id,
-                        severity=rule['severity'],
-                        category=rule['category'],
-                        level=rule['level'],
-                        description=rule['description'],
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        element=match.group(0)[:100],
-                        recommendation=rule['recommendation'],
-                        wcag_reference=rule['wcag_reference'],
-                    )
-                    issues.append(issue)
-
-            # 检查标题层级
-            issues.extend(self._check_heading_hierarchy(content, str(file_path)))
+            issues = self.html_issues(self._html_scanner.scan(content, str(file_path)))
 
         except Exception as e:
             print(f"检查文件 {file_path} 时出错: {e}")
@@ -219,64 +239,153 @@ class AccessibilityChecker:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            # 检查JSX规则
-            for rule_id, rule in self.jsx_rules.items():
-                matches = re.finditer(rule['pattern'], content, re.IGNORECASE | re.MULTILINE)
-
-                for match in matches:
-                    line_num = content[: match.start()].count('\n') + 1
-
-                    issue = AccessibilityIssue(
-                        rule_id=rule_id,
-                        severity=rule['severity'],
-                        category=rule['category'],
-                        level=rule['level'],
-                        description=rule['description'],
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        element=match.group(0)[:100],
-                        recommendation=rule['recommendation'],
-                        wcag_reference=rule['wcag_reference'],
-                    )
-                    issues.append(issue)
+            issues = self.jsx_issues(self._jsx_scanner.scan(content, str(file_path)))
 
         except Exception as e:
             print(f"检查JSX文件 {file_path} 时出错: {e}")
 
         return issues
 
-    def _check_heading_hierarchy(self, content: str, file_path: str) -> List[AccessibilityIssue]:
-        """检查标题层级结构"""
-        issues = []
-        heading_pattern = r'<h([1-6])[^>]*>'
-        headings = []
-
-        for match in re.finditer(heading_pattern, content, re.IGNORECASE):
-            level = int(match.group(1))
-            line_num = content[: match.start()].count('\n') + 1
-            headings.append((level, line_num, match.group(0)))
-
-        # 检查层级跳跃
-        for i in range(1, len(headings)):
-            current_level, current_line, current_element = headings[i]
-            prev_level = headings[i - 1][0]
-
-            if current_level > prev_level + 1:
-                issue = AccessibilityIssue(
-                    rule_id='heading_hierarchy_skip',
-                    severity='warning',
-                    category=AccessibilityCategory.PERCEIVABLE,
-                    level=AccessibilityLevel.AA,
-                    description=f'标题层级跳跃：从h{prev_level}跳到h{current_level}',
-                    file_path=file_path,
-                    line_number=current_line,
-                    element=current_element[:100],
-                    recommendation='按顺序使用标题层级，不要跳级',
-                    wcag_reference='WCAG 2.1 SC 1.3.1',
-                )
-                issues.append(issue)
+    def _add_issue(self, scan: MarkupScan, rule_id: str, offset: int, element: str,
+                   description: Optional[str] = None) -> None:
+        """按规则元数据生成问题并记录到扫描结果"""
+        rule = self.html_rules.get(rule_id) or self.jsx_rules[rule_id]
+        scan.add_issue(rule_id, AccessibilityIssue(
+            rule_id=rule_id,
+            severity=rule['severity'],
+            category=rule['category'],
+            level=rule['level'],
+            description=description or rule['description'],
+            file_path=scan.file_path,
+            line_number=scan.line_number(offset),
+            element=element[:100],
+            recommendation=rule['recommendation'],
+            wcag_reference=rule['wcag_reference'],
+        ))
+
+    def _check_img_alt(self, rule_id: str, tag: MarkupTag, scan: MarkupScan) -> None:
+        """图片必须有alt属性（含属性展开时无法判断，不报告）"""
+        if 'alt' not in tag.attrs and not tag.has_spread:
+            self._add_issue(scan, rule_id, tag.offset, tag.source)
+
+    def _register_label_rule(self, scanner: MarkupScanner, rule_id: str) -> None:
+        """表单输入需要 aria-label/aria-labelledby、外层 <label> 或 for 指向其id的 <label>"""
+        scanner.on_start_tag(('label',), self._enter_label)
+        scanner.on_end_tag(('label',), self._leave_label)
+        scanner.on_start_tag(('input',), self._track_input)
+        scanner.on_finish(partial(self._report_unlabelled_inputs, rule_id))
+
+    def _enter_label(self, tag: MarkupTag, scan: MarkupScan) -> None:
+        state = scan.state
+        state['label_depth'] = state.get('label_depth', 0) + 1
+        target = tag.attrs.get('for') or tag.attrs.get('htmlfor')
+        if target:
+            state.setdefault('label_targets', set()).add(target)
+
+    def _leave_label(self, tag: MarkupTag, scan: MarkupScan) -> None:
+        scan.state['label_depth'] = max(0, scan.state.get('label_depth', 0) - 1)
+
+    def _track_input(self, tag: MarkupTag, scan: MarkupScan) -> None:
+        attrs = tag.attrs
+        if tag.has_spread or 'aria-label' in attrs or 'aria-labelledby' in attrs:
+            return
+        if (attrs.get('type') or '').lower() in UNLABELLED_INPUT_TYPES:
+            return
+        if scan.state.get('label_depth'):
+            return
+        # label 可能出现在输入之后，扫描结束时再核对 for
+        scan.state.setdefault('unlabelled_inputs', []).append(tag)
+
+    def _report_unlabelled_inputs(self, rule_id: str, scan: MarkupScan) -> None:
+        targets = scan.state.get('label_targets', ())
+        for tag in scan.state.get('unlabelled_inputs', ()):
+            if tag.attrs.get('id') not in targets:
+                self._add_issue(scan, rule_id, tag.offset, tag.source)
+
+    def _check_heading(self, tag: MarkupTag, scan: MarkupScan) -> None:
+        """首个标题应为h1，之后的标题不应跳级"""
+        level = int(tag.name[1])
+        previous = scan.state.get('heading_level')
+        if previous is None and level != 1:
+            self._add_issue(scan, 'missing_heading_structure', tag.offset, tag.source)
+        elif previous is not None and level > previous + 1:
+            self._add_issue(
+                scan, 'heading_hierarchy_skip', tag.offset, tag.source,
+                f'标题层级跳跃：从h{previous}跳到h{level}',
+            )
+        scan.state['heading_level'] = level
+
+    def _track_skip_link(self, tag: MarkupTag, scan: MarkupScan) -> None:
+        href = tag.attrs.get('href') or ''
+        if href.startswith('#') and len(href) > 1:
+            scan.state['skip_link'] = True
+
+    def _check_skip_link(self, tag: MarkupTag, scan: MarkupScan) -> None:
+        """导航之前应有跳转到页内锚点的链接，每个文档只报告一次"""
+        if not scan.state.get('skip_link') and not scan.state.get('skip_link_reported'):
+            scan.state['skip_link_reported'] = True
+            self._add_issue(scan, 'missing_skip_links', tag.offset, tag.source)
+
+    def _check_style(self, text: str, offset: int, scan: MarkupScan) -> None:
+        """在样式文本中匹配带 pattern 的规则"""
+        for rule_id, rule in self.html_rules.items():
+            pattern = rule.get('pattern')
+            if pattern is None:
+                continue
+            for match in re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE):
+                self._add_issue(scan, rule_id, offset + match.start(), match.group(0))
 
-        return issues
+    def _check_heading_hierarchy(
+        self, content: str, file_path: str, line_index: Optional[LineIndex] = None
+    ) -> List[AccessibilityIssue]:
+        """检查标题层级结构
+
+        Args:
+            content: 文件内容
+            file_path: 文件路径
+            line_index: 调用方已为 ``content`` 建好的换行偏移表，未提供时现建
+        """
+        scanner = MarkupScanner()
+        scanner.on_start_tag(HEADING_TAGS, self._check_heading)
+        scan = scanner.scan(content, file_path, line_index)
+        return scan.rule_issues(['heading_hierarchy_skip'])
+
+
+@dataclass
+class LocaleKeySet:
+    """翻译文件的扁平化键集合及其对应的文件状态"""
+
+    size: int
+    mtime_ns: int
+    content_hash: str
+    keys: FrozenSet[str]
+
+
+class _CompiledI18nRules:
+    """编译后的国际化规则
+
+    常见硬编码文本与捕获的整段文本比较，使用集合查找；候选行正则在整段
+    内容上一次找出含任一预筛选字符的行。
+    """
+
+    __slots__ = ('key', 'hardcoded_text_patterns', 'common_hardcoded', 'datetime_patterns',
+                 'candidate_line', 'hardcoded_hint', 'datetime_hint')
+
+    def __init__(self, key: Tuple[Any, ...]) -> None:
+        """编译规则
+
+        Args:
+            key: (硬编码文本模式, 常见硬编码文本, 日期时间模式, 两类预筛选字符类片段)
+        """
+        hardcoded, common, datetime_patterns, hardcoded_chars, datetime_chars = key
+        self.key = key
+        self.hardcoded_text_patterns = [re.compile(pattern) for pattern in hardcoded]
+        self.common_hardcoded = frozenset(common)
+        self.datetime_patterns = [re.compile(pattern) for pattern in datetime_patterns]
+        chars = hardcoded_chars + datetime_chars
+        self.candidate_line = re.compile(rf'^[^\n{chars}]*[{chars}][^\n]*', re.MULTILINE)
+        self.hardcoded_hint = re.compile(f'[{hardcoded_chars}]')
+        self.datetime_hint = re.compile(f'[{datetime_chars}]')
 
 
 class InternationalizationChecker:
@@ -324,17 +433,49 @@ class InternationalizationChecker:
             r'\d{1,2}:\d{2}:\d{2}',  # HH:MM:SS
         ]
 
+        # 行预筛选（正则字符类片段）：每个模式的匹配必然包含其中的字符，
+        # 不含这些字符的行不必运行对应模式；增加模式时需要同步调整
+        self.hardcoded_text_prefilter = '"\''
+        self.datetime_prefilter = r'\d'
+
+        self._compiled: Optional[_CompiledI18nRules] = None
+
+        # 翻译文件 -> 键集合；翻译文件 -> (基准内容哈希, 自身内容哈希, 缺失的键)
+        self._locale_keys: Dict[Path, LocaleKeySet] = {}
+        self._missing_keys: Dict[Path, Tuple[str, str, List[str]]] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """交给进程池时不携带翻译键缓存"""
+        state = self.__dict__.copy()
+        state['_locale_keys'] = {}
+        state['_missing_keys'] = {}
+        return state
+
+    def _compiled_rules(self) -> '_CompiledI18nRules':
+        """编译后的规则，规则列表被修改后自动重新编译"""
+        key = (
+            tuple(self.hardcoded_text_patterns),
+            tuple(self.common_hardcoded),
+            tuple(self.datetime_patterns),
+            self.hardcoded_text_prefilter,
+            self.datetime_prefilter,
+        )
+        if self._compiled is None or self._compiled.key != key:
+            self._compiled = _CompiledI18nRules(key)
+        return self._compiled
+
     def _check_hardcoded_text_in_line(self, line: str, line_num: int, file_path: Path) -> List[I18nIssue]:
         """检查单行中的硬编码文本"""
         issues = []
+        rules = self._compiled_rules()
 
-        for pattern in self.hardcoded_text_patterns:
-            matches = re.finditer(pattern, line)
+        for pattern in rules.hardcoded_text_patterns:
+            matches = pattern.finditer(line)
             for match in matches:
                 text = match.group(1)
 
                 # 检查是否是常见的硬编码文本
-                if text in self.common_hardcoded or len(text.split()) > 2:
+                if text in rules.common_hardcoded or len(text.split()) > 2:
                     issue = I18nIssue(
                         issue_type='hardcoded_text',
                         severity='warning',
@@ -352,8 +493,8 @@ class InternationalizationChecker:
         """检查单行中的日期时间格式"""
         issues = []
 
-        for pattern in self.datetime_patterns:
-            matches = re.finditer(pattern, line)
+        for pattern in self._compiled_rules().datetime_patterns:
+            matches = pattern.finditer(line)
             for match in matches:
                 issue = I18nIssue(
                     issue_type='locale_format',
@@ -376,77 +517,126 @@ class InternationalizationChecker:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            lines = content.split('\n')
+            issues = self.check_content(content, file_path)
 
-            # 检查硬编码文本
-            for line_num, line in enumerate(lines, 1):
-                # 跳过注释和导入语句
-                if line.strip().startswith(('#', '//', '/*', 'import', 'from')):
-                    continue
+        except Exception as e:
+            print(f"检查国际化文件 {file_path} 时出错: {e}")
+
+        return issues
 
-                # 检查硬编码文本
+    def check_content(self, content: str, file_path: Path) -> List[I18nIssue]:
+        """检查已读取的文件内容的国际化问题
+
+        先用一个正则在整段内容上找出含引号或数字的候选行，其余行不进入
+        Python循环；行号随匹配位置单调推进，逐段统计换行。
+        """
+        issues = []
+        rules = self._compiled_rules()
+        line_num = 1
+        position = 0
+
+        for match in rules.candidate_line.finditer(content):
+            start = match.start()
+            line_num += content.count('\n', position, start)
+            position = start
+            line = match.group(0)
+
+            # 跳过注释和导入语句
+            if line.strip().startswith(('#', '//', '/*', 'import', 'from')):
+                continue
+
+            # 检查硬编码文本
+            if rules.hardcoded_hint.search(line):
                 hardcoded_issues = self._check_hardcoded_text_in_line(line, line_num, file_path)
                 issues.extend(hardcoded_issues)
 
-                # 检查日期时间格式
+            # 检查日期时间格式
+            if rules.datetime_hint.search(line):
                 datetime_issues = self._check_datetime_format_in_line(line, line_num, file_path)
                 issues.extend(datetime_issues)
 
-        except Exception as e:
-            print(f"检查国际化文件 {file_path} 时出错: {e}")
-
         return issues
 
-    def _collect_translation_keys(self, obj: Dict[str, Any], prefix: str = '') -> Set[str]:
-        """收集翻译键"""
-        keys = set()
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                full_key = f"{prefix}.{key}" if prefix else key
+    def _collect_translation_keys(self, obj: Any, prefix: str = '') -> Set[str]:
+        """收集翻译键（用显式栈展开嵌套字典，深层嵌套不受递归深度限制）
+
+        ``obj`` 为解析后的JSON文档，顶层不是对象时没有翻译键。
+        """
+        keys: Set[str] = set()
+        if not isinstance(obj, dict):
+            return keys
+
+        stack = [(prefix, obj)]
+        while stack:
+            current_prefix, current = stack.pop()
+            for key, value in current.items():
+                full_key = f"{current_prefix}.{key}" if current_prefix else key
                 keys.add(full_key)
                 if isinstance(value, dict):
-                    keys.update(self._collect_translation_keys(value, full_key))
+                    stack.append((full_key, value))
         return keys
 
-    def _load_translation_files(self, locale_dir: Path) -> Tuple[Dict[str, Dict], Set[str]]:
-        """加载所有翻译文件"""
-        translation_files = {}
-        base_keys = set()
+    def _load_locale_keys(self, json_file: Path) -> Optional[LocaleKeySet]:
+        """获取翻译文件的键集合
 
-        for json_file in locale_dir.glob("*.json"):
-            locale = json_file.stem
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    translations = json.load(f)
-                    translation_files[locale] = translations
+        size/mtime_ns 与缓存一致时直接返回；否则读取文件计算内容哈希，
+        哈希未变（如只更新了时间戳）时沿用缓存的键集合，变化时才解析JSON。
 
-                    keys = self._collect_translation_keys(translations)
-                    if not base_keys:
-                        base_keys = keys
-
-            except Exception as e:
-                print(f"读取翻译文件 {json_file} 时出错: {e}")
-
-        return translation_files, base_keys
-
-    def _find_missing_translations(self, translation_files: Dict[str, Dict], base_keys: Set[str]) -> Dict[str, List[str]]:
-        """查找缺失的翻译"""
-        missing_translations = {}
-
-        for locale, translations in translation_files.items():
-            locale_keys = self._collect_translation_keys(translations)
-            missing = base_keys - locale_keys
+        Returns:
+            键集合，读取或解析失败时为 None
+        """
+        try:
+            stat_result = json_file.stat()
+            cached = self._locale_keys.get(json_file)
+            if (
+                cached is not None
+                and cached.size == stat_result.st_size
+                and cached.mtime_ns == stat_result.st_mtime_ns
+            ):
+                return cached
+
+            with open(json_file, 'rb') as f:
+                content = f.read()
+            content_hash = hashlib.md5(content).hexdigest()
+            if cached is not None and cached.content_hash == content_hash:
+                keys = cached.keys
+            else:
+                translations = json.loads(content.decode('utf-8'))
+                keys = frozenset(self._collect_translation_keys(translations))
 
-            if missing:
-                missing_translations[locale] = list(missing)
+        except Exception as e:
+            self._locale_keys.pop(json_file, None)
+            print(f"读取翻译文件 {json_file} 时出错: {e}")
+            return None
 
-        return missing_translations
+        entry = LocaleKeySet(stat_result.st_size, stat_result.st_mtime_ns, content_hash, keys)
+        self._locale_keys[json_file] = entry
+        return entry
 
-    def _calculate_completeness_rates(self, translation_files: Dict[str, Dict], base_keys: Set[str], missing_translations: Dict[str, List[str]]) -> Dict[str, float]:
+    def _missing_locale_keys(
+        self, json_file: Path, base: LocaleKeySet, entry: LocaleKeySet
+    ) -> List[str]:
+        """某个翻译文件相对基准文件缺失的键，基准和该文件内容都未变化时沿用上次结果"""
+        cached = self._missing_keys.get(json_file)
+        if cached is not None and cached[:2] == (base.content_hash, entry.content_hash):
+            return cached[2]
+
+        missing = sorted(base.keys - entry.keys)
+        self._missing_keys[json_file] = (base.content_hash, entry.content_hash, missing)
+        return missing
+
+    def _calculate_completeness_rates(
+        self,
+        locale_keys: Dict[str, LocaleKeySet],
+        base_keys: FrozenSet[str],
+        missing_translations: Dict[str, List[str]],
+    ) -> Dict[str, float]:
         """计算完整性比率"""
         return {
-            locale: (len(base_keys) - len(missing_translations.get(locale, []))) / len(base_keys) * 100
-            for locale in translation_files.keys()
+            locale: (len(base_keys) - len(missing_translations.get(locale, [])))
+            / len(base_keys)
+            * 100
+            for locale in locale_keys
         }
 
     def check_translation_completeness(self, locale_dir: Path) -> Dict[str, Any]:
@@ -454,17 +644,35 @@ class InternationalizationChecker:
         if not locale_dir.exists():
             return {'error': '本地化目录不存在'}
 
-        # 加载翻译文件
-        translation_files, base_keys = self._load_translation_files(locale_dir)
+        # 加载翻译文件的键集合（只重新解析内容变化的文件），首个非空文件为基准
+        locale_keys: Dict[str, LocaleKeySet] = {}
+        locale_files: Dict[str, Path] = {}
+        base: Optional[LocaleKeySet] = None
+        for json_file in locale_dir.glob("*.json"):
+            entry = self._load_locale_keys(json_file)
+            if entry is None:
+                continue
+            locale_keys[json_file.stem] = entry
+            locale_files[json_file.stem] = json_file
+            if base is None and entry.keys:
+                base = entry
+        base_keys = base.keys if base is not None else frozenset()
 
-        # 查找缺失的翻译
-        missing_translations = self._find_missing_translations(translation_files, base_keys)
+        # 查找缺失的翻译（只对基准或自身变化的文件重新计算）
+        missing_translations = {}
+        if base is not None:
+            for locale, entry in locale_keys.items():
+                missing = self._missing_locale_keys(locale_files[locale], base, entry)
+                if missing:
+                    missing_translations[locale] = missing
 
         # 计算完整性比率
-        completeness_rate = self._calculate_completeness_rates(translation_files, base_keys, missing_translations)
+        completeness_rate = self._calculate_completeness_rates(
+            locale_keys, base_keys, missing_translations
+        )
 
         return {
-            'total_locales': len(translation_files),
+            'total_locales': len(locale_keys),
             'total_keys': len(base_keys),
             'missing_translations': missing_translations,
             'completeness_rate': completeness_rate,
@@ -503,6 +711,12 @@ class ResponsiveDesignChecker:
             },
         }
 
+        # HTML中 style 属性和 <style> 元素的样式文本按这些CSS规则检查
+        self.inline_style_rules = ('fixed_width', 'small_touch_target')
+
+        self._html_scanner = MarkupScanner()
+        self.register_html_rules(self._html_scanner)
+
     def check_css_file(self, file_path: Path) -> List[ResponsiveIssue]:
         """检查CSS文件的响应式设计"""
         issues = []
@@ -511,33 +725,85 @@ class ResponsiveDesignChecker:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            for rule_id, rule in self.css_rules.items():
-                matches = re.finditer(rule['pattern'], content, re.IGNORECASE)
+            issues = self.check_css_content(content, str(file_path))
 
-                for match in matches:
-                    line_num = content[: match.start()].count('\n') + 1
+        except Exception as e:
+            print(f"检查CSS文件 {file_path} 时出错: {e}")
 
-                    # 根据规则类型确定设备类型
-                    device_type = DeviceType.MOBILE
-                    if 'width' in match.group(0):
-                        device_type = DeviceType.DESKTOP
+        return issues
 
-                    issue = ResponsiveIssue(
-                        issue_type=rule_id,
-                        severity=rule['severity'],
-                        description=rule['description'],
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        device_type=device_type,
-                        recommendation=rule['recommendation'],
-                    )
-                    issues.append(issue)
+    def check_css_content(self, content: str, file_path: str) -> List[ResponsiveIssue]:
+        """检查已读取的CSS内容的响应式设计"""
+        issues = []
+        line_index = LineIndex(content)
 
-        except Exception as e:
-            print(f"检查CSS文件 {file_path} 时出错: {e}")
+        for rule_id, rule in self.css_rules.items():
+            matches = re.finditer(rule['pattern'], content, re.IGNORECASE)
+
+            for match in matches:
+                line_num = line_index.line_number(match.start())
+                issues.append(self._css_issue(rule_id, rule, match.group(0), file_path, line_num))
 
         return issues
 
+    @staticmethod
+    def _css_issue(
+        rule_id: str, rule: Dict[str, Any], matched: str, file_path: str, line_num: int
+    ) -> ResponsiveIssue:
+        """生成CSS规则问题"""
+        # 根据规则类型确定设备类型
+        device_type = DeviceType.MOBILE
+        if 'width' in matched:
+            device_type = DeviceType.DESKTOP
+
+        return ResponsiveIssue(
+            issue_type=rule_id,
+            severity=rule['severity'],
+            description=rule['description'],
+            file_path=file_path,
+            line_number=line_num,
+            device_type=device_type,
+            recommendation=rule['recommendation'],
+        )
+
+    def register_html_rules(self, scanner: MarkupScanner) -> None:
+        """把HTML响应式规则注册到扫描器，可与其他检查器共用同一次扫描"""
+        scanner.on_start_tag(('meta',), self._check_viewport_meta)
+        scanner.on_style(self._check_inline_style)
+
+    def html_issues(self, scan: MarkupScan) -> List[ResponsiveIssue]:
+        """从扫描结果中取出HTML响应式问题"""
+        issues = []
+
+        # 检查viewport meta标签
+        if not scan.state.get('viewport_meta'):
+            issue = ResponsiveIssue(
+                issue_type='missing_viewport',
+                severity='error',
+                description='缺少viewport meta标签',
+                file_path=scan.file_path,
+                line_number=1,
+                device_type=DeviceType.MOBILE,
+                recommendation='在<head>中添加viewport meta标签',
+            )
+            issues.append(issue)
+
+        issues.extend(scan.rule_issues(self.inline_style_rules))
+        return issues
+
+    def _check_viewport_meta(self, tag: MarkupTag, scan: MarkupScan) -> None:
+        if (tag.attrs.get('name') or '').lower() == 'viewport':
+            scan.state['viewport_meta'] = True
+
+    def _check_inline_style(self, text: str, offset: int, scan: MarkupScan) -> None:
+        for rule_id in self.inline_style_rules:
+            rule = self.css_rules[rule_id]
+            for match in re.finditer(rule['pattern'], text, re.IGNORECASE):
+                scan.add_issue(rule_id, self._css_issue(
+                    rule_id, rule, match.group(0), scan.file_path,
+                    scan.line_number(offset + match.start()),
+                ))
+
     def check_html_file(self, file_path: Path) -> List[ResponsiveIssue]:
         """检查HTML文件的响应式设计"""
         issues = []
@@ -546,18 +812,7 @@ class ResponsiveDesignChecker:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            # 检查viewport meta标签
-            if not re.search(r'<meta\s+name=["\']viewport["\']', content, re.IGNORECASE):
-                issue = ResponsiveIssue(
-                    issue_type='missing_viewport',
-                    severity='error',
-                    description='缺少viewport meta标签',
-                    file_path=str(file_path),
-                    line_number=1,
-                    device_type=DeviceType.MOBILE,
-                    recommendation='在<head>中添加viewport meta标签',
-                )
-                issues.append(issue)
+            issues = self.html_issues(self._html_scanner.scan(content, str(file_path)))
 
         except Exception as e:
             print(f"检查HTML文件 {file_path} 时出错: {e}")
@@ -565,38 +820,282 @@ class ResponsiveDesignChecker:
         return issues
 
 
+# 统一前端扫描的文件类型；可访问性、国际化、响应式各自使用其中一部分
+ACCESSIBILITY_SUFFIXES = ('.html', '.jsx')
+I18N_SUFFIXES = ('.py', '.js', '.jsx', '.ts', '.tsx', '.html')
+RESPONSIVE_SUFFIXES = ('.css', '.html')
+FRONTEND_SUFFIXES = ('.css', '.html', '.js', '.jsx', '.py', '.ts', '.tsx')
+
+# 前端扫描结果在内容哈希缓存中的检查器ID前缀与版本；规则判断逻辑变化时递增版本。
+# 运行哪些检查取决于扩展名，检查器ID按扩展名区分（见 ``FrontendScanner.signature``）
+FRONTEND_CHECKER_ID = 'frontend_scan'
+FRONTEND_CHECKER_VERSION = '1'
+
+# 缓存记录中需要还原为枚举的字段
+_ISSUE_ENUM_FIELDS: Dict[type, Dict[str, type]] = {
+    AccessibilityIssue: {'category': AccessibilityCategory, 'level': AccessibilityLevel},
+    I18nIssue: {},
+    ResponsiveIssue: {'device_type': DeviceType},
+}
+
+
+@dataclass
+class FrontendFileIssues:
+    """单个前端文件的三类检查结果"""
+
+    accessibility: List[AccessibilityIssue] = field(default_factory=list)
+    i18n: List[I18nIssue] = field(default_factory=list)
+    responsive: List[ResponsiveIssue] = field(default_factory=list)
+
+    def to_records(self) -> list:
+        """转换为可写入缓存的记录，不含文件路径（内容相同的文件共用缓存）"""
+        return [
+            [
+                {
+                    key: value.value if isinstance(value, Enum) else value
+                    for key, value in asdict(issue).items()
+                    if key != 'file_path'
+                }
+                for issue in issues
+            ]
+            for issues in (self.accessibility, self.i18n, self.responsive)
+        ]
+
+    @classmethod
+    def from_records(cls, records: list, file_path: Path) -> 'FrontendFileIssues':
+        """从缓存记录还原，文件路径取当前文件"""
+        families = []
+        for issue_type, items in zip(_ISSUE_ENUM_FIELDS, records):
+            enum_fields = _ISSUE_ENUM_FIELDS[issue_type]
+            issues = []
+            for item in items:
+                values = dict(item, file_path=str(file_path))
+                for key, enum_type in enum_fields.items():
+                    values[key] = enum_type(values[key])
+                issues.append(issue_type(**values))
+            families.append(issues)
+        return cls(*families)
+
+
+class FrontendScanner:
+    """统一前端扫描器
+
+    每个文件只读取一次，按扩展名在同一份内容上运行可访问性、国际化和响应式检查；
+    HTML文件的可访问性与响应式规则注册在同一个标记扫描器上，只扫描一遍。
+    """
+
+    def __init__(
+        self,
+        accessibility_checker: AccessibilityChecker,
+        i18n_checker: InternationalizationChecker,
+        responsive_checker: ResponsiveDesignChecker,
+    ) -> None:
+        """初始化统一前端扫描器"""
+        self.accessibility_checker = accessibility_checker
+        self.i18n_checker = i18n_checker
+        self.responsive_checker = responsive_checker
+
+        self.markup_scanner = MarkupScanner()
+        accessibility_checker.register_html_rules(self.markup_scanner)
+        responsive_checker.register_html_rules(self.markup_scanner)
+        self.jsx_scanner = MarkupScanner(jsx=True)
+        accessibility_checker.register_jsx_rules(self.jsx_scanner)
+
+    def signature(self, suffix: str) -> CheckerSignature:
+        """某一扩展名文件的缓存签名
+
+        内容相同但扩展名不同的文件运行的检查不同，不能共用结果；规则表变化时
+        也不会命中旧结果。
+        """
+        accessibility = self.accessibility_checker
+        i18n = self.i18n_checker
+        responsive = self.responsive_checker
+        rules = {
+            'html': accessibility.html_rules,
+            'jsx': accessibility.jsx_rules,
+            'hardcoded_text': i18n.hardcoded_text_patterns,
+            'common_hardcoded': i18n.common_hardcoded,
+            'datetime': i18n.datetime_patterns,
+            'i18n_prefilter': [i18n.hardcoded_text_prefilter, i18n.datetime_prefilter],
+            'css': responsive.css_rules,
+            'inline_style': responsive.inline_style_rules,
+        }
+        return CheckerSignature(
+            f'{FRONTEND_CHECKER_ID}{suffix.lower()}',
+            FRONTEND_CHECKER_VERSION,
+            config_fingerprint(rules),
+        )
+
+    def scan_file(self, file_path: Path) -> Optional[FrontendFileIssues]:
+        """读取并检查单个文件，读取失败时返回 None"""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except Exception as e:
+            print(f"检查文件 {file_path} 时出错: {e}")
+            return None
+
+        suffix = file_path.suffix.lower()
+        result = FrontendFileIssues()
+        if suffix == '.html':
+            scan = self.markup_scanner.scan(content, str(file_path))
+            result.accessibility = self.accessibility_checker.html_issues(scan)
+            result.responsive = self.responsive_checker.html_issues(scan)
+        elif suffix == '.jsx':
+            scan = self.jsx_scanner.scan(content, str(file_path))
+            result.accessibility = self.accessibility_checker.jsx_issues(scan)
+        elif suffix == '.css':
+            result.responsive = self.responsive_checker.check_css_content(content, str(file_path))
+
+        if suffix in I18N_SUFFIXES:
+            result.i18n = self.i18n_checker.check_content(content, file_path)
+        return result
+
+
+def scan_frontend_files(
+    scanner: FrontendScanner, file_paths: List[Path]
+) -> List[Optional[FrontendFileIssues]]:
+    """扫描一批前端文件（进程池任务，结果与 ``file_paths`` 一一对应）"""
+    return [scanner.scan_file(file_path) for file_path in file_paths]
+
+
 class AccessibilityCultureManager:
     """可访问性文化管理器"""
 
-    def __init__(self, project_path: Path):
-        """__init__函数"""
+    def __init__(
+        self,
+        project_path: Path,
+        file_index: Optional[ProjectFileIndex] = None,
+        jobs: int = 1,
+        cache_manager: Optional[SmartCacheManager] = None,
+    ):
+        """初始化可访问性文化管理器
+
+        Args:
+            project_path: 项目路径
+            file_index: 共享的项目文件索引
+            jobs: 前端扫描的并行度，小于等于0时使用全部CPU核心
+            cache_manager: 共享的内容哈希缓存；为空时首次扫描在项目的
+                ``.aiculture/cache`` 下打开
+        """
         self.project_path = project_path
+        self.file_index = file_index or ProjectFileIndex(project_path)
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
         self.accessibility_checker = AccessibilityChecker()
         self.i18n_checker = InternationalizationChecker()
         self.responsive_checker = ResponsiveDesignChecker()
 
-    def scan_project_accessibility(self) -> Dict[str, Any]:
-        """扫描项目可访问性"""
-        all_issues = []
-        file_count = 0
+        # 三类检查共用的统一扫描器：每个文件读取一次，HTML只扫描一遍
+        self.frontend_scanner = FrontendScanner(
+            self.accessibility_checker, self.i18n_checker, self.responsive_checker
+        )
+        self._cache_manager = cache_manager
+        self._owns_cache = cache_manager is None
+
+    @property
+    def cache_manager(self) -> SmartCacheManager:
+        """内容哈希缓存（按需打开）"""
+        if self._cache_manager is None:
+            self._cache_manager = SmartCacheManager(
+                self.project_path, file_index=self.file_index
+            )
+        return self._cache_manager
+
+    def close(self) -> None:
+        """关闭自行打开的缓存"""
+        if self._owns_cache and self._cache_manager is not None:
+            self._cache_manager.close()
+            self._cache_manager = None
+
+    def scan_frontend(self) -> Dict[Path, FrontendFileIssues]:
+        """统一扫描项目中的前端文件
+
+        按扩展名分组、按内容哈希查询缓存，未变化的文件只需一次 stat；其余文件
+        读取一次，交给进程池（``jobs`` 大于1时）运行三类检查，结果写回缓存。
+
+        Returns:
+            {文件路径: 该文件的三类检查结果}，读取失败的文件不在其中
+        """
+        file_paths = self.file_index.files_with_suffix(*FRONTEND_SUFFIXES)
+        if not file_paths:
+            return {}
+        by_suffix: Dict[str, List[Path]] = {}
+        for file_path in file_paths:
+            by_suffix.setdefault(file_path.suffix.lower(), []).append(file_path)
+        signatures = {
+            suffix: self.frontend_scanner.signature(suffix) for suffix in by_suffix
+        }
 
-        # 扫描HTML文件
-        for html_file in self.project_path.rglob("*.html"):
-            if self._should_skip_file(html_file):
-                continue
+        cached: Dict[Path, list] = {}
+        for suffix, paths in by_suffix.items():
+            cached.update(
+                self.cache_manager.get_valid_cached_violations(paths, signatures[suffix])
+            )
 
-            file_count += 1
-            issues = self.accessibility_checker.check_html_file(html_file)
-            all_issues.extend(issues)
+        results = {
+            file_path: FrontendFileIssues.from_records(records, file_path)
+            for file_path, records in cached.items()
+        }
+        pending = [file_path for file_path in file_paths if file_path not in cached]
+        fresh = self._scan_frontend_batches(pending)
+        if fresh:
+            fresh_by_suffix: Dict[str, Dict[Path, list]] = {}
+            for file_path, issues in fresh.items():
+                fresh_by_suffix.setdefault(file_path.suffix.lower(), {})[file_path] = (
+                    issues.to_records()
+                )
+            for suffix, records in fresh_by_suffix.items():
+                self.cache_manager.cache_many_violations(records, signatures[suffix])
+            self.cache_manager.save_cache()
 
-        # 扫描JSX文件
-        for jsx_file in self.project_path.rglob("*.jsx"):
-            if self._should_skip_file(jsx_file):
-                continue
+        results.update(fresh)
+        return results
 
-            file_count += 1
-            issues = self.accessibility_checker.check_jsx_file(jsx_file)
-            all_issues.extend(issues)
+    def _scan_frontend_batches(self, file_paths: List[Path]) -> Dict[Path, FrontendFileIssues]:
+        """检查未命中缓存的文件，并行模式下分批交给进程池"""
+        task = partial(scan_frontend_files, self.frontend_scanner)
+        scanned: List[Optional[FrontendFileIssues]] = []
+        for batch in map_batches(task, file_paths, self.jobs, '前端扫描'):
+            scanned.extend(batch)
+
+        return {
+            file_path: issues
+            for file_path, issues in zip(file_paths, scanned)
+            if issues is not None
+        }
+
+    def _collect_issues(
+        self, frontend: Dict[Path, FrontendFileIssues], suffixes: Tuple[str, ...], family: str
+    ) -> Tuple[int, list]:
+        """按扩展名顺序汇总某一类检查的问题
+
+        Returns:
+            (扫描的文件数, 问题列表)
+        """
+        file_count = 0
+        all_issues = []
+        for suffix in suffixes:
+            for file_path in self.file_index.files_with_suffix(suffix):
+                file_count += 1
+                result = frontend.get(file_path)
+                if result is not None:
+                    all_issues.extend(getattr(result, family))
+        return file_count, all_issues
+
+    def scan_project_accessibility(
+        self, frontend: Optional[Dict[Path, FrontendFileIssues]] = None
+    ) -> Dict[str, Any]:
+        """扫描项目可访问性
+
+        Args:
+            frontend: 已完成的统一前端扫描结果，为空时现扫
+        """
+        if frontend is None:
+            frontend = self.scan_frontend()
+        # 扫描HTML和JSX文件
+        file_count, all_issues = self._collect_issues(
+            frontend, ACCESSIBILITY_SUFFIXES, 'accessibility'
+        )
 
         # 按严重程度和类别分组
         by_severity = {'error': [], 'warning': [], 'info': []}
@@ -615,20 +1114,18 @@ class AccessibilityCultureManager:
             'recommendations': self._generate_accessibility_recommendations(all_issues),
         }
 
-    def scan_project_i18n(self) -> Dict[str, Any]:
-        """扫描项目国际化"""
-        all_issues = []
-        file_count = 0
+    def scan_project_i18n(
+        self, frontend: Optional[Dict[Path, FrontendFileIssues]] = None
+    ) -> Dict[str, Any]:
+        """扫描项目国际化
 
+        Args:
+            frontend: 已完成的统一前端扫描结果，为空时现扫
+        """
+        if frontend is None:
+            frontend = self.scan_frontend()
         # 扫描代码文件
-        for ext in ['*.py', '*.js', '*.jsx', '*.ts', '*.tsx', '*.html']:
-            for file_path in self.project_path.rglob(ext):
-                if self._should_skip_file(file_path):
-                    continue
-
-                file_count += 1
-                issues = self.i18n_checker.check_file(file_path)
-                all_issues.extend(issues)
+        file_count, all_issues = self._collect_issues(frontend, I18N_SUFFIXES, 'i18n')
 
         # 检查翻译完整性
         locale_dir = self.project_path / "locales"
@@ -651,27 +1148,19 @@ class AccessibilityCultureManager:
             ),
         }
 
-    def scan_project_responsive(self) -> Dict[str, Any]:
-        """扫描项目响应式设计"""
-        all_issues = []
-        file_count = 0
-
-        # 扫描CSS文件
-        for css_file in self.project_path.rglob("*.css"):
-            if self._should_skip_file(css_file):
-                continue
+    def scan_project_responsive(
+        self, frontend: Optional[Dict[Path, FrontendFileIssues]] = None
+    ) -> Dict[str, Any]:
+        """扫描项目响应式设计
 
-            file_count += 1
-            issues = self.responsive_checker.check_css_file(css_file)
-            all_issues.extend(issues)
-
-        # 扫描HTML文件
-        for html_file in self.project_path.rglob("*.html"):
-            if self._should_skip_file(html_file):
-                continue
-
-            issues = self.responsive_checker.check_html_file(html_file)
-            all_issues.extend(issues)
+        Args:
+            frontend: 已完成的统一前端扫描结果，为空时现扫
+        """
+        if frontend is None:
+            frontend = self.scan_frontend()
+        # 扫描CSS和HTML文件（只统计CSS文件数）
+        file_count = len(self.file_index.files_with_suffix(".css"))
+        _, all_issues = self._collect_issues(frontend, RESPONSIVE_SUFFIXES, 'responsive')
 
         # 按设备类型分组
         by_device = {device.value: [] for device in DeviceType}
@@ -687,9 +1176,11 @@ class AccessibilityCultureManager:
 
     def generate_comprehensive_report(self) -> Dict[str, Any]:
         """生成综合可访问性报告"""
-        accessibility_scan = self.scan_project_accessibility()
-        i18n_scan = self.scan_project_i18n()
-        responsive_scan = self.scan_project_responsive()
+        # 三类扫描共用一次统一前端扫描
+        frontend = self.scan_frontend()
+        accessibility_scan = self.scan_project_accessibility(frontend)
+        i18n_scan = self.scan_project_i18n(frontend)
+        responsive_scan = self.scan_project_responsive(frontend)
 
         total_issues = (
             accessibility_scan['total_issues']
@@ -720,13 +1211,6 @@ class AccessibilityCultureManager:
             ],
         }
 
-    def _should_skip_file(self, file_path: Path) -> bool:
-        """判断是否跳过文件"""
-        return any(
-            part.startswith('.') or part in ['node_modules', 'venv', '__pycache__', 'build', 'dist']
-            for part in file_path.parts
-        )
-
     def _calculate_wcag_compliance(self, issues: List[AccessibilityIssue]) -> Dict[str, Any]:
         """计算WCAG合规性"""
         level_counts = {level.value: 0 for level in AccessibilityLevel}
@@ -817,3 +1301,5 @@ if __name__ == "__main__":
     # 单独扫描国际化
     i18n_issues = accessibility.scan_project_i18n()
     print(f"国际化问题: {i18n_issues['total_issues']} 个")
+
+    accessibility.close()
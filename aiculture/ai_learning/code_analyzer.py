@@ -9,8 +9,10 @@ import os
 import re
 from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from ..file_index import ProjectFileIndex
+from ..source_cache import ParsedModule, ParsedModuleCache, get_module_cache
 from .pattern_types import (
     ProjectPattern,
     NamingPatternAnalyzer,
@@ -23,19 +25,20 @@ from .pattern_types import (
 class CodeAnalyzer:
     """代码分析器"""
     
-    def __init__(self, project_path: Path):
+    def __init__(
+        self,
+        project_path: Path,
+        file_index: Optional[ProjectFileIndex] = None,
+        module_cache: Optional[ParsedModuleCache] = None,
+    ):
         """初始化代码分析器"""
         self.project_path = project_path
+        self.file_index = file_index or ProjectFileIndex(project_path)
+        self.module_cache = module_cache or get_module_cache()
         self.naming_analyzer = NamingPatternAnalyzer()
         self.structure_analyzer = StructurePatternAnalyzer()
         self.style_analyzer = StylePatternAnalyzer()
         self.doc_analyzer = DocumentationPatternAnalyzer()
-        
-        # 需要跳过的目录
-        self.skip_dirs = {
-            '__pycache__', '.git', '.pytest_cache', 'node_modules',
-            '.mypy_cache', '.tox', 'venv', 'env', '.env', 'build', 'dist'
-        }
     
     def analyze_project(self) -> Dict[str, Any]:
         """分析整个项目"""
@@ -51,28 +54,17 @@ class CodeAnalyzer:
         
         return analysis_result
     
-    def _should_skip_file(self, file_path: Path) -> bool:
-        """判断是否应该跳过文件"""
-        # 跳过隐藏文件
-        if file_path.name.startswith('.'):
-            return True
-        
-        # 跳过特定目录中的文件
-        for part in file_path.parts:
-            if part in self.skip_dirs:
-                return True
-        
-        return False
-    
     def _get_python_files(self) -> List[Path]:
         """获取所有Python文件"""
-        python_files = []
-        
-        for file_path in self.project_path.rglob("*.py"):
-            if not self._should_skip_file(file_path):
-                python_files.append(file_path)
-        
-        return python_files
+        # 隐藏目录、虚拟环境、构建产物等由文件索引统一过滤
+        return self.file_index.python_files()
+    
+    def _iter_modules(self) -> Iterator[ParsedModule]:
+        """遍历可读取的Python模块（每个文件只读取、解析一次）"""
+        for file_path in self._get_python_files():
+            module = self.module_cache.get(file_path)
+            if module is not None:
+                yield module
     
     def _analyze_structure(self) -> Dict[str, Any]:
         """分析项目结构"""
@@ -89,15 +81,14 @@ class CodeAnalyzer:
                 structure_data['directories'].append(item.name)
         
         # 分析文件类型
-        for file_path in self.project_path.rglob("*"):
-            if file_path.is_file() and not self._should_skip_file(file_path):
-                structure_data['total_files'] += 1
-                
-                if file_path.suffix:
-                    structure_data['file_extensions'][file_path.suffix] += 1
-                
-                if file_path.suffix == '.py':
-                    structure_data['python_files'] += 1
+        for file_path in self.file_index.files:
+            structure_data['total_files'] += 1
+            
+            if file_path.suffix:
+                structure_data['file_extensions'][file_path.suffix] += 1
+            
+            if file_path.suffix == '.py':
+                structure_data['python_files'] += 1
         
         return structure_data
     
@@ -110,33 +101,26 @@ class CodeAnalyzer:
             'module_names': []
         }
         
-        python_files = self._get_python_files()
-        
-        for file_path in python_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                tree = ast.parse(content)
-                
-                # 提取函数名
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        naming_data['function_names'].append(node.name)
-                    elif isinstance(node, ast.ClassDef):
-                        naming_data['class_names'].append(node.name)
-                    elif isinstance(node, ast.Assign):
-                        for target in node.targets:
-                            if isinstance(target, ast.Name):
-                                naming_data['variable_names'].append(target.id)
-                
-                # 模块名
-                module_name = file_path.stem
-                if module_name != '__init__':
-                    naming_data['module_names'].append(module_name)
-                
-            except (SyntaxError, UnicodeDecodeError):
+        for module in self._iter_modules():
+            tree = module.tree
+            if tree is None:
                 continue
+            
+            # 提取函数名
+            for node in ast.walk(tree):
+                if isinstance(node, ast.FunctionDef):
+                    naming_data['function_names'].append(node.name)
+                elif isinstance(node, ast.ClassDef):
+                    naming_data['class_names'].append(node.name)
+                elif isinstance(node, ast.Assign):
+                    for target in node.targets:
+                        if isinstance(target, ast.Name):
+                            naming_data['variable_names'].append(target.id)
+            
+            # 模块名
+            module_name = module.path.stem
+            if module_name != '__init__':
+                naming_data['module_names'].append(module_name)
         
         return naming_data
     
@@ -149,38 +133,34 @@ class CodeAnalyzer:
             'blank_lines': 0
         }
         
-        python_files = self._get_python_files()
-        
-        for file_path in python_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
+        for module in self._iter_modules():
+            lines = module.lines
+            # 以换行结尾的文件切分后末尾多出一个空串，与readlines()保持一致
+            if module.text.endswith('\n'):
+                lines = lines[:-1]
+            
+            for line in lines:
+                # 分析引号使用
+                single_quotes = line.count("'") - line.count("\\'")
+                double_quotes = line.count('"') - line.count('\\"')
                 
-                for line in lines:
-                    # 分析引号使用
-                    single_quotes = line.count("'") - line.count("\\'")
-                    double_quotes = line.count('"') - line.count('\\"')
+                style_data['quote_usage']['single'] += single_quotes
+                style_data['quote_usage']['double'] += double_quotes
+                
+                # 分析缩进
+                if line.strip():  # 非空行
+                    leading_spaces = len(line) - len(line.lstrip(' '))
+                    leading_tabs = len(line) - len(line.lstrip('\t'))
                     
-                    style_data['quote_usage']['single'] += single_quotes
-                    style_data['quote_usage']['double'] += double_quotes
+                    if leading_spaces > 0:
+                        style_data['indentation']['spaces'] += 1
+                    if leading_tabs > 0:
+                        style_data['indentation']['tabs'] += 1
                     
-                    # 分析缩进
-                    if line.strip():  # 非空行
-                        leading_spaces = len(line) - len(line.lstrip(' '))
-                        leading_tabs = len(line) - len(line.lstrip('\t'))
-                        
-                        if leading_spaces > 0:
-                            style_data['indentation']['spaces'] += 1
-                        if leading_tabs > 0:
-                            style_data['indentation']['tabs'] += 1
-                        
-                        # 行长度
-                        style_data['line_length'].append(len(line.rstrip()))
-                    else:
-                        style_data['blank_lines'] += 1
-                
-            except UnicodeDecodeError:
-                continue
+                    # 行长度
+                    style_data['line_length'].append(len(line.rstrip()))
+                else:
+                    style_data['blank_lines'] += 1
         
         return style_data
     
@@ -195,38 +175,31 @@ class CodeAnalyzer:
             'coverage': 0.0
         }
         
-        python_files = self._get_python_files()
-        
-        for file_path in python_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                tree = ast.parse(content)
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        doc_data['total_functions'] += 1
-                        
-                        if ast.get_docstring(node):
-                            doc_data['documented_functions'] += 1
-                            
-                            # 分析文档字符串风格
-                            docstring = ast.get_docstring(node)
-                            if docstring:
-                                if docstring.startswith('"""') or '"""' in docstring:
-                                    doc_data['docstring_style']['triple_double'] += 1
-                                elif docstring.startswith("'''") or "'''" in docstring:
-                                    doc_data['docstring_style']['triple_single'] += 1
+        for module in self._iter_modules():
+            tree = module.tree
+            if tree is None:
+                continue
+            
+            for node in ast.walk(tree):
+                if isinstance(node, ast.FunctionDef):
+                    doc_data['total_functions'] += 1
                     
-                    elif isinstance(node, ast.ClassDef):
-                        doc_data['total_classes'] += 1
+                    if ast.get_docstring(node):
+                        doc_data['documented_functions'] += 1
                         
-                        if ast.get_docstring(node):
-                            doc_data['documented_classes'] += 1
+                        # 分析文档字符串风格
+                        docstring = ast.get_docstring(node)
+                        if docstring:
+                            if docstring.startswith('"""') or '"""' in docstring:
+                                doc_data['docstring_style']['triple_double'] += 1
+                            elif docstring.startswith("'''") or "'''" in docstring:
+                                doc_data['docstring_style']['triple_single'] += 1
                 
-            except (SyntaxError, UnicodeDecodeError):
-                continue
+                elif isinstance(node, ast.ClassDef):
+                    doc_data['total_classes'] += 1
+                    
+                    if ast.get_docstring(node):
+                        doc_data['documented_classes'] += 1
         
         # 计算文档覆盖率
         total_items = doc_data['total_functions'] + doc_data['total_classes']
@@ -246,29 +219,22 @@ class CodeAnalyzer:
             'high_complexity_functions': []
         }
         
-        python_files = self._get_python_files()
-        
-        for file_path in python_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                tree = ast.parse(content)
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        complexity = self._calculate_cyclomatic_complexity(node)
-                        complexity_data['function_complexities'].append(complexity)
-                        
-                        if complexity > 10:  # 高复杂度阈值
-                            complexity_data['high_complexity_functions'].append({
-                                'name': node.name,
-                                'complexity': complexity,
-                                'file': str(file_path)
-                            })
-                
-            except (SyntaxError, UnicodeDecodeError):
+        for module in self._iter_modules():
+            tree = module.tree
+            if tree is None:
                 continue
+            
+            for node in ast.walk(tree):
+                if isinstance(node, ast.FunctionDef):
+                    complexity = self._calculate_cyclomatic_complexity(node)
+                    complexity_data['function_complexities'].append(complexity)
+                    
+                    if complexity > 10:  # 高复杂度阈值
+                        complexity_data['high_complexity_functions'].append({
+                            'name': node.name,
+                            'complexity': complexity,
+                            'file': str(module.path)
+                        })
         
         # 计算统计信息
         if complexity_data['function_complexities']:
@@ -286,7 +252,7 @@ class CodeAnalyzer:
                 complexity += 1
             elif isinstance(child, ast.ExceptHandler):
                 complexity += 1
-            elif isinstance(child, ast.With, ast.AsyncWith):
+            elif isinstance(child, (ast.With, ast.AsyncWith)):
                 complexity += 1
             elif isinstance(child, ast.BoolOp):
                 complexity += len(child.values) - 1
@@ -303,41 +269,34 @@ class CodeAnalyzer:
             'wildcard_imports': 0
         }
         
-        python_files = self._get_python_files()
-        
-        for file_path in python_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                tree = ast.parse(content)
+        for module in self._iter_modules():
+            tree = module.tree
+            if tree is None:
+                continue
+            
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Import):
+                    import_data['import_types']['import'] += 1
+                    import_data['absolute_imports'] += 1
+                    
+                    for alias in node.names:
+                        import_data['imported_modules'][alias.name] += 1
                 
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        import_data['import_types']['import'] += 1
+                elif isinstance(node, ast.ImportFrom):
+                    import_data['import_types']['from_import'] += 1
+                    
+                    if node.level > 0:  # 相对导入
+                        import_data['relative_imports'] += 1
+                    else:
                         import_data['absolute_imports'] += 1
-                        
-                        for alias in node.names:
-                            import_data['imported_modules'][alias.name] += 1
                     
-                    elif isinstance(node, ast.ImportFrom):
-                        import_data['import_types']['from_import'] += 1
+                    # 检查通配符导入
+                    for alias in node.names:
+                        if alias.name == '*':
+                            import_data['wildcard_imports'] += 1
                         
-                        if node.level > 0:  # 相对导入
-                            import_data['relative_imports'] += 1
-                        else:
-                            import_data['absolute_imports'] += 1
-                        
-                        # 检查通配符导入
-                        for alias in node.names:
-                            if alias.name == '*':
-                                import_data['wildcard_imports'] += 1
-                            
-                            if node.module:
-                                import_data['imported_modules'][node.module] += 1
-                
-            except (SyntaxError, UnicodeDecodeError):
-                continue
+                        if node.module:
+                            import_data['imported_modules'][node.module] += 1
         
         return import_data
     
@@ -350,38 +309,37 @@ class CodeAnalyzer:
             'test_coverage_estimate': 0.0
         }
         
-        all_files = list(self.project_path.rglob("*.py"))
-        python_files = [f for f in all_files if not self._should_skip_file(f)]
+        python_files = self._get_python_files()
         
         for file_path in python_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # 检查是否为测试文件
-                is_test_file = (
-                    'test' in file_path.name.lower() or
-                    'test' in str(file_path.parent).lower()
-                )
-                
-                if is_test_file:
-                    testing_data['test_files'] += 1
-                
-                # 检查测试框架
-                if 'import unittest' in content or 'from unittest' in content:
-                    testing_data['test_frameworks']['unittest'] += 1
-                
-                if 'import pytest' in content or 'from pytest' in content:
-                    testing_data['test_frameworks']['pytest'] += 1
-                
-                # 计算测试函数数量
-                tree = ast.parse(content)
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
-                        testing_data['test_functions'] += 1
-                
-            except (SyntaxError, UnicodeDecodeError):
+            module = self.module_cache.get(file_path)
+            if module is None:
+                continue
+            content = module.text
+            
+            # 检查是否为测试文件
+            is_test_file = (
+                'test' in file_path.name.lower() or
+                'test' in str(file_path.parent).lower()
+            )
+            
+            if is_test_file:
+                testing_data['test_files'] += 1
+            
+            # 检查测试框架
+            if 'import unittest' in content or 'from unittest' in content:
+                testing_data['test_frameworks']['unittest'] += 1
+            
+            if 'import pytest' in content or 'from pytest' in content:
+                testing_data['test_frameworks']['pytest'] += 1
+            
+            # 计算测试函数数量
+            tree = module.tree
+            if tree is None:
                 continue
+            for node in ast.walk(tree):
+                if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
+                    testing_data['test_functions'] += 1
         
         # 估算测试覆盖率
         if len(python_files) > 0:
@@ -8,8 +8,9 @@ import json
 import logging
 import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+from ..file_index import ProjectFileIndex
 from .code_analyzer import CodeAnalyzer
 from .pattern_types import (
     LearningResult,
@@ -24,10 +25,10 @@ from .pattern_types import (
 class LearningEngine:
     """AI学习引擎"""
     
-    def __init__(self, project_path: Path):
+    def __init__(self, project_path: Path, file_index: Optional[ProjectFileIndex] = None):
         """初始化学习引擎"""
         self.project_path = project_path
-        self.analyzer = CodeAnalyzer(project_path)
+        self.analyzer = CodeAnalyzer(project_path, file_index)
         self.logger = logging.getLogger(__name__)
         
         # 学习配置
@@ -16,6 +16,7 @@ import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .file_index import ProjectFileIndex
 from .ai_learning import (
     ProjectPattern,
     LearningResult,
@@ -27,12 +28,12 @@ from .ai_learning import (
 class ProjectAnalyzer:
     """项目分析器 - 向后兼容接口"""
 
-    def __init__(self, project_path: Path) -> None:
+    def __init__(self, project_path: Path, file_index: Optional[ProjectFileIndex] = None) -> None:
         """初始化项目分析器"""
         self.project_path = project_path
         self.patterns: List[ProjectPattern] = []
         self.logger = logging.getLogger(__name__)
-        self._analyzer = CodeAnalyzer(project_path)
+        self._analyzer = CodeAnalyzer(project_path, file_index)
 
     def analyze_project(self) -> Dict[str, Any]:
         """分析整个项目，返回项目特征"""
@@ -42,12 +43,13 @@ class ProjectAnalyzer:
 class AILearningEngine:
     """AI学习引擎 - 向后兼容接口"""
 
-    def __init__(self, project_path: Path) -> None:
+    def __init__(self, project_path: Path, file_index: Optional[ProjectFileIndex] = None) -> None:
         """初始化AI学习引擎"""
         self.project_path = project_path
-        self.analyzer = ProjectAnalyzer(project_path)
+        self.file_index = file_index or ProjectFileIndex(project_path)
+        self.analyzer = ProjectAnalyzer(project_path, self.file_index)
         self.logger = logging.getLogger(__name__)
-        self._engine = LearningEngine(project_path)
+        self._engine = LearningEngine(project_path, self.file_index)
         
         # 配置
         self.config = {
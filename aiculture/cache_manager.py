@@ -4,10 +4,18 @@
 
 import hashlib
 import json
+import sqlite3
+import threading
 import time
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .file_index import ProjectFileIndex
+from .git_changes import GitChangeDetector
+from .import_graph import ImportGraph
+from .source_cache import get_module_cache
 
 # 常量定义
 HOURS_PER_DAY = 24
@@ -25,29 +33,213 @@ class CacheEntry:
     last_modified: float
     violations: list
     created_at: float
+    size: int = 0
+    mtime_ns: int = 0
+    checker_id: str = ''
+    checker_version: str = ''
+    config_fingerprint: str = ''
+
+
+@dataclass(frozen=True)
+class CheckerSignature:
+    """检查器签名：检查器ID、版本以及其依赖配置的指纹
+
+    缓存结果以 (文件内容哈希, 检查器ID, 检查器版本, 配置指纹) 为键，
+    任一部分变化都不会命中旧结果。
+    """
+
+    checker_id: str
+    version: str = '1'
+    config_fingerprint: str = ''
+
+
+# 未指定检查器时使用的默认签名
+DEFAULT_CHECKER = CheckerSignature('culture')
+
+
+class CheckerScope(Enum):
+    """检查器的作用范围"""
+
+    LOCAL = "local"  # 结果只取决于文件自身内容（如函数复杂度）
+    CROSS_FILE = "cross_file"  # 结果取决于导入的其他模块（如耦合度、导入分析）
+
+
+def config_fingerprint(config: Optional[Dict[str, Any]], sections: Iterable[str] = ()) -> str:
+    """计算配置指纹
+
+    Args:
+        config: 配置字典（如 aiculture.yaml 的内容）
+        sections: 检查器依赖的配置项，支持 'culture.code_style' 形式的点路径；
+            为空时对整个配置计算指纹
+
+    Returns:
+        配置内容的SHA-256摘要
+    """
+    config = config or {}
+    sections = sorted(sections)
+    if sections:
+        selected = {}
+        for section in sections:
+            value: Any = config
+            for part in section.split('.'):
+                value = value.get(part) if isinstance(value, dict) else None
+            selected[section] = value
+    else:
+        selected = config
+
+    payload = json.dumps(selected, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+# 缓存过期时间（7天）
+CACHE_EXPIRY_SECONDS = 7 * HOURS_PER_DAY * SECONDS_PER_HOUR
+
+# 单条SQL中 IN (...) 参数的最大数量（低于SQLite默认上限999）
+SQL_BATCH_SIZE = 500
+
+# 数据库结构版本，变化时丢弃旧表重建
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS file_state (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    file_hash TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS check_results (
+    file_hash TEXT NOT NULL,
+    checker_id TEXT NOT NULL,
+    checker_version TEXT NOT NULL,
+    config_fingerprint TEXT NOT NULL,
+    violations TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (file_hash, checker_id, checker_version, config_fingerprint)
+);
+CREATE INDEX IF NOT EXISTS idx_check_results_checker ON check_results (checker_id);
+CREATE INDEX IF NOT EXISTS idx_check_results_created_at ON check_results (created_at);
+"""
 
+_UPSERT_STATE_SQL = """
+INSERT INTO file_state (path, size, mtime_ns, file_hash, updated_at)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(path) DO UPDATE SET
+    size = excluded.size,
+    mtime_ns = excluded.mtime_ns,
+    file_hash = excluded.file_hash,
+    updated_at = excluded.updated_at
+"""
 
-class SmartCacheManager:
-    """智能缓存管理器"""
+_UPSERT_RESULT_SQL = """
+INSERT INTO check_results
+    (file_hash, checker_id, checker_version, config_fingerprint, violations, created_at)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(file_hash, checker_id, checker_version, config_fingerprint) DO UPDATE SET
+    violations = excluded.violations,
+    created_at = excluded.created_at
+"""
 
-    def __init__(self, project_path: Path, cache_dir: Optional[Path] = None) -> None:
-        """初始化缓存管理器"""
+
+class SmartCacheManager:
+    """智能缓存管理器
+
+    数据保存在 SQLite（WAL 模式）中，分为两张表：
+
+    - ``file_state``：(相对路径 -> size, mtime_ns, 内容哈希)。size 与 mtime_ns
+      未变化时直接使用记录的哈希，无需读取文件。
+    - ``check_results``：以 (内容哈希, 检查器ID, 检查器版本, 配置指纹) 为键的违规记录。
+      内容相同的文件（包括改回旧版本）直接复用结果；配置变化只影响依赖它的检查器。
+
+    写入为按行 upsert，``save_cache()`` 提交事务并在SQL中清理过期条目。
+    """
+
+    def __init__(
+        self,
+        project_path: Path,
+        cache_dir: Optional[Path] = None,
+        file_index: Optional[ProjectFileIndex] = None,
+    ) -> None:
+        """初始化缓存管理器
+
+        Args:
+            project_path: 项目路径
+            cache_dir: 缓存目录，默认为项目下的 .aiculture/cache
+            file_index: 共享的项目文件索引，由其所有者负责刷新；为空时自行创建
+        """
         self.project_path = project_path
         self.cache_dir = cache_dir or project_path / '.aiculture' / 'cache'
+        self._owns_file_index = file_index is None
+        self.file_index = file_index or ProjectFileIndex(project_path)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         # 缓存文件路径
-        self.culture_cache_file = self.cache_dir / 'culture_check.json'
+        self.culture_cache_file = self.cache_dir / 'culture_check.db'
         self.dependency_cache_file = self.cache_dir / 'dependencies.json'
         self.security_cache_file = self.cache_dir / 'security.json'
 
-        # 内存缓存
-        self._memory_cache: Dict[str, CacheEntry] = {}
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        """打开数据库连接并初始化表结构"""
+        conn = sqlite3.connect(str(self.culture_cache_file), check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+
+        if conn.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+            # 旧版本结构不含检查器信息，无法安全复用，直接重建
+            for table in ('file_cache', 'file_state', 'check_results'):
+                conn.execute(f'DROP TABLE IF EXISTS {table}')
+            conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+        conn.executescript(_SCHEMA)
+        conn.commit()
+        return conn
+
+    def close(self) -> None:
+        """提交未保存的写入并关闭数据库连接"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.commit()
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> 'SmartCacheManager':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     @property
     def cache_data(self) -> Dict[str, CacheEntry]:
-        """获取缓存数据"""
-        return self._memory_cache
+        """获取默认检查器的缓存数据（按相对路径）"""
+        return self.get_entries(DEFAULT_CHECKER)
+
+    def get_entries(self, checker: CheckerSignature) -> Dict[str, CacheEntry]:
+        """获取指定检查器签名下、与当前文件状态对应的缓存条目"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT s.path, s.size, s.mtime_ns, s.file_hash, r.violations, r.created_at '
+                'FROM file_state s JOIN check_results r ON r.file_hash = s.file_hash '
+                'WHERE r.checker_id = ? AND r.checker_version = ? AND r.config_fingerprint = ?',
+                (checker.checker_id, checker.version, checker.config_fingerprint),
+            ).fetchall()
+
+        return {
+            path: CacheEntry(
+                file_hash=file_hash,
+                last_modified=mtime_ns / 1e9,
+                violations=json.loads(violations),
+                created_at=created_at,
+                size=size,
+                mtime_ns=mtime_ns,
+                checker_id=checker.checker_id,
+                checker_version=checker.version,
+                config_fingerprint=checker.config_fingerprint,
+            )
+            for path, size, mtime_ns, file_hash, violations, created_at in rows
+        }
 
     def get_file_hash(self, file_path: Path) -> str:
         """计算文件内容哈希"""
@@ -58,115 +250,243 @@ class SmartCacheManager:
         except (OSError, IOError):
             return ""
 
-    def is_file_cached(self, file_path: Path) -> bool:
-        """检查文件是否已缓存且有效"""
-        file_key = str(file_path.relative_to(self.project_path))
+    def _file_key(self, file_path: Path) -> str:
+        """缓存键：相对项目根目录的POSIX路径"""
+        return Path(file_path).relative_to(self.project_path).as_posix()
 
-        # 检查内存缓存
-        if file_key in self._memory_cache:
-            cache_entry = self._memory_cache[file_key]
-            current_hash = self.get_file_hash(file_path)
-            current_mtime = file_path.stat().st_mtime
-
-            # 验证缓存是否仍然有效
-            if cache_entry.file_hash == current_hash and cache_entry.last_modified == current_mtime:
-                return True
-
-        return False
-
-    def get_cached_violations(self, file_path: Path) -> Optional[list]:
-        """获取缓存的违规记录"""
-        file_key = str(file_path.relative_to(self.project_path))
-
-        if file_key in self._memory_cache:
-            return self._memory_cache[file_key].violations
+    def is_file_cached(self, file_path: Path, checker: CheckerSignature = DEFAULT_CHECKER) -> bool:
+        """检查文件是否已缓存且有效"""
+        return file_path in self.get_valid_cached_violations([file_path], checker)
+
+    def get_cached_violations(
+        self, file_path: Path, checker: CheckerSignature = DEFAULT_CHECKER
+    ) -> Optional[list]:
+        """获取缓存的违规记录（基于最近记录的文件内容哈希）"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT r.violations FROM file_state s '
+                'JOIN check_results r ON r.file_hash = s.file_hash '
+                'WHERE s.path = ? AND r.checker_id = ? AND r.checker_version = ? '
+                'AND r.config_fingerprint = ?',
+                (
+                    self._file_key(file_path),
+                    checker.checker_id,
+                    checker.version,
+                    checker.config_fingerprint,
+                ),
+            ).fetchone()
+
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def get_valid_cached_violations(
+        self, file_paths: Iterable[Path], checker: CheckerSignature = DEFAULT_CHECKER
+    ) -> Dict[Path, list]:
+        """批量查询仍然有效的缓存
+
+        先将文件解析为当前内容哈希（见 ``resolve_file_hashes``），
+        再一次性查询该检查器签名下的结果。
+
+        Returns:
+            有效缓存的 {文件路径: 违规记录}
+        """
+        hashes = self.resolve_file_hashes(file_paths)
+        by_hash: Dict[str, List[Path]] = {}
+        for file_path, file_hash in hashes.items():
+            by_hash.setdefault(file_hash, []).append(file_path)
+
+        rows = self._fetch_batched(
+            'SELECT file_hash, violations FROM check_results '
+            'WHERE checker_id = ? AND checker_version = ? AND config_fingerprint = ? '
+            'AND file_hash IN ({placeholders})',
+            (checker.checker_id, checker.version, checker.config_fingerprint),
+            list(by_hash),
+        )
 
-        return None
+        valid: Dict[Path, list] = {}
+        for file_hash, violations in rows:
+            for file_path in by_hash[file_hash]:
+                valid[file_path] = json.loads(violations)
+        return valid
 
-    def cache_file_violations(self, file_path: Path, violations: list) -> None:
-        """缓存文件的违规记录"""
-        file_key = str(file_path.relative_to(self.project_path))
+    def resolve_file_hashes(self, file_paths: Iterable[Path]) -> Dict[Path, str]:
+        """获取文件当前的内容哈希
 
-        cache_entry = CacheEntry(
-            file_hash=self.get_file_hash(file_path),
-            last_modified=file_path.stat().st_mtime,
-            violations=violations,
-            created_at=time.time(),
+        size/mtime_ns 与记录一致时直接使用记录的哈希；否则读取文件计算哈希，
+        并更新 ``file_state``（仅时间戳变化时内容哈希不变，结果仍可复用）。
+        """
+        stats: Dict[str, Tuple[Path, int, int]] = {}
+        for file_path in file_paths:
+            try:
+                stat_result = file_path.stat()
+            except OSError:
+                continue
+            stats[self._file_key(file_path)] = (
+                file_path,
+                stat_result.st_size,
+                stat_result.st_mtime_ns,
+            )
+
+        rows = self._fetch_batched(
+            'SELECT path, size, mtime_ns, file_hash FROM file_state '
+            'WHERE path IN ({placeholders})',
+            (),
+            list(stats),
         )
+        recorded = {path: (size, mtime_ns, file_hash) for path, size, mtime_ns, file_hash in rows}
+
+        hashes: Dict[Path, str] = {}
+        updates = []
+        now = time.time()
+        for key, (file_path, size, mtime_ns) in stats.items():
+            record = recorded.get(key)
+            if record is not None and record[0] == size and record[1] == mtime_ns:
+                hashes[file_path] = record[2]
+                continue
 
-        self._memory_cache[file_key] = cache_entry
+            file_hash = self.get_file_hash(file_path)
+            if not file_hash:
+                continue
+            hashes[file_path] = file_hash
+            updates.append((key, size, mtime_ns, file_hash, now))
+
+        if updates:
+            with self._lock:
+                self._conn.executemany(_UPSERT_STATE_SQL, updates)
+
+        return hashes
+
+    def _fetch_batched(self, sql: str, params: Tuple[Any, ...], values: List[str]) -> List[tuple]:
+        """分批执行 ``IN ({placeholders})`` 查询"""
+        rows: List[tuple] = []
+        with self._lock:
+            for start in range(0, len(values), SQL_BATCH_SIZE):
+                batch = values[start : start + SQL_BATCH_SIZE]
+                placeholders = ','.join('?' * len(batch))
+                rows.extend(
+                    self._conn.execute(
+                        sql.format(placeholders=placeholders), (*params, *batch)
+                    ).fetchall()
+                )
+        return rows
+
+    def cache_file_violations(
+        self, file_path: Path, violations: list, checker: CheckerSignature = DEFAULT_CHECKER
+    ) -> None:
+        """缓存文件的违规记录"""
+        self.cache_many_violations({file_path: violations}, checker)
+
+    def cache_many_violations(
+        self, results: Dict[Path, list], checker: CheckerSignature = DEFAULT_CHECKER
+    ) -> None:
+        """批量缓存多个文件的违规记录（按行upsert，由 save_cache 提交）"""
+        hashes = self.resolve_file_hashes(results)
+        created_at = time.time()
+        rows = [
+            (
+                hashes[file_path],
+                checker.checker_id,
+                checker.version,
+                checker.config_fingerprint,
+                json.dumps(violations, ensure_ascii=False),
+                created_at,
+            )
+            for file_path, violations in results.items()
+            if file_path in hashes
+        ]
+
+        with self._lock:
+            self._conn.executemany(_UPSERT_RESULT_SQL, rows)
+
+    def has_results(self, checker: CheckerSignature) -> bool:
+        """该检查器签名下是否已有任何缓存结果"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT 1 FROM check_results WHERE checker_id = ? AND checker_version = ? '
+                'AND config_fingerprint = ? LIMIT 1',
+                (checker.checker_id, checker.version, checker.config_fingerprint),
+            ).fetchone()
+        return row is not None
+
+    def invalidate_checker(self, checker: CheckerSignature) -> int:
+        """删除同一检查器在其他版本或配置指纹下的结果，其他检查器不受影响
+
+        Returns:
+            删除的条目数
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                'DELETE FROM check_results WHERE checker_id = ? '
+                'AND (checker_version != ? OR config_fingerprint != ?)',
+                (checker.checker_id, checker.version, checker.config_fingerprint),
+            )
+        return cursor.rowcount
 
     def load_cache(self) -> None:
-        """从磁盘加载缓存"""
-        try:
-            if self.culture_cache_file.exists():
-                with open(self.culture_cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-
-                # 转换为CacheEntry对象
-                for file_key, entry_data in cache_data.items():
-                    self._memory_cache[file_key] = CacheEntry(**entry_data)
-
-        except (json.JSONDecodeError, KeyError, TypeError):
-            # 缓存文件损坏，忽略
-            pass
+        """从磁盘加载缓存（SQLite按需查询，保留此方法以兼容旧调用）"""
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._connect()
 
     def save_cache(self) -> None:
-        """保存缓存到磁盘"""
+        """提交待写入的缓存，并清理过期缓存（超过7天）"""
         try:
-            # 清理过期缓存（超过7天）
-            current_time = time.time()
-            expired_keys = []
-
-            for file_key, cache_entry in self._memory_cache.items():
-                if (
-                    current_time - cache_entry.created_at > 7 * HOURS_PER_DAY * SECONDS_PER_HOUR
-                ):  # 7天
-                    expired_keys.append(file_key)
-
-            for key in expired_keys:
-                del self._memory_cache[key]
-
-            # 转换为可序列化的格式
-            cache_data = {}
-            for file_key, cache_entry in self._memory_cache.items():
-                cache_data[file_key] = asdict(cache_entry)
-
-            # 保存到文件
-            with open(self.culture_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
-
-        except (OSError, IOError):
+            cutoff = time.time() - CACHE_EXPIRY_SECONDS
+            with self._lock:
+                self._conn.execute('DELETE FROM check_results WHERE created_at < ?', (cutoff,))
+                self._conn.execute('DELETE FROM file_state WHERE updated_at < ?', (cutoff,))
+                self._conn.commit()
+        except sqlite3.Error:
             # 保存失败，忽略
             pass
 
-    def get_changed_files(self, since_timestamp: Optional[float] = None) -> Set[Path]:
-        """获取自指定时间戳以来发生变化的文件"""
-        changed_files = set()
+    def get_changed_files(
+        self,
+        since_timestamp: Optional[float] = None,
+        since_ref: Optional[str] = None,
+        staged: bool = False,
+    ) -> Set[Path]:
+        """获取发生变化的Python文件
+
+        Args:
+            since_timestamp: 基于mtime比较的时间戳（未指定git模式时使用）
+            since_ref: 返回自该git引用（如 origin/main）以来变更的文件
+            staged: 只返回git暂存区中的文件
+
+        git模式在项目不在git仓库中时回退到时间戳比较。
+        """
+        if since_ref or staged:
+            detector = GitChangeDetector(self.project_path)
+            if detector.available:
+                files = detector.staged_files() if staged else detector.files_since_ref(since_ref)
+                return {path for path in files if path.suffix == '.py'}
+
+        if self._owns_file_index:
+            self.file_index.refresh()
 
         if since_timestamp is None:
             # 返回所有Python文件
-            return set(self.project_path.rglob("*.py"))
+            return set(self.file_index.python_files())
 
-        for file_path in self.project_path.rglob("*.py"):
-            if any(part.startswith('.') for part in file_path.parts):
-                continue
-
-            try:
-                if file_path.stat().st_mtime > since_timestamp:
-                    changed_files.add(file_path)
-            except OSError:
-                continue
+        # 直接使用索引遍历时记录的 mtime，无需再次 stat
+        changed_files = set()
+        for file_path in self.file_index.python_files():
+            stat = self.file_index.get_stat(file_path)
+            if stat is not None and stat.mtime_ns / 1e9 > since_timestamp:
+                changed_files.add(file_path)
 
         return changed_files
 
     def clear_cache(self) -> None:
         """清空所有缓存"""
-        self._memory_cache.clear()
+        with self._lock:
+            self._conn.execute('DELETE FROM check_results')
+            self._conn.execute('DELETE FROM file_state')
+            self._conn.commit()
 
         # 删除缓存文件
         for cache_file in [
-            self.culture_cache_file,
             self.dependency_cache_file,
             self.security_cache_file,
         ]:
@@ -178,12 +498,18 @@ class SmartCacheManager:
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """获取缓存统计信息"""
-        total_files = len(list(self.project_path.rglob("*.py")))
-        cached_files = len(self._memory_cache)
+        total_files = len(self.file_index.python_files())
+        with self._lock:
+            cached_files = self._conn.execute(
+                'SELECT COUNT(DISTINCT s.path) FROM file_state s '
+                'JOIN check_results r ON r.file_hash = s.file_hash'
+            ).fetchone()[0]
 
         cache_size = 0
-        if self.culture_cache_file.exists():
-            cache_size = self.culture_cache_file.stat().st_size
+        for suffix in ('', '-wal'):
+            db_file = Path(f'{self.culture_cache_file}{suffix}')
+            if db_file.exists():
+                cache_size += db_file.stat().st_size
 
         return {
             'total_files': total_files,
@@ -195,13 +521,142 @@ class SmartCacheManager:
 
 
 class IncrementalChecker:
-    """增量检查器 - 只检查发生变化的文件"""
-
-    def __init__(self, project_path: Path) -> None:
-        """初始化增量检查器"""
+    """增量检查器 - 只检查发生变化的文件
+
+    每个检查器通过 ``register_checker`` 声明版本、依赖的配置项和作用范围：
+    配置变化时只有依赖该配置的检查器需要重新检查全部文件；
+    跨文件检查器还需要重新检查变更文件的直接和间接导入方。
+    """
+
+    def __init__(
+        self,
+        project_path: Path,
+        config: Optional[Dict[str, Any]] = None,
+        since_ref: Optional[str] = None,
+        staged: bool = False,
+    ) -> None:
+        """初始化增量检查器
+
+        Args:
+            project_path: 项目路径
+            config: 项目配置，默认读取项目根目录下的 aiculture.yaml
+            since_ref: git模式，只检查自该引用（如 origin/main）以来变更的文件
+            staged: git模式，只检查暂存区中的文件（pre-commit）
+        """
         self.project_path = project_path
-        self.cache_manager = SmartCacheManager(project_path)
+        # 变更检测、缓存和导入关系图共用一份文件索引，每轮检查只遍历一次目录树
+        self.file_index = ProjectFileIndex(project_path)
+        self.cache_manager = SmartCacheManager(project_path, file_index=self.file_index)
         self.last_check_file = project_path / '.aiculture' / 'last_check.txt'
+        self.config = config if config is not None else self._load_project_config()
+        self.checkers: Dict[str, CheckerSignature] = {}
+        self.checker_scopes: Dict[str, CheckerScope] = {}
+        self.since_ref = since_ref
+        self.staged = staged
+        self.git_detector = GitChangeDetector(project_path) if (since_ref or staged) else None
+        # 导入关系图持久化在缓存目录中，每次只重新解析状态变化的文件
+        self.import_graph = ImportGraph(
+            project_path,
+            file_index=self.file_index,
+            module_cache=get_module_cache(),
+            cache_file=self.cache_manager.cache_dir / 'import_graph.json',
+        )
+
+    def get_affected_files(
+        self, scope: CheckerScope, changed_files: Optional[Set[Path]] = None
+    ) -> Set[Path]:
+        """获取某一作用范围的检查器需要重新评估的文件
+
+        局部检查器只需要变更文件本身；跨文件检查器还需要变更文件的传递导入方。
+        """
+        if changed_files is None:
+            changed_files = self.get_changed_files()
+        if scope is CheckerScope.LOCAL:
+            return set(changed_files)
+
+        self.import_graph.update()
+        return set(changed_files) | self.import_graph.transitive_importers(changed_files)
+
+    def close(self) -> None:
+        """关闭缓存数据库连接"""
+        self.cache_manager.close()
+
+    def __enter__(self) -> 'IncrementalChecker':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def git_mode(self) -> bool:
+        """是否基于git确定变更文件（不在git仓库中时回退到时间戳模式）"""
+        return self.git_detector is not None and self.git_detector.available
+
+    def get_changed_files(self) -> Set[Path]:
+        """获取发生变化的文件
+
+        git模式下返回git报告的改动文件；
+        否则返回自上次检查以来mtime变化的文件（首次检查返回全部文件）。
+        每次调用都会重新遍历共享的文件索引，供随后的导入关系图更新使用。
+        """
+        self.file_index.refresh()
+        if self.git_mode:
+            if self.staged:
+                files = self.git_detector.staged_files()
+            else:
+                files = self.git_detector.files_since_ref(self.since_ref)
+            return {path for path in files if path.suffix == '.py'}
+
+        last_check = self.get_last_check_timestamp()
+        if last_check is None:
+            return set(self.file_index.python_files())
+        return self.cache_manager.get_changed_files(last_check)
+
+    def _load_project_config(self) -> Dict[str, Any]:
+        """读取项目的 aiculture.yaml（不存在或无法解析时返回空配置）"""
+        config_file = self.project_path / 'aiculture.yaml'
+        if not config_file.exists():
+            return {}
+        try:
+            import yaml
+
+            with open(config_file, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f) or {}
+        except Exception:
+            return {}
+
+    def register_checker(
+        self,
+        checker_id: str,
+        version: str = '1',
+        config_sections: Iterable[str] = (),
+        scope: CheckerScope = CheckerScope.LOCAL,
+    ) -> CheckerSignature:
+        """注册检查器并清理其过时的缓存结果
+
+        Args:
+            checker_id: 检查器ID
+            version: 检查器版本，规则变化时递增
+            config_sections: 检查器依赖的配置项（点路径），为空表示不依赖配置
+            scope: 检查器作用范围，决定变更后需要重新检查的文件
+
+        Returns:
+            当前生效的检查器签名
+        """
+        fingerprint = config_fingerprint(self.config, config_sections) if config_sections else ''
+        signature = CheckerSignature(checker_id, version, fingerprint)
+        self.checkers[checker_id] = signature
+        self.checker_scopes[checker_id] = scope
+        self.cache_manager.invalidate_checker(signature)
+        return signature
+
+    def get_cached_results(self, checker_id: str, files: Iterable[Path]) -> Dict[Path, list]:
+        """获取指定检查器在这些文件上仍然有效的缓存结果"""
+        return self.cache_manager.get_valid_cached_violations(files, self.checkers[checker_id])
+
+    def store_results(self, checker_id: str, results: Dict[Path, list]) -> None:
+        """保存指定检查器的检查结果"""
+        self.cache_manager.cache_many_violations(results, self.checkers[checker_id])
 
     def get_last_check_timestamp(self) -> Optional[float]:
         """获取上次检查的时间戳"""
@@ -222,22 +677,53 @@ class IncrementalChecker:
         except OSError:
             pass
 
-    def get_files_to_check(self) -> Set[Path]:
-        """获取需要检查的文件列表"""
-        last_check = self.get_last_check_timestamp()
+    def get_files_to_check(self, checker_id: Optional[str] = None) -> Set[Path]:
+        """获取需要检查的文件列表
 
-        if last_check is None:
+        Args:
+            checker_id: 只计算该检查器需要检查的文件；为空时合并所有已注册检查器
+        """
+        git_mode = self.git_mode
+        if not git_mode and self.get_last_check_timestamp() is None:
             # 首次检查，检查所有文件
-            return set(self.project_path.rglob("*.py"))
+            return self.get_changed_files()
 
-        # 增量检查，只检查变化的文件
-        changed_files = self.cache_manager.get_changed_files(last_check)
+        if checker_id is not None:
+            checker_ids = [checker_id]
+        else:
+            checker_ids = list(self.checkers)
 
-        # 过滤掉已缓存且有效的文件
-        files_to_check = set()
-        for file_path in changed_files:
-            if not self.cache_manager.is_file_cached(file_path):
-                files_to_check.add(file_path)
+        # 增量检查，只检查变化的文件
+        changed_files = self.get_changed_files()
+        if not checker_ids:
+            cached = self.cache_manager.get_valid_cached_violations(changed_files)
+            return {path for path in changed_files if path not in cached}
+
+        all_files: Optional[Set[Path]] = None
+        importers: Optional[Set[Path]] = None
+
+        files_to_check: Set[Path] = set()
+        for current_id in checker_ids:
+            signature = self.checkers[current_id]
+            candidates = changed_files
+            # git模式只关注改动范围，不因检查器签名变化而扩展为全量检查
+            if not git_mode and not self.cache_manager.has_results(signature):
+                # 新检查器、版本或相关配置变化：该检查器需要检查全部文件
+                if all_files is None:
+                    all_files = self.cache_manager.get_changed_files()
+                candidates = all_files
+
+            # 过滤掉已缓存且有效的文件（一次批量查询）
+            cached = self.cache_manager.get_valid_cached_violations(candidates, signature)
+            files_to_check.update(path for path in candidates if path not in cached)
+
+            if self.checker_scopes.get(current_id) is CheckerScope.CROSS_FILE:
+                # 导入方自身内容未变，缓存仍会命中，因此不经缓存过滤直接重新检查
+                if importers is None:
+                    importers = self.get_affected_files(
+                        CheckerScope.CROSS_FILE, changed_files
+                    ) - changed_files
+                files_to_check.update(importers)
 
         return files_to_check
 
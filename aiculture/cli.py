@@ -6,17 +6,50 @@ AICultureKit CLI 命令行接口
 注意：此模块已重构为模块化结构，主要命令已迁移到cli_commands子包中。
 """
 
+import importlib
+from pathlib import Path
+from typing import Dict, List, Optional
+
 import click
 
-from .cli_commands import (
-    project_group,
-    quality_group,
-    culture_group,
-    template_group
-)
+# 子命令组 -> "模块:属性"，只在被调用（或列出帮助）时才导入
+LAZY_SUBCOMMANDS: Dict[str, str] = {
+    'project': 'aiculture.cli_commands.project_commands:project_group',
+    'quality': 'aiculture.cli_commands.quality_commands:quality_group',
+    'culture': 'aiculture.cli_commands.culture_commands:culture_group',
+    'template': 'aiculture.cli_commands.template_commands:template_group',
+    'daemon': 'aiculture.cli_commands.daemon_commands:daemon_group',
+}
+
+
+class LazyGroup(click.Group):
+    """按需导入子命令模块的命令组
+
+    各命令组会间接导入 GitPython、jinja2、psutil、requests 等较重的依赖，
+    延迟到真正解析该子命令时再导入，``--version`` 等命令无需承担导入开销。
+    """
+
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, str]] = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
 
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
 
-@click.group()
+    def _load_command(self, cmd_name: str) -> click.Command:
+        module_name, attribute = self.lazy_subcommands[cmd_name].split(':')
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"延迟加载的子命令不是click命令: {cmd_name}")
+        return command
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS)
 @click.version_option(version="0.1.0")
 def main() -> None:
     """
@@ -31,13 +64,6 @@ def main() -> None:
     pass
 
 
-# 注册命令组
-main.add_command(project_group, name='project')
-main.add_command(quality_group, name='quality')
-main.add_command(culture_group, name='culture')
-main.add_command(template_group, name='template')
-
-
 # 向后兼容的快捷命令
 @main.command()
 @click.argument('project_name')
@@ -53,9 +79,30 @@ def create(project_name: str, path: str, template: str) -> None:
 
 
 @main.command()
+@click.argument('files', nargs=-1, type=click.Path())
 @click.option('--path', '-p', default='.', help='项目路径')
-def check(path: str) -> None:
-    """快速质量检查 (向后兼容)"""
+def check(files: tuple, path: str) -> None:
+    """快速质量检查 (向后兼容)
+
+    指定文件时执行单文件文化检查，守护进程运行时自动交给它处理，否则在本进程内执行，
+    两种情况检查内容相同；未指定文件时执行质量工具检查。
+    """
+    if files:
+        from .daemon import check_files
+
+        result = check_files(Path(path), list(files))
+        source = "守护进程" if result['served_by'] == 'daemon' else "本地"
+        click.echo(
+            f"🔍 检查了 {result['files_checked']} 个文件 "
+            f"(缓存命中 {result['cache_hits']}, {source})"
+        )
+        for violation in result['violations']:
+            location = f"{violation['file_path']}:{violation['line_number']}"
+            click.echo(f"  [{violation['severity']}] {location} {violation['description']}")
+        if any(v['severity'] == 'error' for v in result['violations']):
+            raise SystemExit(1)
+        return
+
     from .cli_commands.quality_commands import check as quality_check
 
     # 调用质量检查命令
@@ -2,16 +2,58 @@
 CLI命令模块
 
 将CLI命令拆分为多个模块以提高可维护性。
+各命令组在首次访问时才导入，避免导入本包就加载所有依赖。
 """
 
-from .project_commands import project_group
-from .quality_commands import quality_group
-from .culture_commands import culture_group
-from .template_commands import template_group
+import importlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import click
+
+if TYPE_CHECKING:
+    from ..tool_orchestrator import ToolOrchestrator
+
+_GROUP_MODULES = {
+    'project_group': 'project_commands',
+    'quality_group': 'quality_commands',
+    'culture_group': 'culture_commands',
+    'template_group': 'template_commands',
+    'daemon_group': 'daemon_commands',
+}
 
 __all__ = [
     'project_group',
     'quality_group', 
     'culture_group',
-    'template_group'
+    'template_group',
+    'daemon_group',
+    'run_orchestrator'
 ]
+
+
+def run_orchestrator(project_path: Path) -> 'ToolOrchestrator':
+    """本次CLI运行中该项目共享的外部工具编排器
+
+    编排器保存在click上下文的 ``meta`` 中，同一次运行里的各个命令（包括通过
+    ``ctx.invoke`` 调用的命令）把它传给 QualityTools 和 CultureEnforcer，
+    重复请求的工具只执行一次。
+    """
+    from ..tool_orchestrator import ToolOrchestrator
+
+    meta = click.get_current_context().meta
+    orchestrators = meta.setdefault('aiculture.tool_orchestrators', {})
+    key = str(Path(project_path).resolve())
+    if key not in orchestrators:
+        orchestrators[key] = ToolOrchestrator(Path(project_path))
+    return orchestrators[key]
+
+
+def __getattr__(name: str) -> Any:
+    """按需导入命令组"""
+    if name in _GROUP_MODULES:
+        module = importlib.import_module(f'.{_GROUP_MODULES[name]}', __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
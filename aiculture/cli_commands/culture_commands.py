@@ -3,12 +3,14 @@
 """
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import click
 
+from . import run_orchestrator
 from ..accessibility_culture import AccessibilityCultureManager
-from ..culture_enforcer import CultureEnforcer
+from ..cache_manager import IncrementalChecker
+from ..culture_enforcer import CultureEnforcer, PythonFileChecker
 
 
 @click.group()
@@ -163,7 +165,14 @@ def report(path: str, output: str) -> None:
               help='项目路径')
 @click.option('--strictness', '-s', default=0.7, type=float,
               help='执行严格度 (0.0-1.0)')
-def enforce(path: str, strictness: float) -> None:
+@click.option('--jobs', '-j', default=1, type=int,
+              help='并行进程数 (0 表示使用全部CPU核心)')
+@click.option('--since-ref', default=None,
+              help='只检查自该git引用以来变更的文件 (如 origin/main)')
+@click.option('--staged', is_flag=True,
+              help='只检查git暂存区中的文件')
+def enforce(path: str, strictness: float, jobs: int,
+            since_ref: Optional[str], staged: bool) -> None:
     """执行文化标准"""
     click.echo(f"⚖️  执行文化标准: {path}")
     click.echo(f"📊 严格度: {strictness}")
@@ -172,36 +181,49 @@ def enforce(path: str, strictness: float) -> None:
         project_path = Path(path)
         
         # 初始化文化执行器
-        enforcer = CultureEnforcer(project_path)
+        tools = run_orchestrator(project_path)
+        enforcer = CultureEnforcer(project_path, jobs=jobs, tools=tools)
         
-        # 设置严格度
-        enforcer.set_strictness(strictness)
+        # 确定需要检查的文件
+        files = None
+        if since_ref or staged:
+            incremental = IncrementalChecker(project_path, since_ref=since_ref, staged=staged)
+            with incremental:
+                if incremental.git_mode:
+                    files = incremental.get_affected_files(PythonFileChecker.SCOPE)
+                    click.echo(f"📝 基于git变更检查 {len(files)} 个文件")
+                else:
+                    click.echo("⚠️  项目不在git仓库中，执行全量检查")
         
         # 执行检查
-        click.echo("🔍 执行文化标准检查...")
-        result = enforcer.enforce_standards()
+        click.echo(f"🔍 执行文化标准检查 (并行度: {enforcer.jobs})...")
+        try:
+            result = enforcer.enforce_all(files=files)
+        finally:
+            enforcer.close()
         
         # 显示结果
-        if result.get('success', False):
+        if result.get('errors', 0) == 0:
             click.echo("✅ 文化标准执行成功")
         else:
             click.echo("❌ 文化标准执行失败")
             
-            violations = result.get('violations', [])
-            if violations:
-                click.echo(f"\n📋 发现 {len(violations)} 个违规:")
-                for violation in violations[:10]:  # 只显示前10个
-                    click.echo(f"  • {violation}")
-                
-                if len(violations) > 10:
-                    click.echo(f"  ... 还有 {len(violations) - 10} 个违规")
+        violations = result.get('violations', [])
+        if violations:
+            click.echo(f"\n📋 发现 {len(violations)} 个违规:")
+            for violation in violations[:10]:  # 只显示前10个
+                click.echo(
+                    f"  • [{violation.severity}] {violation.file_path}:{violation.line_number} "
+                    f"{violation.description}"
+                )
+            
+            if len(violations) > 10:
+                click.echo(f"  ... 还有 {len(violations) - 10} 个违规")
         
         # 显示统计信息
-        stats = result.get('statistics', {})
-        if stats:
-            click.echo("\n📊 统计信息:")
-            for key, value in stats.items():
-                click.echo(f"  {key}: {value}")
+        click.echo("\n📊 统计信息:")
+        for key in ('score', 'errors', 'warnings', 'total_violations'):
+            click.echo(f"  {key}: {result.get(key, 0)}")
         
     except Exception as e:
         click.echo(f"❌ 执行文化标准失败: {e}", err=True)
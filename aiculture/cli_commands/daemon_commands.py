@@ -0,0 +1,66 @@
+"""
+守护进程相关的CLI命令
+"""
+
+from pathlib import Path
+from typing import Any
+
+import click
+
+from ..daemon import CultureDaemon, DaemonClient, unix_sockets_supported
+
+
+@click.group()
+def daemon_group() -> Any:
+    """常驻检查守护进程管理命令"""
+    pass
+
+
+@daemon_group.command()
+@click.option('--path', '-p', default='.', help='项目路径')
+def start(path: str) -> None:
+    """在前台启动守护进程"""
+    if not unix_sockets_supported():
+        click.echo("❌ 当前平台不支持Unix域套接字，无法启动守护进程")
+        raise click.Abort()
+
+    daemon = CultureDaemon(Path(path))
+    click.echo(f"🚀 守护进程已启动: {daemon.socket_path}")
+    try:
+        daemon.serve_forever()
+    except RuntimeError as e:
+        click.echo(f"❌ {e}")
+        raise click.Abort()
+    except KeyboardInterrupt:
+        pass
+    click.echo("👋 守护进程已停止")
+
+
+@daemon_group.command()
+@click.option('--path', '-p', default='.', help='项目路径')
+def stop(path: str) -> None:
+    """停止守护进程"""
+    client = DaemonClient(Path(path))
+    if not client.is_running():
+        click.echo("ℹ️ 守护进程未运行")
+        return
+
+    client.request('shutdown')
+    click.echo("✅ 守护进程已停止")
+
+
+@daemon_group.command()
+@click.option('--path', '-p', default='.', help='项目路径')
+def status(path: str) -> None:
+    """查看守护进程状态"""
+    client = DaemonClient(Path(path))
+    if not client.is_running():
+        click.echo("ℹ️ 守护进程未运行")
+        return
+
+    stats = client.request('stats')['result']
+    click.echo(f"🟢 守护进程运行中 (PID {stats['pid']})")
+    click.echo(f"   套接字: {client.socket_path}")
+    click.echo(f"   运行时间: {stats['uptime_seconds']:.0f}秒")
+    click.echo(f"   已处理请求: {stats['requests_served']}")
+    click.echo(f"   已缓存模块: {stats['module_cache'].get('entries', 0)}")
@@ -8,7 +8,12 @@ from typing import Any
 
 import click
 
+from . import run_orchestrator
 from ..core import QualityTools
+from ..tool_orchestrator import ToolResult
+
+# 每个工具最多显示的问题数
+MAX_SHOWN_VIOLATIONS = 20
 
 
 @click.group()
@@ -21,46 +26,47 @@ def quality_group() -> Any:
 @click.option('--path', '-p', default='.', 
               help='项目路径')
 @click.option('--tool', '-t', multiple=True,
-              help='指定检查工具 (flake8, mypy, pytest)')
+              help='指定检查工具 (black, flake8, mypy, bandit, pytest)')
 @click.option('--fix', is_flag=True,
               help='自动修复可修复的问题')
 def check(path: str, tool: tuple, fix: bool) -> None:
-    """运行代码质量检查"""
+    """运行代码质量检查（各工具并发执行）"""
     click.echo(f"🔍 运行质量检查: {path}")
     
     try:
         project_path = Path(path)
-        tools = QualityTools(str(project_path))
+        tools = QualityTools(str(project_path), orchestrator=run_orchestrator(project_path))
         
         # 如果没有指定工具，运行所有工具
         if not tool:
             tool = ('flake8', 'mypy', 'pytest')
         
-        results = {}
-        
-        # 运行指定的工具
+        known_tools = [name for name in tool if name in tools.orchestrator.specs]
         for tool_name in tool:
-            click.echo(f"\n📋 运行 {tool_name}...")
-            
-            if tool_name == 'flake8':
-                result = tools.run_flake8()
-            elif tool_name == 'mypy':
-                result = tools.run_mypy()
-            elif tool_name == 'pytest':
-                result = tools.run_pytest()
-            else:
+            if tool_name not in tools.orchestrator.specs:
                 click.echo(f"❌ 未知工具: {tool_name}")
+        
+        click.echo(f"\n📋 并发运行 {', '.join(known_tools)}...")
+        results = {
+            name: _result_summary(result)
+            for name, result in tools.run_tools(known_tools).items()
+        }
+        
+        # 显示结果
+        for tool_name, result in results.items():
+            if result['success']:
+                click.echo(f"✅ {tool_name} 检查通过 ({result['duration']:.1f}s)")
                 continue
-            
-            results[tool_name] = result
-            
-            # 显示结果
-            if result.get('success', False):
-                click.echo(f"✅ {tool_name} 检查通过")
-            else:
-                click.echo(f"❌ {tool_name} 检查失败")
-                if 'output' in result:
-                    click.echo(result['output'])
+            click.echo(f"❌ {tool_name} 检查失败: {result['reason']}")
+            for violation in result['violations'][:MAX_SHOWN_VIOLATIONS]:
+                location = f"{violation.file_path}:{violation.line_number}"
+                code = f" {violation.code}" if violation.code else ""
+                click.echo(f"   {location}{code} {violation.message}")
+            hidden = len(result['violations']) - MAX_SHOWN_VIOLATIONS
+            if hidden > 0:
+                click.echo(f"   ... 还有 {hidden} 个问题")
+            elif not result['violations'] and result['output']:
+                click.echo(result['output'])
         
         # 自动修复
         if fix:
@@ -242,6 +248,23 @@ def _auto_fix_issues(project_path: Path) -> None:
         click.echo("⚠️  autopep8 未安装，跳过自动修复")
 
 
+def _result_summary(result: ToolResult) -> dict:
+    """将工具结果转换为总结所需的字典"""
+    if not result.available:
+        reason = "工具未安装"
+    elif result.timed_out:
+        reason = "执行超时"
+    else:
+        reason = f"退出码 {result.returncode}，发现 {len(result.violations)} 个问题"
+    return {
+        'success': result.success,
+        'reason': reason,
+        'duration': result.duration,
+        'violations': result.violations,
+        'output': result.output,
+    }
+
+
 def _show_quality_summary(results: dict) -> None:
     """显示质量检查总结"""
     click.echo("\n📊 质量检查总结:")
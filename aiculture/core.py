@@ -7,13 +7,15 @@ AICultureKit 核心功能模块
 import shutil
 import subprocess
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 
 import yaml
 from git import Repo
 from jinja2 import Environment, FileSystemLoader
 import re
 
+from .tool_orchestrator import ToolOrchestrator, ToolResult
+
 
 class CultureConfig:
     """文化配置管理类
@@ -101,14 +103,18 @@ class QualityTools:
         project_path (Path): 项目根目录路径
     """
 
-    def __init__(self, project_path: str = ".") -> None:
+    def __init__(
+        self, project_path: str = ".", orchestrator: Optional[ToolOrchestrator] = None
+    ) -> None:
         """初始化质量工具管理器
 
         Args:
             project_path: 项目根目录路径，默认为当前目录
+            orchestrator: 共享的外部工具编排器，同一次运行中重复的工具调用只执行一次
         """
         self.project_path = Path(project_path)
         self.templates_path = Path(__file__).parent / "templates"
+        self.orchestrator = orchestrator or ToolOrchestrator(self.project_path)
 
     def setup_pre_commit(self) -> bool:
         """设置pre-commit配置"""
@@ -166,34 +172,14 @@ exclude =
         # 这里可以扩展JavaScript相关配置
         return True
 
-    def run_quality_check(self) -> Dict[str, bool]:
-        """运行质量检查"""
-        results = {}
-
-        try:
-            # 运行black格式化检查
-            result = subprocess.run(
-                ["black", "--check", "."], cwd=self.project_path, capture_output=True
-            )
-            results["black"] = result.returncode == 0
-        except FileNotFoundError:
-            results["black"] = False
-
-        try:
-            # 运行flake8检查
-            result = subprocess.run(["flake8", "."], cwd=self.project_path, capture_output=True)
-            results["flake8"] = result.returncode == 0
-        except FileNotFoundError:
-            results["flake8"] = False
-
-        try:
-            # 运行mypy检查
-            result = subprocess.run(["mypy", "."], cwd=self.project_path, capture_output=True)
-            results["mypy"] = result.returncode == 0
-        except FileNotFoundError:
-            results["mypy"] = False
+    def run_tools(self, names: Iterable[str]) -> Dict[str, ToolResult]:
+        """并发运行指定的质量工具，返回结构化结果"""
+        return self.orchestrator.run(names)
 
-        return results
+    def run_quality_check(self) -> Dict[str, bool]:
+        """运行质量检查（black、flake8、mypy 并发执行）"""
+        results = self.run_tools(["black", "flake8", "mypy"])
+        return {name: result.success for name, result in results.items()}
 
 
 class ProjectTemplate:
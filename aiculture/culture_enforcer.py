@@ -7,18 +7,27 @@ from typing import Any
 """
 
 import ast
-import subprocess
+import json
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set
 
 from .accessibility_culture import AccessibilityCultureManager
+from .cache_manager import CheckerScope
 from .ai_culture_principles import AICulturePrinciples, PrincipleCategory
 from .data_governance_culture import DataGovernanceManager
+from .file_index import ProjectFileIndex
 from .observability_culture import ObservabilityManager
 from .performance_culture import MemoryLeakDetector, PerformanceBenchmarkManager
+from .process_pool import map_batches
+from .source_cache import ParsedModule, get_module_cache
+from .tool_orchestrator import ToolOrchestrator, ToolResult
 from .i18n import _
-import json
+
+if TYPE_CHECKING:
+    from .core import QualityTools
 
 
 @dataclass
@@ -33,25 +42,233 @@ class Violation:
     suggestion: str
 
 
+# enforce_all 使用的外部工具，开始检查时即在后台并发启动
+ENFORCER_TOOLS = ("flake8", "bandit", "pytest")
+
+
+class PythonFileChecker:
+    """单文件AST检查（SOLID、DRY、KISS），无状态，可在子进程中执行"""
+
+    # 检查结果只取决于文件自身内容，导入的模块变化时无需重新检查
+    SCOPE = CheckerScope.LOCAL
+
+    # 结果缓存键：规则变化时需要提升版本号
+    CHECKER_ID = 'python_file'
+    VERSION = '1'
+
+    def check(self, file_path: Path, module: ParsedModule) -> List[Violation]:
+        """检查单个文件，按 SOLID、DRY、KISS 的顺序返回违规"""
+        violations: List[Violation] = []
+        violations.extend(self._check_solid_principles(file_path, module))
+        violations.extend(self._check_dry_principle(file_path, module))
+        violations.extend(self._check_kiss_principle(file_path, module))
+        return violations
+
+    def _check_solid_principles(self, file_path: Path, module: ParsedModule) -> List[Violation]:
+        """检查SOLID原则"""
+        violations = []
+        tree = module.tree
+        if tree is None:
+            return violations  # 跳过语法错误的文件
+
+        # 检查单一职责原则
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef):
+                methods = [n for n in node.body if isinstance(n, ast.FunctionDef)]
+                if len(methods) > 10:  # 简单的启发式规则
+                    violations.append(
+                        Violation(
+                            principle="solid_srp",
+                            severity="warning",
+                            file_path=str(file_path),
+                            line_number=node.lineno,
+                            description=f"类 {node.name} 可能违反单一职责原则 (方法数: {len(methods)})",
+                            suggestion="考虑将类拆分为更小的、职责单一的类",
+                        )
+                    )
+        return violations
+
+    def _check_dry_principle(self, file_path: Path, module: ParsedModule) -> List[Violation]:
+        """检查DRY原则"""
+        violations = []
+        line_counts = {}
+
+        for i, line in enumerate(module.lines, 1):
+            line = line.strip()
+            if line and not line.startswith('#') and len(line) > 20:
+                if line in line_counts:
+                    line_counts[line].append(i)
+                else:
+                    line_counts[line] = [i]
+
+        # 检查重复代码
+        for line, occurrences in line_counts.items():
+            if len(occurrences) >= 3:  # 出现3次以上认为是重复
+                violations.append(
+                    Violation(
+                        principle="dry",
+                        severity="warning",
+                        file_path=str(file_path),
+                        line_number=occurrences[0],
+                        description=f"检测到重复代码: '{line[:50]}...'",
+                        suggestion="考虑将重复代码提取为函数或常量",
+                    )
+                )
+        return violations
+
+    def _check_kiss_principle(self, file_path: Path, module: ParsedModule) -> List[Violation]:
+        """检查KISS原则"""
+        violations = []
+        tree = module.tree
+        if tree is None:
+            return violations
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.FunctionDef):
+                # 检查函数复杂度
+                complexity = self._calculate_complexity(node)
+                if complexity > 10:  # 圈复杂度阈值
+                    violations.append(
+                        Violation(
+                            principle="kiss",
+                            severity="warning",
+                            file_path=str(file_path),
+                            line_number=node.lineno,
+                            description=f"函数 {node.name} 复杂度过高 (复杂度: {complexity})",
+                            suggestion="考虑将函数拆分为更小的函数",
+                        )
+                    )
+        return violations
+
+    def _calculate_complexity(self, node: ast.FunctionDef) -> int:
+        """计算函数的圈复杂度"""
+        complexity = 1  # 基础复杂度
+
+        for child in ast.walk(node):
+            if isinstance(child, (ast.If, ast.While, ast.For, ast.AsyncFor)):
+                complexity += 1
+            elif isinstance(child, ast.ExceptHandler):
+                complexity += 1
+            elif isinstance(child, ast.BoolOp):
+                complexity += len(child.values) - 1
+
+        return complexity
+
+
+def check_python_files(file_paths: List[Path]) -> List[Violation]:
+    """按顺序检查一组Python文件（进程池任务入口，须为模块级函数以便序列化）"""
+    checker = PythonFileChecker()
+    module_cache = get_module_cache()
+    violations: List[Violation] = []
+
+    for file_path in file_paths:
+        try:
+            # 每个文件只读取、解析一次，三项检查共享同一份AST
+            module = module_cache.get(file_path)
+            if module is None:
+                print(f"无法分析文件 {file_path}: 文件不可读或不是UTF-8编码")
+                continue
+            violations.extend(checker.check(file_path, module))
+        except Exception as e:
+            print(f"无法分析文件 {file_path}: {e}")
+
+    return violations
+
+
 class CultureEnforcer:
     """文化原则强制执行器"""
 
-    def __init__(self, project_path: str = ".") -> None:
-        """内部方法： init"""
+    def __init__(
+        self, project_path: str = ".", jobs: int = 1, tools: Optional[ToolOrchestrator] = None
+    ) -> None:
+        """初始化文化原则强制执行器
+
+        Args:
+            project_path: 项目路径
+            jobs: 并行度。1 为串行执行；大于1时单文件检查分块交给进程池，
+                相互独立的检查阶段并发执行；小于等于0时使用全部CPU核心
+            tools: 共享的外部工具编排器；为空时每次 enforce_all 使用新的编排器
+        """
         self.project_path = Path(project_path)
+        self._shared_tools = tools
+        self.tools = tools or ToolOrchestrator(self.project_path)
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
         self.principles = AICulturePrinciples()
         self.violations: List[Violation] = []
+        self._target_files: Optional[Set[Path]] = None
+
+        # 所有检查共享的项目文件索引，每次 enforce_all 只遍历一次目录树
+        self.file_index = ProjectFileIndex(self.project_path)
+        self.module_cache = get_module_cache()
 
         # 初始化新的文化模块
         self.performance_manager = PerformanceBenchmarkManager(self.project_path)
         self.memory_detector = MemoryLeakDetector()
         self.observability_manager = ObservabilityManager("aiculture", "1.0.0")
-        self.data_governance = DataGovernanceManager(self.project_path)
-        self.accessibility_manager = AccessibilityCultureManager(self.project_path)
+        self.data_governance = DataGovernanceManager(self.project_path, file_index=self.file_index)
+        self.accessibility_manager = AccessibilityCultureManager(
+            self.project_path, file_index=self.file_index, jobs=self.jobs
+        )
 
-    def enforce_all(self) -> Dict[str, Any]:
-        """执行所有原则检查"""
+    def enforce_all(self, files: Optional[Iterable[Path]] = None) -> Dict[str, Any]:
+        """执行所有原则检查
+
+        Args:
+            files: 只对这些Python文件执行单文件检查（如git变更文件），
+                为空时检查全部文件；项目级检查不受影响
+
+        并行模式下，耗时且相互独立的阶段（bandit、pytest覆盖率、数据治理、
+        可访问性）先在后台线程中收集结果，再按固定阶段顺序写入违规列表，
+        因此违规顺序与串行执行完全一致。
+        """
         self.violations.clear()
+        self.file_index.refresh()
+        self._target_files = {Path(path) for path in files} if files is not None else None
+        # 在启动并发阶段之前完成目录遍历，各线程共享同一份索引
+        self.file_index.files
+
+        # 外部工具在后台并发执行，各阶段取结果时等待同一次执行
+        if self._shared_tools is None:
+            self.tools = ToolOrchestrator(self.project_path)
+        self.tools.submit(ENFORCER_TOOLS)
+
+        collectors: Dict[str, Callable[[], Any]] = {
+            "security": self._run_bandit,
+            "test_coverage": self._run_coverage,
+            "data_governance": self._scan_data_governance,
+            "accessibility": self._scan_accessibility,
+        }
+
+        if self.jobs > 1:
+            with ThreadPoolExecutor(max_workers=len(collectors)) as executor:
+                futures = {name: executor.submit(func) for name, func in collectors.items()}
+                self._run_phases(futures)
+        else:
+            self._run_phases(collectors)
+
+        return self._generate_report()
+
+    @property
+    def quality_tools(self) -> 'QualityTools':
+        """与本次检查共用外部工具编排器的 QualityTools，重复的工具只执行一次"""
+        from .core import QualityTools
+
+        return QualityTools(str(self.project_path), orchestrator=self.tools)
+
+    def close(self) -> None:
+        """关闭各检查模块打开的缓存"""
+        self.accessibility_manager.close()
+
+    def _run_phases(self, collected: Dict[str, Any]) -> None:
+        """按固定顺序执行各检查阶段
+
+        Args:
+            collected: 阶段名到结果获取方式的映射，可以是 Future 或普通函数
+        """
+
+        def result_of(name: str) -> Any:
+            source = collected[name]
+            return source.result() if isinstance(source, Future) else source()
 
         # 检查项目结构
         self._check_project_structure()
@@ -60,10 +277,10 @@ class CultureEnforcer:
         self._check_code_quality()
 
         # 检查安全问题
-        self._check_security()
+        self._report_security(result_of("security"))
 
         # 检查测试覆盖率
-        self._check_test_coverage()
+        self._report_test_coverage(result_of("test_coverage"))
 
         # 检查文档完整性
         self._check_documentation()
@@ -75,12 +292,10 @@ class CultureEnforcer:
         self._check_observability()
 
         # 检查数据治理
-        self._check_data_governance()
+        self._report_data_governance(result_of("data_governance"))
 
         # 检查可访问性
-        self._check_accessibility()
-
-        return self._generate_report()
+        self._report_accessibility(result_of("accessibility"))
 
     def _check_project_structure(self) -> Any:
         """检查项目结构是否符合标准"""
@@ -117,185 +332,62 @@ class CultureEnforcer:
                 )
             )
 
-    def _check_code_quality(self) -> Any:
-        """检查代码质量原则"""
-        python_files = list(self.project_path.rglob("*.py"))
-
-        for file_path in python_files:
-            if "venv" in str(file_path) or ".git" in str(file_path):
-                continue
-
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                # 检查SOLID原则
-                self._check_solid_principles(file_path, content)
-
-                # 检查DRY原则
-                self._check_dry_principle(file_path, content)
-
-                # 检查KISS原则
-                self._check_kiss_principle(file_path, content)
-
-            except Exception as e:
-                print(f"无法分析文件 {file_path}: {e}")
-
-    def _check_solid_principles(self, file_path: Path, content: str) -> Any:
-        """检查SOLID原则"""
-        try:
-            tree = ast.parse(content)
-
-            # 检查单一职责原则
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    methods = [n for n in node.body if isinstance(n, ast.FunctionDef)]
-                    if len(methods) > 10:  # 简单的启发式规则
-                        self.violations.append(
-                            Violation(
-                                principle="solid_srp",
-                                severity="warning",
-                                file_path=str(file_path),
-                                line_number=node.lineno,
-                                description=f"类 {node.name} 可能违反单一职责原则 (方法数: {len(methods)})",
-                                suggestion="考虑将类拆分为更小的、职责单一的类",
-                            )
-                        )
-
-        except SyntaxError:
-            pass  # 跳过语法错误的文件
-
-    def _check_dry_principle(self, file_path: Path, content: str) -> Any:
-        """检查DRY原则"""
-        lines = content.split('\n')
-        line_counts = {}
-
-        for i, line in enumerate(lines, 1):
-            line = line.strip()
-            if line and not line.startswith('#') and len(line) > 20:
-                if line in line_counts:
-                    line_counts[line].append(i)
-                else:
-                    line_counts[line] = [i]
-
-        # 检查重复代码
-        for line, occurrences in line_counts.items():
-            if len(occurrences) >= 3:  # 出现3次以上认为是重复
-                self.violations.append(
-                    Violation(
-                        principle="dry",
-                        severity="warning",
-                        file_path=str(file_path),
-                        line_number=occurrences[0],
-                        description=f"检测到重复代码: '{line[:50]}...'",
-                        suggestion="考虑将重复代码提取为函数或常量",
-                    )
-                )
-
-    def _check_kiss_principle(self, file_path: Path, content: str) -> Any:
-        """检查KISS原则"""
-        try:
-            tree = ast.parse(content)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    # 检查函数复杂度
-                    complexity = self._calculate_complexity(node)
-                    if complexity > 10:  # 圈复杂度阈值
-                        self.violations.append(
-                            Violation(
-                                principle="kiss",
-                                severity="warning",
-                                file_path=str(file_path),
-                                line_number=node.lineno,
-                                description=f"函数 {node.name} 复杂度过高 (复杂度: {complexity})",
-                                suggestion="考虑将函数拆分为更小的函数",
-                            )
-                        )
-
-        except SyntaxError:
-            pass
-
-    def _calculate_complexity(self, node: ast.FunctionDef) -> int:
-        """计算函数的圈复杂度"""
-        complexity = 1  # 基础复杂度
-
-        for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.While, ast.For, ast.AsyncFor)):
-                complexity += 1
-            elif isinstance(child, ast.ExceptHandler):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp):
-                complexity += len(child.values) - 1
-
-        return complexity
-
     def _check_security(self) -> Any:
         """检查安全问题"""
-        try:
-            # 使用bandit进行安全检查
-            result = subprocess.run(
-                ["bandit", "-r", str(self.project_path), "-", "json"],
-                capture_output=True,
-                text=True,
-            )
+        self._report_security(self._run_bandit())
 
-            if result.returncode == 0:
-                import json
+    def _run_bandit(self) -> ToolResult:
+        """获取bandit结果（不修改违规列表，可并发执行）"""
+        return self.tools.run(["bandit"])["bandit"]
 
-                bandit_results = json.loads(result.stdout)
-
-                for issue in bandit_results.get('results', []):
-                    self.violations.append(
-                        Violation(
-                            principle="security",
-                            severity=issue['issue_severity'].lower(),
-                            file_path=issue['filename'],
-                            line_number=issue['line_number'],
-                            description=issue['issue_text'],
-                            suggestion=f"查看bandit文档: {issue['test_id']}",
-                        )
-                    )
+    def _report_security(self, bandit_result: Optional[ToolResult]) -> None:
+        """将bandit结果转换为违规记录"""
+        if bandit_result is None:
+            return
 
-        except FileNotFoundError:
-            # bandit未安装
-            pass
-        except Exception:
-            # 其他错误
-            pass
+        for issue in bandit_result.violations:
+            self.violations.append(
+                Violation(
+                    principle="security",
+                    severity=issue.severity,
+                    file_path=issue.file_path,
+                    line_number=issue.line_number,
+                    description=issue.message,
+                    suggestion=f"查看bandit文档: {issue.code}",
+                )
+            )
 
     def _check_test_coverage(self) -> Any:
         """检查测试覆盖率"""
-        try:
-            # 运行pytest获取覆盖率
-            result = subprocess.run(
-                ["pytest", "--cov=.", "--cov-report=json", "--quiet"],
-                cwd=self.project_path,
-                capture_output=True,
-                text=True,
-            )
-
-            coverage_file = self.project_path / "coverage.json"
-            if coverage_file.exists():
+        self._report_test_coverage(self._run_coverage())
 
-                with open(coverage_file) as f:
-                    coverage_data = json.load(f)
+    def _run_coverage(self) -> Optional[float]:
+        """运行pytest获取总覆盖率（不修改违规列表，可并发执行）"""
+        result = self.tools.run(["pytest"])["pytest"]
+        if not result.available or result.timed_out:
+            return None
 
-                total_coverage = coverage_data['totals']['percent_covered']
-                if total_coverage < 80:
-                    self.violations.append(
-                        Violation(
-                            principle="testing",
-                            severity="warning",
-                            file_path="overall",
-                            line_number=0,
-                            description=f"测试覆盖率不足: {total_coverage:.1f}%",
-                            suggestion="添加更多测试用例以达到80%覆盖率",
-                        )
-                    )
-
-        except (FileNotFoundError, subprocess.CalledProcessError):
-            pass
+        coverage_file = self.project_path / "coverage.json"
+        try:
+            with open(coverage_file) as f:
+                coverage_data = json.load(f)
+            return coverage_data['totals']['percent_covered']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _report_test_coverage(self, total_coverage: Optional[float]) -> None:
+        """根据总覆盖率生成违规记录"""
+        if total_coverage is not None and total_coverage < 80:
+            self.violations.append(
+                Violation(
+                    principle="testing",
+                    severity="warning",
+                    file_path="overall",
+                    line_number=0,
+                    description=f"测试覆盖率不足: {total_coverage:.1f}%",
+                    suggestion="添加更多测试用例以达到80%覆盖率",
+                )
+            )
 
     def _check_documentation(self) -> Any:
         """检查文档完整性"""
@@ -406,14 +498,8 @@ class CultureEnforcer:
 
     def _scan_python_files(self) -> Any:
         """扫描Python文件"""
-        for py_file in self.project_path.rglob("*.py"):
-            # 跳过虚拟环境和隐藏目录
-            if any(
-                part.startswith(".") or part in ["venv", "__pycache__", "build", "dist"]
-                for part in py_file.parts
-            ):
-                continue
-            yield py_file
+        # 虚拟环境、隐藏目录和构建产物已由文件索引统一过滤
+        yield from self.file_index.python_files()
 
     def _check_file_structure(self) -> None:
         """检查文件结构"""
@@ -466,24 +552,36 @@ class CultureEnforcer:
     def _check_code_quality(self) -> None:
         """检查代码质量"""
 
-        # 运行flake8检查
-        try:
-            result = subprocess.run(
-                ["flake8", str(self.project_path)],
-                capture_output=True,
-                text=True,
-                timeout=30,
+        # 单文件AST检查（SOLID、DRY、KISS）
+        self.violations.extend(self._check_python_files())
+
+        # flake8检查（外部工具结果汇总为一条违规，详细问题见 quality check）
+        result = self.tools.run(["flake8"])["flake8"]
+        if result.available and not result.timed_out and result.returncode != 0:
+            first = result.violations[0] if result.violations else None
+            self._add_violation(
+                principle="code_quality",
+                severity="warning",
+                message=f"代码质量检查发现 {len(result.violations)} 个问题",
+                file_path=first.file_path if first else "",
+                line_number=first.line_number if first else 0,
+                suggestion="运行 flake8 查看详细信息",
             )
-            if result.returncode != 0:
-                self._add_violation(
-                    principle="code_quality",
-                    severity="warning",
-                    message="代码质量检查发现问题",
-                    suggestion="运行 flake8 查看详细信息",
-                )
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            # flake8未安装或超时，跳过检查
-            pass
+
+    def _check_python_files(self) -> List[Violation]:
+        """对所有Python文件执行单文件检查
+
+        并行模式下文件分批交给进程池，各批次结果按提交顺序返回，
+        结果顺序与串行执行一致。
+        """
+        file_paths = list(self._scan_python_files())
+        if self._target_files is not None:
+            file_paths = [path for path in file_paths if path in self._target_files]
+
+        violations: List[Violation] = []
+        for batch_violations in map_batches(check_python_files, file_paths, self.jobs, '检查'):
+            violations.extend(batch_violations)
+        return violations
 
     def _check_performance_culture(self) -> None:
         """检查性能文化"""
@@ -515,7 +613,7 @@ class CultureEnforcer:
         """检查可观测性"""
         try:
             # 检查日志配置
-            log_files = list(self.project_path.rglob("*.log"))
+            log_files = self.file_index.files_with_suffix(".log")
             if not log_files and not (self.project_path / ".aiculture" / "observability").exists():
                 self._add_violation(
                     principle="observability",
@@ -543,12 +641,24 @@ class CultureEnforcer:
 
     def _check_data_governance(self) -> None:
         """检查数据治理"""
+        self._report_data_governance(self._scan_data_governance())
+
+    def _scan_data_governance(self) -> Optional[Dict[str, Any]]:
+        """扫描隐私问题（不修改违规列表，可并发执行）"""
         try:
-            # 扫描隐私问题
-            privacy_scan = self.data_governance.scan_project_for_privacy_issues()
+            return self.data_governance.scan_project_for_privacy_issues(jobs=self.jobs)
+        except Exception as e:
+            print(f"数据治理检查错误: {e}")
+            return None
+
+    def _report_data_governance(self, privacy_scan: Optional[Dict[str, Any]]) -> None:
+        """根据隐私扫描结果生成违规记录"""
+        if privacy_scan is None:
+            return
 
+        try:
             if privacy_scan['total_findings'] > 0:
-                high_risk = len(privacy_scan['by_severity']['high'])
+                high_risk = privacy_scan['severity_counts']['high']
                 if high_risk > 0:
                     self._add_violation(
                         principle="data_governance",
@@ -557,7 +667,7 @@ class CultureEnforcer:
                         suggestion="移除代码中的硬编码个人信息",
                     )
 
-                medium_risk = len(privacy_scan['by_severity']['medium'])
+                medium_risk = privacy_scan['severity_counts']['medium']
                 if medium_risk > 0:
                     self._add_violation(
                         principle="data_governance",
@@ -579,10 +689,22 @@ class CultureEnforcer:
 
     def _check_accessibility(self) -> None:
         """检查可访问性"""
+        self._report_accessibility(self._scan_accessibility())
+
+    def _scan_accessibility(self) -> Optional[Dict[str, Any]]:
+        """扫描可访问性问题（不修改违规列表，可并发执行）"""
         try:
-            # 扫描可访问性问题
-            accessibility_report = self.accessibility_manager.generate_comprehensive_report()
+            return self.accessibility_manager.generate_comprehensive_report()
+        except Exception as e:
+            print(f"可访问性检查错误: {e}")
+            return None
 
+    def _report_accessibility(self, accessibility_report: Optional[Dict[str, Any]]) -> None:
+        """根据可访问性报告生成违规记录"""
+        if accessibility_report is None:
+            return
+
+        try:
             total_issues = accessibility_report['total_issues']
             if total_issues > 0:
                 accessibility_issues = accessibility_report['accessibility']['by_severity']
@@ -616,7 +738,10 @@ class CultureEnforcer:
             print(f"可访问性检查错误: {e}")
 
 
-def enforce_culture_in_project(project_path: str = ".") -> Dict[str, Any]:
+def enforce_culture_in_project(project_path: str = ".", jobs: int = 1) -> Dict[str, Any]:
     """在项目中强制执行文化原则"""
-    enforcer = CultureEnforcer(project_path)
-    return enforcer.enforce_all()
+    enforcer = CultureEnforcer(project_path, jobs=jobs)
+    try:
+        return enforcer.enforce_all()
+    finally:
+        enforcer.close()
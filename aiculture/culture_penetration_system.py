@@ -18,6 +18,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
+from .source_cache import ParsedModule, get_module_cache
+
 
 class CultureViolationSeverity(Enum):
     """文化违规严重程度"""
@@ -88,6 +90,9 @@ class RealTimeCultureMonitor:
         # 文件修改时间缓存
         self.file_mtimes = {}
 
+        # 源码/AST缓存，同一文件的多项检查共享一次解析
+        self.module_cache = get_module_cache()
+
     def add_violation_callback(self, callback: Callable[[CultureViolation], None]) -> None:
         """添加违规回调函数"""
         self.callbacks.append(callback)
@@ -176,25 +181,22 @@ class RealTimeCultureMonitor:
         violations = []
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            lines = content.split('\n')
+            module = self.module_cache.get(file_path)
+            if module is None:
+                raise OSError("文件不可读或不是UTF-8编码")
 
             # 检查各种文化违规
-            violations.extend(self._check_test_culture(file_path, content, lines))
-            violations.extend(self._check_documentation_culture(file_path, content, lines))
-            violations.extend(self._check_security_culture(file_path, content, lines))
-            violations.extend(self._check_code_quality_culture(file_path, content, lines))
+            violations.extend(self._check_test_culture(file_path, module))
+            violations.extend(self._check_documentation_culture(file_path, module))
+            violations.extend(self._check_security_culture(file_path, module))
+            violations.extend(self._check_code_quality_culture(file_path, module))
 
         except Exception as e:
             print(f"检查文件 {file_path} 时出错: {e}")
 
         return violations
 
-    def _check_test_culture(
-        self, file_path: Path, content: str, lines: List[str]
-    ) -> List[CultureViolation]:
+    def _check_test_culture(self, file_path: Path, module: ParsedModule) -> List[CultureViolation]:
         """检查测试文化"""
         violations = []
 
@@ -220,40 +222,32 @@ class RealTimeCultureMonitor:
         return violations
 
     def _check_documentation_culture(
-        self, file_path: Path, content: str, lines: List[str]
+        self, file_path: Path, module: ParsedModule
     ) -> List[CultureViolation]:
         """检查文档文化"""
         violations = []
 
-        if file_path.suffix == '.py':
+        if file_path.suffix == '.py' and module.tree is not None:
             # 检查类和函数是否有文档字符串
-            import ast
-
-            try:
-                tree = ast.parse(content)
-                for node in ast.walk(tree):
-                    if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
-                        if not ast.get_docstring(node):
-                            violations.append(
-                                CultureViolation(
-                                    principle="documentation",
-                                    severity=CultureViolationSeverity.WARNING,
-                                    message=f"{type(node).__name__} '{node.name}' 缺少文档字符串",
-                                    file_path=str(file_path),
-                                    line_number=node.lineno,
-                                    suggestion="添加描述性的文档字符串",
-                                    auto_fixable=True,
-                                    fix_command="# 可以使用自动文档生成工具",
-                                )
+            for node in ast.walk(module.tree):
+                if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+                    if not ast.get_docstring(node):
+                        violations.append(
+                            CultureViolation(
+                                principle="documentation",
+                                severity=CultureViolationSeverity.WARNING,
+                                message=f"{type(node).__name__} '{node.name}' 缺少文档字符串",
+                                file_path=str(file_path),
+                                line_number=node.lineno,
+                                suggestion="添加描述性的文档字符串",
+                                auto_fixable=True,
+                                fix_command="# 可以使用自动文档生成工具",
                             )
-            except SyntaxError:
-                pass
+                        )
 
         return violations
 
-    def _check_security_culture(
-        self, file_path: Path, content: str, lines: List[str]
-    ) -> List[CultureViolation]:
+    def _check_security_culture(self, file_path: Path, module: ParsedModule) -> List[CultureViolation]:
         """检查安全文化"""
         violations = []
 
@@ -266,7 +260,7 @@ class RealTimeCultureMonitor:
             r'token\s*=\s*["\'][^"\']+["\']',
         ]
 
-        for line_num, line in enumerate(lines, 1):
+        for line_num, line in enumerate(module.lines, 1):
             for pattern in password_patterns:
                 if re.search(pattern, line, re.IGNORECASE):
                     violations.append(
@@ -284,33 +278,29 @@ class RealTimeCultureMonitor:
         return violations
 
     def _check_code_quality_culture(
-        self, file_path: Path, content: str, lines: List[str]
+        self, file_path: Path, module: ParsedModule
     ) -> List[CultureViolation]:
         """检查代码质量文化"""
         violations = []
 
         # 检查函数长度
-        if file_path.suffix == '.py':
-            try:
-                tree = ast.parse(content)
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        if hasattr(node, 'end_lineno') and node.end_lineno:
-                            func_lines = node.end_lineno - node.lineno + 1
-                            if func_lines > 50:
-                                violations.append(
-                                    CultureViolation(
-                                        principle="code_quality",
-                                        severity=CultureViolationSeverity.WARNING,
-                                        message=f"函数 '{node.name}' 过长 ({func_lines} 行)",
-                                        file_path=str(file_path),
-                                        line_number=node.lineno,
-                                        suggestion="考虑将大函数拆分为多个小函数",
-                                        auto_fixable=False,
-                                    )
+        if file_path.suffix == '.py' and module.tree is not None:
+            for node in ast.walk(module.tree):
+                if isinstance(node, ast.FunctionDef):
+                    if hasattr(node, 'end_lineno') and node.end_lineno:
+                        func_lines = node.end_lineno - node.lineno + 1
+                        if func_lines > 50:
+                            violations.append(
+                                CultureViolation(
+                                    principle="code_quality",
+                                    severity=CultureViolationSeverity.WARNING,
+                                    message=f"函数 '{node.name}' 过长 ({func_lines} 行)",
+                                    file_path=str(file_path),
+                                    line_number=node.lineno,
+                                    suggestion="考虑将大函数拆分为多个小函数",
+                                    auto_fixable=False,
                                 )
-            except SyntaxError:
-                pass
+                            )
 
         return violations
 
@@ -478,7 +468,10 @@ class AIDevCultureAssistant:
         from .culture_enforcer import CultureEnforcer
 
         enforcer = CultureEnforcer(str(self.project_path))
-        result = enforcer.enforce_all()
+        try:
+            result = enforcer.enforce_all()
+        finally:
+            enforcer.close()
 
         # 转换为违规对象
         violations = []
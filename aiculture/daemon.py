@@ -0,0 +1,337 @@
+"""
+AICulture 守护进程 - 常驻内存的检查服务
+
+守护进程常驻保存项目文件索引、源码/AST缓存、SmartCacheManager
+以及 CultureEnforcer（含已加载的 AICulturePrinciples），
+通过 Unix 域套接字提供基于行的 JSON 协议：
+
+    请求:  {"command": "check", "files": ["/abs/path/a.py"]}\n
+    响应:  {"ok": true, "result": {...}}\n
+
+支持的命令：ping、check、enforce、stats、shutdown。
+"""
+
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# 客户端等待守护进程响应的默认超时（秒）
+DEFAULT_CLIENT_TIMEOUT = 30.0
+
+# 单个请求/响应的最大字节数
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+
+def unix_sockets_supported() -> bool:
+    """当前平台是否支持 Unix 域套接字"""
+    return hasattr(socket, 'AF_UNIX')
+
+
+def socket_path_for(project_path: Path) -> Path:
+    """项目对应的套接字路径
+
+    放在临时目录而不是项目目录中，避免超出 Unix 套接字路径长度限制（约108字节）。
+    """
+    resolved = str(Path(project_path).resolve())
+    digest = hashlib.sha1(resolved.encode('utf-8')).hexdigest()[:12]
+    uid = os.getuid() if hasattr(os, 'getuid') else 0
+    return Path(tempfile.gettempdir()) / f'aiculture-{uid}-{digest}.sock'
+
+
+class CheckService:
+    """检查服务：持有常驻状态，可在守护进程中或直接在进程内使用"""
+
+    def __init__(self, project_path: Path) -> None:
+        """初始化检查服务"""
+        # 检查相关模块只在服务端加载，客户端（aiculture check）只需套接字通信
+        from .cache_manager import CheckerSignature, SmartCacheManager
+        from .culture_enforcer import CultureEnforcer, PythonFileChecker
+        from .source_cache import get_module_cache
+
+        self.project_path = Path(project_path).resolve()
+        self.enforcer = CultureEnforcer(str(self.project_path))
+        self.file_index = self.enforcer.file_index
+        self.module_cache = get_module_cache()
+        self.cache_manager = SmartCacheManager(self.project_path, file_index=self.file_index)
+        self.checker = PythonFileChecker()
+        self.signature = CheckerSignature(PythonFileChecker.CHECKER_ID, PythonFileChecker.VERSION)
+        self.started_at = time.time()
+        self.requests_served = 0
+
+    def check(self, files: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """对指定Python文件执行单文件检查，未指定时检查全部文件
+
+        已缓存且内容未变化的文件直接返回缓存结果。缓存按内容哈希共用，
+        记录中不含文件路径，读取时补上当前文件的路径。相对路径按项目路径解析。
+        """
+        if files:
+            file_paths = []
+            for name in files:
+                path = Path(name)
+                if not path.is_absolute():
+                    path = self.project_path / path
+                try:
+                    path.relative_to(self.project_path)
+                except ValueError:
+                    continue
+                if path.suffix == '.py' and path.is_file():
+                    file_paths.append(path)
+        else:
+            self.file_index.refresh()
+            file_paths = self.file_index.python_files()
+
+        cached = self.cache_manager.get_valid_cached_violations(file_paths, self.signature)
+        fresh: Dict[Path, list] = {}
+        for file_path in file_paths:
+            if file_path in cached:
+                continue
+            module = self.module_cache.get(file_path)
+            if module is None:
+                continue
+            fresh[file_path] = [asdict(v) for v in self.checker.check(file_path, module)]
+
+        if fresh:
+            records = {
+                file_path: [
+                    {key: value for key, value in violation.items() if key != 'file_path'}
+                    for violation in items
+                ]
+                for file_path, items in fresh.items()
+            }
+            self.cache_manager.cache_many_violations(records, self.signature)
+            self.cache_manager.save_cache()
+
+        violations: List[Dict[str, Any]] = []
+        for file_path in file_paths:
+            if file_path in fresh:
+                violations.extend(fresh[file_path])
+            else:
+                violations.extend(
+                    dict(record, file_path=str(file_path)) for record in cached.get(file_path, [])
+                )
+
+        return {
+            'files_checked': len(file_paths),
+            'cache_hits': len(cached),
+            'violations': violations,
+        }
+
+    def enforce(self, jobs: int = 1) -> Dict[str, Any]:
+        """执行完整的文化原则检查（复用常驻的 CultureEnforcer）"""
+        self.enforcer.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        report = self.enforcer.enforce_all()
+        report = dict(report)
+        report['violations'] = [asdict(v) for v in report['violations']]
+        report['by_principle'] = {
+            principle: [asdict(v) for v in items]
+            for principle, items in report['by_principle'].items()
+        }
+        return report
+
+    def stats(self) -> Dict[str, Any]:
+        """守护进程运行状态"""
+        return {
+            'project_path': str(self.project_path),
+            'pid': os.getpid(),
+            'uptime_seconds': time.time() - self.started_at,
+            'requests_served': self.requests_served,
+            'module_cache': self.module_cache.get_stats(),
+            'principles_loaded': len(self.enforcer.principles.principles),
+        }
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """处理一个协议请求"""
+        command = request.get('command')
+        self.requests_served += 1
+
+        if command == 'ping':
+            return {'ok': True, 'result': 'pong'}
+        if command == 'check':
+            return {'ok': True, 'result': self.check(request.get('files'))}
+        if command == 'enforce':
+            return {'ok': True, 'result': self.enforce(int(request.get('jobs', 1)))}
+        if command == 'stats':
+            return {'ok': True, 'result': self.stats()}
+        return {'ok': False, 'error': f'未知命令: {command}'}
+
+    def close(self) -> None:
+        """释放资源"""
+        self.cache_manager.close()
+        self.enforcer.close()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """每个连接读取一行JSON请求并返回一行JSON响应"""
+
+    def handle(self) -> None:
+        line = self.rfile.readline(MAX_MESSAGE_BYTES)
+        if not line:
+            return
+
+        server: 'CultureDaemon' = self.server.daemon  # type: ignore[attr-defined]
+        try:
+            request = json.loads(line.decode('utf-8'))
+            if request.get('command') == 'shutdown':
+                response = {'ok': True, 'result': 'stopping'}
+                threading.Thread(target=server.stop, daemon=True).start()
+            else:
+                # 常驻状态不是线程安全的，请求串行处理
+                with server.lock:
+                    response = server.service.handle(request)
+        except Exception as e:
+            response = {'ok': False, 'error': str(e)}
+
+        self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+
+
+class CultureDaemon:
+    """AICulture 守护进程"""
+
+    def __init__(self, project_path: Path, socket_path: Optional[Path] = None) -> None:
+        """初始化守护进程
+
+        Args:
+            project_path: 项目路径
+            socket_path: 套接字路径，默认由项目路径计算
+        """
+        self.project_path = Path(project_path).resolve()
+        self.socket_path = socket_path or socket_path_for(self.project_path)
+        self.service = CheckService(self.project_path)
+        self.lock = threading.Lock()
+        self._server: Optional[socketserver.ThreadingUnixStreamServer] = None
+
+    def serve_forever(self) -> None:
+        """绑定套接字并处理请求，直到收到 shutdown 或调用 stop()"""
+        if not unix_sockets_supported():
+            raise RuntimeError("当前平台不支持Unix域套接字")
+
+        client = DaemonClient(self.project_path, self.socket_path)
+        if client.is_running():
+            raise RuntimeError(f"守护进程已在运行: {self.socket_path}")
+        if self.socket_path.exists():
+            # 上次异常退出留下的套接字文件
+            self.socket_path.unlink()
+
+        self._server = socketserver.ThreadingUnixStreamServer(
+            str(self.socket_path), _RequestHandler
+        )
+        self._server.daemon_threads = True
+        self._server.daemon = self  # type: ignore[attr-defined]
+        os.chmod(self.socket_path, 0o600)
+
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self.service.close()
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+
+    def stop(self) -> None:
+        """停止处理请求"""
+        if self._server is not None:
+            self._server.shutdown()
+
+
+class DaemonClient:
+    """守护进程客户端"""
+
+    def __init__(
+        self,
+        project_path: Path,
+        socket_path: Optional[Path] = None,
+        timeout: float = DEFAULT_CLIENT_TIMEOUT,
+    ) -> None:
+        """初始化客户端"""
+        self.project_path = Path(project_path).resolve()
+        self.socket_path = socket_path or socket_path_for(self.project_path)
+        self.timeout = timeout
+
+    def is_running(self) -> bool:
+        """守护进程是否在运行（能否成功响应 ping）"""
+        if not unix_sockets_supported() or not self.socket_path.exists():
+            return False
+        try:
+            return self.request('ping').get('ok', False)
+        except (OSError, ValueError):
+            return False
+
+    def request(self, command: str, **params: Any) -> Dict[str, Any]:
+        """发送请求并返回响应
+
+        Raises:
+            OSError: 无法连接守护进程
+            ValueError: 响应不是合法的JSON
+        """
+        payload = json.dumps({'command': command, **params}, ensure_ascii=False)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(str(self.socket_path))
+            sock.sendall(payload.encode('utf-8') + b'\n')
+            with sock.makefile('rb') as reader:
+                line = reader.readline(MAX_MESSAGE_BYTES)
+        if not line:
+            raise ValueError("守护进程未返回响应")
+        return json.loads(line.decode('utf-8'))
+
+
+def _absolute_files(files: Optional[List[str]]) -> List[str]:
+    """按客户端的当前工作目录解析文件路径（守护进程的工作目录与客户端无关）"""
+    return [str(Path(name).resolve()) for name in files or []]
+
+
+def _request_check(
+    project_path: Path, files: Optional[List[str]] = None
+) -> Optional[Dict[str, Any]]:
+    """守护进程运行时交给它执行单文件检查，未运行或请求失败时返回 None
+
+    Args:
+        project_path: 项目路径
+        files: 需要检查的文件（相对路径按当前工作目录解析），为空时检查全部文件
+    """
+    client = DaemonClient(project_path)
+    if not client.is_running():
+        return None
+    try:
+        response = client.request('check', files=_absolute_files(files))
+    except (OSError, ValueError):
+        return None
+    if not response.get('ok'):
+        return None
+    result = response['result']
+    result['served_by'] = 'daemon'
+    return result
+
+
+def check_files(project_path: Path, files: Optional[List[str]] = None) -> Dict[str, Any]:
+    """执行单文件检查：守护进程运行时交给它处理，否则在当前进程内执行
+
+    Args:
+        project_path: 项目路径
+        files: 需要检查的文件（相对路径按当前工作目录解析），为空时检查全部文件
+
+    Returns:
+        检查结果，``served_by`` 标明由守护进程还是本进程完成
+    """
+    result = _request_check(project_path, files)
+    if result is not None:
+        return result
+
+    files = _absolute_files(files)
+    service = CheckService(project_path)
+    try:
+        result = service.check(files)
+    finally:
+        service.close()
+    result['served_by'] = 'local'
+    return result
@@ -4,14 +4,31 @@
 """
 
 import json
+import os
+import re
 import time
+import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Optional, Any, Set, Tuple
 from enum import Enum
 
 from .i18n import _
 
+# 倒排索引的分词规则（小写后按连续的字母、数字、下划线切分，中文连续字符为一个词）
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# 操作日志达到该条数（且不少于资产与血缘总数）时压缩进快照文件，
+# 快照的写入成本分摊到每次修改上为常数
+COMPACTION_MIN_OPS = 1000
+
+# 搜索结果排序权重
+NAME_EXACT_WEIGHT = 8
+NAME_MATCH_WEIGHT = 4
+TAG_MATCH_WEIGHT = 2
+DESCRIPTION_MATCH_WEIGHT = 1
+
 
 class DataAssetType(Enum):
     """数据资产类型"""
@@ -54,6 +71,7 @@ class DataLineage:
     transformation: str
     created_at: float
     metadata: Dict[str, Any]
+    id: str = ''
 
 
 @dataclass
@@ -90,43 +108,160 @@ class DataAsset:
     metadata: Dict[str, Any]
 
 
+# 资产加入索引时的 (词, 类型, 分类, 标签)，用于移出索引
+_IndexedKeys = Tuple[Set[str], DataAssetType, DataClassification, Set[str]]
+
+
+def _tokenize(text: str) -> Set[str]:
+    return set(TOKEN_PATTERN.findall(text.lower()))
+
+
 class DataCatalog:
-    """数据目录"""
+    """数据目录
+
+    名称、描述和标签的词建立倒排索引，资产类型、分类和标签另有分面索引，
+    均在 ``add_asset`` / ``update_asset`` / ``remove_asset`` 时维护。
+    直接修改资产对象的属性不会更新索引，应通过目录方法修改。
+
+    每次修改只向操作日志 ``data_catalog.log`` 追加一行，日志足够长时才压缩进
+    快照文件（``data_catalog.json`` / ``data_lineage.json``）；加载时先读取快照，
+    再重放快照之后的日志。``bulk()`` 内的修改在退出时一次性写入。
+
+    每条血缘只保存一份（``data_lineage.json``），资产中按ID引用；按源资产和
+    目标资产建立索引，查询成本与相关血缘数量成正比。
+    """
 
     def __init__(self, catalog_dir: Path):
         """__init__函数"""
         self.catalog_dir = catalog_dir
         self.catalog_file = catalog_dir / "data_catalog.json"
         self.lineage_file = catalog_dir / "data_lineage.json"
+        self.log_file = catalog_dir / "data_catalog.log"
 
         # 确保目录存在
         catalog_dir.mkdir(parents=True, exist_ok=True)
 
         # 加载现有数据
         self.assets: Dict[str, DataAsset] = {}
-        self.lineages: List[DataLineage] = []
+
+        # 血缘：ID -> 血缘（按添加顺序），资产ID -> 以其为源/目标的血缘ID（有序集合）
+        self._lineages: Dict[str, DataLineage] = {}
+        self._lineage_positions: Dict[str, int] = {}
+        self._next_lineage_position = 0
+        self._lineages_by_source: Dict[str, Dict[str, None]] = {}
+        self._lineages_by_target: Dict[str, Dict[str, None]] = {}
+
+        # 搜索索引：词 -> 资产ID，分面值 -> 资产ID，资产ID -> 目录中的位置
+        self._token_index: Dict[str, Set[str]] = {}
+        self._type_index: Dict[DataAssetType, Set[str]] = {}
+        self._classification_index: Dict[DataClassification, Set[str]] = {}
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._indexed_keys: Dict[str, _IndexedKeys] = {}
+        self._positions: Dict[str, int] = {}
+        self._next_position = 0
+
+        # 操作日志：最后一条操作的序号、日志中的操作数、bulk() 中待写入的操作
+        self._seq = 0
+        self._log_ops = 0
+        self._bulk_depth = 0
+        self._pending_ops: List[str] = []
+
         self._load_catalog()
 
     def _load_catalog(self) -> None:
-        """加载数据目录"""
-        try:
-            if self.catalog_file.exists():
-                with open(self.catalog_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    for asset_data in data.get('assets', []):
-                        asset = self._dict_to_asset(asset_data)
-                        self.assets[asset.id] = asset
+        """加载数据目录：读取快照，再重放快照之后的操作日志
 
+        血缘先于资产加载，资产中的血缘ID据此解析。
+        """
+        asset_seq = lineage_seq = 0
+        legacy_lineages = False
+        try:
             if self.lineage_file.exists():
                 with open(self.lineage_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
+                    lineage_seq = data.get('last_seq', 0)
                     for lineage_data in data.get('lineages', []):
-                        lineage = DataLineage(**lineage_data)
-                        self.lineages.append(lineage)
+                        legacy_lineages = legacy_lineages or not lineage_data.get('id')
+                        self._index_lineage(self._dict_to_lineage(lineage_data))
+
+            if self.catalog_file.exists():
+                with open(self.catalog_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    asset_seq = data.get('last_seq', 0)
+                    for asset_data in data.get('assets', []):
+                        self._put_asset(self._dict_to_asset(asset_data))
 
         except Exception as e:
             print(f"Warning: Failed to load data catalog: {e}")
 
+        self._seq = max(asset_seq, lineage_seq)
+        self._replay_log(asset_seq, lineage_seq)
+
+        if legacy_lineages:
+            # 立即保存新分配的血缘ID，之后的日志才能按ID引用
+            self._save_catalog()
+
+    @property
+    def lineages(self) -> List[DataLineage]:
+        """全部血缘（按添加顺序）"""
+        return list(self._lineages.values())
+
+    @staticmethod
+    def _dict_to_lineage(data: Dict[str, Any]) -> DataLineage:
+        """将字典转换为血缘对象（旧格式没有ID时补充）"""
+        lineage = DataLineage(**data)
+        if not lineage.id:
+            lineage.id = uuid.uuid4().hex
+        return lineage
+
+    def _replay_log(self, asset_seq: int, lineage_seq: int) -> None:
+        """重放操作日志
+
+        两个快照文件分别记录写入时的最后序号，压缩过程中崩溃时已写入快照的
+        操作会被跳过；末尾不完整的一行（写入时崩溃）被忽略。
+        """
+        if not self.log_file.exists():
+            return
+        torn = False
+        try:
+            with open(self.log_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        op = json.loads(line)
+                    except json.JSONDecodeError:
+                        torn = True
+                        break
+                    self._log_ops += 1
+                    self._seq = max(self._seq, op['seq'])
+                    self._apply_op(op, op['seq'] > asset_seq, op['seq'] > lineage_seq)
+        except Exception as e:
+            print(f"Warning: Failed to replay data catalog log: {e}")
+            return
+
+        if torn:
+            # 丢弃不完整的行，否则之后追加的操作无法重放
+            print("Warning: Ignoring incomplete data catalog log entry")
+            self._save_catalog()
+
+    def _apply_op(self, op: Dict[str, Any], apply_assets: bool, apply_lineages: bool) -> None:
+        """把一条日志操作应用到内存中的目录"""
+        kind = op['op']
+        if kind == 'put_asset' and apply_assets:
+            self._put_asset(self._dict_to_asset(op['asset']))
+        elif kind == 'remove_asset':
+            if apply_assets:
+                self._delete_asset(op['id'])
+            if apply_lineages:
+                self._delete_lineages(op['id'])
+        elif kind == 'add_lineage':
+            if apply_lineages:
+                self._append_lineage(self._dict_to_lineage(op['lineage']))
+            elif apply_assets:
+                # 血缘快照已包含该血缘而资产快照没有：把已加载的血缘挂到两端资产上
+                lineage = self._lineages.get(op['lineage'].get('id'))
+                if lineage is not None:
+                    self._attach_lineage(lineage)
+
     def _dict_to_asset(self, data: Dict[str, Any]) -> DataAsset:
         """将字典转换为数据资产对象"""
         # 处理枚举类型
@@ -138,10 +273,20 @@ class DataCatalog:
         if data.get('quality_metrics'):
             data['quality_metrics'] = DataQualityMetrics(**data['quality_metrics'])
 
-        # 处理血缘
+        # 处理血缘：新格式为血缘ID；旧格式为完整副本，按内容对应到已加载的血缘
         lineages = []
-        for lineage_data in data.get('lineage', []):
-            lineages.append(DataLineage(**lineage_data))
+        legacy_keys = None
+        for entry in data.get('lineage', []):
+            if isinstance(entry, str):
+                lineage = self._lineages.get(entry)
+            else:
+                if legacy_keys is None:
+                    legacy_keys = {
+                        self._lineage_key(known): known for known in self._lineages.values()
+                    }
+                lineage = legacy_keys.get(self._lineage_key(DataLineage(**entry)))
+            if lineage is not None:
+                lineages.append(lineage)
         data['lineage'] = lineages
 
         return DataAsset(**data)
@@ -155,13 +300,100 @@ class DataCatalog:
         data['classification'] = asset.classification.value
         data['format'] = asset.format.value
 
+        # 血缘只保存ID
+        data['lineage'] = [lineage.id for lineage in asset.lineage]
+
         return data
 
+    @staticmethod
+    def _lineage_key(lineage: DataLineage) -> Tuple[str, str, str, float]:
+        return (
+            lineage.source_asset,
+            lineage.target_asset,
+            lineage.transformation,
+            lineage.created_at,
+        )
+
+    def _index_asset(self, asset: DataAsset) -> None:
+        """把资产加入搜索索引"""
+        tokens = _tokenize(asset.name) | _tokenize(asset.description)
+        tags = set(asset.tags)
+        for tag in tags:
+            tokens |= _tokenize(tag)
+            self._tag_index.setdefault(tag, set()).add(asset.id)
+        for token in tokens:
+            self._token_index.setdefault(token, set()).add(asset.id)
+        self._type_index.setdefault(asset.asset_type, set()).add(asset.id)
+        self._classification_index.setdefault(asset.classification, set()).add(asset.id)
+        self._indexed_keys[asset.id] = (tokens, asset.asset_type, asset.classification, tags)
+
+        if asset.id not in self._positions:
+            self._positions[asset.id] = self._next_position
+            self._next_position += 1
+
+    def _unindex_asset(self, asset_id: str, keep_position: bool = True) -> None:
+        """按建立索引时记录的键把资产移出搜索索引"""
+        keys = self._indexed_keys.pop(asset_id, None)
+        if keys is None:
+            return
+        tokens, asset_type, classification, tags = keys
+        for token in tokens:
+            self._discard(self._token_index, token, asset_id)
+        for tag in tags:
+            self._discard(self._tag_index, tag, asset_id)
+        self._discard(self._type_index, asset_type, asset_id)
+        self._discard(self._classification_index, classification, asset_id)
+        if not keep_position:
+            self._positions.pop(asset_id, None)
+
+    @staticmethod
+    def _discard(index: Dict[Any, Set[str]], key: Any, asset_id: str) -> None:
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(asset_id)
+            if not ids:
+                del index[key]
+
+    def _put_asset(self, asset: DataAsset) -> None:
+        self._unindex_asset(asset.id)
+        self.assets[asset.id] = asset
+        self._index_asset(asset)
+
+    def _delete_asset(self, asset_id: str) -> None:
+        if self.assets.pop(asset_id, None) is not None:
+            self._unindex_asset(asset_id, keep_position=False)
+
+    def _delete_lineages(self, asset_id: str) -> None:
+        """删除以该资产为源或目标的血缘，并从另一端资产的血缘列表中移除"""
+        related = list(self._lineages_by_source.get(asset_id, ()))
+        related += self._lineages_by_target.get(asset_id, ())
+        for lineage_id in related:
+            lineage = self._lineages.pop(lineage_id, None)
+            if lineage is None:
+                continue
+            del self._lineage_positions[lineage_id]
+            self._discard_lineage_id(self._lineages_by_source, lineage.source_asset, lineage_id)
+            self._discard_lineage_id(self._lineages_by_target, lineage.target_asset, lineage_id)
+            for endpoint in (lineage.source_asset, lineage.target_asset):
+                asset = self.assets.get(endpoint)
+                if asset is not None:
+                    asset.lineage[:] = [item for item in asset.lineage if item.id != lineage_id]
+
+    @staticmethod
+    def _discard_lineage_id(
+        index: Dict[str, Dict[str, None]], asset_id: str, lineage_id: str
+    ) -> None:
+        ids = index.get(asset_id)
+        if ids is not None:
+            ids.pop(lineage_id, None)
+            if not ids:
+                del index[asset_id]
+
     def add_asset(self, asset: DataAsset) -> None:
         """添加数据资产"""
         asset.updated_at = time.time()
-        self.assets[asset.id] = asset
-        self._save_catalog()
+        self._put_asset(asset)
+        self._record({'op': 'put_asset', 'asset': self._asset_to_dict(asset)})
 
     def update_asset(self, asset_id: str, updates: Dict[str, Any]) -> bool:
         """更新数据资产"""
@@ -169,12 +401,14 @@ class DataCatalog:
             return False
 
         asset = self.assets[asset_id]
+        self._unindex_asset(asset_id)
         for key, value in updates.items():
             if hasattr(asset, key):
                 setattr(asset, key, value)
+        self._index_asset(asset)
 
         asset.updated_at = time.time()
-        self._save_catalog()
+        self._record({'op': 'put_asset', 'asset': self._asset_to_dict(asset)})
         return True
 
     def remove_asset(self, asset_id: str) -> bool:
@@ -182,16 +416,12 @@ class DataCatalog:
         if asset_id not in self.assets:
             return False
 
-        del self.assets[asset_id]
+        self._delete_asset(asset_id)
 
         # 移除相关血缘
-        self.lineages = [
-            lineage
-            for lineage in self.lineages
-            if lineage.source_asset != asset_id and lineage.target_asset != asset_id
-        ]
+        self._delete_lineages(asset_id)
 
-        self._save_catalog()
+        self._record({'op': 'remove_asset', 'id': asset_id})
         return True
 
     def get_asset(self, asset_id: str) -> Optional[DataAsset]:
@@ -204,29 +434,100 @@ class DataCatalog:
         asset_type: DataAssetType = None,
         classification: DataClassification = None,
         tags: List[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[DataAsset]:
-        """搜索数据资产"""
-        results = list(self.assets.values())
+        """搜索数据资产
+
+        各条件取交集：``query`` 为名称、描述或标签中包含的子串（不区分大小写），
+        ``tags`` 匹配任一标签即可。有 ``query`` 时按相关度排序（名称 > 标签 > 描述），
+        否则按资产加入目录的顺序排列。
+
+        Args:
+            offset: 跳过的结果数
+            limit: 最多返回的结果数，为空时返回全部
+        """
+        candidates = self._facet_candidates(asset_type, classification, tags)
 
-        # 按查询条件过滤
         if query:
             query_lower = query.lower()
-            results = [
-                asset
-                for asset in results
-                if query_lower in asset.name.lower() or query_lower in asset.description.lower()
-            ]
-
+            matches = self._query_candidates(query_lower, candidates)
+            scored = []
+            for asset_id in matches:
+                score = self._relevance(self.assets[asset_id], query_lower)
+                if score:
+                    scored.append((-score, self._positions[asset_id], asset_id))
+            ordered = [asset_id for _, _, asset_id in sorted(scored)]
+        elif candidates is None:
+            ordered = list(self.assets)
+        else:
+            ordered = sorted(candidates, key=self._positions.__getitem__)
+
+        end = None if limit is None else offset + limit
+        return [self.assets[asset_id] for asset_id in ordered[offset:end]]
+
+    def _facet_candidates(
+        self,
+        asset_type: Optional[DataAssetType],
+        classification: Optional[DataClassification],
+        tags: Optional[List[str]],
+    ) -> Optional[Set[str]]:
+        """分面条件对应的资产ID交集；没有分面条件时返回 None（不限制）"""
+        facets: List[Set[str]] = []
         if asset_type:
-            results = [asset for asset in results if asset.asset_type == asset_type]
-
+            facets.append(self._type_index.get(asset_type, set()))
         if classification:
-            results = [asset for asset in results if asset.classification == classification]
-
+            facets.append(self._classification_index.get(classification, set()))
         if tags:
-            results = [asset for asset in results if any(tag in asset.tags for tag in tags)]
-
-        return results
+            facets.append(set().union(*(self._tag_index.get(tag, set()) for tag in tags)))
+        if not facets:
+            return None
+
+        # 从最小的集合开始求交集
+        facets.sort(key=len)
+        result = set(facets[0])
+        for facet in facets[1:]:
+            result &= facet
+        return result
+
+    def _query_candidates(
+        self, query_lower: str, candidates: Optional[Set[str]]
+    ) -> AbstractSet[str]:
+        """用倒排索引缩小查询的候选资产
+
+        子串中每个完整的词必然是资产某个词的子串，因此候选集为"包含各查询词的
+        索引词"所对应资产的交集，最终是否匹配由 ``_relevance`` 精确判断。
+        """
+        query_tokens = sorted(_tokenize(query_lower), key=len, reverse=True)
+        if not query_tokens:
+            return self.assets.keys() if candidates is None else candidates
+
+        result = candidates
+        for query_token in query_tokens:
+            matched: Set[str] = set()
+            for token, ids in self._token_index.items():
+                if query_token in token:
+                    matched |= ids
+            result = matched if result is None else result & matched
+            if not result:
+                break
+        # 至少有一个查询词，循环后 result 不为 None
+        return result or set()
+
+    @staticmethod
+    def _relevance(asset: DataAsset, query_lower: str) -> int:
+        """查询与资产的相关度，0 表示不匹配"""
+        name_lower = asset.name.lower()
+        score = 0
+        if name_lower == query_lower:
+            score += NAME_EXACT_WEIGHT
+        elif query_lower in name_lower:
+            score += NAME_MATCH_WEIGHT
+        if any(query_lower in tag.lower() for tag in asset.tags):
+            score += TAG_MATCH_WEIGHT
+        if query_lower in asset.description.lower():
+            score += DESCRIPTION_MATCH_WEIGHT
+        return score
 
     def add_lineage(
         self,
@@ -242,31 +543,74 @@ class DataCatalog:
             transformation=transformation,
             created_at=time.time(),
             metadata=metadata or {},
+            id=uuid.uuid4().hex,
         )
 
-        self.lineages.append(lineage)
-
-        # 更新资产的血缘信息
-        if source_asset in self.assets:
-            self.assets[source_asset].lineage.append(lineage)
-        if target_asset in self.assets:
-            self.assets[target_asset].lineage.append(lineage)
-
-        self._save_catalog()
-
-    def get_lineage(self, asset_id: str, direction: str = "both") -> List[DataLineage]:
-        """获取数据血缘"""
-        lineages = []
-
-        for lineage in self.lineages:
-            if direction == "upstream" and lineage.target_asset == asset_id:
-                lineages.append(lineage)
-            elif direction == "downstream" and lineage.source_asset == asset_id:
-                lineages.append(lineage)
-            elif direction == "both" and (
-                lineage.source_asset == asset_id or lineage.target_asset == asset_id
-            ):
+        self._append_lineage(lineage)
+        self._record({'op': 'add_lineage', 'lineage': asdict(lineage)})
+
+    def _append_lineage(self, lineage: DataLineage) -> None:
+        self._index_lineage(lineage)
+        self._attach_lineage(lineage)
+
+    def _attach_lineage(self, lineage: DataLineage) -> None:
+        """更新两端资产的血缘信息（引用同一个对象，已存在时不重复添加）"""
+        for asset_id in dict.fromkeys((lineage.source_asset, lineage.target_asset)):
+            asset = self.assets.get(asset_id)
+            if asset is not None and all(item is not lineage for item in asset.lineage):
+                asset.lineage.append(lineage)
+
+    def _index_lineage(self, lineage: DataLineage) -> None:
+        self._lineages[lineage.id] = lineage
+        self._lineage_positions[lineage.id] = self._next_lineage_position
+        self._next_lineage_position += 1
+        self._lineages_by_source.setdefault(lineage.source_asset, {})[lineage.id] = None
+        self._lineages_by_target.setdefault(lineage.target_asset, {})[lineage.id] = None
+
+    def get_lineage(
+        self, asset_id: str, direction: str = "both", depth: int = 1
+    ) -> List[DataLineage]:
+        """获取数据血缘
+
+        Args:
+            asset_id: 资产ID
+            direction: upstream（指向该资产）、downstream（从该资产出发）或 both
+            depth: 沿血缘展开的跳数，1 为直接相关的血缘
+
+        Returns:
+            按 (跳数, 添加顺序) 排列、不重复的血缘
+        """
+        upstream = direction in ("upstream", "both")
+        downstream = direction in ("downstream", "both")
+        visited = {asset_id}
+        frontier = [asset_id]
+        seen_lineages: Set[str] = set()
+        lineages: List[DataLineage] = []
+
+        for _hop in range(depth):
+            hop: Set[str] = set()
+            for current in frontier:
+                if upstream:
+                    hop.update(self._lineages_by_target.get(current, ()))
+                if downstream:
+                    hop.update(self._lineages_by_source.get(current, ()))
+            hop -= seen_lineages
+            if not hop:
+                break
+            seen_lineages |= hop
+
+            next_frontier = []
+            for lineage_id in sorted(hop, key=self._lineage_positions.__getitem__):
+                lineage = self._lineages[lineage_id]
                 lineages.append(lineage)
+                for neighbor, follow in (
+                    (lineage.source_asset, upstream),
+                    (lineage.target_asset, downstream),
+                ):
+                    if follow and neighbor not in visited:
+                        visited.add(neighbor)
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
 
         return lineages
 
@@ -279,7 +623,7 @@ class DataCatalog:
         self.assets[asset_id].quality_metrics = metrics
         self.assets[asset_id].updated_at = time.time()
 
-        self._save_catalog()
+        self._record({'op': 'put_asset', 'asset': self._asset_to_dict(self.assets[asset_id])})
         return True
 
     def get_quality_report(self) -> Dict[str, Any]:
@@ -362,7 +706,7 @@ class DataCatalog:
 
         return {
             "total_assets": len(self.assets),
-            "total_lineages": len(self.lineages),
+            "total_lineages": len(self._lineages),
             "by_type": type_counts,
             "by_classification": classification_counts,
             "by_owner": owner_counts,
@@ -370,30 +714,86 @@ class DataCatalog:
             "generated_at": time.time(),
         }
 
-    def _save_catalog(self) -> None:
-        """保存数据目录"""
+    @contextmanager
+    def bulk(self) -> Iterator['DataCatalog']:
+        """批量修改：期间的操作暂存在内存中，退出（含异常退出）时一次性写入
+
+        可以嵌套，最外层退出时写入。
+        """
+        self._bulk_depth += 1
         try:
-            # 保存资产
-            catalog_data = {
-                "assets": [self._asset_to_dict(asset) for asset in self.assets.values()],
-                "updated_at": time.time(),
-            }
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if not self._bulk_depth and self._pending_ops:
+                lines, self._pending_ops = self._pending_ops, []
+                self._write_log(lines)
+
+    def compact(self) -> None:
+        """把操作日志压缩进快照文件"""
+        self._pending_ops = []
+        self._save_catalog()
+
+    def _record(self, op: Dict[str, Any]) -> None:
+        """记录一条修改操作"""
+        self._seq += 1
+        op['seq'] = self._seq
+        line = json.dumps(op, ensure_ascii=False)
+        if self._bulk_depth:
+            self._pending_ops.append(line)
+        else:
+            self._write_log([line])
+
+    def _write_log(self, lines: List[str]) -> None:
+        """追加操作日志；日志足够长时改为写快照"""
+        threshold = max(COMPACTION_MIN_OPS, len(self.assets) + len(self._lineages))
+        if self._log_ops + len(lines) >= threshold:
+            self._save_catalog()
+            return
+
+        try:
+            with open(self.log_file, 'a', encoding='utf-8') as f:
+                f.write(''.join(line + '\n' for line in lines))
+            self._log_ops += len(lines)
+        except Exception as e:
+            print(f"Error saving data catalog: {e}")
 
-            with open(self.catalog_file, 'w', encoding='utf-8') as f:
-                json.dump(catalog_data, f, ensure_ascii=False, indent=2)
+    def _save_catalog(self) -> None:
+        """保存数据目录快照并清空操作日志
 
+        每个快照文件先写入临时文件再替换，并记录最后一条已包含的操作序号。
+        """
+        try:
             # 保存血缘
             lineage_data = {
-                "lineages": [asdict(lineage) for lineage in self.lineages],
+                "lineages": [asdict(lineage) for lineage in self._lineages.values()],
                 "updated_at": time.time(),
+                "last_seq": self._seq,
             }
+            self._write_snapshot(self.lineage_file, lineage_data)
 
-            with open(self.lineage_file, 'w', encoding='utf-8') as f:
-                json.dump(lineage_data, f, ensure_ascii=False, indent=2)
+            # 保存资产
+            catalog_data = {
+                "assets": [self._asset_to_dict(asset) for asset in self.assets.values()],
+                "updated_at": time.time(),
+                "last_seq": self._seq,
+            }
+            self._write_snapshot(self.catalog_file, catalog_data)
+
+            if self.log_file.exists():
+                self.log_file.unlink()
+            self._log_ops = 0
 
         except Exception as e:
             print(f"Error saving data catalog: {e}")
 
+    @staticmethod
+    def _write_snapshot(path: Path, data: Dict[str, Any]) -> None:
+        temp_path = path.with_name(path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
 
 # 使用示例
 if __name__ == "__main__":
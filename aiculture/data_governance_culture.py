@@ -14,13 +14,22 @@
 """
 
 import ast
+import io
 import json
+import os
 import re
 import time
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
+
+from .file_index import ProjectFileIndex
+from .line_index import LineIndex
+from .process_pool import map_batches
 
 
 class DataSensitivityLevel(Enum):
@@ -94,11 +103,74 @@ class DataLineageEdge:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+# 占位符邮箱域名与前缀
+PLACEHOLDER_EMAIL_DOMAINS = frozenset(
+    {'placeholder.local', 'demo.local', 'example.com', 'test.com', 'demo.com'}
+)
+PLACEHOLDER_EMAIL_PREFIXES = frozenset(
+    {'demo', 'test', 'example', 'placeholder', 'user1', 'user2', 'noreply'}
+)
+PLACEHOLDER_INDICATORS = ('xxx', 'placeholder', 'demo', 'test', 'example')
+
+# 缓冲区级预过滤：文件中不含这些字符时不可能匹配对应的PII模式
+PII_PREFILTERS = {
+    'email': re.compile('@'),
+    'phone': re.compile(r'\d'),
+    'ssn': re.compile(r'\d'),
+    'credit_card': re.compile(r'\d'),
+    'ip_address': re.compile(r'\d'),
+    'passport': re.compile(r'\d'),
+    'driver_license': re.compile(r'\d'),
+}
+
+# 忽略大小写时会匹配ASCII字母、但 lower() 后不是对应ASCII字母的字符（İ ı ſ K），
+# 文本含有这些字符时不能用小写副本代替忽略大小写匹配
+FOLD_UNSAFE_CHARS = re.compile('[\u0130\u0131\u017f\u212a]')
+
+# 超过该大小（字节）的文件按 large_file_policy 处理
+DEFAULT_MAX_SCAN_BYTES = 10 * 1024 * 1024
+
+# 流式扫描每批读取的字符数
+DEFAULT_STREAM_CHUNK_CHARS = 1024 * 1024
+
+# 超长行窗口之间的重叠字符数，需不小于最长可能匹配的长度；
+# 邮箱等含无界重复的模式按匹配长度不超过该值处理
+STREAM_OVERLAP_CHARS = 4096
+
+
+class LargeFilePolicy(Enum):
+    """大文件扫描策略"""
+
+    SKIP = "skip"  # 跳过，只记录说明
+    SAMPLE = "sample"  # 只扫描开头 max_file_size 个字符
+    STREAM = "stream"  # 流式扫描全部内容
+
+
 class DataPrivacyScanner:
-    """数据隐私扫描器"""
+    """数据隐私扫描器
+
+    所有模式在初始化时编译一次。扫描文件时每个模式对整个文件缓冲区执行一次
+    ``finditer``，再通过换行偏移表换算行列号，结果与逐行扫描完全一致。
+    大文件按策略跳过、抽样或以有界内存流式扫描。
+    """
+
+    def __init__(
+        self,
+        max_file_size: int = DEFAULT_MAX_SCAN_BYTES,
+        large_file_policy: LargeFilePolicy = LargeFilePolicy.STREAM,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_CHARS,
+    ):
+        """初始化隐私扫描器
+
+        Args:
+            max_file_size: 整体读入扫描的最大文件大小（字节）
+            large_file_policy: 超过 max_file_size 的文件的处理策略
+            chunk_size: 流式扫描每批的字符数，至少为重叠长度的4倍
+        """
+        self.max_file_size = max_file_size
+        self.large_file_policy = LargeFilePolicy(large_file_policy)
+        self.chunk_size = max(chunk_size, 4 * STREAM_OVERLAP_CHARS)
 
-    def __init__(self):
-        """__init__函数"""
         # 个人信息模式
         self.pii_patterns = {
             'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
@@ -123,114 +195,381 @@ class DataPrivacyScanner:
             'financial': r'(?i)(salary|income|bank|account|credit|debit|payment)',
         }
 
+        self.compile_patterns()
+
+    def compile_patterns(self) -> None:
+        """编译模式（修改 pii_patterns 或 sensitive_field_patterns 后需重新调用）"""
+        self._compiled_pii = [
+            (pii_type, re.compile(pattern), PII_PREFILTERS.get(pii_type))
+            for pii_type, pattern in self.pii_patterns.items()
+        ]
+        self._compiled_fields = [
+            (field_type, re.compile(pattern), self._compile_folded(pattern))
+            for field_type, pattern in self.sensitive_field_patterns.items()
+        ]
+
+    @staticmethod
+    def _compile_folded(pattern: str) -> Optional['re.Pattern[str]']:
+        """为全小写的忽略大小写模式编译区分大小写的版本，用于匹配已转为小写的ASCII文本
+
+        ``re`` 对忽略大小写的模式无法使用字面量前缀优化，对小写缓冲区做区分大小写
+        匹配要快得多；文本不含 ``FOLD_UNSAFE_CHARS`` 时结果与忽略大小写匹配相同。
+        """
+        if not pattern.startswith('(?i)'):
+            return None
+        body = pattern[4:]
+        if not body.isascii() or body != body.lower() or '\\' in body:
+            return None
+        return re.compile(body)
+
     def _is_placeholder_data(self, pii_type: str, matched_text: str) -> bool:
         """判断是否为占位符数据"""
         text_lower = matched_text.lower()
 
         # 邮箱占位符
         if pii_type == 'email':
-            placeholder_domains = [
-                'placeholder.local',
-                'demo.local',
-                'example.com',
-                'test.com',
-                'demo.com',
-            ]
-            placeholder_prefixes = [
-                'demo',
-                'test',
-                'example',
-                'placeholder',
-                'user1',
-                'user2',
-                'noreply',
-            ]
-
-            domain = matched_text.split('@')[1].lower() if '@' in matched_text else ''
-            prefix = matched_text.split('@')[0].lower() if '@' in matched_text else ''
-
-            if domain in placeholder_domains or prefix in placeholder_prefixes:
-                return True
-
-        # IP地址占位符
-        elif pii_type == 'ip_address':
-            if 'xxx' in text_lower or '192.168.1.xxx' in text_lower:
+            prefix, at, domain = text_lower.partition('@')
+            if at and (
+                domain in PLACEHOLDER_EMAIL_DOMAINS or prefix in PLACEHOLDER_EMAIL_PREFIXES
+            ):
                 return True
 
-        # 电话号码占位符
-        elif pii_type == 'phone':
-            if 'xxx' in text_lower:
-                return True
+        # IP地址、电话号码及其他占位符标识
+        return any(indicator in text_lower for indicator in PLACEHOLDER_INDICATORS)
 
-        # 其他占位符标识
-        placeholder_indicators = ['xxx', 'placeholder', 'demo', 'test', 'example']
-        if any(indicator in text_lower for indicator in placeholder_indicators):
-            return True
+    def scan_code_for_pii(self, file_path: Path) -> List[Dict[str, Any]]:
+        """扫描代码中的个人信息
 
-        return False
+        不超过 ``max_file_size`` 的文件整体读入后扫描；更大的文件按
+        ``large_file_policy`` 跳过、只扫描开头部分或流式扫描全部内容。
+        """
+        return list(self.iter_code_pii(file_path))
 
-    def scan_code_for_pii(self, file_path: Path) -> List[Dict[str, Any]]:
-        """扫描代码中的个人信息"""
-        findings = []
+    def iter_code_pii(self, file_path: Path) -> Iterator[Dict[str, Any]]:
+        """逐条产生 ``scan_code_for_pii`` 的结果
 
+        流式扫描的大文件每扫描完一批行就产生该批的结果，调用方无需持有整个文件的结果；
+        读取出错时在已产生的结果之后产生一条 ``scan_error``。
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            size = file_path.stat().st_size
+            if size <= self.max_file_size:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                yield from self.scan_text_for_pii(content, str(file_path))
+                return
 
-            lines = content.split('\n')
+            if self.large_file_policy == LargeFilePolicy.SKIP:
+                yield self._large_file_note(file_path, size, 'scan_skipped')
+                return
 
-            for line_num, line in enumerate(lines, 1):
-                # 检查PII模式
-                for pii_type, pattern in self.pii_patterns.items():
-                    matches = re.finditer(pattern, line)
-                    for match in matches:
-                        matched_text = match.group()
+            with open(file_path, 'r', encoding='utf-8') as f:
+                if self.large_file_policy == LargeFilePolicy.SAMPLE:
+                    yield from self.iter_stream_pii(f, str(file_path), self.max_file_size)
+                    yield self._large_file_note(file_path, size, 'scan_sampled')
+                    return
+                yield from self.iter_stream_pii(f, str(file_path))
 
-                        # 跳过占位符数据
-                        if self._is_placeholder_data(pii_type, matched_text):
-                            continue
+        except Exception as e:
+            yield {
+                'type': 'scan_error',
+                'file': str(file_path),
+                'error': str(e),
+                'severity': 'low',
+            }
+
+    def _large_file_note(self, file_path: Path, size: int, note_type: str) -> Dict[str, Any]:
+        """大文件未完整扫描的说明"""
+        return {
+            'type': note_type,
+            'file': str(file_path),
+            'size': size,
+            'max_file_size': self.max_file_size,
+            'severity': 'low',
+        }
 
-                        findings.append(
-                            {
-                                'type': 'pii_in_code',
-                                'pii_type': pii_type,
-                                'file': str(file_path),
-                                'line': line_num,
-                                'column': match.start(),
-                                'matched_text': matched_text,
-                                'severity': 'high',
-                                'recommendation': f'避免在代码中硬编码{pii_type}信息',
-                            }
+    def scan_stream_for_pii(
+        self, stream: TextIO, file_name: str, char_limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """流式扫描文本流，内存占用与文件大小无关
+
+        Args:
+            stream: 以文本模式打开的文件
+            file_name: 结果中记录的文件名
+            char_limit: 读取的字符数达到该值后停止（抽样扫描）
+        """
+        return list(self.iter_stream_pii(stream, file_name, char_limit))
+
+    def iter_stream_pii(
+        self, stream: TextIO, file_name: str, char_limit: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """逐批产生 ``scan_stream_for_pii`` 的结果
+
+        按完整行组成不超过 ``chunk_size`` 个字符的批次交给 ``scan_text_for_pii``，
+        扫描结果只取决于单行内容，因此与整体读入的结果完全一致；超过
+        ``chunk_size`` 的超长行按带重叠的窗口扫描。同时持有的结果不超过一批
+        （或一个超长行）的结果。
+        """
+        batch: List[str] = []
+        batch_chars = 0
+        next_line = 1
+        chars_read = 0
+
+        while char_limit is None or chars_read < char_limit:
+            line = stream.readline(self.chunk_size)
+            if not line:
+                break
+            chars_read += len(line)
+
+            long_line = len(line) == self.chunk_size and not line.endswith('\n')
+            if not long_line:
+                batch.append(line)
+                batch_chars += len(line)
+                if batch_chars < self.chunk_size:
+                    continue
+
+            if batch:
+                yield from self.scan_text_for_pii(''.join(batch), file_name, next_line)
+                next_line += len(batch)
+                batch, batch_chars = [], 0
+
+            if long_line:
+                findings, extra_chars = self._scan_long_line(stream, line, file_name, next_line)
+                chars_read += extra_chars
+                next_line += 1
+                yield from findings
+
+        if batch:
+            yield from self.scan_text_for_pii(''.join(batch), file_name, next_line)
+
+    def _scan_long_line(
+        self,
+        stream: TextIO,
+        head: str,
+        file_name: str,
+        line_num: int,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """按窗口扫描一个超长行，返回 (该行的结果, 额外读取的字符数)
+
+        相邻窗口重叠 ``STREAM_OVERLAP_CHARS`` 个字符：只接受起点距窗口末尾
+        超过重叠长度的匹配，这些匹配的完整内容及 ``\\b`` 所需的前后字符都在窗口内。
+        每个模式记录上一次匹配的结束位置，下一个窗口从该位置继续，
+        与对整行执行 ``finditer`` 得到的匹配序列相同。
+        """
+        # (模式序号, 类型, 模式, 小写模式, 预筛选模式, 是否为PII模式)
+        patterns: List[
+            Tuple[
+                int,
+                str,
+                're.Pattern[str]',
+                Optional['re.Pattern[str]'],
+                Optional['re.Pattern[str]'],
+                bool,
+            ]
+        ] = [
+            (order, pii_type, pattern, None, prefilter, True)
+            for order, (pii_type, pattern, prefilter) in enumerate(self._compiled_pii)
+        ]
+        first_order = len(self._compiled_pii)
+        patterns += [
+            (order, field_type, pattern, folded, None, False)
+            for order, (field_type, pattern, folded) in enumerate(
+                self._compiled_fields, first_order
+            )
+        ]
+        resume = [0] * len(patterns)
+        # (模式序号, 列号, 结果)
+        hits: List[Tuple[int, int, Dict[str, Any]]] = []
+
+        window = head
+        window_start = 0
+        extra_chars = 0
+        line_done = False
+        while True:
+            if window.endswith('\n'):
+                window = window[:-1]
+                line_done = True
+            accept_end = len(window) if line_done else len(window) - STREAM_OVERLAP_CHARS
+            lowered = None
+            if FOLD_UNSAFE_CHARS.search(window) is None:
+                lowered = window.lower()
+                if len(lowered) != len(window):
+                    lowered = None
+
+            for index, (order, name, pattern, folded, prefilter, is_pii) in enumerate(patterns):
+                target = window
+                if folded is not None and lowered is not None:
+                    pattern, target = folded, lowered
+                position = max(resume[index] - window_start, 0)
+                if prefilter is not None and prefilter.search(window, position) is None:
+                    resume[index] = max(resume[index], window_start + accept_end)
+                    continue
+                while position <= accept_end:
+                    match = pattern.search(target, position)
+                    if match is None or match.start() >= accept_end:
+                        position = max(position, accept_end)
+                        break
+                    start, end = match.span()
+                    column = window_start + start
+                    matched_text = window[start:end]
+                    if not is_pii:
+                        finding = self._field_finding(
+                            name, file_name, line_num, column, matched_text
                         )
+                        hits.append((order, column, finding))
+                    elif not self._is_placeholder_data(name, matched_text):
+                        finding = self._pii_finding(name, file_name, line_num, column, matched_text)
+                        hits.append((order, column, finding))
+                    position = end if end > start else end + 1
+                resume[index] = window_start + position
+
+            if line_done:
+                break
+
+            # 保留一个字符作为下一个窗口中 \b 的左侧上下文
+            keep_from = accept_end - 1
+            more = stream.readline(self.chunk_size)
+            extra_chars += len(more)
+            window = window[keep_from:] + more
+            window_start += keep_from
+            if not more:
+                line_done = True
+
+        hits.sort(key=lambda hit: hit[:2])
+        return [hit[2] for hit in hits], extra_chars
+
+    def scan_text_for_pii(
+        self, content: str, file_name: str, first_line: int = 1
+    ) -> List[Dict[str, Any]]:
+        """扫描文本缓冲区中的个人信息和敏感字段名
+
+        结果按 (行号, 模式顺序, 列号) 排列，与逐行逐模式扫描的顺序相同。
+
+        Args:
+            content: 文本内容
+            file_name: 结果中记录的文件名
+            first_line: 文本第一行在文件中的行号（流式扫描分批时使用）
+        """
+        line_index = LineIndex(content)
+        line_offset = first_line - 1
+        # (行号, 模式序号, 列号, 结果)
+        hits: List[Tuple[int, int, int, Dict[str, Any]]] = []
+
+        # 检查PII模式
+        for order, (pii_type, pattern, prefilter) in enumerate(self._compiled_pii):
+            if prefilter is not None and prefilter.search(content) is None:
+                continue
+            for line_num, column, matched_text in self._iter_matches(pattern, line_index):
+                # 跳过占位符数据
+                if self._is_placeholder_data(pii_type, matched_text):
+                    continue
+
+                line_num += line_offset
+                hits.append(
+                    (
+                        line_num,
+                        order,
+                        column,
+                        self._pii_finding(pii_type, file_name, line_num, column, matched_text),
+                    )
+                )
 
-                # 检查敏感字段名
-                for field_type, pattern in self.sensitive_field_patterns.items():
-                    matches = re.finditer(pattern, line)
-                    for match in matches:
-                        findings.append(
-                            {
-                                'type': 'sensitive_field',
-                                'field_type': field_type,
-                                'file': str(file_path),
-                                'line': line_num,
-                                'column': match.start(),
-                                'matched_text': match.group(),
-                                'severity': 'medium',
-                                'recommendation': f'确保{field_type}字段有适当的保护措施',
-                            }
-                        )
+        # 检查敏感字段名
+        folded_index = None
+        if FOLD_UNSAFE_CHARS.search(content) is None:
+            lowered = content.lower()
+            if len(lowered) == len(content):
+                folded_index = LineIndex(lowered)
+        first_order = len(self._compiled_pii)
+        for order, (field_type, pattern, folded) in enumerate(self._compiled_fields, first_order):
+            if folded is not None and folded_index is not None:
+                matches = self._iter_matches(folded, folded_index, content)
+            else:
+                matches = self._iter_matches(pattern, line_index)
+            for line_num, column, matched_text in matches:
+                line_num += line_offset
+                hits.append(
+                    (
+                        line_num,
+                        order,
+                        column,
+                        self._field_finding(field_type, file_name, line_num, column, matched_text),
+                    )
+                )
 
-        except Exception as e:
-            findings.append(
-                {
-                    'type': 'scan_error',
-                    'file': str(file_path),
-                    'error': str(e),
-                    'severity': 'low',
-                }
-            )
+        hits.sort(key=lambda hit: hit[:3])
+        return [hit[3] for hit in hits]
 
-        return findings
+    @staticmethod
+    def _pii_finding(
+        pii_type: str, file_name: str, line_num: int, column: int, matched_text: str
+    ) -> Dict[str, Any]:
+        return {
+            'type': 'pii_in_code',
+            'pii_type': pii_type,
+            'file': file_name,
+            'line': line_num,
+            'column': column,
+            'matched_text': matched_text,
+            'severity': 'high',
+            'recommendation': f'避免在代码中硬编码{pii_type}信息',
+        }
+
+    @staticmethod
+    def _field_finding(
+        field_type: str, file_name: str, line_num: int, column: int, matched_text: str
+    ) -> Dict[str, Any]:
+        return {
+            'type': 'sensitive_field',
+            'field_type': field_type,
+            'file': file_name,
+            'line': line_num,
+            'column': column,
+            'matched_text': matched_text,
+            'severity': 'medium',
+            'recommendation': f'确保{field_type}字段有适当的保护措施',
+        }
+
+    @staticmethod
+    def _iter_matches(
+        pattern: 're.Pattern[str]', line_index: LineIndex, original: Optional[str] = None
+    ) -> Iterator[Tuple[int, int, str]]:
+        """对整个缓冲区执行一次匹配，产出 (行号, 列号, 匹配文本)
+
+        个别模式（如含 ``\\s`` 的电话号码）可能跨越换行匹配，而逐行扫描不会；
+        遇到跨行匹配时对该行剩余部分按行重新匹配，并从下一行开始继续扫描。
+
+        Args:
+            pattern: 已编译的模式
+            line_index: 被匹配文本的换行偏移表
+            original: 被匹配文本是转为小写的副本时，从原文中取匹配文本
+        """
+        text = line_index.text
+        source = original if original is not None else text
+        search = pattern.search
+        position = 0
+        while True:
+            match = search(text, position)
+            if match is None:
+                return
+            start, end = match.span()
+            line_num, column = line_index.line_col(start)
+            if '\n' not in text[start:end]:
+                yield line_num, column, source[start:end]
+                position = end if end > start else end + 1
+                continue
+
+            # 该行此前的匹配已产出，只需按行重新匹配列号不小于 column 的部分
+            line_start = line_index.line_start(line_num)
+            for line_match in pattern.finditer(line_index.line_text(line_num)):
+                if line_match.start() >= column:
+                    match_start, match_end = line_match.span()
+                    yield line_num, match_start, source[
+                        line_start + match_start : line_start + match_end
+                    ]
+            if line_num >= len(line_index):
+                return
+            position = line_index.line_start(line_num + 1)
 
     def scan_database_schema(self, schema_info: Dict[str, Any]) -> List[Dict[str, Any]]:
         """扫描数据库模式中的敏感信息"""
@@ -244,8 +583,8 @@ class DataPrivacyScanner:
                 column_type = column.get('type', '')
 
                 # 检查敏感字段名
-                for field_type, pattern in self.sensitive_field_patterns.items():
-                    if re.search(pattern, column_name):
+                for field_type, pattern, _ in self._compiled_fields:
+                    if pattern.search(column_name):
                         findings.append(
                             {
                                 'type': 'sensitive_database_field',
@@ -261,8 +600,99 @@ class DataPrivacyScanner:
         return findings
 
 
+# 每个严重程度保留完整内容的发现数上限，其余只计数
+DEFAULT_DETAILED_FINDINGS = 100
+
+PRIVACY_SEVERITIES = ('high', 'medium', 'low')
+
+
+class PrivacyScanAggregate:
+    """隐私扫描结果的增量汇总
+
+    计数、高风险文件和PII类型逐条累加；每个严重程度只按扫描顺序保留前
+    ``detail_limit`` 条完整结果，内存占用与发现总数无关。
+    """
+
+    __slots__ = ('detail_limit', 'total', 'counts', 'details', 'high_risk_files', 'pii_types')
+
+    def __init__(self, detail_limit: int = DEFAULT_DETAILED_FINDINGS) -> None:
+        self.detail_limit = detail_limit
+        self.total = 0
+        self.counts: Dict[str, int] = {severity: 0 for severity in PRIVACY_SEVERITIES}
+        self.details: Dict[str, List[Dict[str, Any]]] = {
+            severity: [] for severity in PRIVACY_SEVERITIES
+        }
+        self.high_risk_files: Set[str] = set()
+        self.pii_types: Set[str] = set()
+
+    def add(self, finding: Dict[str, Any]) -> None:
+        """累加一条扫描结果"""
+        severity = finding.get('severity', 'low')
+        self.total += 1
+        self.counts[severity] = self.counts.get(severity, 0) + 1
+        if severity == 'high':
+            self.high_risk_files.add(finding['file'])
+        if finding.get('pii_type'):
+            self.pii_types.add(finding['pii_type'])
+
+        kept = self.details.setdefault(severity, [])
+        if len(kept) < self.detail_limit:
+            kept.append(finding)
+
+    def merge(self, other: 'PrivacyScanAggregate') -> None:
+        """合并后续文件批次的汇总（保持扫描顺序）"""
+        self.total += other.total
+        for severity, count in other.counts.items():
+            self.counts[severity] = self.counts.get(severity, 0) + count
+        for severity, findings in other.details.items():
+            kept = self.details.setdefault(severity, [])
+            kept.extend(findings[: max(self.detail_limit - len(kept), 0)])
+        self.high_risk_files |= other.high_risk_files
+        self.pii_types |= other.pii_types
+
+    @property
+    def truncated(self) -> bool:
+        """是否有结果因超过上限只计数未保留"""
+        return any(len(self.details[severity]) < count for severity, count in self.counts.items())
+
+
+def scan_files_for_privacy(
+    scanner: DataPrivacyScanner,
+    file_paths: List[Path],
+    detail_limit: int = DEFAULT_DETAILED_FINDINGS,
+) -> PrivacyScanAggregate:
+    """按顺序扫描一组文件并汇总（进程池任务入口，须为模块级函数以便序列化）
+
+    扫描结果产生后立即累加，不保留文件的完整结果列表。
+    """
+    aggregate = PrivacyScanAggregate(detail_limit)
+    for file_path in file_paths:
+        for finding in scanner.iter_code_pii(file_path):
+            aggregate.add(finding)
+    return aggregate
+
+
+# validate_stream 每块的记录数与每个规则保留的问题详情数
+DEFAULT_VALIDATION_CHUNK_SIZE = 10000
+DEFAULT_MAX_ISSUES_PER_RULE = 100
+
+
+def _numpy() -> Any:
+    """按需导入 NumPy（可选依赖），未安装时返回 None"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
 class DataQualityValidator:
-    """数据质量验证器"""
+    """数据质量验证器
+
+    输入只转置一次为按字段的列，每个规则对整列做一次线性扫描：``range`` 在
+    NumPy 可用且列为纯数值时向量化比较，``unique`` 基于哈希计数，``pattern``
+    使用预编译的正则表达式。规则只记录失败记录的下标，问题详情在需要时才生成。
+    """
 
     def __init__(self):
         """__init__函数"""
@@ -272,8 +702,15 @@ class DataQualityValidator:
         """添加质量规则"""
         self.rules.append(rule)
 
-    def validate_data(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """验证数据质量"""
+    def validate_data(
+        self, data: List[Dict[str, Any]], include_issues: bool = True
+    ) -> Dict[str, Any]:
+        """验证数据质量
+
+        Args:
+            data: 待验证的记录
+            include_issues: 为 False 时只统计数量，不生成问题详情
+        """
         results = {
             'total_records': len(data),
             'passed_records': 0,
@@ -282,100 +719,333 @@ class DataQualityValidator:
             'issues': [],
         }
 
-        if not data:
-            return results
+        # 空数据同样为每个规则返回零计数的结果，与 validate_stream 一致
+        columns = self._to_columns(data)
+        failed_record_ids: Set[int] = set()
 
         # 按规则验证
         for rule in self.rules:
-            rule_results = self._validate_rule(rule, data)
-            results['rule_results'][rule.name] = rule_results
-            results['issues'].extend(rule_results['issues'])
+            column = columns[rule.field_name]
+            failed = self._failed_indices(rule, column)
+            failed_record_ids.update(failed)
+
+            rule_issues = []
+            if include_issues:
+                rule_issues = list(self._iter_rule_issues(rule, column, failed))
+            results['rule_results'][rule.name] = {
+                'rule_name': rule.name,
+                'rule_type': rule.rule_type,
+                'passed': len(column) - len(failed),
+                'failed': len(failed),
+                'issues': rule_issues,
+            }
+            results['issues'].extend(rule_issues)
 
         # 计算通过/失败记录数
-        failed_record_ids = set()
-        for issue in results['issues']:
-            if issue.get('record_id') is not None:
-                failed_record_ids.add(issue['record_id'])
-
         results['failed_records'] = len(failed_record_ids)
         results['passed_records'] = results['total_records'] - results['failed_records']
 
         return results
 
+    def iter_issues(self, data: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """按规则顺序逐条产出问题，不一次性生成全部问题详情"""
+        if not data:
+            return
+        columns = self._to_columns(data)
+        for rule in self.rules:
+            column = columns[rule.field_name]
+            yield from self._iter_rule_issues(rule, column, self._failed_indices(rule, column))
+
     def _validate_rule(self, rule: DataQualityRule, data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """验证单个规则"""
-        rule_result = {
+        column = [record.get(rule.field_name) for record in data]
+        failed = self._failed_indices(rule, column)
+        return {
             'rule_name': rule.name,
             'rule_type': rule.rule_type,
-            'passed': 0,
-            'failed': 0,
-            'issues': [],
+            'passed': len(column) - len(failed),
+            'failed': len(failed),
+            'issues': list(self._iter_rule_issues(rule, column, failed)),
         }
 
-        for record_id, record in enumerate(data):
-            field_value = record.get(rule.field_name)
+    def _to_columns(self, data: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """把规则涉及的字段转置为列（每个字段只遍历一次记录）"""
+        field_names = dict.fromkeys(rule.field_name for rule in self.rules)
+        return {name: [record.get(name) for record in data] for name in field_names}
 
-            is_valid = True
-            issue_message = ""
+    def _failed_indices(self, rule: DataQualityRule, column: List[Any]) -> List[int]:
+        """返回不满足规则的记录下标（升序）"""
+        if rule.rule_type == "not_null":
+            return [i for i, value in enumerate(column) if value is None or value == ""]
 
-            if rule.rule_type == "not_null":
-                is_valid = field_value is not None and field_value != ""
-                issue_message = f"字段 {rule.field_name} 不能为空"
+        if rule.rule_type == "unique":
+            return self._duplicate_indices(column)
 
-            elif rule.rule_type == "unique":
-                # 这需要在所有记录的上下文中检查
-                values = [r.get(rule.field_name) for r in data]
-                is_valid = values.count(field_value) == 1
-                issue_message = f"字段 {rule.field_name} 值重复: {field_value}"
+        if rule.rule_type == "range":
+            return self._out_of_range_indices(
+                column, rule.parameters.get('min'), rule.parameters.get('max')
+            )
+
+        if rule.rule_type == "pattern":
+            pattern = rule.parameters.get('pattern')
+            if not pattern:
+                return list(range(len(column)))
+            match = re.compile(pattern).match
+            return [
+                i
+                for i, value in enumerate(column)
+                if not isinstance(value, str) or match(value) is None
+            ]
 
-            elif rule.rule_type == "range":
+        # custom 等未实现的规则类型视为全部通过
+        return []
+
+    @staticmethod
+    def _duplicate_indices(column: List[Any]) -> List[int]:
+        """哈希计数找出重复值的下标；不可哈希的值退回按相等比较计数"""
+        counts: Dict[Any, int] = {}
+        unhashable: List[Any] = []
+        for value in column:
+            try:
+                counts[value] = counts.get(value, 0) + 1
+            except TypeError:
+                unhashable.append(value)
+
+        failed = []
+        for i, value in enumerate(column):
+            try:
+                count = counts[value]
+            except TypeError:
+                count = unhashable.count(value)
+            if count != 1:
+                failed.append(i)
+        return failed
+
+    @staticmethod
+    def _out_of_range_indices(
+        column: List[Any], min_val: Optional[Any], max_val: Optional[Any]
+    ) -> List[int]:
+        """数值范围检查；非数值（含 None）视为失败"""
+        np = _numpy()
+        if np is not None:
+            try:
+                values = np.asarray(column)
+            except (ValueError, TypeError):
+                values = None
+            # 只有纯整数或浮点数列才能向量化，其余（含 None、字符串、布尔）逐个检查
+            if values is not None and values.ndim == 1 and values.dtype.kind in 'iuf':
+                valid = np.ones(len(column), dtype=bool)
+                if min_val is not None:
+                    valid &= values >= min_val
+                if max_val is not None:
+                    valid &= values <= max_val
+                return np.flatnonzero(~valid).tolist()
+
+        return [
+            i
+            for i, value in enumerate(column)
+            if not isinstance(value, (int, float))
+            or (min_val is not None and not value >= min_val)
+            or (max_val is not None and not value <= max_val)
+        ]
+
+    @classmethod
+    def _iter_rule_issues(
+        cls, rule: DataQualityRule, column: List[Any], failed: Iterable[int], offset: int = 0
+    ) -> Iterator[Dict[str, Any]]:
+        """为失败记录生成问题详情（``offset`` 为列中第一条记录的编号）"""
+        for index in failed:
+            yield cls._make_issue(rule, offset + index, column[index])
+
+    @staticmethod
+    def _make_issue(rule: DataQualityRule, record_id: int, field_value: Any) -> Dict[str, Any]:
+        """生成一条问题详情"""
+        pattern = rule.parameters.get('pattern')
+        if rule.rule_type == "not_null":
+            issue_message = f"字段 {rule.field_name} 不能为空"
+        elif rule.rule_type == "unique":
+            issue_message = f"字段 {rule.field_name} 值重复: {field_value}"
+        elif rule.rule_type == "range":
+            if isinstance(field_value, (int, float)):
                 min_val = rule.parameters.get('min')
                 max_val = rule.parameters.get('max')
-                if isinstance(field_value, (int, float)):
-                    is_valid = (min_val is None or field_value >= min_val) and (
-                        max_val is None or field_value <= max_val
-                    )
-                    issue_message = (
-                        f"字段 {rule.field_name} 值 {field_value} 超出范围 [{min_val}, {max_val}]"
-                    )
-                else:
-                    is_valid = False
-                    issue_message = f"字段 {rule.field_name} 不是数值类型"
-
-            elif rule.rule_type == "pattern":
-                pattern = rule.parameters.get('pattern')
-                if pattern and isinstance(field_value, str):
-                    is_valid = bool(re.match(pattern, field_value))
-                    issue_message = f"字段 {rule.field_name} 值 {field_value} 不匹配模式 {pattern}"
+                issue_message = (
+                    f"字段 {rule.field_name} 值 {field_value} 超出范围 [{min_val}, {max_val}]"
+                )
+            else:
+                issue_message = f"字段 {rule.field_name} 不是数值类型"
+        elif pattern and isinstance(field_value, str):
+            issue_message = f"字段 {rule.field_name} 值 {field_value} 不匹配模式 {pattern}"
+        else:
+            issue_message = f"字段 {rule.field_name} 模式验证失败"
+
+        return {
+            'record_id': record_id,
+            'field_name': rule.field_name,
+            'field_value': field_value,
+            'rule_name': rule.name,
+            'severity': rule.severity,
+            'message': issue_message,
+        }
+
+    def validate_stream(
+        self,
+        records: Iterable[Dict[str, Any]],
+        chunk_size: int = DEFAULT_VALIDATION_CHUNK_SIZE,
+        max_issues_per_rule: int = DEFAULT_MAX_ISSUES_PER_RULE,
+    ) -> Dict[str, Any]:
+        """分块验证记录流（如 ``csv.DictReader`` 或逐行解析的JSONL）
+
+        每次只转置 ``chunk_size`` 条记录，规则的计数在块之间累加，``unique``
+        规则保存已出现的值，每个规则最多保留 ``max_issues_per_rule`` 条问题详情。
+        计数与 ``validate_data`` 相同；``unique`` 的首次出现在第二次出现时才
+        记为失败，因此问题详情的顺序可能不同。
+
+        内存占用取决于块大小、``unique`` 字段的不同值个数，以及每条记录
+        1比特的失败标记。
+        """
+        states = [_RuleState(rule, max_issues_per_rule) for rule in self.rules]
+        failed_bits = bytearray()
+        failed_records = 0
+        total = 0
+
+        def mark_failed(record_id: int) -> None:
+            nonlocal failed_records
+            byte, bit = divmod(record_id, 8)
+            if not failed_bits[byte] >> bit & 1:
+                failed_bits[byte] |= 1 << bit
+                failed_records += 1
+
+        iterator = iter(records)
+        while True:
+            chunk = list(islice(iterator, max(chunk_size, 1)))
+            if not chunk:
+                break
+            failed_bits.extend(bytes((total + len(chunk)) // 8 + 1 - len(failed_bits)))
+
+            columns = self._to_columns(chunk)
+            for state in states:
+                column = columns[state.rule.field_name]
+                if state.rule.rule_type == "unique":
+                    failed, earlier = state.unique_failures(column, total)
+                    for record_id, value in earlier:
+                        mark_failed(record_id)
+                        state.record_issue(record_id, value)
                 else:
-                    is_valid = False
-                    issue_message = f"字段 {rule.field_name} 模式验证失败"
+                    failed = self._failed_indices(state.rule, column)
+
+                state.failed += len(failed)
+                state.passed += len(column) - len(failed)
+                for index in failed:
+                    mark_failed(total + index)
+                    state.record_issue(total + index, column[index])
+            total += len(chunk)
+
+        # 首次出现在后续块中才被判定为重复，需从通过数中扣除
+        for state in states:
+            state.passed -= state.late_failures
+            state.failed += state.late_failures
+
+        issues: List[Dict[str, Any]] = []
+        for state in states:
+            issues.extend(state.issues)
+        return {
+            'total_records': total,
+            'passed_records': total - failed_records,
+            'failed_records': failed_records,
+            'rule_results': {state.rule.name: state.result() for state in states},
+            'issues': issues,
+            'issues_truncated': any(len(state.issues) < state.failed for state in states),
+        }
 
-            if is_valid:
-                rule_result['passed'] += 1
-            else:
-                rule_result['failed'] += 1
-                rule_result['issues'].append(
-                    {
-                        'record_id': record_id,
-                        'field_name': rule.field_name,
-                        'field_value': field_value,
-                        'rule_name': rule.name,
-                        'severity': rule.severity,
-                        'message': issue_message,
-                    }
-                )
 
-        return rule_result
+class _RuleState:
+    """流式验证中单个规则的累计状态"""
+
+    __slots__ = ('rule', 'passed', 'failed', 'late_failures', 'issues', 'issue_limit', 'seen',
+                 'unhashable')
+
+    def __init__(self, rule: DataQualityRule, issue_limit: int = DEFAULT_MAX_ISSUES_PER_RULE):
+        self.rule = rule
+        self.passed = 0
+        self.failed = 0
+        self.late_failures = 0
+        self.issues: List[Dict[str, Any]] = []
+        self.issue_limit = issue_limit
+        # unique 规则：值 -> [首次出现的记录编号, 首次出现的值]，已判定重复后编号为 None
+        self.seen: Dict[Any, List[Any]] = {}
+        self.unhashable: List[List[Any]] = []
+
+    def record_issue(self, record_id: int, field_value: Any) -> None:
+        """在上限内保留问题详情"""
+        if len(self.issues) < self.issue_limit:
+            self.issues.append(DataQualityValidator._make_issue(self.rule, record_id, field_value))
+
+    def unique_failures(
+        self, column: List[Any], offset: int
+    ) -> Tuple[List[int], List[Tuple[int, Any]]]:
+        """返回本块中重复值的下标，以及此前块中首次出现、现在才确认重复的记录"""
+        failed: List[int] = []
+        earlier: List[Tuple[int, Any]] = []
+        for index, value in enumerate(column):
+            entry = self._lookup(value, offset + index)
+            if entry is None:
+                continue
+
+            failed.append(index)
+            if entry[0] is not None:
+                # 首次出现的记录在本块内时随本块一起计入失败，否则单独计数
+                first_id = entry[0]
+                if first_id >= offset:
+                    failed.append(first_id - offset)
+                else:
+                    earlier.append((first_id, entry[1]))
+                    self.late_failures += 1
+                entry[0] = None
+        failed.sort()
+        return failed, earlier
+
+    def _lookup(self, value: Any, record_id: int) -> Optional[List[Any]]:
+        """查找值的首次出现记录 [记录编号, 值]；首次出现时登记并返回 None"""
+        try:
+            entry = self.seen.get(value)
+        except TypeError:
+            # 不可哈希的值按相等比较查找
+            for entry in self.unhashable:
+                if entry[1] == value:
+                    return entry
+            self.unhashable.append([record_id, value])
+            return None
+
+        if entry is None:
+            self.seen[value] = [record_id, value]
+        return entry
+
+    def result(self) -> Dict[str, Any]:
+        """与 validate_data 相同格式的规则结果"""
+        return {
+            'rule_name': self.rule.name,
+            'rule_type': self.rule.rule_type,
+            'passed': self.passed,
+            'failed': self.failed,
+            'issues': self.issues,
+        }
 
 
 class DataLineageTracker:
-    """数据血缘追踪器"""
+    """数据血缘追踪器
+
+    ``add_edge`` 同时维护按源节点和目标节点分组的邻接索引，上下游血缘通过
+    迭代广度优先遍历获取，复杂度为 O(V+E)，不受递归深度限制。
+    """
 
     def __init__(self):
         """__init__函数"""
         self.nodes: Dict[str, DataLineageNode] = {}
         self.edges: List[DataLineageEdge] = []
+        self._outgoing: Dict[str, List[DataLineageEdge]] = defaultdict(list)
+        self._incoming: Dict[str, List[DataLineageEdge]] = defaultdict(list)
+        self._indexed_edges = 0
 
     def add_node(self, node: DataLineageNode) -> None:
         """添加血缘节点"""
@@ -383,7 +1053,24 @@ class DataLineageTracker:
 
     def add_edge(self, edge: DataLineageEdge) -> None:
         """添加血缘边"""
+        self._sync_indexes()
         self.edges.append(edge)
+        self._index_edge(edge)
+
+    def _index_edge(self, edge: DataLineageEdge) -> None:
+        self._outgoing[edge.source_id].append(edge)
+        self._incoming[edge.target_id].append(edge)
+        self._indexed_edges += 1
+
+    def _sync_indexes(self) -> None:
+        """edges 列表被直接修改时重建邻接索引"""
+        if self._indexed_edges == len(self.edges):
+            return
+        self._outgoing.clear()
+        self._incoming.clear()
+        self._indexed_edges = 0
+        for edge in self.edges:
+            self._index_edge(edge)
 
     def track_transformation(
         self, source_id: str, target_id: str, transformation: str, **metadata
@@ -399,132 +1086,160 @@ class DataLineageTracker:
         self.add_edge(edge)
 
     def get_upstream_lineage(self, node_id: str, max_depth: int = 10) -> Dict[str, Any]:
-        """获取上游血缘"""
-        visited = set()
-        lineage = {'nodes': {}, 'edges': []}
-
-        def traverse_upstream(current_id: str, depth: int):
-            """traverse_upstream函数"""
-            if depth >= max_depth or current_id in visited:
-                return
-
-            visited.add(current_id)
-
-            if current_id in self.nodes:
-                lineage['nodes'][current_id] = self.nodes[current_id]
-
-            # 查找指向当前节点的边
-            for edge in self.edges:
-                if edge.target_id == current_id:
-                    lineage['edges'].append(edge)
-                    traverse_upstream(edge.source_id, depth + 1)
-
-        traverse_upstream(node_id, 0)
-        return lineage
+        """获取上游血缘（距离小于 max_depth 的节点及指向它们的边）"""
+        self._sync_indexes()
+        return self._traverse(node_id, max_depth, self._incoming, upstream=True)
 
     def get_downstream_lineage(self, node_id: str, max_depth: int = 10) -> Dict[str, Any]:
-        """获取下游血缘"""
-        visited = set()
-        lineage = {'nodes': {}, 'edges': []}
-
-        def traverse_downstream(current_id: str, depth: int):
-            """traverse_downstream函数"""
-            if depth >= max_depth or current_id in visited:
-                return
-
-            visited.add(current_id)
-
-            if current_id in self.nodes:
-                lineage['nodes'][current_id] = self.nodes[current_id]
-
-            # 查找从当前节点出发的边
-            for edge in self.edges:
-                if edge.source_id == current_id:
+        """获取下游血缘（距离小于 max_depth 的节点及从它们出发的边）"""
+        self._sync_indexes()
+        return self._traverse(node_id, max_depth, self._outgoing, upstream=False)
+
+    def _traverse(
+        self,
+        node_id: str,
+        max_depth: int,
+        adjacency: Dict[str, List[DataLineageEdge]],
+        upstream: bool,
+    ) -> Dict[str, Any]:
+        """从 node_id 出发按层遍历，每个节点及每条边只访问一次"""
+        lineage: Dict[str, Any] = {'nodes': {}, 'edges': []}
+        if max_depth <= 0:
+            return lineage
+
+        visited = {node_id}
+        frontier = [node_id]
+        depth = 0
+        while frontier:
+            next_frontier = []
+            for current_id in frontier:
+                if current_id in self.nodes:
+                    lineage['nodes'][current_id] = self.nodes[current_id]
+
+                # 用 get 避免在 defaultdict 中为没有边的节点创建空列表
+                for edge in adjacency.get(current_id, ()):
                     lineage['edges'].append(edge)
-                    traverse_downstream(edge.target_id, depth + 1)
+                    neighbor = edge.source_id if upstream else edge.target_id
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        next_frontier.append(neighbor)
+
+            depth += 1
+            if depth >= max_depth:
+                break
+            frontier = next_frontier
 
-        traverse_downstream(node_id, 0)
         return lineage
 
     def get_impact_analysis(self, node_id: str) -> Dict[str, Any]:
         """获取影响分析"""
-        downstream = self.get_downstream_lineage(node_id)
+        return summarize_impact(self.get_downstream_lineage(node_id))
 
-        impact_summary = {
-            'affected_nodes': len(downstream['nodes']),
-            'affected_transformations': len(downstream['edges']),
-            'critical_paths': [],
-            'recommendations': [],
-        }
+    def write_lineage_graph(self, handle: TextIO, format: str = "json") -> None:
+        """把血缘图逐条写入文件句柄"""
+        write_lineage(handle, self.nodes.values(), self.edges, format)
 
-        # 分析关键路径
-        for edge in downstream['edges']:
-            if 'critical' in edge.metadata:
-                impact_summary['critical_paths'].append(
-                    {
-                        'source': edge.source_id,
-                        'target': edge.target_id,
-                        'transformation': edge.transformation,
-                    }
-                )
+    def export_lineage_graph(self, format: str = "json") -> str:
+        """导出血缘图"""
+        buffer = io.StringIO()
+        self.write_lineage_graph(buffer, format)
+        return buffer.getvalue()
+
+
+def summarize_impact(downstream: Dict[str, Any]) -> Dict[str, Any]:
+    """根据下游血缘生成影响分析"""
+    impact_summary = {
+        'affected_nodes': len(downstream['nodes']),
+        'affected_transformations': len(downstream['edges']),
+        'critical_paths': [],
+        'recommendations': [],
+    }
+
+    # 分析关键路径
+    for edge in downstream['edges']:
+        if 'critical' in edge.metadata:
+            impact_summary['critical_paths'].append(
+                {
+                    'source': edge.source_id,
+                    'target': edge.target_id,
+                    'transformation': edge.transformation,
+                }
+            )
 
-        # 生成建议
-        if impact_summary['affected_nodes'] > 10:
-            impact_summary['recommendations'].append("影响范围较大，建议分阶段实施变更")
+    # 生成建议
+    if impact_summary['affected_nodes'] > 10:
+        impact_summary['recommendations'].append("影响范围较大，建议分阶段实施变更")
 
-        if impact_summary['critical_paths']:
-            impact_summary['recommendations'].append("存在关键路径，需要额外的测试和验证")
+    if impact_summary['critical_paths']:
+        impact_summary['recommendations'].append("存在关键路径，需要额外的测试和验证")
 
-        return impact_summary
+    return impact_summary
 
-    def export_lineage_graph(self, format: str = "json") -> str:
-        """导出血缘图"""
-        if format == "json":
-            return json.dumps(
+
+def write_lineage(
+    handle: TextIO,
+    nodes: Iterable[DataLineageNode],
+    edges: Iterable[DataLineageEdge],
+    format: str = "json",
+) -> None:
+    """逐条写出血缘图，不在内存中拼接整个文档
+
+    JSON 格式每个节点或边占一行；DOT 格式为 Graphviz 有向图。不支持的格式不写入内容。
+    """
+    if format == "json":
+        handle.write('{"nodes": [')
+        _write_json_items(
+            handle,
+            (
                 {
-                    'nodes': [
-                        {
-                            'id': node.id,
-                            'name': node.name,
-                            'type': node.type,
-                            'location': node.location,
-                            'metadata': node.metadata,
-                        }
-                        for node in self.nodes.values()
-                    ],
-                    'edges': [
-                        {
-                            'source': edge.source_id,
-                            'target': edge.target_id,
-                            'transformation': edge.transformation,
-                            'timestamp': edge.timestamp,
-                            'metadata': edge.metadata,
-                        }
-                        for edge in self.edges
-                    ],
-                },
-                indent=2,
-                ensure_ascii=False,
-            )
+                    'id': node.id,
+                    'name': node.name,
+                    'type': node.type,
+                    'location': node.location,
+                    'metadata': node.metadata,
+                }
+                for node in nodes
+            ),
+        )
+        handle.write('],\n"edges": [')
+        _write_json_items(
+            handle,
+            (
+                {
+                    'source': edge.source_id,
+                    'target': edge.target_id,
+                    'transformation': edge.transformation,
+                    'timestamp': edge.timestamp,
+                    'metadata': edge.metadata,
+                }
+                for edge in edges
+            ),
+        )
+        handle.write(']}\n')
 
-        elif format == "dot":
-            # Graphviz DOT格式
-            lines = ["digraph DataLineage {"]
+    elif format == "dot":
+        # Graphviz DOT格式
+        handle.write("digraph DataLineage {\n")
 
-            # 添加节点
-            for node in self.nodes.values():
-                lines.append(f'  "{node.id}" [label="{node.name}\\n({node.type})"];')
+        # 添加节点
+        for node in nodes:
+            handle.write(f'  "{node.id}" [label="{node.name}\\n({node.type})"];\n')
 
-            # 添加边
-            for edge in self.edges:
-                lines.append(
-                    f'  "{edge.source_id}" -> "{edge.target_id}" [label="{edge.transformation}"];'
-                )
+        # 添加边
+        for edge in edges:
+            handle.write(
+                f'  "{edge.source_id}" -> "{edge.target_id}" [label="{edge.transformation}"];\n'
+            )
 
-            lines.append("}")
-            return "\n".join(lines)
+        handle.write("}\n")
 
-        return ""
+
+def _write_json_items(handle: TextIO, items: Iterable[Dict[str, Any]]) -> None:
+    separator = '\n'
+    for item in items:
+        handle.write(separator)
+        handle.write(json.dumps(item, ensure_ascii=False))
+        separator = ',\n'
 
 
 class GDPRComplianceChecker:
@@ -672,15 +1387,34 @@ class GDPRComplianceChecker:
 class DataGovernanceManager:
     """数据治理管理器"""
 
-    def __init__(self, project_path: Path):
-        """__init__函数"""
+    def __init__(
+        self,
+        project_path: Path,
+        file_index: Optional[ProjectFileIndex] = None,
+        jobs: int = 1,
+        max_detailed_findings: int = DEFAULT_DETAILED_FINDINGS,
+    ):
+        """初始化数据治理管理器
+
+        Args:
+            project_path: 项目路径
+            file_index: 共享的项目文件索引
+            jobs: 隐私扫描的并行度，小于等于0时使用全部CPU核心
+            max_detailed_findings: 扫描报告中每个严重程度保留的完整结果数
+        """
         self.project_path = project_path
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.max_detailed_findings = max_detailed_findings
+        self.file_index = file_index or ProjectFileIndex(project_path)
         self.config_dir = project_path / ".aiculture" / "data_governance"
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
         self.privacy_scanner = DataPrivacyScanner()
         self.quality_validator = DataQualityValidator()
-        self.lineage_tracker = DataLineageTracker()
+        # 血缘持久化到 SQLite，重启后保留；延迟导入避免与 lineage_store 循环导入
+        from .lineage_store import LineageStore
+
+        self.lineage_tracker = LineageStore(self.config_dir / "lineage.db")
         self.gdpr_checker = GDPRComplianceChecker()
 
         self.data_inventory: List[DataField] = []
@@ -733,34 +1467,27 @@ class DataGovernanceManager:
         with open(inventory_file, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
 
-    def scan_project_for_privacy_issues(self) -> Dict[str, Any]:
-        """扫描项目中的隐私问题"""
-        all_findings = []
+    def scan_project_for_privacy_issues(self, jobs: Optional[int] = None) -> Dict[str, Any]:
+        """扫描项目中的隐私问题
 
-        # 扫描Python文件
-        for py_file in self.project_path.rglob("*.py"):
-            if any(
-                part.startswith('.') or part in ['venv', '__pycache__'] for part in py_file.parts
-            ):
-                continue
+        Args:
+            jobs: 并行度，为空时使用初始化时的设置；大于1时文件分批交给进程池
 
-            findings = self.privacy_scanner.scan_code_for_pii(py_file)
-            all_findings.extend(findings)
-
-        # 按严重程度分组
-        by_severity = {'high': [], 'medium': [], 'low': []}
-        for finding in all_findings:
-            severity = finding.get('severity', 'low')
-            by_severity[severity].append(finding)
+        ``by_severity`` 中每个严重程度只保留前 ``max_detailed_findings`` 条完整结果，
+        完整数量见 ``severity_counts``。
+        """
+        jobs = self.jobs if jobs is None else (jobs if jobs > 0 else (os.cpu_count() or 1))
+        file_paths = list(self.file_index.python_files())
+        aggregate = self._scan_privacy_batches(file_paths, jobs)
 
         return {
-            'total_findings': len(all_findings),
-            'by_severity': by_severity,
+            'total_findings': aggregate.total,
+            'by_severity': aggregate.details,
+            'severity_counts': aggregate.counts,
+            'truncated': aggregate.truncated,
             'summary': {
-                'high_risk_files': len(set(f['file'] for f in by_severity['high'])),
-                'pii_types_found': len(
-                    set(f.get('pii_type', '') for f in all_findings if f.get('pii_type'))
-                ),
+                'high_risk_files': len(aggregate.high_risk_files),
+                'pii_types_found': len(aggregate.pii_types),
                 'recommendations': [
                     "移除代码中的硬编码个人信息",
                     "使用环境变量或配置文件存储敏感信息",
@@ -770,6 +1497,18 @@ class DataGovernanceManager:
             },
         }
 
+    def _scan_privacy_batches(self, file_paths: List[Path], jobs: int) -> PrivacyScanAggregate:
+        """扫描文件并汇总结果
+
+        并行模式下各批次的汇总按提交顺序返回，合并后保留的完整结果与串行扫描相同。
+        """
+        limit = self.max_detailed_findings
+        task = partial(scan_files_for_privacy, self.privacy_scanner, detail_limit=limit)
+        aggregate = PrivacyScanAggregate(limit)
+        for batch in map_batches(task, file_paths, jobs, '隐私扫描'):
+            aggregate.merge(batch)
+        return aggregate
+
     def generate_compliance_report(self) -> Dict[str, Any]:
         """生成合规报告"""
         privacy_scan = self.scan_project_for_privacy_issues()
@@ -0,0 +1,300 @@
+"""
+项目文件索引 - 一次遍历，供所有检查器共享。
+
+使用单次 ``os.scandir`` 遍历构建项目文件清单：
+1. 在下降前剪枝需要跳过的目录
+2. 统一的忽略策略（隐藏目录、虚拟环境、构建产物以及 .gitignore）
+3. 按扩展名分组，并记录每个文件的 size / mtime_ns
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+# 统一跳过的目录名（隐藏目录另行整体跳过）
+DEFAULT_SKIP_DIRS = frozenset(
+    {
+        '__pycache__',
+        'node_modules',
+        'venv',
+        'env',
+        'build',
+        'dist',
+        'site-packages',
+        'htmlcov',
+        'coverage',
+    }
+)
+
+
+@dataclass(frozen=True)
+class FileStat:
+    """索引中记录的文件状态"""
+
+    size: int
+    mtime_ns: int
+
+
+@dataclass(frozen=True)
+class GitIgnoreRule:
+    """单条 .gitignore 规则"""
+
+    regex: Pattern[str]
+    negated: bool
+    dir_only: bool
+
+
+def _translate_gitignore_pattern(pattern: str) -> str:
+    """将 gitignore 通配符转换为正则表达式"""
+    parts = []
+    i = 0
+    length = len(pattern)
+
+    while i < length:
+        char = pattern[i]
+        if char == '*':
+            if pattern[i : i + 3] == '**/':
+                parts.append('(?:.*/)?')
+                i += 3
+                continue
+            if pattern[i : i + 2] == '**':
+                parts.append('.*')
+                i += 2
+                continue
+            parts.append('[^/]*')
+        elif char == '?':
+            parts.append('[^/]')
+        elif char == '[':
+            end = pattern.find(']', i + 1)
+            if end == -1:
+                parts.append(re.escape(char))
+            else:
+                body = pattern[i + 1 : end]
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                parts.append(f'[{body}]')
+                i = end
+        elif char == '\\' and i + 1 < length:
+            i += 1
+            parts.append(re.escape(pattern[i]))
+        else:
+            parts.append(re.escape(char))
+        i += 1
+
+    return ''.join(parts)
+
+
+def parse_gitignore(content: str) -> List[GitIgnoreRule]:
+    """解析 .gitignore 内容为规则列表"""
+    rules = []
+
+    for raw_line in content.splitlines():
+        line = raw_line.rstrip()
+        if not line or line.startswith('#'):
+            continue
+
+        negated = line.startswith('!')
+        if negated:
+            line = line[1:]
+        elif line.startswith('\\'):
+            line = line[1:]
+
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            continue
+
+        # 包含斜杠的模式相对于 .gitignore 所在目录锚定，否则匹配任意层级的名称
+        anchored = '/' in line
+        line = line.lstrip('/')
+        body = _translate_gitignore_pattern(line)
+        prefix = '' if anchored else '(?:.*/)?'
+        rules.append(
+            GitIgnoreRule(
+                regex=re.compile(f'^{prefix}{body}$'),
+                negated=negated,
+                dir_only=dir_only,
+            )
+        )
+
+    return rules
+
+
+class ProjectFileIndex:
+    """项目文件索引
+
+    首次访问时执行一次目录遍历，之后所有检查器共享同一份结果。
+    调用 ``refresh()`` 后，下一次访问会重新遍历。
+    """
+
+    def __init__(
+        self,
+        project_path: Path,
+        skip_dirs: Optional[Iterable[str]] = None,
+        respect_gitignore: bool = True,
+    ) -> None:
+        """初始化项目文件索引
+
+        Args:
+            project_path: 项目根目录
+            skip_dirs: 需要跳过的目录名，默认使用 DEFAULT_SKIP_DIRS
+            respect_gitignore: 是否遵循各级目录中的 .gitignore
+        """
+        self.project_path = Path(project_path)
+        self.skip_dirs = frozenset(skip_dirs) if skip_dirs is not None else DEFAULT_SKIP_DIRS
+        self.respect_gitignore = respect_gitignore
+
+        self._files: Optional[List[Path]] = None
+        self._by_extension: Dict[str, List[Path]] = {}
+        self._stats: Dict[Path, FileStat] = {}
+        self.walk_count = 0
+
+    def refresh(self) -> None:
+        """丢弃当前索引，下次访问时重新遍历"""
+        self._files = None
+        self._by_extension = {}
+        self._stats = {}
+
+    @property
+    def files(self) -> List[Path]:
+        """索引中的全部文件（按路径排序）"""
+        if self._files is None:
+            self._build()
+        return self._files
+
+    @property
+    def by_extension(self) -> Dict[str, List[Path]]:
+        """按小写扩展名分组的文件"""
+        if self._files is None:
+            self._build()
+        return self._by_extension
+
+    def files_with_suffix(self, *suffixes: str) -> List[Path]:
+        """获取指定扩展名的文件，如 files_with_suffix('.py', '.pyi')"""
+        by_extension = self.by_extension
+        result: List[Path] = []
+        for suffix in suffixes:
+            result.extend(by_extension.get(suffix.lower(), []))
+        if len(suffixes) > 1:
+            result.sort()
+        return result
+
+    def python_files(self) -> List[Path]:
+        """获取所有Python文件"""
+        return self.files_with_suffix('.py')
+
+    def get_stat(self, file_path: Path) -> Optional[FileStat]:
+        """获取遍历时记录的文件状态"""
+        if self._files is None:
+            self._build()
+        return self._stats.get(Path(file_path))
+
+    def relative_path(self, file_path: Path) -> str:
+        """获取相对项目根目录的 POSIX 路径"""
+        return Path(file_path).relative_to(self.project_path).as_posix()
+
+    def _build(self) -> None:
+        """执行单次 scandir 遍历"""
+        self.walk_count += 1
+        files: List[Path] = []
+        by_extension: Dict[str, List[Path]] = {}
+        stats: Dict[Path, FileStat] = {}
+
+        # 栈元素: (目录路径, 相对路径, 生效的 gitignore 规则)
+        root_rules = self._load_gitignore(self.project_path, '', [])
+        stack: List[Tuple[Path, str, List[Tuple[str, GitIgnoreRule]]]] = [
+            (self.project_path, '', root_rules)
+        ]
+
+        while stack:
+            directory, rel_dir, rules = stack.pop()
+            try:
+                with os.scandir(directory) as iterator:
+                    entries = sorted(iterator, key=lambda entry: entry.name)
+            except OSError:
+                continue
+
+            subdirs = []
+            for entry in entries:
+                name = entry.name
+                if name.startswith('.'):
+                    continue
+
+                rel_path = f'{rel_dir}/{name}' if rel_dir else name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+
+                if is_dir:
+                    if name in self.skip_dirs or self._is_ignored(rel_path, True, rules):
+                        continue
+                    child_path = Path(entry.path)
+                    child_rules = self._load_gitignore(child_path, rel_path, rules)
+                    subdirs.append((child_path, rel_path, child_rules))
+                    continue
+
+                try:
+                    if not entry.is_file() or self._is_ignored(rel_path, False, rules):
+                        continue
+                    stat_result = entry.stat()
+                except OSError:
+                    continue
+
+                file_path = Path(entry.path)
+                files.append(file_path)
+                stats[file_path] = FileStat(stat_result.st_size, stat_result.st_mtime_ns)
+                by_extension.setdefault(file_path.suffix.lower(), []).append(file_path)
+
+            # 逆序入栈，保证按名称深度优先的稳定顺序
+            stack.extend(reversed(subdirs))
+
+        files.sort()
+        for paths in by_extension.values():
+            paths.sort()
+
+        self._files = files
+        self._by_extension = by_extension
+        self._stats = stats
+
+    def _load_gitignore(
+        self,
+        directory: Path,
+        rel_dir: str,
+        inherited: List[Tuple[str, GitIgnoreRule]],
+    ) -> List[Tuple[str, GitIgnoreRule]]:
+        """读取目录中的 .gitignore，与上级规则合并"""
+        if not self.respect_gitignore:
+            return inherited
+
+        gitignore = directory / '.gitignore'
+        try:
+            content = gitignore.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            return inherited
+
+        rules = parse_gitignore(content)
+        if not rules:
+            return inherited
+        return inherited + [(rel_dir, rule) for rule in rules]
+
+    @staticmethod
+    def _is_ignored(
+        rel_path: str, is_dir: bool, rules: List[Tuple[str, GitIgnoreRule]]
+    ) -> bool:
+        """按 gitignore 语义判断路径是否被忽略（后出现的规则优先）"""
+        ignored = False
+        for base, rule in rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if base:
+                if not rel_path.startswith(base + '/'):
+                    continue
+                candidate = rel_path[len(base) + 1 :]
+            else:
+                candidate = rel_path
+            if rule.regex.match(candidate):
+                ignored = not rule.negated
+        return ignored
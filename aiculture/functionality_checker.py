@@ -12,6 +12,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .file_index import ProjectFileIndex
+
 
 @dataclass
 class FunctionalityViolation:
@@ -29,13 +31,16 @@ class FunctionalityViolation:
 class FunctionalityChecker:
     """功能完整性检查器 - 确保代码功能真正可用"""
 
-    def __init__(self, project_path: Path) -> None:
+    def __init__(self, project_path: Path, file_index: Optional[ProjectFileIndex] = None) -> None:
         """初始化功能完整性检查器
 
         Args:
             project_path: 项目根目录路径
+            file_index: 共享的项目文件索引，未提供时自动创建；共享索引由其所有者负责刷新
         """
         self.project_path = Path(project_path)
+        self._owns_file_index = file_index is None
+        self.file_index = file_index or ProjectFileIndex(self.project_path)
         self.violations: List[FunctionalityViolation] = []
 
     def check_all_functionality(self) -> List[FunctionalityViolation]:
@@ -45,6 +50,8 @@ class FunctionalityChecker:
             发现的违规列表
         """
         self.violations.clear()
+        if self._owns_file_index:
+            self.file_index.refresh()
 
         print("🎯 开始功能完整性检查...")
 
@@ -100,12 +107,7 @@ class FunctionalityChecker:
         """检查代码中引用的文件是否真实存在"""
         print("📁 检查文件依赖完整性...")
 
-        python_files = list(self.project_path.rglob("*.py"))
-
-        for py_file in python_files:
-            if self._should_skip_file(py_file):
-                continue
-
+        for py_file in self.file_index.python_files():
             try:
                 content = py_file.read_text(encoding='utf-8')
                 self._check_file_references_in_code(py_file, content)
@@ -256,10 +258,8 @@ class FunctionalityChecker:
         print("⚙️ 检查配置系统一致性...")
 
         # 查找配置相关文件
-        config_files = list(self.project_path.glob("**/*.yaml")) + list(
-            self.project_path.glob("**/*.yml")
-        )
-        python_files = [f for f in self.project_path.rglob("*.py") if "config" in f.name.lower()]
+        config_files = self.file_index.files_with_suffix(".yaml", ".yml")
+        python_files = [f for f in self.file_index.python_files() if "config" in f.name.lower()]
 
         if not config_files and python_files:
             self._add_violation(
@@ -272,8 +272,6 @@ class FunctionalityChecker:
 
         # 检查配置类与配置文件的一致性
         for py_file in python_files:
-            if self._should_skip_file(py_file):
-                continue
             self._check_config_class_consistency(py_file)
 
     def _check_config_class_consistency(self, config_file: Path) -> None:
@@ -377,19 +375,18 @@ class FunctionalityChecker:
         """检查测试覆盖率情况"""
         print("🧪 检查测试覆盖率...")
 
+        python_files = self.file_index.python_files()
+        tests_dir = self.project_path / "tests"
+
         # 查找测试文件
         test_files = (
-            list(self.project_path.rglob("test_*.py"))
-            + list(self.project_path.rglob("*_test.py"))
-            + list(self.project_path.glob("tests/**/*.py"))
+            [f for f in python_files if f.name.startswith("test_")]
+            + [f for f in python_files if f.name.endswith("_test.py")]
+            + [f for f in python_files if tests_dir in f.parents]
         )
 
         # 查找源代码文件
-        source_files = [
-            f
-            for f in self.project_path.rglob("*.py")
-            if "aiculture" in str(f) and not self._should_skip_file(f)
-        ]
+        source_files = [f for f in python_files if "aiculture" in str(f)]
 
         if not test_files and source_files:
             self._add_violation(
@@ -487,23 +484,6 @@ class FunctionalityChecker:
                 impact="依赖安装可能失败",
             )
 
-    # 辅助方法
-
-    def _should_skip_file(self, file_path: Path) -> bool:
-        """判断是否应该跳过检查的文件"""
-        skip_patterns = [
-            '__pycache__',
-            '.git',
-            '.venv',
-            'venv',
-            '.pytest_cache',
-            'node_modules',
-            '.aiculture/cache',
-        ]
-
-        file_str = str(file_path)
-        return any(pattern in file_str for pattern in skip_patterns)
-
     def generate_report(self) -> Dict[str, Any]:
         """生成功能完整性检查报告"""
         total_violations = len(self.violations)
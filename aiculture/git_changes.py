@@ -0,0 +1,83 @@
+"""
+基于Git的变更文件检测
+
+通过git自身的索引/stat缓存获取变更，而不是遍历整个目录树比较mtime：
+1. 工作区变更：未暂存修改 + 已暂存修改 + 未跟踪文件
+2. ``--staged``：仅暂存区中的文件（适用于 pre-commit）
+3. ``--since-ref``：``git diff <ref>...HEAD`` 加上工作区变更（适用于PR流水线）
+"""
+
+from pathlib import Path
+from typing import Iterable, List, Optional, Set
+
+from git import Repo
+from git.exc import GitCommandError, InvalidGitRepositoryError, NoSuchPathError
+
+# 只关心新增、复制、修改、重命名的文件，已删除的文件无需检查
+DIFF_FILTER = '--diff-filter=ACMR'
+
+
+class GitChangeDetector:
+    """Git变更文件检测器"""
+
+    def __init__(self, project_path: Path) -> None:
+        """初始化检测器
+
+        Args:
+            project_path: 项目路径，可以是仓库的子目录
+        """
+        self.project_path = Path(project_path)
+        self._resolved_project_path = self.project_path.resolve()
+        self.repo: Optional[Repo] = None
+        try:
+            self.repo = Repo(self._resolved_project_path, search_parent_directories=True)
+        except (InvalidGitRepositoryError, NoSuchPathError):
+            self.repo = None
+
+    @property
+    def available(self) -> bool:
+        """项目是否位于可用的git仓库中"""
+        return self.repo is not None and self.repo.working_tree_dir is not None
+
+    def staged_files(self) -> Set[Path]:
+        """暂存区中的变更文件"""
+        return self._paths(self._git_lines('diff', '--name-only', '--cached', DIFF_FILTER))
+
+    def working_tree_files(self) -> Set[Path]:
+        """工作区中的全部变更：未暂存、已暂存以及未跟踪的文件"""
+        lines = self._git_lines('diff', '--name-only', DIFF_FILTER)
+        lines += self._git_lines('diff', '--name-only', '--cached', DIFF_FILTER)
+        lines += self._git_lines('ls-files', '--others', '--exclude-standard')
+        return self._paths(lines)
+
+    def files_since_ref(self, ref: str) -> Set[Path]:
+        """自 ``ref`` 与 HEAD 的合并基点以来的变更，包含工作区中尚未提交的变更"""
+        lines = self._git_lines('diff', '--name-only', DIFF_FILTER, f'{ref}...HEAD')
+        return self._paths(lines) | self.working_tree_files()
+
+    def _git_lines(self, *args: str) -> List[str]:
+        """执行git命令并按行返回输出"""
+        if not self.available:
+            return []
+        try:
+            output = self.repo.git.execute(['git', '-c', 'core.quotepath=off', *args])
+        except GitCommandError as e:
+            print(f"git命令执行失败: {e}")
+            return []
+        return [line for line in output.splitlines() if line.strip()]
+
+    def _paths(self, lines: Iterable[str]) -> Set[Path]:
+        """将仓库相对路径转换为项目内仍存在的文件路径（以 project_path 为前缀）"""
+        if not self.available:
+            return set()
+        root = Path(self.repo.working_tree_dir).resolve()
+        paths = set()
+        for line in lines:
+            try:
+                relative = (root / line.strip()).relative_to(self._resolved_project_path)
+            except ValueError:
+                continue
+            path = self.project_path / relative
+            if path.is_file():
+                paths.add(path)
+        return paths
@@ -0,0 +1,249 @@
+"""
+项目内部的导入关系图
+
+基于共享的源码/AST缓存解析每个Python文件的 import 语句，
+只保留指向项目内部模块的边，用于查找某个文件的反向依赖（导入它的文件）。
+
+每个文件的导入引用（未解析的点分模块名）连同 size / mtime_ns 可以持久化到
+JSON 文件中；``update()`` 只重新解析状态发生变化的文件，再在内存中重新解析边。
+"""
+
+import ast
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .file_index import ProjectFileIndex
+from .source_cache import ParsedModuleCache, get_module_cache
+
+# 持久化格式版本
+GRAPH_FORMAT_VERSION = 1
+
+
+class ImportGraph:
+    """项目内部导入关系图"""
+
+    def __init__(
+        self,
+        project_path: Path,
+        file_index: Optional[ProjectFileIndex] = None,
+        module_cache: Optional[ParsedModuleCache] = None,
+        cache_file: Optional[Path] = None,
+    ) -> None:
+        """初始化导入关系图
+
+        Args:
+            project_path: 项目路径
+            file_index: 共享的项目文件索引，由其所有者负责刷新；为空时自行创建，
+                每次 ``update()`` 前重新遍历
+            module_cache: 共享的源码/AST缓存
+            cache_file: 持久化文件路径，为空时只在内存中构建
+        """
+        self.project_path = Path(project_path)
+        self._owns_file_index = file_index is None
+        self.file_index = file_index or ProjectFileIndex(self.project_path)
+        self.module_cache = module_cache or get_module_cache()
+        self.cache_file = cache_file
+
+        self.modules: Dict[str, Path] = {}
+        self.imports: Dict[Path, Set[Path]] = {}
+        self.importers: Dict[Path, Set[Path]] = {}
+
+        # 相对路径 -> {size, mtime_ns, prefix, exact}
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self._built = False
+
+    def build(self) -> None:
+        """丢弃已有记录，重新解析所有Python文件"""
+        self._records = {}
+        self._loaded = True
+        self.update()
+
+    def update(self) -> Set[Path]:
+        """按文件索引中的状态增量更新导入关系
+
+        Returns:
+            新增、修改或删除的Python文件
+        """
+        if not self._loaded:
+            self._load()
+        if self._owns_file_index:
+            self.file_index.refresh()
+
+        records: Dict[str, Dict[str, Any]] = {}
+        changed: Set[Path] = set()
+        for file_path in self.file_index.python_files():
+            key = self.file_index.relative_path(file_path)
+            stat = self.file_index.get_stat(file_path)
+            record = self._records.get(key)
+            if (
+                record is None
+                or stat is None
+                or record['size'] != stat.size
+                or record['mtime_ns'] != stat.mtime_ns
+            ):
+                prefix, exact = self._parse_references(file_path)
+                record = {
+                    'size': stat.size if stat else -1,
+                    'mtime_ns': stat.mtime_ns if stat else -1,
+                    'prefix': prefix,
+                    'exact': exact,
+                }
+                changed.add(file_path)
+            records[key] = record
+
+        changed |= {self.project_path / key for key in self._records.keys() - records.keys()}
+        self._records = records
+        self._resolve_all()
+        self._built = True
+
+        if changed and self.cache_file is not None:
+            self.save()
+        return changed
+
+    def save(self) -> None:
+        """将导入引用写入持久化文件"""
+        if self.cache_file is None:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': GRAPH_FORMAT_VERSION, 'files': self._records}, f)
+        except OSError as e:
+            print(f"保存导入关系图失败: {e}")
+
+    def importers_of(self, file_path: Path) -> Set[Path]:
+        """直接导入该文件的项目文件"""
+        self._ensure_built()
+        return set(self.importers.get(Path(file_path), ()))
+
+    def transitive_importers(self, file_paths: Iterable[Path]) -> Set[Path]:
+        """直接或间接导入这些文件的项目文件（不含输入文件本身）"""
+        self._ensure_built()
+        start = {Path(path) for path in file_paths}
+        seen: Set[Path] = set()
+        stack = list(start)
+
+        while stack:
+            current = stack.pop()
+            for importer in self.importers.get(current, ()):
+                if importer not in seen:
+                    seen.add(importer)
+                    stack.append(importer)
+
+        return seen - start
+
+    def _ensure_built(self) -> None:
+        if not self._built:
+            self.update()
+
+    def _load(self) -> None:
+        """读取持久化的导入引用（格式不符或损坏时忽略）"""
+        self._loaded = True
+        if self.cache_file is None or not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == GRAPH_FORMAT_VERSION:
+                self._records = data.get('files', {})
+        except (OSError, json.JSONDecodeError, AttributeError):
+            self._records = {}
+
+    def _resolve_all(self) -> None:
+        """根据所有文件的导入引用重新建立边及反向索引"""
+        self.modules = {}
+        paths = {key: self.project_path / key for key in sorted(self._records)}
+        for file_path in paths.values():
+            for name in self._module_names(file_path):
+                self.modules.setdefault(name, file_path)
+
+        self.imports = {}
+        self.importers = {}
+        for key, file_path in paths.items():
+            record = self._records[key]
+            targets: Set[Path] = set()
+            for name in record['prefix']:
+                target = self._resolve_prefix(name)
+                if target is not None:
+                    targets.add(target)
+            for name in record['exact']:
+                target = self.modules.get(name)
+                if target is not None:
+                    targets.add(target)
+            targets.discard(file_path)
+
+            self.imports[file_path] = targets
+            for target in targets:
+                self.importers.setdefault(target, set()).add(file_path)
+
+    def _source_roots(self) -> List[Path]:
+        """模块名解析的根目录：项目根目录以及 src 布局"""
+        roots = [self.project_path]
+        src = self.project_path / 'src'
+        if src.is_dir():
+            roots.append(src)
+        return roots
+
+    def _module_names(self, file_path: Path) -> List[str]:
+        """文件在各源码根目录下对应的点分模块名"""
+        names = []
+        for root in self._source_roots():
+            try:
+                parts = list(file_path.relative_to(root).with_suffix('').parts)
+            except ValueError:
+                continue
+            if parts and parts[-1] == '__init__':
+                parts = parts[:-1]
+            if parts:
+                names.append('.'.join(parts))
+        return names
+
+    def _parse_references(self, file_path: Path) -> Tuple[List[str], List[str]]:
+        """解析文件中的导入引用
+
+        Returns:
+            (按最长前缀解析的模块名, 需精确匹配的模块名)。后者来自
+            ``from 包 import 名称``，名称只有在恰好是子模块时才构成依赖。
+        """
+        module = self.module_cache.get(file_path)
+        if module is None or module.tree is None:
+            return [], []
+
+        names = self._module_names(file_path)
+        package = names[-1].split('.') if names else []
+        if file_path.name != '__init__.py':
+            package = package[:-1]
+
+        prefix: Set[str] = set()
+        exact: Set[str] = set()
+        for node in ast.walk(module.tree):
+            if isinstance(node, ast.Import):
+                prefix.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                if node.level:
+                    if node.level - 1 > len(package):
+                        continue
+                    base = package[: len(package) - (node.level - 1)]
+                    if node.module:
+                        base = base + node.module.split('.')
+                else:
+                    base = node.module.split('.') if node.module else []
+                if not base:
+                    continue
+                base_name = '.'.join(base)
+                prefix.add(base_name)
+                exact.update(f'{base_name}.{alias.name}' for alias in node.names)
+
+        return sorted(prefix), sorted(exact)
+
+    def _resolve_prefix(self, dotted_name: str) -> Optional[Path]:
+        """模块名对应的最长项目内部前缀模块"""
+        parts = dotted_name.split('.')
+        while parts:
+            target = self.modules.get('.'.join(parts))
+            if target is not None:
+                return target
+            parts.pop()
+        return None
@@ -13,6 +13,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .file_index import ProjectFileIndex
+
 
 @dataclass
 class InfrastructureViolation:
@@ -30,13 +32,16 @@ class InfrastructureViolation:
 class InfrastructureChecker:
     """基础设施检查器"""
 
-    def __init__(self, project_path: Path) -> None:
+    def __init__(self, project_path: Path, file_index: Optional[ProjectFileIndex] = None) -> None:
         """初始化基础设施检查器
 
         Args:
             project_path: 项目根目录路径
+            file_index: 共享的项目文件索引，未提供时自动创建；共享索引由其所有者负责刷新
         """
         self.project_path = Path(project_path)
+        self._owns_file_index = file_index is None
+        self.file_index = file_index or ProjectFileIndex(self.project_path)
         self.violations: List[InfrastructureViolation] = []
 
     def check_all_infrastructure(self) -> List[InfrastructureViolation]:
@@ -46,6 +51,8 @@ class InfrastructureChecker:
             发现的违规列表
         """
         self.violations.clear()
+        if self._owns_file_index:
+            self.file_index.refresh()
 
         # 环境管理检查
         self._check_environment_isolation()
@@ -302,16 +309,7 @@ class InfrastructureChecker:
     def _check_environment_variables(self) -> None:
         """检查环境变量使用"""
         # 扫描代码中的硬编码问题
-        python_files = list(self.project_path.rglob('*.py'))
-
-        for py_file in python_files:
-            if (
-                py_file.name.startswith('.')
-                or 'venv' in str(py_file)
-                or '__pycache__' in str(py_file)
-            ):
-                continue
-
+        for py_file in self.file_index.python_files():
             try:
                 content = py_file.read_text(encoding='utf-8')
                 lines = content.split('\n')
@@ -404,12 +402,7 @@ class InfrastructureChecker:
 
     def _check_cross_platform_compatibility(self) -> None:
         """检查跨平台兼容性"""
-        python_files = list(self.project_path.rglob('*.py'))
-
-        for py_file in python_files:
-            if py_file.name.startswith('.') or 'venv' in str(py_file):
-                continue
-
+        for py_file in self.file_index.python_files():
             try:
                 content = py_file.read_text(encoding='utf-8')
 
@@ -0,0 +1,55 @@
+"""
+文本行号映射
+
+为整段文本预先计算每行起始偏移，按字符偏移二分查找行号和列号。
+对整个文件缓冲区执行一次正则扫描后，用它把匹配位置换算为行列，
+无需逐行切分文本。
+"""
+
+from bisect import bisect_right
+from typing import List, Tuple
+
+
+class LineIndex:
+    """换行偏移表"""
+
+    __slots__ = ('text', 'line_starts')
+
+    def __init__(self, text: str) -> None:
+        """初始化换行偏移表
+
+        Args:
+            text: 完整文本，以 ``\\n`` 分行
+        """
+        self.text = text
+        starts: List[int] = [0]
+        find = text.find
+        position = find('\n')
+        while position != -1:
+            starts.append(position + 1)
+            position = find('\n', position + 1)
+        self.line_starts = starts
+
+    def __len__(self) -> int:
+        """行数，与 ``text.split('\\n')`` 的长度一致"""
+        return len(self.line_starts)
+
+    def line_number(self, offset: int) -> int:
+        """偏移所在的行号（从1开始）"""
+        return bisect_right(self.line_starts, offset)
+
+    def line_col(self, offset: int) -> Tuple[int, int]:
+        """偏移对应的 (行号, 列号)，行号从1开始，列号从0开始"""
+        line = bisect_right(self.line_starts, offset)
+        return line, offset - self.line_starts[line - 1]
+
+    def line_start(self, line: int) -> int:
+        """行首偏移"""
+        return self.line_starts[line - 1]
+
+    def line_text(self, line: int) -> str:
+        """行内容（不含换行符）"""
+        start = self.line_starts[line - 1]
+        if line < len(self.line_starts):
+            return self.text[start : self.line_starts[line] - 1]
+        return self.text[start:]
@@ -0,0 +1,288 @@
+"""
+持久化的数据血缘存储
+
+节点和边保存在 SQLite（WAL 模式）中，边表按源节点和目标节点建索引。
+上下游血缘在数据库中按层展开（每层一条 INSERT ... SELECT，已到达的节点不再展开），
+导出时逐行读取并写入文件句柄，图的规模不受内存限制，进程重启后血缘仍然保留。
+"""
+
+import io
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, TextIO
+
+from .data_governance_culture import (
+    DataLineageEdge,
+    DataLineageNode,
+    summarize_impact,
+    write_lineage,
+)
+
+# 数据库结构版本，变化时丢弃旧表重建
+LINEAGE_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS lineage_nodes (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    location TEXT NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS lineage_edges (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    source_id TEXT NOT NULL,
+    target_id TEXT NOT NULL,
+    transformation TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_lineage_edges_source ON lineage_edges (source_id);
+CREATE INDEX IF NOT EXISTS idx_lineage_edges_target ON lineage_edges (target_id);
+"""
+
+_UPSERT_NODE_SQL = """
+INSERT INTO lineage_nodes (id, name, type, location, metadata)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    name = excluded.name,
+    type = excluded.type,
+    location = excluded.location,
+    metadata = excluded.metadata
+"""
+
+_INSERT_EDGE_SQL = """
+INSERT INTO lineage_edges (source_id, target_id, transformation, timestamp, metadata)
+VALUES (?, ?, ?, ?, ?)
+"""
+
+# 遍历时记录已到达节点及其最短距离的临时表（每个连接一份）
+_REACH_SCHEMA = """
+CREATE TEMP TABLE IF NOT EXISTS lineage_reach (
+    id TEXT PRIMARY KEY,
+    depth INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS temp.idx_lineage_reach_depth ON lineage_reach (depth);
+"""
+
+# 由上一层节点展开下一层：{next_column}/{join_column} 决定方向，
+# 下游沿 source -> target，上游反之；已到达的节点被主键忽略，每条边只展开一次
+_EXPAND_SQL = """
+INSERT OR IGNORE INTO lineage_reach (id, depth)
+SELECT e.{next_column}, ?
+FROM lineage_reach r JOIN lineage_edges e ON e.{join_column} = r.id
+WHERE r.depth = ?
+"""
+
+_EDGE_COLUMNS = "e.source_id, e.target_id, e.transformation, e.timestamp, e.metadata"
+_NODE_COLUMNS = "n.id, n.name, n.type, n.location, n.metadata"
+
+
+class LineageStore:
+    """基于 SQLite 的数据血缘存储
+
+    接口与 ``DataLineageTracker`` 相同，查询结果中的节点和边也是
+    ``DataLineageNode`` / ``DataLineageEdge``；边按 (源节点距离, 写入顺序) 排列。
+    数据库在第一次使用时才创建。
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """初始化血缘存储
+
+        Args:
+            db_path: 数据库文件路径
+        """
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """打开数据库连接并初始化表结构"""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+
+            if conn.execute('PRAGMA user_version').fetchone()[0] != LINEAGE_SCHEMA_VERSION:
+                for table in ('lineage_nodes', 'lineage_edges'):
+                    conn.execute(f'DROP TABLE IF EXISTS {table}')
+                conn.execute(f'PRAGMA user_version = {LINEAGE_SCHEMA_VERSION}')
+
+            conn.executescript(_SCHEMA)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.commit()
+                self._conn.close()
+                self._conn = None
+
+    def add_node(self, node: DataLineageNode) -> None:
+        """添加或更新血缘节点"""
+        self.add_nodes([node])
+
+    def add_nodes(self, nodes: Iterable[DataLineageNode]) -> None:
+        """批量添加或更新血缘节点（一个事务）"""
+        rows = (
+            (node.id, node.name, node.type, node.location, _dump(node.metadata))
+            for node in nodes
+        )
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(_UPSERT_NODE_SQL, rows)
+
+    def add_edge(self, edge: DataLineageEdge) -> None:
+        """添加血缘边"""
+        self.add_edges([edge])
+
+    def add_edges(self, edges: Iterable[DataLineageEdge]) -> None:
+        """批量添加血缘边（一个事务）"""
+        rows = (
+            (
+                edge.source_id,
+                edge.target_id,
+                edge.transformation,
+                edge.timestamp,
+                _dump(edge.metadata),
+            )
+            for edge in edges
+        )
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(_INSERT_EDGE_SQL, rows)
+
+    def track_transformation(
+        self, source_id: str, target_id: str, transformation: str, **metadata
+    ) -> None:
+        """追踪数据转换"""
+        self.add_edge(
+            DataLineageEdge(
+                source_id=source_id,
+                target_id=target_id,
+                transformation=transformation,
+                timestamp=time.time(),
+                metadata=metadata,
+            )
+        )
+
+    def get_upstream_lineage(self, node_id: str, max_depth: int = 10) -> Dict[str, Any]:
+        """获取上游血缘（距离小于 max_depth 的节点及指向它们的边）"""
+        return self._lineage(node_id, max_depth, upstream=True)
+
+    def get_downstream_lineage(self, node_id: str, max_depth: int = 10) -> Dict[str, Any]:
+        """获取下游血缘（距离小于 max_depth 的节点及从它们出发的边）"""
+        return self._lineage(node_id, max_depth, upstream=False)
+
+    def _lineage(self, node_id: str, max_depth: int, upstream: bool) -> Dict[str, Any]:
+        """在数据库中按层展开，再按距离一次性取出节点和边"""
+        lineage: Dict[str, Any] = {'nodes': {}, 'edges': []}
+        if max_depth <= 0:
+            return lineage
+
+        if upstream:
+            expand = _EXPAND_SQL.format(next_column='source_id', join_column='target_id')
+            edge_join = 'e.target_id'
+        else:
+            expand = _EXPAND_SQL.format(next_column='target_id', join_column='source_id')
+            edge_join = 'e.source_id'
+
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executescript(_REACH_SCHEMA)
+                conn.execute('DELETE FROM lineage_reach')
+                conn.execute('INSERT INTO lineage_reach (id, depth) VALUES (?, 0)', (node_id,))
+                for depth in range(1, max_depth):
+                    if not conn.execute(expand, (depth, depth - 1)).rowcount:
+                        break
+
+                node_rows = conn.execute(
+                    f"SELECT {_NODE_COLUMNS} FROM lineage_reach r "
+                    f"JOIN lineage_nodes n ON n.id = r.id ORDER BY r.depth, n.rowid"
+                ).fetchall()
+                edge_rows = conn.execute(
+                    f"SELECT {_EDGE_COLUMNS} FROM lineage_reach r "
+                    f"JOIN lineage_edges e ON {edge_join} = r.id ORDER BY r.depth, e.seq"
+                ).fetchall()
+                conn.execute('DELETE FROM lineage_reach')
+
+        for row in node_rows:
+            lineage['nodes'][row[0]] = _node_from_row(row)
+        lineage['edges'] = [_edge_from_row(row) for row in edge_rows]
+        return lineage
+
+    def get_impact_analysis(self, node_id: str) -> Dict[str, Any]:
+        """获取影响分析"""
+        return summarize_impact(self.get_downstream_lineage(node_id))
+
+    def iter_nodes(self) -> Iterator[DataLineageNode]:
+        """按添加顺序逐个读取全部节点"""
+        yield from self._iter_rows(
+            f"SELECT {_NODE_COLUMNS} FROM lineage_nodes n ORDER BY n.rowid", _node_from_row
+        )
+
+    def iter_edges(self) -> Iterator[DataLineageEdge]:
+        """按写入顺序逐条读取全部边"""
+        yield from self._iter_rows(
+            f"SELECT {_EDGE_COLUMNS} FROM lineage_edges e ORDER BY e.seq", _edge_from_row
+        )
+
+    def _iter_rows(self, sql: str, convert: Callable[[tuple], Any]) -> Iterator[Any]:
+        # 使用独立的游标分批读取，避免一次性加载整张表
+        with self._lock:
+            cursor = self._connection().execute(sql)
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(1000)
+            if not rows:
+                return
+            for row in rows:
+                yield convert(row)
+
+    def count(self) -> Dict[str, int]:
+        """节点数和边数"""
+        with self._lock:
+            conn = self._connection()
+            nodes = conn.execute('SELECT COUNT(*) FROM lineage_nodes').fetchone()[0]
+            edges = conn.execute('SELECT COUNT(*) FROM lineage_edges').fetchone()[0]
+        return {'nodes': nodes, 'edges': edges}
+
+    def write_lineage_graph(self, handle: TextIO, format: str = "json") -> None:
+        """把血缘图逐条写入文件句柄"""
+        write_lineage(handle, self.iter_nodes(), self.iter_edges(), format)
+
+    def export_lineage_graph(self, format: str = "json") -> str:
+        """导出血缘图（大图请使用 write_lineage_graph 写入文件）"""
+        buffer = io.StringIO()
+        self.write_lineage_graph(buffer, format)
+        return buffer.getvalue()
+
+
+def _dump(metadata: Dict[str, Any]) -> str:
+    return json.dumps(metadata, ensure_ascii=False, sort_keys=True, default=str)
+
+
+def _node_from_row(row: tuple) -> DataLineageNode:
+    return DataLineageNode(
+        id=row[0], name=row[1], type=row[2], location=row[3], metadata=json.loads(row[4])
+    )
+
+
+def _edge_from_row(row: tuple) -> DataLineageEdge:
+    return DataLineageEdge(
+        source_id=row[0],
+        target_id=row[1],
+        transformation=row[2],
+        timestamp=row[3],
+        metadata=json.loads(row[4]),
+    )
@@ -0,0 +1,239 @@
+"""
+单遍标记扫描
+
+按文档顺序访问HTML/JSX中的每个开始标签、结束标签和样式文本（``style``
+属性值与 ``<style>`` 元素内容），分派给已注册的规则回调。多套规则注册到
+同一个扫描器后，读取一次、扫描一遍即可得到全部结果；规则按标签属性判断，
+不再在整篇文档上运行回溯正则。
+"""
+
+import re
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .line_index import LineIndex
+
+# JSX属性中的花括号表达式（最多三层嵌套）
+_BRACES = r'\{(?:[^{}]|\{(?:[^{}]|\{[^{}]*\})*\})*\}'
+
+# 注释、开始标签（属性值可含引号字符串或JSX表达式）、结束标签
+_TOKEN_PATTERN = re.compile(
+    r'<!--.*?(?:-->|\Z)'
+    r'|<(?P<name>[A-Za-z][\w:.-]*)'
+    r'(?P<attrs>(?:[^>"\'{]|"[^"]*"|\'[^\']*\'|' + _BRACES + r')*)>'
+    r'|</(?P<end>[A-Za-z][\w:.-]*)\s*>',
+    re.DOTALL,
+)
+
+# 单个属性：JSX展开 {...props}，或 名称[=值]
+_ATTRIBUTE_PATTERN = re.compile(
+    r'(?P<spread>' + _BRACES + r')'
+    r'|(?P<name>[^\s"\'<>/={}]+)'
+    r'(?:\s*=\s*(?:"(?P<dq>[^"]*)"|\'(?P<sq>[^\']*)\'|(?P<expr>' + _BRACES + r')'
+    r'|(?P<bare>[^\s"\'=<>`{}]+)))?'
+)
+
+_STYLE_HINT = re.compile(r'style\s*=', re.IGNORECASE)
+
+# 内容按原始文本处理、不再识别其中标签的元素 -> 其结束标签
+_RAW_TEXT_END = {
+    name: re.compile(r'</' + name + r'\s*>', re.IGNORECASE) for name in ('script', 'style')
+}
+
+
+class MarkupTag:
+    """标签：属性在首次访问时才解析"""
+
+    __slots__ = ('name', 'offset', 'source', '_attrs_text', '_attrs_offset', '_attrs',
+                 '_value_offsets', '_spread')
+
+    def __init__(self, name: str, offset: int, source: str, attrs_text: str = '',
+                 attrs_offset: int = 0) -> None:
+        """初始化标签
+
+        Args:
+            name: 标签名（HTML中为小写，JSX中保留原样以区分组件）
+            offset: 标签在文档中的起始偏移
+            source: 标签原文
+            attrs_text: 标签名之后、``>`` 之前的属性文本
+            attrs_offset: 属性文本在文档中的起始偏移
+        """
+        self.name = name
+        self.offset = offset
+        self.source = source
+        self._attrs_text = attrs_text
+        self._attrs_offset = attrs_offset
+        self._attrs: Optional[Dict[str, Optional[str]]] = None
+        self._value_offsets: Dict[str, int] = {}
+        self._spread = False
+
+    @property
+    def attrs(self) -> Dict[str, Optional[str]]:
+        """属性（名称小写；无值属性为 None；JSX表达式保留花括号）"""
+        attrs = self._attrs
+        if attrs is None:
+            attrs = self._parse_attrs()
+        return attrs
+
+    @property
+    def has_spread(self) -> bool:
+        """是否含JSX属性展开，此时无法确定实际属性"""
+        if self._attrs is None:
+            self._parse_attrs()
+        return self._spread
+
+    def value_offset(self, name: str) -> int:
+        """属性值在文档中的起始偏移（不含引号）"""
+        if self._attrs is None:
+            self._parse_attrs()
+        return self._value_offsets[name]
+
+    def _parse_attrs(self) -> Dict[str, Optional[str]]:
+        """解析属性文本，返回解析出的属性"""
+        attrs: Dict[str, Optional[str]] = {}
+        for match in _ATTRIBUTE_PATTERN.finditer(self._attrs_text):
+            if match.group('spread'):
+                self._spread = True
+                continue
+            name = match.group('name').lower()
+            for group in ('dq', 'sq', 'expr', 'bare'):
+                value = match.group(group)
+                if value is not None:
+                    self._value_offsets[name] = self._attrs_offset + match.start(group)
+                    break
+            attrs.setdefault(name, value)
+        self._attrs = attrs
+        return attrs
+
+
+class MarkupScan:
+    """一次扫描的上下文：规则回调共享的状态和按规则ID收集的问题"""
+
+    __slots__ = ('file_path', 'line_index', 'state', 'issues')
+
+    def __init__(self, file_path: str, line_index: LineIndex) -> None:
+        """初始化扫描上下文"""
+        self.file_path = file_path
+        self.line_index = line_index
+        self.state: Dict[str, Any] = {}
+        self.issues: Dict[str, List[Any]] = defaultdict(list)
+
+    def line_number(self, offset: int) -> int:
+        """文档偏移所在的行号"""
+        return self.line_index.line_number(offset)
+
+    def add_issue(self, rule_id: str, issue: Any) -> None:
+        """记录规则发现的问题"""
+        self.issues[rule_id].append(issue)
+
+    def rule_issues(self, rule_ids: Iterable[str]) -> List[Any]:
+        """按给定的规则顺序拼接问题，同一规则内按文档顺序"""
+        issues: List[Any] = []
+        for rule_id in rule_ids:
+            issues.extend(self.issues.get(rule_id, ()))
+        return issues
+
+
+TagCallback = Callable[[MarkupTag, MarkupScan], None]
+StyleCallback = Callable[[str, int, MarkupScan], None]
+FinishCallback = Callable[[MarkupScan], None]
+
+
+class MarkupScanner:
+    """单遍标记扫描器"""
+
+    def __init__(self, jsx: bool = False) -> None:
+        """初始化扫描器
+
+        Args:
+            jsx: 按JSX扫描：标签名区分大小写（``<Img>`` 是组件而不是 ``<img>``）
+        """
+        self.jsx = jsx
+        self._start_callbacks: Dict[str, List[TagCallback]] = defaultdict(list)
+        self._end_callbacks: Dict[str, List[TagCallback]] = defaultdict(list)
+        self._style_callbacks: List[StyleCallback] = []
+        self._finish_callbacks: List[FinishCallback] = []
+
+    def _tag_name(self, name: str) -> str:
+        return name if self.jsx else name.lower()
+
+    def on_start_tag(self, names: Iterable[str], callback: TagCallback) -> None:
+        """注册开始标签回调"""
+        for name in names:
+            self._start_callbacks[self._tag_name(name)].append(callback)
+
+    def on_end_tag(self, names: Iterable[str], callback: TagCallback) -> None:
+        """注册结束标签回调"""
+        for name in names:
+            self._end_callbacks[self._tag_name(name)].append(callback)
+
+    def on_style(self, callback: StyleCallback) -> None:
+        """注册样式文本回调，参数为样式文本及其在文档中的起始偏移"""
+        self._style_callbacks.append(callback)
+
+    def on_finish(self, callback: FinishCallback) -> None:
+        """注册文档扫描结束回调，用于需要看完整篇文档才能判断的规则"""
+        self._finish_callbacks.append(callback)
+
+    def scan(self, content: str, file_path: str = '',
+             line_index: Optional[LineIndex] = None) -> MarkupScan:
+        """扫描文档一遍并分派回调
+
+        Args:
+            content: 文档内容
+            file_path: 写入问题的文件路径
+            line_index: 调用方已为 ``content`` 建好的换行偏移表，未提供时现建
+
+        Returns:
+            扫描上下文，``issues`` 中为各规则发现的问题
+        """
+        scan = MarkupScan(file_path, line_index or LineIndex(content))
+        start_callbacks = self._start_callbacks
+        end_callbacks = self._end_callbacks
+        style_callbacks = self._style_callbacks
+        search = _TOKEN_PATTERN.search
+        position = 0
+
+        while True:
+            match = search(content, position)
+            if match is None:
+                break
+            position = match.end()
+
+            name = match.group('name')
+            if name is not None:
+                name = self._tag_name(name)
+                attrs_text = match.group('attrs')
+                callbacks = start_callbacks.get(name)
+                styled = bool(style_callbacks) and _STYLE_HINT.search(attrs_text) is not None
+                if callbacks or styled:
+                    tag = MarkupTag(name, match.start(), match.group(0), attrs_text,
+                                    match.start('attrs'))
+                    for callback in callbacks or ():
+                        callback(tag, scan)
+                    style = tag.attrs.get('style') if styled else None
+                    if style and not style.startswith('{'):
+                        self._dispatch_style(style, tag.value_offset('style'), scan)
+                raw_end = _RAW_TEXT_END.get(name.lower())
+                if raw_end is not None and not attrs_text.rstrip().endswith('/'):
+                    # 原始文本元素：跳到结束标签，<style> 内容作为样式文本分派
+                    end = raw_end.search(content, position)
+                    text_end = end.start() if end else len(content)
+                    if raw_end is _RAW_TEXT_END['style'] and style_callbacks:
+                        self._dispatch_style(content[position:text_end], position, scan)
+                    position = text_end
+                continue
+
+            end_name = match.group('end')
+            if end_name is not None:
+                end_name = self._tag_name(end_name)
+                for callback in end_callbacks.get(end_name, ()):
+                    callback(MarkupTag(end_name, match.start(), match.group(0)), scan)
+
+        for finish in self._finish_callbacks:
+            finish(scan)
+        return scan
+
+    def _dispatch_style(self, text: str, offset: int, scan: MarkupScan) -> None:
+        for callback in self._style_callbacks:
+            callback(text, offset, scan)
@@ -13,6 +13,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .file_index import ProjectFileIndex
+
 
 @dataclass
 class LanguagePattern:
@@ -43,9 +45,10 @@ class LanguageMetrics:
 class LanguageAnalyzer(ABC):
     """语言分析器抽象基类"""
 
-    def __init__(self, project_path: Path) -> None:
+    def __init__(self, project_path: Path, file_index: Optional[ProjectFileIndex] = None) -> None:
         """初始化语言分析器"""
         self.project_path = project_path
+        self.file_index = file_index or ProjectFileIndex(project_path)
         self.patterns: List[LanguagePattern] = []
 
     @abstractmethod
@@ -68,12 +71,9 @@ class LanguageAnalyzer(ABC):
         """分析整个项目的该语言代码"""
         file_analyses = []
 
-        # 找到所有相关文件
+        # 找到所有相关文件（跳过规则由文件索引统一处理）
         for ext in self.get_file_extensions():
-            for file_path in self.project_path.rglob(f"*{ext}"):
-                if self._should_skip_file(file_path):
-                    continue
-
+            for file_path in self.file_index.files_with_suffix(ext):
                 try:
                     analysis = self.analyze_file(file_path)
                     if analysis:
@@ -97,23 +97,6 @@ class LanguageAnalyzer(ABC):
         # 聚合分析结果
         return self._aggregate_analysis(file_analyses)
 
-    def _should_skip_file(self, file_path: Path) -> bool:
-        """判断是否应该跳过文件"""
-        skip_patterns = [
-            'node_modules',
-            '.git',
-            'dist',
-            'build',
-            '.cache',
-            'coverage',
-            '.nyc_output',
-            'lib',
-            'out',
-            'target',
-        ]
-
-        return any(pattern in str(file_path) for pattern in skip_patterns)
-
     def _aggregate_analysis(self, file_analyses: List[Dict[str, Any]]) -> LanguageMetrics:
         """聚合多个文件的分析结果"""
         total_lines = sum(analysis.get('line_count', 0) for analysis in file_analyses)
@@ -607,11 +590,12 @@ class JavaScriptTypeScriptAnalyzer(LanguageAnalyzer):
 class MultiLanguageManager:
     """多语言管理器 - 协调不同语言的分析器"""
 
-    def __init__(self, project_path: Path) -> None:
+    def __init__(self, project_path: Path, file_index: Optional[ProjectFileIndex] = None) -> None:
         """初始化多语言管理器"""
         self.project_path = project_path
+        self.file_index = file_index or ProjectFileIndex(project_path)
         self.analyzers = {
-            'javascript': JavaScriptTypeScriptAnalyzer(project_path),
+            'javascript': JavaScriptTypeScriptAnalyzer(project_path, self.file_index),
             # 未来可以添加更多语言分析器
             # 'java': JavaAnalyzer(project_path),
             # 'go': GoAnalyzer(project_path),
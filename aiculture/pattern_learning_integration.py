@@ -15,6 +15,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from .ai_learning_system import AILearningEngine, LearningResult
+from .file_index import ProjectFileIndex
 from .multi_language_analyzer import LanguageMetrics, MultiLanguageManager
 
 
@@ -46,14 +47,24 @@ class IntegratedLearningResult:
 class PatternLearningIntegrator:
     """模式学习集成器"""
 
-    def __init__(self, project_path: Path) -> None:
-        """初始化模式学习集成器"""
+    def __init__(self, project_path: Path, file_index: Optional[ProjectFileIndex] = None) -> None:
+        """初始化模式学习集成器
+
+        Args:
+            project_path: 项目根目录路径
+            file_index: 共享的项目文件索引，未提供时自动创建；共享索引由其所有者负责刷新
+        """
         self.project_path = project_path
-        self.ai_learning_engine = AILearningEngine(project_path)
-        self.multi_language_manager = MultiLanguageManager(project_path)
+        self._owns_file_index = file_index is None
+        self.file_index = file_index or ProjectFileIndex(project_path)
+        self.ai_learning_engine = AILearningEngine(project_path, self.file_index)
+        self.multi_language_manager = MultiLanguageManager(project_path, self.file_index)
 
     def perform_comprehensive_learning(self) -> IntegratedLearningResult:
         """执行综合学习分析"""
+        if self._owns_file_index:
+            self.file_index.refresh()
+
         # 1. 执行Python AI学习
         try:
             python_learning = self.ai_learning_engine.learn_project_patterns()
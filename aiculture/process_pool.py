@@ -0,0 +1,62 @@
+"""
+文件批次的进程池执行
+
+单文件检查、隐私扫描和前端扫描共用的并行执行方式：文件按固定大小分批交给
+进程池，``map`` 按提交顺序返回各批次结果，调用方按顺序合并即可得到与串行
+执行相同的结果；进程池不可用时回退到串行执行。
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Sequence, TypeVar
+
+# 每个进程任务处理的最大文件数
+MAX_FILES_PER_BATCH = 64
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def process_pool_context() -> Any:
+    """子进程启动方式：调用方可能有其他线程在运行，直接fork不安全，优先使用forkserver"""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def batch_size(item_count: int, jobs: int) -> int:
+    """计算每个进程任务的文件数（每个进程约分到4批，便于负载均衡）"""
+    if item_count == 0:
+        return 1
+    per_worker = -(-item_count // (jobs * 4))
+    return max(1, min(MAX_FILES_PER_BATCH, per_worker))
+
+
+def map_batches(
+    task: Callable[[List[T]], R], items: Sequence[T], jobs: int, label: str
+) -> List[R]:
+    """分批执行任务，按批次顺序返回结果
+
+    ``jobs`` 不大于1或只有一批时在当前进程内执行一次 ``task(items)``。
+
+    Args:
+        task: 处理一批文件的任务，须可序列化（模块级函数或其 ``functools.partial``）
+        items: 待处理的文件
+        jobs: 并行度
+        label: 回退到串行执行时提示信息中的任务名称
+    """
+    items = list(items)
+    size = batch_size(len(items), jobs)
+    if jobs <= 1 or len(items) <= size:
+        return [task(items)]
+
+    batches = [items[i : i + size] for i in range(0, len(items), size)]
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(batches)), mp_context=process_pool_context()
+        ) as executor:
+            return list(executor.map(task, batches))
+    except (OSError, RuntimeError) as e:
+        # 进程池不可用（如受限环境），回退到串行执行
+        print(f"并行{label}不可用，改为串行执行: {e}")
+        return [task(items)]
@@ -0,0 +1,162 @@
+"""
+源码与AST缓存 - 每个文件在进程内只读取、解析一次。
+
+ParsedModule 保存解码后的文本、按行切分结果和AST，
+缓存以 (路径, mtime_ns, size) 作为键，文件变化后自动失效，
+并按估算内存占用进行LRU淘汰。
+"""
+
+import ast
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# 默认内存上限（估算值）
+DEFAULT_MAX_MEMORY_BYTES = 256 * 1024 * 1024
+
+# 文本、行列表与AST相对源码字节数的估算放大系数
+ESTIMATED_MEMORY_FACTOR = 12
+
+
+@dataclass
+class ParsedModule:
+    """已读取的源码模块，行列表与AST按需生成"""
+
+    path: Path
+    text: str
+    size: int
+    mtime_ns: int
+    syntax_error: Optional[Exception] = None
+    _lines: Optional[List[str]] = field(default=None, repr=False)
+    _tree: Optional[ast.Module] = field(default=None, repr=False)
+    _parsed: bool = field(default=False, repr=False)
+
+    @property
+    def lines(self) -> List[str]:
+        """按 '\\n' 切分的行（与AST行号一致）"""
+        if self._lines is None:
+            self._lines = self.text.split('\n')
+        return self._lines
+
+    @property
+    def tree(self) -> Optional[ast.Module]:
+        """模块AST，存在语法错误时为None"""
+        if not self._parsed:
+            try:
+                self._tree = ast.parse(self.text, filename=str(self.path))
+            except (SyntaxError, ValueError) as e:
+                self.syntax_error = e
+            self._parsed = True
+        return self._tree
+
+    @property
+    def estimated_memory(self) -> int:
+        """估算的内存占用（字节）"""
+        return max(self.size, len(self.text)) * ESTIMATED_MEMORY_FACTOR
+
+
+class ParsedModuleCache:
+    """进程级源码/AST缓存，带内存上限的LRU淘汰"""
+
+    def __init__(self, max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES) -> None:
+        """初始化缓存
+
+        Args:
+            max_memory_bytes: 估算内存上限，超出后淘汰最久未使用的模块
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self._entries: "OrderedDict[Path, Tuple[Tuple[int, int], ParsedModule]]" = OrderedDict()
+        self._memory_usage = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, file_path: Path) -> Optional[ParsedModule]:
+        """获取文件的ParsedModule，文件不可读或非UTF-8时返回None"""
+        path = Path(file_path)
+        try:
+            stat_result = path.stat()
+        except OSError:
+            return None
+        key = (stat_result.st_mtime_ns, stat_result.st_size)
+
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is not None and cached[0] == key:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return cached[1]
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        module = ParsedModule(
+            path=path,
+            text=text,
+            size=stat_result.st_size,
+            mtime_ns=stat_result.st_mtime_ns,
+        )
+
+        with self._lock:
+            self.misses += 1
+            previous = self._entries.pop(path, None)
+            if previous is not None:
+                self._memory_usage -= previous[1].estimated_memory
+            self._entries[path] = (key, module)
+            self._memory_usage += module.estimated_memory
+            self._evict()
+
+        return module
+
+    def invalidate(self, file_path: Path) -> None:
+        """移除单个文件的缓存"""
+        with self._lock:
+            previous = self._entries.pop(Path(file_path), None)
+            if previous is not None:
+                self._memory_usage -= previous[1].estimated_memory
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._entries.clear()
+            self._memory_usage = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取缓存统计信息"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'estimated_memory_bytes': self._memory_usage,
+                'max_memory_bytes': self.max_memory_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def _evict(self) -> None:
+        """淘汰最久未使用的条目直到低于内存上限（至少保留最新条目）"""
+        while self._memory_usage > self.max_memory_bytes and len(self._entries) > 1:
+            _, (_, module) = self._entries.popitem(last=False)
+            self._memory_usage -= module.estimated_memory
+            self.evictions += 1
+
+
+_module_cache: Optional[ParsedModuleCache] = None
+_module_cache_lock = threading.Lock()
+
+
+def get_module_cache() -> ParsedModuleCache:
+    """获取进程级共享的ParsedModuleCache"""
+    global _module_cache
+    if _module_cache is None:
+        with _module_cache_lock:
+            if _module_cache is None:
+                _module_cache = ParsedModuleCache()
+    return _module_cache
@@ -0,0 +1,364 @@
+"""
+外部质量工具编排器
+
+基于 asyncio 并发启动 black、flake8、mypy、bandit、pytest 等外部工具：
+1. 每个工具有独立的超时时间，超时后终止进程
+2. 逐行读取输出并解析为结构化的 ToolViolation
+3. 同一个编排器内相同的命令只执行一次，重复请求直接复用结果（包括正在执行中的请求）。
+   CLI 每次运行为每个项目创建一个编排器（``cli_commands.run_orchestrator``）传给
+   QualityTools 和 CultureEnforcer；``CultureEnforcer.quality_tools`` 也使用
+   CultureEnforcer 自身的编排器
+
+总耗时接近最慢的工具，而不是所有工具耗时之和。
+"""
+
+import asyncio
+import json
+import re
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# 默认超时时间（秒）
+DEFAULT_TIMEOUTS: Dict[str, float] = {
+    'black': 120.0,
+    'flake8': 120.0,
+    'mypy': 300.0,
+    'bandit': 300.0,
+    'pytest': 900.0,
+}
+
+# 单行输出的最大字节数（asyncio 默认只有 64 KiB）；超出的行被丢弃，不影响其他输出
+STREAM_LIMIT_BYTES = 16 * 1024 * 1024
+
+# flake8: path:line:col: CODE message
+FLAKE8_PATTERN = re.compile(r'^(?P<path>.+?):(?P<line>\d+):(?P<col>\d+): (?P<code>[A-Z]+\d+) (?P<msg>.*)$')
+
+# mypy 输出格式: path:line[:col]: error|warning|note: message  [code]
+MYPY_PATTERN = re.compile(
+    r'^(?P<path>.+?):(?P<line>\d+):(?:(?P<col>\d+):)? (?P<level>error|warning|note): '
+    r'(?P<msg>.*?)(?:  \[(?P<code>[\w-]+)\])?$'
+)
+
+# black --check: would reformat path
+BLACK_PATTERN = re.compile(r'^would reformat (?P<path>.+)$')
+
+# pytest -q: FAILED|ERROR nodeid - message
+PYTEST_PATTERN = re.compile(r'^(?P<kind>FAILED|ERROR) (?P<node>\S+)(?: - (?P<msg>.*))?$')
+
+
+@dataclass
+class ToolViolation:
+    """外部工具报告的问题"""
+
+    tool: str
+    file_path: str
+    line_number: int
+    column: int
+    code: str
+    message: str
+    severity: str  # error, warning, info
+
+
+@dataclass
+class ToolSpec:
+    """外部工具定义
+
+    Attributes:
+        name: 工具名
+        command: 命令行参数
+        timeout: 超时时间（秒）
+        line_parser: 逐行解析 stdout/stderr，适用于按行输出的工具
+        output_parser: 进程结束后解析完整 stdout，适用于 JSON 等整体输出
+    """
+
+    name: str
+    command: List[str]
+    timeout: float
+    line_parser: Optional[Callable[[str], Optional[ToolViolation]]] = None
+    output_parser: Optional[Callable[[str], List[ToolViolation]]] = None
+
+
+@dataclass
+class ToolResult:
+    """外部工具执行结果"""
+
+    name: str
+    command: List[str]
+    returncode: Optional[int] = None
+    stdout: str = ''
+    stderr: str = ''
+    duration: float = 0.0
+    available: bool = True
+    timed_out: bool = False
+    violations: List[ToolViolation] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        """工具已安装、未超时且退出码为0"""
+        return self.available and not self.timed_out and self.returncode == 0
+
+    @property
+    def output(self) -> str:
+        """合并后的输出"""
+        return '\n'.join(part for part in (self.stdout, self.stderr) if part)
+
+
+def _parse_flake8_line(line: str) -> Optional[ToolViolation]:
+    match = FLAKE8_PATTERN.match(line)
+    if not match:
+        return None
+    code = match['code']
+    return ToolViolation(
+        tool='flake8',
+        file_path=match['path'],
+        line_number=int(match['line']),
+        column=int(match['col']),
+        code=code,
+        message=match['msg'],
+        severity='error' if code[0] in 'EF' else 'warning',
+    )
+
+
+def _parse_mypy_line(line: str) -> Optional[ToolViolation]:
+    match = MYPY_PATTERN.match(line)
+    if not match:
+        return None
+    level = match['level']
+    return ToolViolation(
+        tool='mypy',
+        file_path=match['path'],
+        line_number=int(match['line']),
+        column=int(match['col'] or 0),
+        code=match['code'] or '',
+        message=match['msg'],
+        severity='info' if level == 'note' else level,
+    )
+
+
+def _parse_black_line(line: str) -> Optional[ToolViolation]:
+    match = BLACK_PATTERN.match(line)
+    if not match:
+        return None
+    return ToolViolation(
+        tool='black',
+        file_path=match['path'],
+        line_number=0,
+        column=0,
+        code='format',
+        message='文件格式不符合 black 规范',
+        severity='warning',
+    )
+
+
+def _parse_pytest_line(line: str) -> Optional[ToolViolation]:
+    match = PYTEST_PATTERN.match(line)
+    if not match:
+        return None
+    node = match['node']
+    return ToolViolation(
+        tool='pytest',
+        file_path=node.split('::', 1)[0],
+        line_number=0,
+        column=0,
+        code=match['kind'].lower(),
+        message=f"{node} {match['msg'] or ''}".strip(),
+        severity='error',
+    )
+
+
+def _parse_bandit_output(stdout: str) -> List[ToolViolation]:
+    try:
+        data = json.loads(stdout)
+    except json.JSONDecodeError:
+        return []
+    return [
+        ToolViolation(
+            tool='bandit',
+            file_path=issue.get('filename', ''),
+            line_number=issue.get('line_number', 0),
+            column=issue.get('col_offset', 0),
+            code=issue.get('test_id', ''),
+            message=issue.get('issue_text', ''),
+            severity=issue.get('issue_severity', 'LOW').lower(),
+        )
+        for issue in data.get('results', [])
+    ]
+
+
+def default_tool_specs(timeouts: Optional[Dict[str, float]] = None) -> Dict[str, ToolSpec]:
+    """默认的工具定义，所有工具都在项目根目录下以 ``.`` 为目标执行"""
+    timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+    specs = [
+        ToolSpec('black', ['black', '--check', '.'], timeouts['black'], _parse_black_line),
+        ToolSpec('flake8', ['flake8', '.'], timeouts['flake8'], _parse_flake8_line),
+        ToolSpec(
+            'mypy', ['mypy', '.', '--show-column-numbers'], timeouts['mypy'], _parse_mypy_line
+        ),
+        ToolSpec(
+            'bandit',
+            ['bandit', '-r', '.', '-f', 'json', '-q'],
+            timeouts['bandit'],
+            output_parser=_parse_bandit_output,
+        ),
+        ToolSpec(
+            'pytest',
+            ['pytest', '--cov=.', '--cov-report=json', '-q', '-rfE'],
+            timeouts['pytest'],
+            _parse_pytest_line,
+        ),
+    ]
+    return {spec.name: spec for spec in specs}
+
+
+class ToolOrchestrator:
+    """外部工具编排器"""
+
+    def __init__(
+        self,
+        project_path: Path,
+        timeouts: Optional[Dict[str, float]] = None,
+        specs: Optional[Dict[str, ToolSpec]] = None,
+    ) -> None:
+        """初始化编排器
+
+        Args:
+            project_path: 项目路径，工具在此目录下执行
+            timeouts: 覆盖默认超时时间
+            specs: 自定义工具定义，默认使用 ``default_tool_specs``
+        """
+        self.project_path = Path(project_path)
+        self.specs = specs if specs is not None else default_tool_specs(timeouts)
+        self._lock = threading.Lock()
+        self._futures: Dict[Tuple[Tuple[str, ...], str], Future] = {}
+
+    def run(self, names: Iterable[str]) -> Dict[str, ToolResult]:
+        """并发执行指定工具并等待全部完成
+
+        Raises:
+            KeyError: 未知的工具名
+        """
+        names = list(dict.fromkeys(names))
+        futures, owned = self._claim(names)
+        if owned:
+            self._execute_all(owned, futures)
+        return {name: futures[name].result() for name in names}
+
+    def submit(self, names: Iterable[str]) -> Future:
+        """在后台线程中执行工具，立即返回 Future
+
+        工具在调用线程中即登记为执行中，之后对相同工具的 ``run`` 会等待同一结果。
+        """
+        names = list(dict.fromkeys(names))
+        futures, owned = self._claim(names)
+        result: Future = Future()
+
+        def worker() -> None:
+            try:
+                if owned:
+                    self._execute_all(owned, futures)
+                result.set_result({name: futures[name].result() for name in names})
+            except Exception as e:
+                result.set_exception(e)
+
+        threading.Thread(target=worker, daemon=True).start()
+        return result
+
+    def reset(self) -> None:
+        """丢弃已完成的结果，下一次请求重新执行工具"""
+        with self._lock:
+            self._futures = {
+                key: future for key, future in self._futures.items() if not future.done()
+            }
+
+    def _claim(self, names: List[str]) -> Tuple[Dict[str, Future], List[ToolSpec]]:
+        """为每个工具取得共享的 Future，返回 (工具名 -> Future, 需要由调用方执行的工具)"""
+        futures: Dict[str, Future] = {}
+        owned: List[ToolSpec] = []
+        with self._lock:
+            for name in names:
+                spec = self.specs[name]
+                key = (tuple(spec.command), str(self.project_path))
+                future = self._futures.get(key)
+                if future is None:
+                    future = Future()
+                    self._futures[key] = future
+                    owned.append(spec)
+                futures[name] = future
+        return futures, owned
+
+    def _execute_all(self, specs: List[ToolSpec], futures: Dict[str, Future]) -> None:
+        """在新的事件循环中并发执行工具，并设置各自的 Future"""
+        try:
+            results = asyncio.run(self._gather(specs))
+        except Exception as e:
+            for spec in specs:
+                futures[spec.name].set_exception(e)
+            raise
+        for spec, result in zip(specs, results):
+            futures[spec.name].set_result(result)
+
+    async def _gather(self, specs: List[ToolSpec]) -> List[ToolResult]:
+        return list(await asyncio.gather(*(self._run_tool(spec) for spec in specs)))
+
+    async def _run_tool(self, spec: ToolSpec) -> ToolResult:
+        """执行单个工具，逐行收集输出并解析"""
+        result = ToolResult(name=spec.name, command=list(spec.command))
+        start = time.perf_counter()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *spec.command,
+                cwd=str(self.project_path),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=STREAM_LIMIT_BYTES,
+            )
+        except (FileNotFoundError, PermissionError):
+            result.available = False
+            return result
+
+        # 以 PIPE 启动，两个输出流一定存在
+        assert process.stdout is not None and process.stderr is not None
+        stdout_lines: List[str] = []
+        stderr_lines: List[str] = []
+
+        async def consume(stream: asyncio.StreamReader, lines: List[str]) -> None:
+            while True:
+                try:
+                    raw = await stream.readline()
+                except ValueError:
+                    # 超长行已被 StreamReader 丢弃，继续读取后续输出
+                    continue
+                if not raw:
+                    break
+                line = raw.decode('utf-8', errors='replace').rstrip('\r\n')
+                lines.append(line)
+                if spec.line_parser is not None:
+                    violation = spec.line_parser(line)
+                    if violation is not None:
+                        result.violations.append(violation)
+
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    consume(process.stdout, stdout_lines),
+                    consume(process.stderr, stderr_lines),
+                    process.wait(),
+                ),
+                timeout=spec.timeout,
+            )
+        except asyncio.TimeoutError:
+            result.timed_out = True
+            process.kill()
+            await process.wait()
+
+        result.returncode = process.returncode
+        result.stdout = '\n'.join(stdout_lines)
+        result.stderr = '\n'.join(stderr_lines)
+        result.duration = time.perf_counter() - start
+        if spec.output_parser is not None and not result.timed_out:
+            result.violations.extend(spec.output_parser(result.stdout))
+        return result
@@ -5,11 +5,18 @@
 
 import ast
 import re
+import sys
 from pathlib import Path
 from typing import Dict, List, Set, Any, Tuple
 from dataclasses import dataclass
 from collections import defaultdict, Counter
 
+# 从源码目录直接运行脚本时（未安装 aiculture）也能导入项目包
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aiculture.file_index import ProjectFileIndex  # noqa: E402
+from aiculture.source_cache import get_module_cache  # noqa: E402
+
 
 @dataclass
 class ArchitectureIssue:
@@ -32,6 +39,8 @@ class ArchitectureAnalyzer:
         self.issues = []
         self.dependencies = defaultdict(set)  # 简化的依赖图
         self.module_info = {}
+        self.file_index = ProjectFileIndex(project_path)
+        self.module_cache = get_module_cache()
 
     def analyze_architecture(self) -> Dict[str, Any]:
         """分析项目架构"""
@@ -59,35 +68,28 @@ class ArchitectureAnalyzer:
 
     def _analyze_dependencies(self):
         """分析模块依赖关系"""
-        python_files = list(self.project_path.rglob("*.py"))
-
-        for file_path in python_files:
-            if self._should_skip_file(file_path):
+        # 跳过的目录由共享文件索引统一处理，源码与AST来自共享缓存
+        for file_path in self.file_index.python_files():
+            module = self.module_cache.get(file_path)
+            if module is None or module.tree is None:
                 continue
 
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    tree = ast.parse(content)
-
-                module_name = self._get_module_name(file_path)
-                imports = self._extract_imports(tree)
+            tree = module.tree
+            module_name = self._get_module_name(file_path)
+            imports = self._extract_imports(tree)
 
-                self.module_info[module_name] = {
-                    'file_path': str(file_path),
-                    'imports': imports,
-                    'classes': self._extract_classes(tree),
-                    'functions': self._extract_functions(tree),
-                    'lines_of_code': len(content.split('\n')),
-                }
+            self.module_info[module_name] = {
+                'file_path': str(file_path),
+                'imports': imports,
+                'classes': self._extract_classes(tree),
+                'functions': self._extract_functions(tree),
+                'lines_of_code': len(module.lines),
+            }
 
-                # 构建依赖关系
-                for imported_module in imports:
-                    if imported_module.startswith('aiculture'):
-                        self.dependencies[module_name].add(imported_module)
-
-            except (SyntaxError, UnicodeDecodeError):
-                continue
+            # 构建依赖关系
+            for imported_module in imports:
+                if imported_module.startswith('aiculture'):
+                    self.dependencies[module_name].add(imported_module)
 
     def _check_circular_dependencies(self):
         """检查循环依赖（简化版本）"""
@@ -258,11 +260,6 @@ class ArchitectureAnalyzer:
                     )
                 )
 
-    def _should_skip_file(self, file_path: Path) -> bool:
-        """判断是否跳过文件"""
-        skip_dirs = {'venv', '__pycache__', '.git', 'node_modules', '.pytest_cache'}
-        return any(part in skip_dirs for part in file_path.parts)
-
     def _get_module_name(self, file_path: Path) -> str:
         """获取模块名"""
         relative_path = file_path.relative_to(self.project_path)
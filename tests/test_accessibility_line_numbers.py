@@ -0,0 +1,104 @@
+"""
+测试模块: aiculture.accessibility_culture 行号换算
+"""
+
+import re
+import shutil
+import tempfile
+from pathlib import Path
+
+from aiculture.accessibility_culture import AccessibilityChecker, ResponsiveDesignChecker
+
+HTML_CHUNK = """<nav class="top">
+  <h1>标题</h1>
+  <img src="a.png">
+  <input type="text" name="q">
+
+  <h3 style="color: #abc; outline: none">跳级</h3>
+  <img src="b.png" alt="b">
+"""
+
+CSS_CHUNK = """.card {
+  width: 320px;
+  height: 24px;
+}
+@media (max-width: 600px) { .card { width: 12px; } }
+"""
+
+
+def _expected_lines(pattern: str, content: str, flags: int) -> list:
+    """逐个匹配统计换行（优化前的算法），用于对照"""
+    return [
+        content[: match.start()].count("\n") + 1
+        for match in re.finditer(pattern, content, flags)
+    ]
+
+
+class TestAccessibilityLineNumbers:
+    """测试匹配位置按换行偏移表换算行号"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        self.checker = AccessibilityChecker()
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_html_rules_match_counting(self) -> None:
+        """测试HTML规则和标题层级的行号与逐个统计换行相同"""
+        content = "<!DOCTYPE html>\n" + HTML_CHUNK * 30
+        html_file = self.temp_path / "page.html"
+        html_file.write_text(content, encoding="utf-8")
+
+        issues = self.checker.check_html_file(html_file)
+
+        def lines(rule_id: str) -> list:
+            return [i.line_number for i in issues if i.rule_id == rule_id]
+
+        flags = re.IGNORECASE | re.MULTILINE
+        assert lines("missing_alt_text") == _expected_lines(r"<img src=\"a", content, flags)
+        assert lines("missing_form_labels") == _expected_lines(r"<input", content, flags)
+        assert lines("heading_hierarchy_skip") == _expected_lines(r"<h3", content, flags)
+        for rule_id in ("low_contrast", "missing_focus_indicators"):
+            pattern = self.checker.html_rules[rule_id]["pattern"]
+            assert lines(rule_id) == _expected_lines(pattern, content, flags), rule_id
+        assert lines("missing_skip_links") == [2]
+        assert lines("heading_hierarchy_skip")[:2] == [7, 14]
+
+    def test_jsx_rules_match_counting(self) -> None:
+        """测试JSX规则的行号"""
+        content = "const A = () => (\n  <div>\n    <img src={a} />\n    <input value={v} />\n"
+        content = content * 10 + ");\n"
+        jsx_file = self.temp_path / "App.jsx"
+        jsx_file.write_text(content, encoding="utf-8")
+
+        issues = self.checker.check_jsx_file(jsx_file)
+
+        assert [i.line_number for i in issues if i.rule_id == "missing_jsx_alt"] == list(
+            range(3, 40, 4)
+        )
+        assert [i.line_number for i in issues if i.rule_id == "missing_jsx_labels"] == list(
+            range(4, 41, 4)
+        )
+
+    def test_heading_hierarchy_without_shared_index(self) -> None:
+        """测试单独调用标题层级检查时自行建立偏移表"""
+        issues = self.checker._check_heading_hierarchy("<h1>a</h1>\n\n<h4>b</h4>", "x.html")
+
+        assert [(i.line_number, i.element) for i in issues] == [(3, "<h4>")]
+
+    def test_responsive_css_match_counting(self) -> None:
+        """测试响应式CSS规则的行号"""
+        content = CSS_CHUNK * 20
+        css_file = self.temp_path / "site.css"
+        css_file.write_text(content, encoding="utf-8")
+
+        checker = ResponsiveDesignChecker()
+        issues = checker.check_css_file(css_file)
+
+        for rule_id, rule in checker.css_rules.items():
+            actual = [i.line_number for i in issues if i.issue_type == rule_id]
+            assert actual == _expected_lines(rule["pattern"], content, re.IGNORECASE), rule_id
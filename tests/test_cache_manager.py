@@ -5,6 +5,23 @@ from typing import Any
 TODO: 添加具体的测试用例
 """
 
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from aiculture.cache_manager import (
+    CACHE_EXPIRY_SECONDS,
+    SQL_BATCH_SIZE,
+    CheckerScope,
+    CheckerSignature,
+    IncrementalChecker,
+    SmartCacheManager,
+    config_fingerprint,
+)
+
 
 class TestCacheManager:
     """TODO: 添加测试类文档字符串"""
@@ -18,3 +35,222 @@ class TestCacheManager:
         """TODO: 添加边界情况测试"""
         # 这是一个占位测试，请添加实际的测试逻辑
         assert True
+
+
+class TestSmartCacheManager:
+    """测试基于SQLite的SmartCacheManager"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        self.manager = SmartCacheManager(self.temp_path)
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        self.manager.close()
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, name: str, content: str) -> Path:
+        path = self.temp_path / name
+        path.write_text(content)
+        return path
+
+    def test_cached_violations_survive_reopen(self) -> None:
+        """测试缓存在提交后可被新的管理器读取"""
+        path = self._write("a.py", "x = 1\n")
+        self.manager.cache_file_violations(path, [{"line": 1, "message": "问题"}])
+        self.manager.save_cache()
+
+        reopened = SmartCacheManager(self.temp_path)
+        try:
+            assert reopened.is_file_cached(path)
+            assert reopened.get_cached_violations(path) == [{"line": 1, "message": "问题"}]
+        finally:
+            reopened.close()
+
+    def test_unchanged_file_is_not_rehashed(self) -> None:
+        """测试 size/mtime 未变化时不读取文件内容"""
+        path = self._write("a.py", "x = 1\n")
+        self.manager.cache_file_violations(path, [])
+
+        with patch.object(self.manager, "get_file_hash") as mock_hash:
+            assert self.manager.is_file_cached(path)
+            mock_hash.assert_not_called()
+
+    def test_touched_file_falls_back_to_content_hash(self) -> None:
+        """测试仅mtime变化时按内容哈希判断，内容变化则失效"""
+        path = self._write("a.py", "x = 1\n")
+        self.manager.cache_file_violations(path, [])
+        mtime_ns = path.stat().st_mtime_ns
+
+        os.utime(path, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+        assert self.manager.is_file_cached(path)
+        assert self.manager.cache_data["a.py"].mtime_ns == mtime_ns + 1_000_000_000
+
+        path.write_text("x = 2\n")
+        os.utime(path, ns=(mtime_ns, mtime_ns + 2_000_000_000))
+        assert not self.manager.is_file_cached(path)
+
+    def test_bulk_lookup(self) -> None:
+        """测试批量查询超过单批大小的路径"""
+        paths = [self._write(f"m{i}.py", f"x = {i}\n") for i in range(SQL_BATCH_SIZE + 20)]
+        self.manager.cache_many_violations({path: [i] for i, path in enumerate(paths)})
+        uncached = self._write("new.py", "y = 1\n")
+
+        valid = self.manager.get_valid_cached_violations(paths + [uncached])
+
+        assert len(valid) == len(paths)
+        assert valid[paths[-1]] == [len(paths) - 1]
+        assert uncached not in valid
+
+    def test_save_cache_expires_old_entries(self) -> None:
+        """测试保存时清理超过7天的条目"""
+        old = self._write("old.py", "x = 1\n")
+        fresh = self._write("fresh.py", "x = 2\n")
+        self.manager.cache_many_violations({old: [], fresh: []})
+        self.manager._conn.execute(
+            "UPDATE check_results SET created_at = ? WHERE file_hash = ?",
+            (time.time() - CACHE_EXPIRY_SECONDS - 1, self.manager.get_file_hash(old)),
+        )
+
+        self.manager.save_cache()
+
+        assert set(self.manager.cache_data) == {"fresh.py"}
+
+    def test_clear_cache(self) -> None:
+        """测试清空缓存"""
+        path = self._write("a.py", "x = 1\n")
+        self.manager.cache_file_violations(path, [])
+        self.manager.clear_cache()
+
+        assert self.manager.get_cache_stats()["cached_files"] == 0
+        assert self.manager.get_cached_violations(path) is None
+
+    def test_results_are_keyed_by_checker_signature(self) -> None:
+        """测试不同检查器、版本、配置指纹的结果互不干扰"""
+        path = self._write("a.py", "x = 1\n")
+        kiss_v1 = CheckerSignature("kiss", "1")
+        kiss_v2 = CheckerSignature("kiss", "2")
+        dry = CheckerSignature("dry", "1", "abc")
+
+        self.manager.cache_file_violations(path, ["kiss"], kiss_v1)
+        self.manager.cache_file_violations(path, ["dry"], dry)
+
+        assert self.manager.get_cached_violations(path, kiss_v1) == ["kiss"]
+        assert self.manager.get_cached_violations(path, dry) == ["dry"]
+        assert not self.manager.is_file_cached(path, kiss_v2)
+        assert not self.manager.is_file_cached(path, CheckerSignature("dry", "1", "def"))
+
+        assert self.manager.invalidate_checker(kiss_v2) == 1
+        assert not self.manager.is_file_cached(path, kiss_v1)
+        assert self.manager.is_file_cached(path, dry)
+
+    def test_identical_content_reuses_results(self) -> None:
+        """测试内容相同的文件共享检查结果"""
+        first = self._write("a.py", "x = 1\n")
+        second = self._write("b.py", "x = 1\n")
+
+        self.manager.cache_file_violations(first, ["same"])
+
+        assert self.manager.get_valid_cached_violations([second]) == {second: ["same"]}
+
+    def test_context_manager_closes_connection(self) -> None:
+        """测试退出上下文时关闭数据库连接"""
+        with SmartCacheManager(self.temp_path) as manager:
+            assert manager._conn is not None
+        assert manager._conn is None
+
+        with IncrementalChecker(self.temp_path, config={}) as checker:
+            checker.register_checker("kiss")
+        assert checker.cache_manager._conn is None
+
+
+class TestIncrementalChecker:
+    """测试按检查器增量失效的IncrementalChecker"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        self.files = []
+        for name in ("a.py", "b.py"):
+            path = self.temp_path / name
+            path.write_text(f"# {name}\n")
+            self.files.append(path)
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        shutil.rmtree(self.temp_dir)
+
+    def _run(self, config: dict) -> dict:
+        """注册检查器，返回各检查器需要检查的文件，并缓存结果"""
+        checker = IncrementalChecker(self.temp_path, config=config)
+        checker.register_checker("kiss", "1", ["culture.complexity"])
+        checker.register_checker("style", "1", ["culture.code_style"])
+        pending = {
+            checker_id: checker.get_files_to_check(checker_id)
+            for checker_id in checker.checkers
+        }
+        for checker_id, files in pending.items():
+            checker.store_results(checker_id, {path: [] for path in files})
+        checker.cache_manager.save_cache()
+        checker.update_last_check_timestamp()
+        checker.close()
+        return pending
+
+    def test_unrelated_config_change_keeps_results(self) -> None:
+        """测试配置变化只让依赖该配置的检查器重新检查"""
+        config = {"culture": {"complexity": {"max": 10}, "code_style": {"line_length": 88}}}
+        first = self._run(config)
+        assert first["kiss"] == set(self.files)
+
+        unchanged = self._run(config)
+        assert unchanged == {"kiss": set(), "style": set()}
+
+        config["culture"]["code_style"]["line_length"] = 100
+        after_change = self._run(config)
+        assert after_change["kiss"] == set()
+        assert after_change["style"] == set(self.files)
+
+    def test_fallback_uses_file_index(self) -> None:
+        """测试首次检查和时间戳模式跳过虚拟环境、依赖目录等"""
+        for skipped in ("venv/lib.py", "node_modules/pkg/x.py", ".git/hook.py"):
+            path = self.temp_path / skipped
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x = 1\n")
+
+        with IncrementalChecker(self.temp_path, config={}) as checker:
+            assert checker.get_files_to_check() == set(self.files)
+            assert checker.cache_manager.get_changed_files(0) == set(self.files)
+            assert checker.cache_manager.get_cache_stats()["total_files"] == 2
+
+    def test_reused_checker_sees_new_files(self) -> None:
+        """测试复用的检查器在后续检查中发现新增文件及其导入关系"""
+        a, _ = self.files
+        with IncrementalChecker(self.temp_path, config={}) as checker:
+            checker.register_checker("coupling", scope=CheckerScope.CROSS_FILE)
+            checker.store_results("coupling", {path: [] for path in checker.get_files_to_check()})
+            checker.update_last_check_timestamp()
+
+            # 新文件的mtime早于上次检查，只能通过导入关系图发现
+            importer = self.temp_path / "c.py"
+            importer.write_text("import a\n")
+            os.utime(importer, ns=(1, 1))
+            a.write_text("VALUE = 1\n")
+            future_ns = int((time.time() + 10) * 1e9)
+            os.utime(a, ns=(future_ns, future_ns))
+
+            assert checker.get_files_to_check("coupling") == {a, importer}
+            walks = checker.file_index.walk_count
+            assert checker.get_affected_files(CheckerScope.CROSS_FILE) == {a, importer}
+            assert checker.file_index.walk_count == walks + 1
+
+    def test_config_fingerprint_uses_selected_sections(self) -> None:
+        """测试配置指纹只取声明的配置项"""
+        base = {"culture": {"a": 1, "b": 2}}
+        changed = {"culture": {"a": 1, "b": 3}}
+
+        assert config_fingerprint(base, ["culture.a"]) == config_fingerprint(changed, ["culture.a"])
+        assert config_fingerprint(base, ["culture.b"]) != config_fingerprint(changed, ["culture.b"])
+        assert config_fingerprint(base) != config_fingerprint(changed)
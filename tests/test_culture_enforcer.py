@@ -2,11 +2,13 @@
 测试aiculture.culture_enforcer模块
 """
 
+import sys
 import tempfile
 from pathlib import Path
-from unittest.mock import patch
 
-from aiculture.culture_enforcer import CultureEnforcer
+from aiculture.culture_enforcer import ENFORCER_TOOLS, CultureEnforcer
+from aiculture.process_pool import batch_size
+from aiculture.tool_orchestrator import ToolOrchestrator, default_tool_specs
 
 
 class TestCultureEnforcer:
@@ -22,6 +24,7 @@ class TestCultureEnforcer:
         """清理测试环境"""
         import shutil
 
+        self.enforcer.close()
         shutil.rmtree(self.temp_dir)
 
     def test_culture_enforcer_creation(self) -> None:
@@ -159,23 +162,22 @@ class TestCultureEnforcer:
         assert isinstance(report, dict)
         assert report["score"] < 100  # 空项目不应该得满分
 
-    @patch('subprocess.run')
-    def test_check_code_quality_tools(self, mock_run) -> None:
-        """测试代码质量工具检查"""
-        # Mock subprocess.run to simulate tool execution
-        mock_run.return_value.returncode = 0
-        mock_run.return_value.stdout = ""
-        mock_run.return_value.stderr = ""
+    def test_check_code_quality_tools(self) -> None:
+        """测试flake8结果汇总为代码质量违规"""
+        flake8_output = "print('./test.py:1:1: E302 expected 2 blank lines'); raise SystemExit(1)"
+        enforcer = CultureEnforcer(self.temp_path, tools=_fake_tools(self.temp_path, flake8=flake8_output))
 
         # 创建一个Python文件
         py_file = self.temp_path / "test.py"
         py_file.write_text("def test() -> None:\n    pass\n")
 
         # 运行代码质量检查
-        self.enforcer._check_code_quality()
+        enforcer._check_code_quality()
 
-        # 验证subprocess.run被调用
-        assert mock_run.called
+        quality = [v for v in enforcer.violations if v.principle == "code_quality"]
+        assert len(quality) == 1
+        assert quality[0].file_path == "./test.py"
+        assert "1 个问题" in quality[0].description
 
     def test_calculate_score(self) -> None:
         """测试分数计算"""
@@ -191,3 +193,68 @@ class TestCultureEnforcer:
         score_errors_only = self.enforcer._calculate_score(1, 0)
         score_warnings_only = self.enforcer._calculate_score(0, 1)
         assert score_errors_only < score_warnings_only
+
+    def _write_files_with_violations(self, count: int) -> None:
+        """创建带有重复代码和大类的Python文件"""
+        duplicated = "    value = compute_something(alpha, beta, gamma)\n" * 3
+        methods = "".join(f"    def m{i}(self) -> None:\n        pass\n" for i in range(11))
+        for i in range(count):
+            (self.temp_path / f"module_{i:02d}.py").write_text(
+                f"def f{i}() -> None:\n{duplicated}\n\nclass Big{i}:\n{methods}"
+            )
+
+    def test_jobs_non_positive_uses_all_cores(self) -> None:
+        """测试jobs小于等于0时使用全部CPU核心"""
+        import os
+
+        enforcer = CultureEnforcer(self.temp_path, jobs=0)
+        assert enforcer.jobs == (os.cpu_count() or 1)
+        assert self.enforcer.jobs == 1
+
+    def test_parallel_file_checks_match_serial(self) -> None:
+        """测试进程池分块检查与串行检查结果及顺序一致"""
+        self._write_files_with_violations(12)
+
+        serial = self.enforcer._check_python_files()
+        parallel_enforcer = CultureEnforcer(self.temp_path, jobs=2)
+        assert batch_size(12, parallel_enforcer.jobs) < 12
+        parallel = parallel_enforcer._check_python_files()
+
+        assert len(serial) == 24
+        assert parallel == serial
+
+    def test_enforce_all_parallel_matches_serial(self) -> None:
+        """测试并行执行时违规顺序与串行执行一致"""
+        self._write_files_with_violations(6)
+
+        reports = []
+        for jobs in (1, 4):
+            tools = _fake_tools(self.temp_path)
+            enforcer = CultureEnforcer(self.temp_path, jobs=jobs, tools=tools)
+            reports.append(enforcer.enforce_all())
+            enforcer.close()
+        serial, parallel = reports
+
+        assert parallel["violations"] == serial["violations"]
+        assert parallel["score"] == serial["score"]
+
+    def test_bandit_issues_become_violations(self) -> None:
+        """测试bandit的JSON输出转换为安全违规"""
+        report = {"results": [{"filename": "./a.py", "line_number": 3, "issue_text": "eval",
+                               "issue_severity": "MEDIUM", "test_id": "B307"}]}
+        bandit = f"import json; print(json.dumps({report!r})); raise SystemExit(1)"
+        enforcer = CultureEnforcer(self.temp_path, tools=_fake_tools(self.temp_path, bandit=bandit))
+
+        enforcer._check_security()
+
+        assert [(v.severity, v.file_path, v.line_number) for v in enforcer.violations] == [
+            ("medium", "./a.py", 3)
+        ]
+
+
+def _fake_tools(project_path: Path, **scripts: str) -> ToolOrchestrator:
+    """用Python脚本代替外部工具的编排器"""
+    specs = default_tool_specs()
+    for name in ENFORCER_TOOLS:
+        specs[name].command = [sys.executable, "-c", scripts.get(name, "pass")]
+    return ToolOrchestrator(project_path, specs=specs)
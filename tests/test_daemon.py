@@ -0,0 +1,171 @@
+"""
+测试模块: aiculture.daemon
+"""
+
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from aiculture.cli import main
+from aiculture.daemon import (
+    CheckService,
+    CultureDaemon,
+    DaemonClient,
+    check_files,
+    socket_path_for,
+    unix_sockets_supported,
+)
+
+COMPLEX_SOURCE = "def f(x):\n" + "".join(
+    f"    if x == {i}:\n        return {i}\n" for i in range(12)
+)
+
+
+class TestCheckService:
+    """测试进程内检查服务"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        (self.temp_path / "complex.py").write_text(COMPLEX_SOURCE)
+        (self.temp_path / "simple.py").write_text("x = 1\n")
+        self.service = CheckService(self.temp_path)
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        self.service.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_check_reuses_cached_results(self) -> None:
+        """测试第二次检查命中结果缓存且结果一致"""
+        first = self.service.check(["complex.py", "simple.py"])
+        second = self.service.check(["complex.py", "simple.py"])
+
+        assert first["files_checked"] == 2
+        assert first["cache_hits"] == 0
+        assert second["cache_hits"] == 2
+        assert second["violations"] == first["violations"]
+        assert any(v["principle"] == "kiss" for v in first["violations"])
+
+    def test_identical_content_keeps_own_path(self) -> None:
+        """测试内容相同的文件共用缓存时违规记录各自的路径"""
+        (self.temp_path / "copy.py").write_text(COMPLEX_SOURCE)
+
+        first = self.service.check(["complex.py"])
+        second = self.service.check(["copy.py"])
+
+        assert second["cache_hits"] == 1
+        copy_path = str(self.service.project_path / "copy.py")
+        assert {v["file_path"] for v in second["violations"]} == {copy_path}
+        assert second["violations"] == [dict(v, file_path=copy_path) for v in first["violations"]]
+
+    def test_check_ignores_files_outside_project(self) -> None:
+        """测试忽略项目外及非Python文件"""
+        result = self.service.check(["/etc/hosts", "missing.py"])
+        assert result["files_checked"] == 0
+
+    def test_unknown_command(self) -> None:
+        """测试未知命令返回错误"""
+        assert self.service.handle({"command": "nope"})["ok"] is False
+
+
+@pytest.mark.skipif(not unix_sockets_supported(), reason="需要Unix域套接字")
+class TestCultureDaemon:
+    """测试守护进程的套接字协议"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        (self.temp_path / "complex.py").write_text(COMPLEX_SOURCE)
+        self.socket_path = self.temp_path / "d.sock"
+        self.daemon = CultureDaemon(self.temp_path, socket_path=self.socket_path)
+        self.thread = threading.Thread(target=self.daemon.serve_forever, daemon=True)
+        self.thread.start()
+        self.client = DaemonClient(self.temp_path, socket_path=self.socket_path)
+        for _ in range(100):
+            if self.client.is_running():
+                break
+            time.sleep(0.02)
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        self.daemon.stop()
+        self.thread.join(timeout=5)
+        shutil.rmtree(self.temp_dir)
+
+    def test_ping_check_and_shutdown(self) -> None:
+        """测试 ping、check、stats 以及 shutdown 后删除套接字"""
+        served = self.client.request("stats")["result"]["requests_served"]
+        assert self.client.request("ping") == {"ok": True, "result": "pong"}
+
+        response = self.client.request("check", files=["complex.py"])
+        assert response["ok"]
+        assert response["result"]["files_checked"] == 1
+        assert response["result"]["violations"]
+
+        stats = self.client.request("stats")["result"]
+        assert stats["requests_served"] == served + 3
+
+        assert self.client.request("shutdown")["ok"]
+        self.thread.join(timeout=5)
+        assert not self.thread.is_alive()
+        assert not self.socket_path.exists()
+
+    def test_invalid_request(self) -> None:
+        """测试无法解析的请求返回错误而不是断开服务"""
+        response = self.client.request("check", files=123)
+        assert response["ok"] is False
+        assert self.client.is_running()
+
+
+def test_check_files_falls_back_to_local() -> None:
+    """测试守护进程未运行时在本进程内检查"""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        temp_path = Path(temp_dir)
+        (temp_path / "complex.py").write_text(COMPLEX_SOURCE)
+
+        assert not DaemonClient(temp_path).is_running()
+        result = check_files(temp_path, [str(temp_path / "complex.py")])
+
+        assert result["served_by"] == "local"
+        assert result["files_checked"] == 1
+        assert socket_path_for(temp_path) == socket_path_for(temp_path / ".")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+@pytest.mark.skipif(not unix_sockets_supported(), reason="需要Unix域套接字")
+def test_cli_check_uses_running_daemon(monkeypatch: pytest.MonkeyPatch) -> None:
+    """测试 aiculture check FILE 在守护进程运行时交给它处理，相对路径按当前目录解析"""
+    temp_dir = tempfile.mkdtemp()
+    temp_path = Path(temp_dir).resolve()
+    (temp_path / "pkg").mkdir()
+    (temp_path / "complex.py").write_text(COMPLEX_SOURCE)
+    (temp_path / "pkg" / "complex.py").write_text(COMPLEX_SOURCE.replace("f(x)", "g(x)"))
+    daemon = CultureDaemon(temp_path)
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = DaemonClient(temp_path)
+        for _ in range(100):
+            if client.is_running():
+                break
+            time.sleep(0.02)
+        monkeypatch.chdir(temp_path / "pkg")
+        runner = CliRunner()
+
+        single = runner.invoke(main, ["check", "-p", str(temp_path), "complex.py"])
+        assert "1 个文件" in single.output and "守护进程" in single.output
+        assert "函数 g 复杂度过高" in single.output
+    finally:
+        daemon.stop()
+        thread.join(timeout=5)
+        shutil.rmtree(temp_dir)
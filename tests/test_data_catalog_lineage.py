@@ -0,0 +1,128 @@
+"""
+测试模块: aiculture.data_catalog.DataCatalog 血缘索引
+"""
+
+import json
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from aiculture.data_catalog import (
+    DataAsset,
+    DataAssetType,
+    DataCatalog,
+    DataClassification,
+    DataFormat,
+)
+
+
+def _asset(asset_id: str) -> DataAsset:
+    now = time.time()
+    return DataAsset(
+        id=asset_id, name=asset_id, description="", asset_type=DataAssetType.TABLE,
+        classification=DataClassification.INTERNAL, format=DataFormat.CSV, owner="data",
+        steward="ops", location=f"db.{asset_id}", schema={}, tags=[], quality_metrics=None,
+        lineage=[], created_at=now, updated_at=now, metadata={},
+    )
+
+
+def _linear_lineage(catalog: DataCatalog, asset_id: str, direction: str) -> list:
+    """逐条扫描全部血缘（优化前的实现），用于对照"""
+    return [
+        lineage for lineage in catalog.lineages
+        if (direction in ("upstream", "both") and lineage.target_asset == asset_id)
+        or (direction in ("downstream", "both") and lineage.source_asset == asset_id)
+    ]
+
+
+class TestDataCatalogLineage:
+    """测试血缘只保存一份并按索引查询"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.catalog_dir = Path(self.temp_dir)
+        self.catalog = DataCatalog(self.catalog_dir)
+        with self.catalog.bulk():
+            for asset_id in ("raw", "clean", "mart", "report"):
+                self.catalog.add_asset(_asset(asset_id))
+            self.catalog.add_lineage("raw", "clean", "dedupe")
+            self.catalog.add_lineage("clean", "mart", "model")
+            self.catalog.add_lineage("mart", "report", "aggregate")
+            self.catalog.add_lineage("raw", "report", "sample")
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_direct_lineage_matches_scan(self) -> None:
+        """测试一跳查询与逐条扫描的结果和顺序相同"""
+        rng = random.Random(5)
+        for i in range(80):
+            self.catalog.add_lineage(f"n{rng.randrange(15)}", f"n{rng.randrange(15)}", f"t{i}")
+
+        for asset_id in ["raw", "report"] + [f"n{i}" for i in range(15)]:
+            for direction in ("upstream", "downstream", "both"):
+                assert self.catalog.get_lineage(asset_id, direction) == _linear_lineage(
+                    self.catalog, asset_id, direction
+                )
+
+    def test_multi_hop(self) -> None:
+        """测试多跳展开"""
+        def names(lineages: list) -> list:
+            return [lineage.transformation for lineage in lineages]
+
+        assert names(self.catalog.get_lineage("raw", "downstream", depth=2)) == [
+            "dedupe", "sample", "model"
+        ]
+        assert names(self.catalog.get_lineage("report", "upstream", depth=5)) == [
+            "aggregate", "sample", "model", "dedupe"
+        ]
+        assert names(self.catalog.get_lineage("clean", "both", depth=2)) == [
+            "dedupe", "model", "aggregate", "sample"
+        ]
+
+    def test_serialized_by_id(self) -> None:
+        """测试快照中资产按ID引用血缘，加载后共享同一个对象"""
+        self.catalog.compact()
+        snapshot = json.loads(self.catalog.catalog_file.read_text(encoding="utf-8"))
+        raw = next(asset for asset in snapshot["assets"] if asset["id"] == "raw")
+        assert raw["lineage"] == [lineage.id for lineage in self.catalog.get_lineage("raw")]
+
+        reloaded = DataCatalog(self.catalog_dir)
+        [dedupe, sample] = reloaded.get_lineage("raw")
+        assert reloaded.assets["raw"].lineage[0] is dedupe
+        assert reloaded.assets["clean"].lineage[0] is dedupe
+        assert sample.transformation == "sample"
+
+    def test_remove_asset_drops_lineage_everywhere(self) -> None:
+        """测试移除资产后另一端资产的血缘列表同步更新"""
+        self.catalog.remove_asset("mart")
+
+        assert [item.transformation for item in self.catalog.assets["clean"].lineage] == ["dedupe"]
+        assert self.catalog.get_lineage("report", "upstream") == [
+            self.catalog.assets["report"].lineage[0]
+        ]
+        reloaded = DataCatalog(self.catalog_dir)
+        assert [item.transformation for item in reloaded.lineages] == ["dedupe", "sample"]
+
+    def test_loads_legacy_snapshot(self) -> None:
+        """测试加载资产内嵌完整血缘副本、血缘没有ID的旧格式"""
+        legacy_dir = self.catalog_dir / "legacy"
+        legacy_dir.mkdir()
+        lineage = {"source_asset": "a", "target_asset": "b", "transformation": "copy",
+                   "created_at": 1.0, "metadata": {}}
+        asset = self.catalog._asset_to_dict(_asset("a"))
+        asset["lineage"] = [lineage]
+        (legacy_dir / "data_catalog.json").write_text(json.dumps({"assets": [asset]}))
+        (legacy_dir / "data_lineage.json").write_text(json.dumps({"lineages": [lineage]}))
+
+        catalog = DataCatalog(legacy_dir)
+
+        [loaded] = catalog.get_lineage("a")
+        assert loaded.id
+        assert catalog.assets["a"].lineage == [loaded]
+        assert catalog.assets["a"].lineage[0] is loaded
+        assert DataCatalog(legacy_dir).lineages[0].id == loaded.id
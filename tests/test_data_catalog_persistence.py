@@ -0,0 +1,144 @@
+"""
+测试模块: aiculture.data_catalog.DataCatalog 操作日志与快照
+"""
+
+import json
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from aiculture import data_catalog
+from aiculture.data_catalog import (
+    DataAsset,
+    DataAssetType,
+    DataCatalog,
+    DataClassification,
+    DataFormat,
+    DataQualityMetrics,
+)
+
+
+def _asset(asset_id: str, name: str = "", tags=None) -> DataAsset:
+    now = time.time()
+    return DataAsset(
+        id=asset_id, name=name or asset_id, description="", asset_type=DataAssetType.TABLE,
+        classification=DataClassification.INTERNAL, format=DataFormat.CSV, owner="data",
+        steward="ops", location=f"db.{asset_id}", schema={}, tags=list(tags or []),
+        quality_metrics=None, lineage=[], created_at=now, updated_at=now, metadata={},
+    )
+
+
+def _state(catalog: DataCatalog) -> tuple:
+    """可比较的目录状态"""
+    return (
+        {asset_id: catalog._asset_to_dict(asset) for asset_id, asset in catalog.assets.items()},
+        [(item.source_asset, item.target_asset, item.transformation) for item in catalog.lineages],
+    )
+
+
+class TestDataCatalogPersistence:
+    """测试追加式操作日志、压缩和崩溃恢复"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.catalog_dir = Path(self.temp_dir)
+        self.catalog = DataCatalog(self.catalog_dir)
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_mutations_append_to_log_and_replay(self) -> None:
+        """测试修改只追加日志，重新加载后状态一致"""
+        self.catalog.add_asset(_asset("orders", tags=["sales"]))
+        self.catalog.add_asset(_asset("users"))
+        self.catalog.add_asset(_asset("tmp"))
+        self.catalog.update_asset("orders", {"description": "订单明细"})
+        self.catalog.add_lineage("users", "orders", "join")
+        self.catalog.add_lineage("tmp", "orders", "copy")
+        self.catalog.remove_asset("tmp")
+        self.catalog.update_quality_metrics(
+            "users", DataQualityMetrics(90, 91, 92, 93, 94, 0)
+        )
+
+        assert not self.catalog.catalog_file.exists()
+        assert len(self.catalog.log_file.read_text(encoding="utf-8").splitlines()) == 8
+
+        reloaded = DataCatalog(self.catalog_dir)
+        assert _state(reloaded) == _state(self.catalog)
+        assert [a.id for a in reloaded.search_assets("订单")] == ["orders"]
+
+    def test_bulk_defers_and_compacts(self, monkeypatch) -> None:
+        """测试 bulk() 退出时才写入，日志足够长时压缩进快照"""
+        monkeypatch.setattr(data_catalog, "COMPACTION_MIN_OPS", 10)
+
+        with self.catalog.bulk():
+            for i in range(5):
+                self.catalog.add_asset(_asset(f"a{i}"))
+            assert not self.catalog.log_file.exists()
+        assert len(self.catalog.log_file.read_text(encoding="utf-8").splitlines()) == 5
+
+        with self.catalog.bulk():
+            with self.catalog.bulk():
+                for i in range(5, 20):
+                    self.catalog.add_asset(_asset(f"a{i}"))
+        assert not self.catalog.log_file.exists()
+        snapshot = json.loads(self.catalog.catalog_file.read_text(encoding="utf-8"))
+        assert len(snapshot["assets"]) == 20
+
+        self.catalog.remove_asset("a0")
+        assert _state(DataCatalog(self.catalog_dir)) == _state(self.catalog)
+
+    def test_incomplete_log_line_is_dropped(self) -> None:
+        """测试写入时崩溃留下的不完整行被忽略，之后的修改仍可恢复"""
+        self.catalog.add_asset(_asset("kept"))
+        with open(self.catalog.log_file, "a", encoding="utf-8") as f:
+            f.write('{"op": "put_asset", "asset": {"id": "lost"')
+
+        recovered = DataCatalog(self.catalog_dir)
+        recovered.add_asset(_asset("after"))
+
+        assert list(DataCatalog(self.catalog_dir).assets) == ["kept", "after"]
+
+    def test_crash_during_compaction_skips_applied_ops(self) -> None:
+        """测试血缘快照已写入、日志未清空时不会重复应用血缘"""
+        self.catalog.add_asset(_asset("src"))
+        self.catalog.add_asset(_asset("dst"))
+        self.catalog.add_lineage("src", "dst", "etl")
+        log_text = self.catalog.log_file.read_text(encoding="utf-8")
+
+        # 模拟压缩只完成了血缘快照
+        self.catalog._write_snapshot(
+            self.catalog.lineage_file,
+            {"lineages": [{"source_asset": "src", "target_asset": "dst",
+                           "transformation": "etl", "created_at": 0, "metadata": {}}],
+             "last_seq": 3},
+        )
+        self.catalog.log_file.write_text(log_text, encoding="utf-8")
+
+        reloaded = DataCatalog(self.catalog_dir)
+
+        assert len(reloaded.lineages) == 1
+        assert set(reloaded.assets) == {"src", "dst"}
+
+    def test_crash_during_compaction_keeps_asset_lineage(self) -> None:
+        """测试只写入血缘快照时，重放的资产仍引用快照中的血缘"""
+        self.catalog.add_asset(_asset("src"))
+        self.catalog.add_asset(_asset("dst"))
+        self.catalog.add_lineage("src", "dst", "etl")
+        expected = _state(self.catalog)
+        log_text = self.catalog.log_file.read_text(encoding="utf-8")
+
+        # 模拟压缩只完成了血缘快照
+        self.catalog._save_catalog()
+        self.catalog.catalog_file.unlink()
+        self.catalog.log_file.write_text(log_text, encoding="utf-8")
+
+        reloaded = DataCatalog(self.catalog_dir)
+
+        assert _state(reloaded) == expected
+        lineage = reloaded.lineages[0]
+        assert reloaded.assets["src"].lineage == [lineage]
+        assert reloaded.assets["dst"].lineage[0] is lineage
@@ -0,0 +1,125 @@
+"""
+测试模块: aiculture.data_catalog.DataCatalog 搜索索引
+"""
+
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from aiculture.data_catalog import (
+    DataAsset,
+    DataAssetType,
+    DataCatalog,
+    DataClassification,
+    DataFormat,
+)
+
+WORDS = ["user", "order", "订单", "用户信息", "event", "Payment", "stream", "daily", "raw"]
+
+
+def _asset(asset_id: str, name: str, description: str = "", tags=None,
+           asset_type: DataAssetType = DataAssetType.TABLE,
+           classification: DataClassification = DataClassification.INTERNAL) -> DataAsset:
+    now = time.time()
+    return DataAsset(
+        id=asset_id, name=name, description=description, asset_type=asset_type,
+        classification=classification, format=DataFormat.JSON, owner="data", steward="ops",
+        location=f"db.{asset_id}", schema={}, tags=list(tags or []), quality_metrics=None,
+        lineage=[], created_at=now, updated_at=now, metadata={},
+    )
+
+
+def _linear_search(catalog: DataCatalog, query=None, asset_type=None, classification=None,
+                   tags=None) -> set:
+    """逐个资产过滤，用于对照匹配集合"""
+    matched = set()
+    for asset in catalog.assets.values():
+        if query:
+            q = query.lower()
+            if not (q in asset.name.lower() or q in asset.description.lower()
+                    or any(q in tag.lower() for tag in asset.tags)):
+                continue
+        if asset_type and asset.asset_type != asset_type:
+            continue
+        if classification and asset.classification != classification:
+            continue
+        if tags and not any(tag in asset.tags for tag in tags):
+            continue
+        matched.add(asset.id)
+    return matched
+
+
+class TestDataCatalogSearch:
+    """测试倒排索引与分面搜索"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.catalog = DataCatalog(Path(self.temp_dir))
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_matches_linear_filters(self) -> None:
+        """测试索引搜索的匹配集合与逐个过滤相同（含子串、中文和多词查询）"""
+        rng = random.Random(3)
+        for i in range(60):
+            self.catalog.assets[f"a{i}"] = asset = _asset(
+                f"a{i}",
+                "_".join(rng.sample(WORDS, 2)),
+                " ".join(rng.sample(WORDS, 3)),
+                rng.sample(["core", "pii", "finance"], rng.randrange(3)),
+                rng.choice(list(DataAssetType)),
+                rng.choice(list(DataClassification)),
+            )
+            self.catalog._index_asset(asset)
+
+        for query in (None, "user", "ORD", "用户", "信息", "order_raw", "daily raw", "-", "zzz"):
+            for asset_type in (None, DataAssetType.TABLE):
+                for tags in (None, ["pii", "finance"]):
+                    found = self.catalog.search_assets(query, asset_type, tags=tags)
+                    expected = _linear_search(self.catalog, query, asset_type, tags=tags)
+                    assert {a.id for a in found} == expected, (query, asset_type, tags)
+                    assert len(found) == len(expected)
+
+    def test_ranking_and_pagination(self) -> None:
+        """测试相关度排序与分页"""
+        self.catalog.add_asset(_asset("desc", "sales", "orders by day"))
+        self.catalog.add_asset(_asset("tag", "ledger", tags=["orders"]))
+        self.catalog.add_asset(_asset("exact", "Orders"))
+        self.catalog.add_asset(_asset("name", "orders_daily"))
+
+        ranked = [a.id for a in self.catalog.search_assets("orders")]
+        page = [a.id for a in self.catalog.search_assets("orders", offset=1, limit=2)]
+
+        assert ranked == ["exact", "name", "tag", "desc"]
+        assert page == ["name", "tag"]
+        assert [a.id for a in self.catalog.search_assets(limit=2)] == ["desc", "tag"]
+
+    def test_index_follows_updates_and_removal(self) -> None:
+        """测试更新、替换和删除资产后索引同步"""
+        self.catalog.add_asset(_asset("t1", "customer", tags=["crm"]))
+        self.catalog.add_asset(_asset("t2", "invoice", classification=DataClassification.RESTRICTED))
+
+        self.catalog.update_asset("t1", {"name": "client", "tags": ["sales"]})
+        assert self.catalog.search_assets("customer") == []
+        assert [a.id for a in self.catalog.search_assets("client", tags=["sales"])] == ["t1"]
+        assert self.catalog.search_assets(tags=["crm"]) == []
+
+        self.catalog.add_asset(_asset("t2", "invoice", classification=DataClassification.PUBLIC))
+        assert self.catalog.search_assets(classification=DataClassification.RESTRICTED) == []
+
+        self.catalog.remove_asset("t2")
+        assert self.catalog.search_assets("invoice") == []
+        assert self.catalog._token_index.get("invoice") is None
+
+    def test_index_rebuilt_on_load(self) -> None:
+        """测试重新加载目录后可以搜索"""
+        self.catalog.add_asset(_asset("s1", "clickstream", asset_type=DataAssetType.STREAM))
+
+        reloaded = DataCatalog(Path(self.temp_dir))
+
+        assert [a.id for a in reloaded.search_assets("click", DataAssetType.STREAM)] == ["s1"]
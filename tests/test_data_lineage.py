@@ -0,0 +1,75 @@
+"""
+测试模块: aiculture.data_governance_culture.DataLineageTracker
+"""
+
+from aiculture.data_governance_culture import DataLineageEdge, DataLineageNode, DataLineageTracker
+
+
+def _node(node_id: str) -> DataLineageNode:
+    return DataLineageNode(id=node_id, name=node_id, type="table", location=f"db.{node_id}")
+
+
+class TestDataLineageTracker:
+    """测试邻接索引与迭代遍历"""
+
+    def setup_method(self) -> None:
+        """设置测试环境：raw -> clean -> {report, features -> model}，model -> raw 成环"""
+        self.tracker = DataLineageTracker()
+        for node_id in ("raw", "clean", "report", "features", "model"):
+            self.tracker.add_node(_node(node_id))
+        self.tracker.track_transformation("raw", "clean", "dedupe")
+        self.tracker.track_transformation("clean", "report", "aggregate")
+        self.tracker.track_transformation("clean", "features", "encode", critical=True)
+        self.tracker.track_transformation("features", "model", "train")
+        self.tracker.track_transformation("model", "raw", "feedback")
+
+    def test_downstream_with_cycle(self) -> None:
+        """测试下游遍历在环上终止，每条边只出现一次"""
+        lineage = self.tracker.get_downstream_lineage("raw")
+
+        assert set(lineage["nodes"]) == {"raw", "clean", "report", "features", "model"}
+        assert [e.transformation for e in lineage["edges"]] == [
+            "dedupe", "aggregate", "encode", "train", "feedback"
+        ]
+
+    def test_depth_limit(self) -> None:
+        """测试深度限制：边界层节点的出边保留，但不再继续展开"""
+        lineage = self.tracker.get_downstream_lineage("raw", max_depth=2)
+
+        assert set(lineage["nodes"]) == {"raw", "clean"}
+        assert [e.transformation for e in lineage["edges"]] == ["dedupe", "aggregate", "encode"]
+        assert self.tracker.get_downstream_lineage("raw", max_depth=0) == {"nodes": {}, "edges": []}
+
+    def test_upstream(self) -> None:
+        """测试上游遍历"""
+        lineage = self.tracker.get_upstream_lineage("report", max_depth=2)
+
+        assert set(lineage["nodes"]) == {"report", "clean"}
+        assert [e.transformation for e in lineage["edges"]] == ["aggregate", "dedupe"]
+
+    def test_impact_analysis(self) -> None:
+        """测试影响分析"""
+        impact = self.tracker.get_impact_analysis("clean")
+
+        assert impact["affected_nodes"] == 5
+        assert impact["critical_paths"] == [
+            {"source": "clean", "target": "features", "transformation": "encode"}
+        ]
+
+    def test_edges_appended_directly(self) -> None:
+        """测试直接修改 edges 列表后重建索引"""
+        self.tracker.edges.append(DataLineageEdge("report", "dashboard", "publish", 0.0))
+
+        lineage = self.tracker.get_downstream_lineage("report")
+
+        assert [e.target_id for e in lineage["edges"]] == ["dashboard"]
+
+    def test_long_chain_without_recursion(self) -> None:
+        """测试超过递归深度限制的长链"""
+        tracker = DataLineageTracker()
+        for i in range(5000):
+            tracker.track_transformation(f"n{i}", f"n{i + 1}", "copy")
+
+        lineage = tracker.get_upstream_lineage("n5000", max_depth=10000)
+
+        assert len(lineage["edges"]) == 5000
@@ -0,0 +1,207 @@
+"""
+测试模块: aiculture.data_governance_culture.DataQualityValidator
+"""
+
+import csv
+import io
+import random
+import re
+
+from aiculture.data_governance_culture import DataQualityRule, DataQualityValidator
+
+RECORDS = [
+    {"id": 1, "age": 30, "email": "alice@corp.io", "tags": ["a"]},
+    {"id": 2, "age": -1, "email": "", "tags": ["b"]},
+    {"id": 2, "age": 130.5, "email": None, "tags": ["a"]},
+    {"id": 1.0, "age": "42", "email": "bob@corp", "tags": None},
+    {"id": True, "age": None, "tags": ["c"]},
+    {"id": float("nan"), "age": True, "email": 7, "tags": ["c"]},
+    {"id": None, "age": 18, "email": "carol@corp.io"},
+]
+
+RULES = [
+    DataQualityRule("id_unique", "id", "unique", {}),
+    DataQualityRule("tags_unique", "tags", "unique", {}, severity="warning"),
+    DataQualityRule("email_required", "email", "not_null", {}),
+    DataQualityRule("age_range", "age", "range", {"min": 0, "max": 120}),
+    DataQualityRule("age_min", "age", "range", {"min": 18}),
+    DataQualityRule("email_format", "email", "pattern", {"pattern": r"[^@]+@[^@]+\.\w+$"}),
+    DataQualityRule("no_pattern", "email", "pattern", {}),
+    DataQualityRule("custom", "email", "custom", {}),
+]
+
+
+def _reference_rule(rule: DataQualityRule, data: list) -> dict:
+    """逐条记录验证（优化前的实现），用于对照"""
+    result = {"rule_name": rule.name, "rule_type": rule.rule_type, "passed": 0, "failed": 0,
+              "issues": []}
+    for record_id, record in enumerate(data):
+        value = record.get(rule.field_name)
+        is_valid, message = True, ""
+        if rule.rule_type == "not_null":
+            is_valid = value is not None and value != ""
+            message = f"字段 {rule.field_name} 不能为空"
+        elif rule.rule_type == "unique":
+            is_valid = [r.get(rule.field_name) for r in data].count(value) == 1
+            message = f"字段 {rule.field_name} 值重复: {value}"
+        elif rule.rule_type == "range":
+            min_val, max_val = rule.parameters.get("min"), rule.parameters.get("max")
+            if isinstance(value, (int, float)):
+                is_valid = (min_val is None or value >= min_val) and (
+                    max_val is None or value <= max_val
+                )
+                message = f"字段 {rule.field_name} 值 {value} 超出范围 [{min_val}, {max_val}]"
+            else:
+                is_valid, message = False, f"字段 {rule.field_name} 不是数值类型"
+        elif rule.rule_type == "pattern":
+            pattern = rule.parameters.get("pattern")
+            if pattern and isinstance(value, str):
+                is_valid = bool(re.match(pattern, value))
+                message = f"字段 {rule.field_name} 值 {value} 不匹配模式 {pattern}"
+            else:
+                is_valid, message = False, f"字段 {rule.field_name} 模式验证失败"
+        if is_valid:
+            result["passed"] += 1
+        else:
+            result["failed"] += 1
+            result["issues"].append({"record_id": record_id, "field_name": rule.field_name,
+                                     "field_value": value, "rule_name": rule.name,
+                                     "severity": rule.severity, "message": message})
+    return result
+
+
+class TestDataQualityValidator:
+    """测试按列验证与逐条验证结果一致"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.validator = DataQualityValidator()
+        for rule in RULES:
+            self.validator.add_rule(rule)
+
+    def test_matches_record_by_record_validation(self) -> None:
+        """测试每个规则的结果及问题顺序"""
+        results = self.validator.validate_data(RECORDS)
+
+        expected_issues = []
+        for rule in RULES:
+            expected = _reference_rule(rule, RECORDS)
+            assert results["rule_results"][rule.name] == expected, rule.name
+            expected_issues.extend(expected["issues"])
+        assert results["issues"] == expected_issues
+        failed = {issue["record_id"] for issue in expected_issues}
+        assert results["failed_records"] == len(failed)
+        assert results["passed_records"] == len(RECORDS) - len(failed)
+
+    def test_counts_without_issue_details(self) -> None:
+        """测试只统计数量时不生成问题详情"""
+        full = self.validator.validate_data(RECORDS)
+        counts = self.validator.validate_data(RECORDS, include_issues=False)
+
+        assert counts["issues"] == []
+        assert counts["failed_records"] == full["failed_records"]
+        assert counts["rule_results"]["age_range"]["failed"] == (
+            full["rule_results"]["age_range"]["failed"]
+        )
+
+    def test_iter_issues_is_lazy(self) -> None:
+        """测试逐条产出问题"""
+        issues = self.validator.iter_issues(RECORDS)
+
+        assert next(issues)["rule_name"] == "id_unique"
+        assert list(self.validator.iter_issues(RECORDS)) == (
+            self.validator.validate_data(RECORDS)["issues"]
+        )
+
+    def test_numeric_range_column(self) -> None:
+        """测试纯数值列（可向量化）与混合列的范围检查"""
+        validator = DataQualityValidator()
+        validator.add_rule(DataQualityRule("score", "score", "range", {"min": 0, "max": 1}))
+        data = [{"score": value} for value in (0, 0.5, 1, 1.5, -2, float("nan"))]
+
+        result = validator.validate_data(data)
+
+        assert result["rule_results"]["score"] == _reference_rule(validator.rules[0], data)
+        assert [issue["record_id"] for issue in result["issues"]] == [3, 4, 5]
+
+    def test_empty_data(self) -> None:
+        """测试空数据"""
+        assert self.validator.validate_data([])["total_records"] == 0
+        assert list(self.validator.iter_issues([])) == []
+
+    def test_empty_data_matches_stream(self) -> None:
+        """测试空数据时每个规则的结果与流式验证相同"""
+        validator = DataQualityValidator()
+        for rule in RULES:
+            validator.add_rule(rule)
+
+        result = validator.validate_data([])
+
+        assert result["rule_results"] == validator.validate_stream([])["rule_results"]
+        assert {r["failed"] for r in result["rule_results"].values()} == {0}
+        assert len(result["rule_results"]) == len(RULES)
+
+
+def _random_records(seed: int, count: int) -> list:
+    """生成含重复、空值和非数值的随机记录"""
+    rng = random.Random(seed)
+    pool = [1, 1.0, 2, "x", "", None, ["a"], ["a"], 150, -3, "bob@corp.io", True]
+    return [
+        {"id": rng.choice(pool + list(range(20))), "age": rng.choice(pool),
+         "email": rng.choice(pool), "tags": rng.choice(pool)}
+        for _ in range(count)
+    ]
+
+
+class TestStreamingValidation:
+    """测试分块流式验证"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.validator = DataQualityValidator()
+        for rule in RULES:
+            self.validator.add_rule(rule)
+
+    def test_stream_matches_in_memory_validation(self) -> None:
+        """测试各种块大小下计数与问题集合和整体验证相同"""
+        for seed, chunk_size in ((1, 1), (2, 7), (3, 50), (4, 1000)):
+            data = _random_records(seed, 300)
+            full = self.validator.validate_data(data)
+
+            streamed = self.validator.validate_stream(
+                iter(data), chunk_size=chunk_size, max_issues_per_rule=len(data)
+            )
+
+            assert not streamed["issues_truncated"]
+            for key in ("total_records", "passed_records", "failed_records"):
+                assert streamed[key] == full[key]
+            for name, result in full["rule_results"].items():
+                stream_result = streamed["rule_results"][name]
+                assert (stream_result["passed"], stream_result["failed"]) == (
+                    result["passed"], result["failed"]
+                )
+                assert sorted(stream_result["issues"], key=lambda i: i["record_id"]) == (
+                    result["issues"]
+                )
+
+    def test_issue_cap(self) -> None:
+        """测试每个规则的问题详情数量上限"""
+        data = [{"id": 1, "email": None}] * 50
+
+        result = self.validator.validate_stream(data, chunk_size=8, max_issues_per_rule=3)
+
+        assert result["issues_truncated"]
+        assert result["rule_results"]["id_unique"]["failed"] == 50
+        assert [i["record_id"] for i in result["rule_results"]["id_unique"]["issues"]] == [0, 1, 2]
+        assert len(result["issues"]) <= 3 * len(RULES)
+
+    def test_csv_reader_input(self) -> None:
+        """测试直接验证CSV读取器"""
+        validator = DataQualityValidator()
+        validator.add_rule(DataQualityRule("email_required", "email", "not_null", {}))
+        text = "id,email\n1,a@corp.io\n2,\n3,c@corp.io\n"
+
+        result = validator.validate_stream(csv.DictReader(io.StringIO(text)), chunk_size=2)
+
+        assert (result["total_records"], result["failed_records"]) == (3, 1)
+        assert result["issues"][0]["record_id"] == 1
@@ -0,0 +1,135 @@
+"""
+测试aiculture.file_index模块
+"""
+
+import tempfile
+from pathlib import Path
+
+from aiculture.file_index import ProjectFileIndex, parse_gitignore
+from aiculture.functionality_checker import FunctionalityChecker
+from aiculture.infrastructure_checker import InfrastructureChecker
+
+
+class TestProjectFileIndex:
+    """测试ProjectFileIndex类"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, relative: str, content: str = "") -> Path:
+        path = self.temp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+        return path
+
+    def test_groups_files_by_extension(self) -> None:
+        """测试按扩展名分组"""
+        py_file = self._write("pkg/module.py")
+        html_file = self._write("web/index.html")
+        self._write("README.md")
+
+        index = ProjectFileIndex(self.temp_path)
+
+        assert index.python_files() == [py_file]
+        assert index.files_with_suffix(".html") == [html_file]
+        assert len(index.files) == 3
+
+    def test_prunes_skipped_directories(self) -> None:
+        """测试跳过虚拟环境、隐藏目录和构建产物"""
+        kept = self._write("src/app.py")
+        self._write("venv/lib/site.py")
+        self._write("node_modules/pkg/index.js")
+        self._write(".git/hooks/hook.py")
+        self._write("src/__pycache__/app.py")
+        self._write("build/lib/app.py")
+
+        index = ProjectFileIndex(self.temp_path)
+
+        assert index.files == [kept]
+
+    def test_honors_gitignore(self) -> None:
+        """测试遵循.gitignore（含子目录规则和取反规则）"""
+        self._write(".gitignore", "*.log\ngenerated/\n/local.py\n!keep.log\n")
+        self._write("app.log")
+        keep = self._write("keep.log")
+        self._write("generated/out.py")
+        self._write("local.py")
+        nested_local = self._write("pkg/local.py")
+        self._write("pkg/.gitignore", "fixtures/*.json\n")
+        self._write("pkg/fixtures/big.json")
+        other_json = self._write("other/fixtures/big.json")
+
+        index = ProjectFileIndex(self.temp_path)
+
+        assert set(index.files) == {keep, nested_local, other_json}
+
+    def test_gitignore_can_be_disabled(self) -> None:
+        """测试关闭.gitignore支持"""
+        self._write(".gitignore", "*.log\n")
+        log_file = self._write("app.log")
+
+        index = ProjectFileIndex(self.temp_path, respect_gitignore=False)
+
+        assert index.files == [log_file]
+
+    def test_single_walk_until_refresh(self) -> None:
+        """测试多次访问只遍历一次，refresh后重新遍历"""
+        self._write("a.py")
+        index = ProjectFileIndex(self.temp_path)
+
+        index.python_files()
+        index.files_with_suffix(".html")
+        index.files
+        assert index.walk_count == 1
+
+        new_file = self._write("b.py")
+        index.refresh()
+        assert new_file in index.python_files()
+        assert index.walk_count == 2
+
+    def test_shared_index_refreshed_only_by_owner(self) -> None:
+        """测试检查器不刷新共享索引，自建索引时自行刷新"""
+        self._write("a.py", "print('hi')\n")
+        index = ProjectFileIndex(self.temp_path)
+        index.files
+
+        FunctionalityChecker(self.temp_path, file_index=index).check_all_functionality()
+        InfrastructureChecker(self.temp_path, file_index=index).check_all_infrastructure()
+        assert index.walk_count == 1
+
+        checker = InfrastructureChecker(self.temp_path)
+        checker.check_all_infrastructure()
+        checker.check_all_infrastructure()
+        assert checker.file_index.walk_count == 2
+
+    def test_records_file_stat(self) -> None:
+        """测试记录文件状态"""
+        py_file = self._write("a.py", "print('hi')\n")
+        index = ProjectFileIndex(self.temp_path)
+
+        stat = index.get_stat(py_file)
+
+        assert stat is not None
+        assert stat.size == py_file.stat().st_size
+        assert stat.mtime_ns == py_file.stat().st_mtime_ns
+        assert index.relative_path(py_file) == "a.py"
+
+
+def test_parse_gitignore_skips_comments_and_blank_lines() -> None:
+    """测试解析.gitignore时忽略注释和空行"""
+    rules = parse_gitignore("# comment\n\n*.pyc\n!important.pyc\ndocs/_build/\n")
+
+    assert len(rules) == 3
+    assert rules[1].negated
+    assert rules[2].dir_only
+    assert rules[2].regex.match("docs/_build")
+    assert not rules[2].regex.match("other/docs/_build")
+    assert rules[0].regex.match("deep/nested/file.pyc")
@@ -0,0 +1,197 @@
+"""
+测试模块: aiculture.accessibility_culture 统一前端扫描
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from aiculture.accessibility_culture import AccessibilityCultureManager
+
+PAGE = """<html><head><title>Sign in</title></head>
+<body>
+  <h2>Welcome back to the dashboard</h2>
+  <img src="logo.png">
+  <input type="text" placeholder="Enter your name">
+  <div style="width: 800px">2024-01-31</div>
+</body></html>
+"""
+
+STYLE = ".button { width: 20px; height: 20px; }\n@media (max-width: 600px) {}\n"
+
+COMPONENT = '<img src={logo} />\n<input />\nconst title = "Click here now";\n'
+
+SCRIPT = 'const message = "Please try again later";\n'
+
+
+def _summary(report: dict) -> tuple:
+    """报告中与问题相关的可比较部分"""
+    def keys(issues: list) -> list:
+        return [(i.file_path, i.line_number, i.description) for i in issues]
+
+    accessibility = report["accessibility"]
+    i18n = report["internationalization"]
+    responsive = report["responsive_design"]
+    return (
+        accessibility["total_files_scanned"],
+        {severity: keys(issues) for severity, issues in accessibility["by_severity"].items()},
+        i18n["total_files_scanned"],
+        {issue_type: keys(issues) for issue_type, issues in i18n["by_type"].items()},
+        responsive["total_files_scanned"],
+        {device: keys(issues) for device, issues in responsive["by_device"].items()},
+    )
+
+
+class TestFrontendScan:
+    """测试统一前端扫描、并行执行与内容哈希缓存"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        for i in range(6):
+            (self.temp_path / f"page{i}.html").write_text(PAGE, encoding="utf-8")
+        (self.temp_path / "site.css").write_text(STYLE, encoding="utf-8")
+        (self.temp_path / "App.jsx").write_text(COMPONENT, encoding="utf-8")
+        (self.temp_path / "app.js").write_text(SCRIPT, encoding="utf-8")
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        shutil.rmtree(self.temp_dir)
+
+    def _manager(self, jobs: int = 1) -> AccessibilityCultureManager:
+        manager = AccessibilityCultureManager(self.temp_path, jobs=jobs)
+        self.scanned = []
+        scan_file = manager.frontend_scanner.scan_file
+
+        def recording_scan_file(path: Path):
+            self.scanned.append(path)
+            return scan_file(path)
+
+        manager.frontend_scanner.scan_file = recording_scan_file
+        return manager
+
+    def test_matches_per_checker_scans(self) -> None:
+        """测试统一扫描与各检查器单独检查文件的结果相同"""
+        manager = self._manager()
+        report = manager.generate_comprehensive_report()
+        manager.close()
+
+        html = sorted(self.temp_path.glob("*.html"))
+        checker = manager.accessibility_checker
+        expected_accessibility = [
+            issue for path in html for issue in checker.check_html_file(path)
+        ] + checker.check_jsx_file(self.temp_path / "App.jsx")
+        expected_i18n = [
+            issue
+            for path in [self.temp_path / "app.js", self.temp_path / "App.jsx", *html]
+            for issue in manager.i18n_checker.check_file(path)
+        ]
+        responsive = manager.responsive_checker
+        expected_responsive = responsive.check_css_file(self.temp_path / "site.css") + [
+            issue for path in html for issue in responsive.check_html_file(path)
+        ]
+
+        assert report["accessibility"]["total_issues"] == len(expected_accessibility)
+        assert report["internationalization"]["total_issues"] == len(expected_i18n)
+        assert report["responsive_design"]["total_issues"] == len(expected_responsive)
+        by_type = report["internationalization"]["by_type"]
+        assert [issue for issues in by_type.values() for issue in issues] == sorted(
+            expected_i18n, key=lambda issue: list(by_type).index(issue.issue_type)
+        )
+        assert report["responsive_design"]["by_device"]["desktop"] == [
+            issue for issue in expected_responsive if issue.device_type.value == "desktop"
+        ]
+        assert report["accessibility"]["by_severity"]["error"] == [
+            issue for issue in expected_accessibility if issue.severity == "error"
+        ]
+        assert len(self.scanned) == 9
+
+    def test_cache_skips_unchanged_files(self) -> None:
+        """测试未变化的文件直接使用缓存结果，修改后的文件重新检查"""
+        first = self._manager()
+        report = first.generate_comprehensive_report()
+        first.close()
+
+        second = self._manager()
+        cached_report = second.generate_comprehensive_report()
+        assert self.scanned == []
+        assert _summary(cached_report) == _summary(report)
+
+        changed = self.temp_path / "page3.html"
+        changed.write_text(PAGE.replace('<img src="logo.png">', ""), encoding="utf-8")
+        os.utime(changed, ns=(1, 1))
+        second.file_index.refresh()
+        updated = second.generate_comprehensive_report()
+        second.close()
+
+        assert self.scanned == [changed]
+        assert updated["accessibility"]["total_issues"] == (
+            report["accessibility"]["total_issues"] - 1
+        )
+
+    def test_identical_content_keeps_own_path(self) -> None:
+        """测试内容相同的文件共用缓存时问题记录各自的路径"""
+        manager = self._manager()
+        manager.scan_frontend()
+        manager.close()
+
+        manager = self._manager()
+        frontend = manager.scan_frontend()
+        manager.close()
+
+        assert self.scanned == []
+        for i in range(6):
+            path = self.temp_path / f"page{i}.html"
+            assert {issue.file_path for issue in frontend[path].accessibility} == {str(path)}
+
+    def test_same_content_different_suffix_not_shared(self) -> None:
+        """测试内容相同、扩展名不同的文件不共用缓存结果"""
+        manager = self._manager()
+        cold = manager.scan_frontend()
+        manager.close()
+        copy = self.temp_path / "copy.js"
+        copy.write_text(COMPONENT, encoding="utf-8")
+
+        manager = self._manager()
+        added = manager.scan_frontend()
+        manager.close()
+        manager = self._manager()
+        warm = manager.scan_frontend()
+        manager.close()
+
+        component = self.temp_path / "App.jsx"
+        assert cold[component].accessibility
+        assert self.scanned == []
+        for frontend in (added, warm):
+            assert frontend[copy].accessibility == []
+            assert len(frontend[copy].i18n) == len(cold[component].i18n)
+            assert len(frontend[component].accessibility) == len(cold[component].accessibility)
+
+    def test_rule_changes_invalidate_cache(self) -> None:
+        """测试规则表变化后不会命中旧结果"""
+        manager = self._manager()
+        manager.scan_frontend()
+        manager.close()
+
+        manager = self._manager()
+        manager.i18n_checker.common_hardcoded.append("Welcome")
+        manager.scan_frontend()
+        manager.close()
+
+        assert len(self.scanned) == 9
+
+    def test_parallel_scan_matches_serial(self) -> None:
+        """测试进程池扫描与串行扫描结果相同"""
+        serial = AccessibilityCultureManager(self.temp_path)
+        expected = _summary(serial.generate_comprehensive_report())
+        serial.close()
+        shutil.rmtree(self.temp_path / ".aiculture")
+
+        # 9个文件、每批2个，交给进程池
+        parallel = AccessibilityCultureManager(self.temp_path, jobs=2)
+        report = parallel.generate_comprehensive_report()
+        parallel.close()
+
+        assert _summary(report) == expected
@@ -0,0 +1,95 @@
+"""
+测试aiculture.git_changes模块以及IncrementalChecker的git模式
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from git import Actor, Repo
+
+from aiculture.cache_manager import CheckerScope, IncrementalChecker
+from aiculture.git_changes import GitChangeDetector
+
+
+class TestGitChangeDetector:
+    """测试GitChangeDetector类"""
+
+    def setup_method(self) -> None:
+        """创建包含一次提交的git仓库"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        self.repo = Repo.init(self.temp_path)
+        self.actor = Actor("tester", "tester@example.com")
+
+        (self.temp_path / "pkg").mkdir()
+        self._write("pkg/__init__.py", "")
+        self._write("pkg/core.py", "VALUE = 1\n")
+        self._write("pkg/user.py", "from .core import VALUE\n")
+        self._write("other.py", "import os\n")
+        self._commit("initial")
+        self.repo.git.branch("base")
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        self.repo.close()
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, relative: str, content: str) -> Path:
+        path = self.temp_path / relative
+        path.write_text(content)
+        return path
+
+    def _commit(self, message: str) -> None:
+        self.repo.git.add(A=True)
+        self.repo.index.commit(message, author=self.actor, committer=self.actor)
+
+    def test_not_a_repository(self) -> None:
+        """测试非git目录时不可用且不返回文件"""
+        plain_dir = Path(tempfile.mkdtemp())
+        try:
+            detector = GitChangeDetector(plain_dir)
+            assert not detector.available
+            assert detector.working_tree_files() == set()
+        finally:
+            shutil.rmtree(plain_dir)
+
+    def test_staged_and_working_tree_files(self) -> None:
+        """测试暂存、未暂存与未跟踪文件"""
+        staged = self._write("pkg/core.py", "VALUE = 2\n")
+        self.repo.git.add(str(staged))
+        modified = self._write("other.py", "import sys\n")
+        untracked = self._write("new_module.py", "x = 1\n")
+
+        detector = GitChangeDetector(self.temp_path)
+
+        assert detector.staged_files() == {staged}
+        assert detector.working_tree_files() == {staged, modified, untracked}
+
+    def test_files_since_ref(self) -> None:
+        """测试自指定引用以来提交的变更"""
+        core = self._write("pkg/core.py", "VALUE = 3\n")
+        self._commit("change core")
+
+        detector = GitChangeDetector(self.temp_path)
+
+        assert detector.files_since_ref("base") == {core}
+
+    def test_incremental_checker_scopes(self) -> None:
+        """测试git模式下跨文件检查器包含导入变更文件的模块，局部检查器不包含"""
+        core = self._write("pkg/core.py", "VALUE = 4\n")
+        self.repo.git.add(str(core))
+        user = self.temp_path / "pkg" / "user.py"
+
+        checker = IncrementalChecker(self.temp_path, config={}, staged=True)
+        try:
+            checker.register_checker("kiss", scope=CheckerScope.LOCAL)
+            checker.register_checker("coupling", scope=CheckerScope.CROSS_FILE)
+
+            assert checker.git_mode
+            assert checker.get_changed_files() == {core}
+            assert checker.get_affected_files(CheckerScope.CROSS_FILE) == {core, user}
+            assert checker.get_files_to_check("kiss") == {core}
+            assert checker.get_files_to_check("coupling") == {core, user}
+        finally:
+            checker.close()
@@ -0,0 +1,87 @@
+"""
+测试模块: aiculture.accessibility_culture.InternationalizationChecker 行扫描
+"""
+
+import random
+import re
+import shutil
+import tempfile
+from pathlib import Path
+
+from aiculture.accessibility_culture import InternationalizationChecker
+
+FRAGMENTS = [
+    'label = "Click here"',
+    "msg = 'Please try again later'",
+    '<input placeholder="Your email" title="Email address">',
+    '<img alt="Company logo">',
+    "deadline = '12/31/2024 23:59:59'",
+    "created = 2024-01-31",
+    "# comment with 'Sign in' text",
+    "// 'Cancel' in a comment",
+    "import 'Loading many things'",
+    "plain text without markers",
+    "count = 42",
+    '"OK"',
+    "",
+    "\r",
+    "'Yes' or \"No\" or 'Maybe not today'",
+]
+
+
+def _reference_issues(checker: InternationalizationChecker, content: str) -> list:
+    """逐行运行原始正则（优化前的实现），用于对照"""
+    issues = []
+    for line_num, line in enumerate(content.split("\n"), 1):
+        if line.strip().startswith(("#", "//", "/*", "import", "from")):
+            continue
+        for pattern in checker.hardcoded_text_patterns:
+            for match in re.finditer(pattern, line):
+                text = match.group(1)
+                if text in checker.common_hardcoded or len(text.split()) > 2:
+                    issues.append(("hardcoded_text", line_num, text))
+        for pattern in checker.datetime_patterns:
+            for match in re.finditer(pattern, line):
+                issues.append(("locale_format", line_num, match.group(0)))
+    return issues
+
+
+class TestInternationalizationChecker:
+    """测试预编译规则与候选行预筛选"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.checker = InternationalizationChecker()
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_matches_line_by_line_reference(self) -> None:
+        """测试结果和顺序与逐行运行原始正则相同"""
+        rng = random.Random(11)
+        content = "\n".join(rng.choice(FRAGMENTS) for _ in range(400))
+        file_path = Path(self.temp_dir) / "page.jsx"
+        file_path.write_text(content, encoding="utf-8")
+
+        issues = self.checker.check_file(file_path)
+
+        assert [(i.issue_type, i.line_number, i.text_content) for i in issues] == (
+            _reference_issues(self.checker, content)
+        )
+        assert {i.file_path for i in issues} == {str(file_path)}
+
+    def test_rule_lists_recompiled_after_change(self) -> None:
+        """测试修改规则列表后重新编译"""
+        content = 'title = "Dashboard"\nwhen = "2024.01.31"\n'
+        assert self.checker.check_content(content, Path("a.js")) == []
+
+        self.checker.common_hardcoded.append("Dashboard")
+        self.checker.datetime_patterns.append(r"\d{4}\.\d{2}\.\d{2}")
+
+        issues = self.checker.check_content(content, Path("a.js"))
+        assert [(i.line_number, i.text_content) for i in issues] == [
+            (1, "Dashboard"),
+            (2, "2024.01.31"),
+        ]
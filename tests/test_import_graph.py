@@ -0,0 +1,86 @@
+"""
+测试aiculture.import_graph模块
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from aiculture.import_graph import ImportGraph
+
+
+class TestImportGraph:
+    """测试ImportGraph类"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, relative: str, content: str = "") -> Path:
+        path = self.temp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+        return path
+
+    def test_resolves_absolute_relative_and_submodule_imports(self) -> None:
+        """测试绝对导入、相对导入与 from 包 import 子模块"""
+        init = self._write("pkg/__init__.py")
+        base = self._write("pkg/base.py", "import os\n")
+        utils = self._write("pkg/sub/utils.py", "from ..base import thing\n")
+        self._write("pkg/sub/__init__.py")
+        app = self._write("app.py", "import pkg.base\nfrom pkg.sub import utils\n")
+
+        graph = ImportGraph(self.temp_path)
+
+        assert graph.importers_of(base) == {utils, app}
+        assert graph.importers_of(utils) == {app}
+        assert graph.importers_of(init) == set()
+
+    def test_transitive_importers(self) -> None:
+        """测试间接导入方"""
+        a = self._write("a.py", "X = 1\n")
+        b = self._write("b.py", "from a import X\n")
+        c = self._write("c.py", "import b\n")
+        self._write("d.py", "import json\n")
+
+        graph = ImportGraph(self.temp_path)
+
+        assert graph.transitive_importers([a]) == {b, c}
+        assert graph.transitive_importers([c]) == set()
+
+    def test_src_layout(self) -> None:
+        """测试 src 布局下的模块名解析"""
+        lib = self._write("src/mylib/core.py", "X = 1\n")
+        test = self._write("tests/test_core.py", "from mylib.core import X\n")
+
+        graph = ImportGraph(self.temp_path)
+
+        assert graph.importers_of(lib) == {test}
+
+    def test_persisted_graph_only_reparses_changed_files(self) -> None:
+        """测试持久化的导入关系图只重新解析状态变化的文件"""
+        a = self._write("a.py", "X = 1\n")
+        b = self._write("b.py", "import json\n")
+        cache_file = self.temp_path / ".cache" / "graph.json"
+
+        first = ImportGraph(self.temp_path, cache_file=cache_file)
+        assert first.update() == {a, b}
+        assert cache_file.exists()
+
+        b.write_text("import a\n")
+        stat_result = b.stat()
+        os.utime(b, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+
+        second = ImportGraph(self.temp_path, cache_file=cache_file)
+        assert second.update() == {b}
+        assert second.importers_of(a) == {b}
+
+        b.unlink()
+        assert second.update() == {b}
+        assert second.importers_of(a) == set()
@@ -0,0 +1,121 @@
+"""
+导入耗时回归测试
+
+通过 ``python -X importtime`` 在独立进程中统计导入的模块，
+确保 ``import aiculture`` 和 ``aiculture --version`` 不会加载较重的依赖。
+"""
+
+import subprocess
+import sys
+from typing import Dict
+
+import click
+import pytest
+from click.testing import CliRunner
+
+import aiculture
+from aiculture.cli import LAZY_SUBCOMMANDS, LazyGroup, main
+
+# 轻量路径上不允许出现的模块
+HEAVY_MODULES = {
+    "aiculture.core",
+    "aiculture.cli_commands.culture_commands",
+    "aiculture.culture_enforcer",
+    "aiculture.performance_culture",
+    "git",
+    "jinja2",
+    "psutil",
+    "requests",
+}
+
+# 累计导入耗时上限（微秒），远高于正常值，仅用于发现数量级上的回退
+IMPORT_TIME_BUDGET_US = 100_000
+
+
+def _import_times(code: str) -> Dict[str, int]:
+    """在子进程中执行代码，返回 模块名 -> 累计导入耗时（微秒）"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        times[parts[2].strip()] = int(parts[1])
+    return times
+
+
+class TestImportTime:
+    """导入耗时回归测试"""
+
+    def test_package_import_is_light(self) -> None:
+        """测试导入包本身不加载重依赖"""
+        times = _import_times("import aiculture")
+
+        assert "aiculture" in times
+        assert not HEAVY_MODULES & set(times)
+        assert "aiculture.cli" not in times
+        assert times["aiculture"] < IMPORT_TIME_BUDGET_US
+
+    def test_version_does_not_load_subcommands(self) -> None:
+        """测试 --version 只导入CLI入口"""
+        times = _import_times(
+            "from aiculture.cli import main\n"
+            "try:\n"
+            "    main(['--version'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+        )
+
+        assert "aiculture.cli" in times
+        assert not HEAVY_MODULES & set(times)
+        assert times["aiculture.cli"] < IMPORT_TIME_BUDGET_US
+
+
+class TestLazyAttributes:
+    """测试延迟导入的公开名称"""
+
+    def test_public_names_resolve(self) -> None:
+        """测试公开类按需导入"""
+        from aiculture.core import CultureConfig, ProjectTemplate, QualityTools
+
+        assert aiculture.CultureConfig is CultureConfig
+        assert aiculture.ProjectTemplate is ProjectTemplate
+        assert aiculture.QualityTools is QualityTools
+        assert aiculture.main is main
+        assert set(aiculture.__all__) <= set(dir(aiculture))
+
+    def test_unknown_attribute(self) -> None:
+        """测试未知名称抛出AttributeError"""
+        with pytest.raises(AttributeError):
+            aiculture.NotAThing
+
+
+class TestLazyGroup:
+    """测试延迟加载的命令组"""
+
+    def test_subcommands_resolve(self) -> None:
+        """测试所有延迟子命令都能解析为click命令"""
+        ctx = click.Context(main)
+        for name in LAZY_SUBCOMMANDS:
+            assert isinstance(main.get_command(ctx, name), click.Group)
+        assert set(LAZY_SUBCOMMANDS) <= set(main.list_commands(ctx))
+
+    def test_help_lists_lazy_commands(self) -> None:
+        """测试帮助信息包含延迟加载的命令"""
+        result = CliRunner().invoke(main, ["--help"])
+
+        assert result.exit_code == 0
+        assert "culture" in result.output
+        assert "daemon" in result.output
+
+    def test_invalid_target(self) -> None:
+        """测试目标不是click命令时报错"""
+        group = LazyGroup(lazy_subcommands={"bad": "aiculture:__version__"})
+
+        with pytest.raises(ValueError):
+            group.get_command(click.Context(group), "bad")
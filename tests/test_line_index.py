@@ -0,0 +1,39 @@
+"""
+测试模块: aiculture.line_index
+"""
+
+from aiculture.line_index import LineIndex
+
+
+class TestLineIndex:
+    """测试换行偏移表"""
+
+    def test_line_col_matches_split(self) -> None:
+        """测试行列号与按行切分的结果一致"""
+        text = "first\n\nthird line\nlast"
+        index = LineIndex(text)
+        lines = text.split("\n")
+
+        assert len(index) == len(lines)
+        for line_num, line in enumerate(lines, 1):
+            assert index.line_text(line_num) == line
+            start = index.line_start(line_num)
+            for column in range(len(line)):
+                assert index.line_col(start + column) == (line_num, column)
+
+    def test_newline_belongs_to_its_line(self) -> None:
+        """测试换行符本身属于它结束的那一行"""
+        index = LineIndex("ab\ncd\n")
+
+        assert index.line_col(2) == (1, 2)
+        assert index.line_number(3) == 2
+        assert len(index) == 3
+        assert index.line_text(3) == ""
+
+    def test_empty_text(self) -> None:
+        """测试空文本"""
+        index = LineIndex("")
+
+        assert len(index) == 1
+        assert index.line_col(0) == (1, 0)
+        assert index.line_text(1) == ""
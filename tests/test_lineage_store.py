@@ -0,0 +1,107 @@
+"""
+测试模块: aiculture.lineage_store
+"""
+
+import io
+import json
+import random
+import shutil
+import tempfile
+from pathlib import Path
+
+from aiculture.data_governance_culture import (
+    DataGovernanceManager,
+    DataLineageNode,
+    DataLineageTracker,
+)
+from aiculture.lineage_store import LineageStore
+
+
+def _edge_keys(lineage: dict) -> list:
+    return sorted((e.source_id, e.target_id, e.transformation) for e in lineage["edges"])
+
+
+class TestLineageStore:
+    """测试SQLite血缘存储"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        self.store = LineageStore(self.temp_path / "lineage.db")
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        self.store.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_queries_match_in_memory_tracker(self) -> None:
+        """测试递归CTE查询与内存遍历结果相同（含环和深度限制）"""
+        tracker = DataLineageTracker()
+        rng = random.Random(7)
+        for i in range(40):
+            node = DataLineageNode(id=f"n{i}", name=f"N{i}", type="table", location="db")
+            tracker.add_node(node)
+            self.store.add_node(node)
+        for i in range(120):
+            source, target = f"n{rng.randrange(50)}", f"n{rng.randrange(50)}"
+            tracker.track_transformation(source, target, f"t{i}", critical=i % 9 == 0)
+            self.store.track_transformation(source, target, f"t{i}", critical=i % 9 == 0)
+
+        for start in ("n0", "n5", "n45"):
+            for depth in (0, 1, 3, 10):
+                for getter in ("get_upstream_lineage", "get_downstream_lineage"):
+                    expected = getattr(tracker, getter)(start, depth)
+                    actual = getattr(self.store, getter)(start, depth)
+                    assert set(actual["nodes"]) == set(expected["nodes"])
+                    assert _edge_keys(actual) == _edge_keys(expected)
+
+        impact = self.store.get_impact_analysis("n0")
+        expected_impact = tracker.get_impact_analysis("n0")
+        assert impact["affected_nodes"] == expected_impact["affected_nodes"]
+        assert sorted(map(str, impact["critical_paths"])) == sorted(
+            map(str, expected_impact["critical_paths"])
+        )
+
+    def test_persists_across_reopen(self) -> None:
+        """测试重新打开后血缘仍然存在"""
+        self.store.add_node(DataLineageNode("raw", "Raw", "table", "db.raw", {"owner": "etl"}))
+        self.store.track_transformation("raw", "clean", "dedupe", rows=10)
+        self.store.close()
+
+        reopened = LineageStore(self.temp_path / "lineage.db")
+        lineage = reopened.get_downstream_lineage("raw")
+        reopened.close()
+
+        assert lineage["nodes"]["raw"].metadata == {"owner": "etl"}
+        [edge] = lineage["edges"]
+        assert (edge.target_id, edge.metadata) == ("clean", {"rows": 10})
+
+    def test_streamed_export(self) -> None:
+        """测试导出写入文件句柄"""
+        self.store.add_nodes(
+            DataLineageNode(f"n{i}", f"N{i}", "table", "db") for i in range(3)
+        )
+        self.store.track_transformation("n0", "n1", "copy")
+
+        buffer = io.StringIO()
+        self.store.write_lineage_graph(buffer, "json")
+        exported = json.loads(buffer.getvalue())
+
+        assert [node["id"] for node in exported["nodes"]] == ["n0", "n1", "n2"]
+        assert exported["edges"][0]["transformation"] == "copy"
+        assert '"n0" -> "n1" [label="copy"];' in self.store.export_lineage_graph("dot")
+        assert self.store.export_lineage_graph("xml") == ""
+        assert self.store.count() == {"nodes": 3, "edges": 1}
+
+    def test_governance_manager_persists_lineage(self) -> None:
+        """测试数据治理管理器把血缘保存在 .aiculture/data_governance 下"""
+        manager = DataGovernanceManager(self.temp_path)
+        manager.lineage_tracker.track_transformation("orders", "revenue", "sum")
+        manager.lineage_tracker.close()
+
+        reloaded = DataGovernanceManager(self.temp_path)
+
+        assert (self.temp_path / ".aiculture" / "data_governance" / "lineage.db").exists()
+        assert reloaded.lineage_tracker.count()["edges"] == 1
+        reloaded.lineage_tracker.close()
@@ -0,0 +1,151 @@
+"""
+测试模块: aiculture.markup_scanner 及基于它的可访问性、响应式规则
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from aiculture.accessibility_culture import (
+    AccessibilityChecker,
+    AccessibilityCultureManager,
+    ResponsiveDesignChecker,
+)
+from aiculture.markup_scanner import MarkupScanner
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+  <meta content="width=device-width" name="viewport">
+  <style>
+    .box { width: 12px; outline: none; }
+  </style>
+  <script>if (a <img > b) { document.write("<input>"); }</script>
+</head>
+<body>
+  <a href="#main">跳到主内容</a>
+  <nav><a href="/">首页</a></nav>
+  <!-- <img src="commented.png"> -->
+  <h2 id="main">概览</h2>
+  <img src="empty.png" alt="">
+  <IMG SRC="upper.png">
+  <input type="text" id="email">
+  <label for="email">邮箱</label>
+  <label>姓名 <input type="text"></label>
+  <input type="hidden" name="token">
+  <input aria-label="搜索" type="search">
+  <input type="text" id="orphan">
+  <div style="color: #777; width: 600px">正文</div>
+</body>
+</html>
+"""
+
+
+class TestMarkupScanner:
+    """测试单遍扫描与结构化规则"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_tokenizer_attributes_and_raw_text(self) -> None:
+        """测试属性解析、JSX表达式、注释和原始文本元素"""
+        seen = []
+        styles = []
+        scanner = MarkupScanner(jsx=True)
+        scanner.on_start_tag(("img", "input"), lambda tag, scan: seen.append((tag.name, tag.attrs)))
+        scanner.on_style(lambda text, offset, scan: styles.append((text, offset)))
+        content = (
+            '<img src={a > b ? x : y} alt={t("logo")} />\n'
+            '<Img src="component.png" />\n'
+            '<!-- <img src="hidden"> -->\n'
+            "<input {...props} disabled value='a>b' />\n"
+            '<p style="width: 1px">x</p>'
+        )
+
+        scanner.scan(content)
+
+        assert seen == [
+            ("img", {"src": "{a > b ? x : y}", "alt": '{t("logo")}'}),
+            ("input", {"disabled": None, "value": "a>b"}),
+        ]
+        [(text, offset)] = styles
+        assert text == "width: 1px" and content[offset:offset + len(text)] == text
+
+    def test_accessibility_rules_are_structural(self) -> None:
+        """测试可访问性规则按属性和文档结构判断"""
+        html_file = self.temp_path / "page.html"
+        html_file.write_text(PAGE, encoding="utf-8")
+
+        issues = AccessibilityChecker().check_html_file(html_file)
+
+        assert [(i.rule_id, i.line_number) for i in issues] == [
+            ("missing_alt_text", 16),
+            ("missing_form_labels", 22),
+            ("missing_heading_structure", 14),
+            ("low_contrast", 23),
+            ("missing_focus_indicators", 6),
+        ]
+        assert issues[0].element == '<IMG SRC="upper.png">'
+
+    def test_skip_link_reported_once_when_absent(self) -> None:
+        """测试导航前没有跳转链接时只报告一次"""
+        html_file = self.temp_path / "nav.html"
+        html_file.write_text("<nav></nav>\n<nav></nav>\n<a href='#top'>", encoding="utf-8")
+
+        issues = AccessibilityChecker().check_html_file(html_file)
+
+        assert [(i.rule_id, i.line_number) for i in issues] == [("missing_skip_links", 1)]
+
+    def test_jsx_spread_and_components(self) -> None:
+        """测试JSX属性展开和组件不报告，htmlFor关联输入"""
+        jsx_file = self.temp_path / "Form.jsx"
+        jsx_file.write_text(
+            "<Img src={logo} />\n<img {...imageProps} />\n"
+            '<label htmlFor="q">查询</label><input id="q" />\n<input />\n',
+            encoding="utf-8",
+        )
+
+        issues = AccessibilityChecker().check_jsx_file(jsx_file)
+
+        assert [(i.rule_id, i.line_number) for i in issues] == [("missing_jsx_labels", 4)]
+
+    def test_responsive_rules(self) -> None:
+        """测试viewport属性顺序无关，样式文本中的固定宽度被报告"""
+        html_file = self.temp_path / "page.html"
+        html_file.write_text(PAGE, encoding="utf-8")
+        bare_file = self.temp_path / "bare.html"
+        bare_file.write_text("<p>无viewport</p>", encoding="utf-8")
+        checker = ResponsiveDesignChecker()
+
+        issues = checker.check_html_file(html_file)
+
+        assert [(i.issue_type, i.line_number) for i in issues] == [
+            ("fixed_width", 6),
+            ("fixed_width", 23),
+            ("small_touch_target", 6),
+        ]
+        assert [i.issue_type for i in checker.check_html_file(bare_file)] == ["missing_viewport"]
+
+    def test_manager_scans_each_html_file_once(self) -> None:
+        """测试可访问性和响应式扫描共用同一次HTML扫描"""
+        for name in ("a.html", "b.html"):
+            (self.temp_path / name).write_text(PAGE, encoding="utf-8")
+        manager = AccessibilityCultureManager(self.temp_path)
+        scans = []
+        markup_scanner = manager.frontend_scanner.markup_scanner
+        original_scan = markup_scanner.scan
+        markup_scanner.scan = lambda *args: scans.append(args[1]) or original_scan(*args)
+
+        accessibility = manager.scan_project_accessibility()
+        responsive = manager.scan_project_responsive()
+        manager.close()
+
+        assert len(scans) == 2
+        assert accessibility["total_issues"] == 10
+        assert responsive["total_issues"] == 6
@@ -0,0 +1,74 @@
+"""
+测试模块: aiculture.data_governance_culture.DataGovernanceManager 项目隐私扫描
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from aiculture.data_governance_culture import DataGovernanceManager, PrivacyScanAggregate
+
+
+class TestProjectPrivacyScan:
+    """测试并行扫描与有界汇总"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        for i in range(10):
+            (self.temp_path / f"module_{i:02d}.py").write_text(
+                f'OWNER = "owner{i}@corp.io"\nBACKUP = "ops{i}@corp.io"\nhost = "10.0.0.{i}"\n',
+                encoding="utf-8",
+            )
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        shutil.rmtree(self.temp_dir)
+
+    def _full_findings(self, manager: DataGovernanceManager) -> list:
+        """按文件顺序逐个扫描得到的全部结果"""
+        findings = []
+        for path in manager.file_index.python_files():
+            findings.extend(manager.privacy_scanner.scan_code_for_pii(path))
+        return findings
+
+    def test_counts_and_detail_cap(self) -> None:
+        """测试计数完整而完整结果只保留前N条"""
+        manager = DataGovernanceManager(self.temp_path, max_detailed_findings=5)
+        findings = self._full_findings(manager)
+        high = [f for f in findings if f["severity"] == "high"]
+
+        result = manager.scan_project_for_privacy_issues()
+
+        assert result["total_findings"] == len(findings)
+        assert result["severity_counts"]["high"] == len(high) == 30
+        assert result["by_severity"]["high"] == high[:5]
+        assert result["truncated"]
+        assert result["summary"]["high_risk_files"] == 10
+        assert result["summary"]["pii_types_found"] == 2
+
+    def test_parallel_matches_serial(self) -> None:
+        """测试进程池扫描结果与串行扫描相同"""
+        manager = DataGovernanceManager(self.temp_path, max_detailed_findings=7)
+
+        serial = manager.scan_project_for_privacy_issues()
+        parallel = manager.scan_project_for_privacy_issues(jobs=2)
+
+        assert parallel == serial
+
+    def test_aggregate_merge_keeps_order(self) -> None:
+        """测试合并批次时按顺序截取"""
+        first, second = PrivacyScanAggregate(3), PrivacyScanAggregate(3)
+        for i in range(2):
+            first.add({"severity": "medium", "file": "a.py", "line": i})
+        for i in range(2):
+            second.add({"severity": "medium", "file": "b.py", "line": i})
+
+        first.merge(second)
+
+        assert [(f["file"], f["line"]) for f in first.details["medium"]] == [
+            ("a.py", 0), ("a.py", 1), ("b.py", 0)
+        ]
+        assert first.counts["medium"] == 4
+        assert first.truncated
@@ -0,0 +1,213 @@
+"""
+测试模块: aiculture.data_governance_culture.DataPrivacyScanner
+"""
+
+import io
+import random
+import re
+import shutil
+import tempfile
+from pathlib import Path
+
+from aiculture.data_governance_culture import (
+    STREAM_OVERLAP_CHARS,
+    DataPrivacyScanner,
+    LargeFilePolicy,
+)
+
+SAMPLE = """\
+contact = "alice.smith@corp.io"  # Email
+backup = "demo@placeholder.local"
+phone = "+1 (555) 123-4567"; ssn = "123-45-6789"
+card = "4111 1111 1111 1111"
+host = "10.1.2.3"; passport = "AB1234567"
+split = "555
+123 4567"
+ethnicity_city = True; API_KEY = "x"
+token_state = {"date_of_birth": 1, "Salary": 2}
+说明 = "用户银行 account"
+"""
+
+
+# 拼接随机文本用的片段：PII、敏感字段名以及会跨越窗口边界的普通内容
+TOKENS = [
+    "alice@corp.io", "555-123-4567", "4111 1111 1111 1111", "10.0.0.1", "AB1234567",
+    "Password", "ethnicity", "city", "x", " ", "  ", "123", "key", "ſex", "9999999", "é",
+]
+
+
+def _random_text(seed: int, count: int, newline_rate: float) -> str:
+    """生成含超长行的随机文本"""
+    rng = random.Random(seed)
+    return "".join(
+        "\n" if rng.random() < newline_rate else rng.choice(TOKENS) for _ in range(count)
+    )
+
+
+def _reference_scan(scanner: DataPrivacyScanner, content: str, file_name: str) -> list:
+    """逐行逐模式扫描（优化前的实现），用于对照"""
+    findings = []
+    for line_num, line in enumerate(content.split("\n"), 1):
+        for pii_type, pattern in scanner.pii_patterns.items():
+            for match in re.finditer(pattern, line):
+                if scanner._is_placeholder_data(pii_type, match.group()):
+                    continue
+                findings.append(
+                    {
+                        "type": "pii_in_code",
+                        "pii_type": pii_type,
+                        "file": file_name,
+                        "line": line_num,
+                        "column": match.start(),
+                        "matched_text": match.group(),
+                        "severity": "high",
+                        "recommendation": f"避免在代码中硬编码{pii_type}信息",
+                    }
+                )
+        for field_type, pattern in scanner.sensitive_field_patterns.items():
+            for match in re.finditer(pattern, line):
+                findings.append(
+                    {
+                        "type": "sensitive_field",
+                        "field_type": field_type,
+                        "file": file_name,
+                        "line": line_num,
+                        "column": match.start(),
+                        "matched_text": match.group(),
+                        "severity": "medium",
+                        "recommendation": f"确保{field_type}字段有适当的保护措施",
+                    }
+                )
+    return findings
+
+
+class TestDataPrivacyScanner:
+    """测试整缓冲区扫描与逐行扫描结果一致"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        self.scanner = DataPrivacyScanner()
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_matches_line_by_line_scan(self) -> None:
+        """测试结果及顺序与逐行扫描相同（含重叠匹配和跨行的空白）"""
+        findings = self.scanner.scan_text_for_pii(SAMPLE, "sample.py")
+
+        assert findings == _reference_scan(self.scanner, SAMPLE, "sample.py")
+        found = {(f.get("pii_type") or f["field_type"], f["matched_text"]) for f in findings}
+        assert ("email", "alice.smith@corp.io") in found
+        assert ("passport", "AB1234567") in found
+        assert ("driver_license", "AB1234567") in found
+        assert ("address", "city") in found
+        assert ("race", "ethnicity") in found
+        assert not any(f["matched_text"].startswith("demo@") for f in findings)
+
+    def test_case_fold_unsafe_text(self) -> None:
+        """测试含特殊大小写字符的文本回退到忽略大小写匹配"""
+        content = "ſex = 1\nKEY = 2\nİD_token = 3\n"
+
+        findings = self.scanner.scan_text_for_pii(content, "a.py")
+
+        assert findings == _reference_scan(self.scanner, content, "a.py")
+        assert [f["matched_text"] for f in findings] == ["ſex", "KEY", "token"]
+
+    def test_scan_file_and_errors(self) -> None:
+        """测试扫描文件及读取失败"""
+        path = self.temp_path / "data.py"
+        path.write_text(SAMPLE, encoding="utf-8")
+
+        assert self.scanner.scan_code_for_pii(path) == _reference_scan(
+            self.scanner, SAMPLE, str(path)
+        )
+        [error] = self.scanner.scan_code_for_pii(self.temp_path / "missing.py")
+        assert error["type"] == "scan_error"
+
+    def test_recompile_after_pattern_change(self) -> None:
+        """测试修改模式后重新编译"""
+        self.scanner.sensitive_field_patterns["custom"] = r"(?i)(mother_maiden)"
+        self.scanner.compile_patterns()
+
+        findings = self.scanner.scan_text_for_pii("Mother_Maiden = 1\n", "a.py")
+
+        assert [f["field_type"] for f in findings] == ["custom"]
+
+    def test_placeholder_detection(self) -> None:
+        """测试占位符判断"""
+        assert self.scanner._is_placeholder_data("email", "demo@corp.io")
+        assert self.scanner._is_placeholder_data("email", "a@example.com")
+        assert self.scanner._is_placeholder_data("phone", "555-xxx-1234")
+        assert not self.scanner._is_placeholder_data("email", "alice@corp.io")
+
+    def test_database_schema_scan(self) -> None:
+        """测试数据库模式扫描使用预编译模式"""
+        schema = {"users": {"columns": [{"name": "Password_Hash", "type": "text"},
+                                        {"name": "id", "type": "int"}]}}
+
+        [finding] = self.scanner.scan_database_schema(schema)
+
+        assert (finding["table"], finding["column"], finding["field_type"]) == (
+            "users", "Password_Hash", "password"
+        )
+
+
+class TestStreamingScan:
+    """测试流式扫描与整体读入的结果一致"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        self.scanner = DataPrivacyScanner(max_file_size=1024, chunk_size=1)
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_stream_matches_full_scan(self) -> None:
+        """测试普通行批次和跨多个窗口的超长行"""
+        assert self.scanner.chunk_size == 4 * STREAM_OVERLAP_CHARS
+        for seed, newline_rate in ((1, 0.05), (2, 0.0005), (3, 0.0)):
+            text = _random_text(seed, 12000, newline_rate)
+            assert max(len(line) for line in text.split("\n")) > self.scanner.chunk_size or seed == 1
+
+            full = self.scanner.scan_text_for_pii(text, "f.sql")
+            streamed = self.scanner.scan_stream_for_pii(io.StringIO(text), "f.sql")
+
+            assert streamed == full
+
+    def test_large_file_policies(self) -> None:
+        """测试大文件的 stream、sample、skip 策略"""
+        path = self.temp_path / "dump.sql"
+        lines = [f"INSERT INTO users VALUES ('user{i}@corp.io');" for i in range(200)]
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        full = DataPrivacyScanner().scan_code_for_pii(path)
+
+        assert self.scanner.scan_code_for_pii(path) == full
+
+        sampler = DataPrivacyScanner(max_file_size=1024, large_file_policy=LargeFilePolicy.SAMPLE)
+        sampled = sampler.scan_code_for_pii(path)
+        assert sampled[-1]["type"] == "scan_sampled"
+        assert sampled[:-1] == full[: len(sampled) - 1]
+        assert 0 < len(sampled) - 1 < len(full)
+
+        skipper = DataPrivacyScanner(max_file_size=1024, large_file_policy="skip")
+        [note] = skipper.scan_code_for_pii(path)
+        assert note["type"] == "scan_skipped"
+        assert note["size"] == path.stat().st_size
+
+    def test_stream_yields_before_reading_everything(self) -> None:
+        """测试流式扫描每批产生结果，不等读完整个文件"""
+        text = "".join(f"email = 'user{i}@corp.io'\n" for i in range(2000))
+        stream = io.StringIO(text)
+
+        findings = self.scanner.iter_stream_pii(stream, "dump.sql")
+        first = next(findings)
+
+        assert first["line"] == 1
+        assert stream.tell() <= 2 * self.scanner.chunk_size < len(text)
+        assert [first, *findings] == self.scanner.scan_text_for_pii(text, "dump.sql")
@@ -0,0 +1,40 @@
+"""
+测试模块: aiculture.process_pool
+"""
+
+from aiculture.process_pool import MAX_FILES_PER_BATCH, batch_size, map_batches
+
+
+def _double(items: list) -> list:
+    """进程池任务：须为模块级函数以便序列化"""
+    return [item * 2 for item in items]
+
+
+def test_batch_size() -> None:
+    """测试每个进程约分到4批，且不超过上限"""
+    assert batch_size(0, 4) == 1
+    assert batch_size(10, 1) == 3
+    assert batch_size(12, 2) == 2
+    assert batch_size(100000, 2) == MAX_FILES_PER_BATCH
+
+
+def test_map_batches_keeps_order() -> None:
+    """测试并行执行时批次结果按提交顺序返回"""
+    items = list(range(50))
+
+    batches = map_batches(_double, items, 3, "测试")
+
+    assert len(batches) > 1
+    assert [value for batch in batches for value in batch] == [item * 2 for item in items]
+
+
+def test_map_batches_serial() -> None:
+    """测试并行度为1时在当前进程内执行一次"""
+    calls = []
+
+    def task(items: list) -> int:
+        calls.append(list(items))
+        return len(items)
+
+    assert map_batches(task, range(5), 1, "测试") == [5]
+    assert calls == [[0, 1, 2, 3, 4]]
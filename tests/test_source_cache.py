@@ -0,0 +1,107 @@
+"""
+测试aiculture.source_cache模块
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+from aiculture.source_cache import ParsedModuleCache
+
+
+class TestParsedModuleCache:
+    """测试ParsedModuleCache类"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, name: str, content: str) -> Path:
+        path = self.temp_path / name
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    def test_second_get_is_cache_hit(self) -> None:
+        """测试同一文件只读取、解析一次"""
+        path = self._write("a.py", "def f():\n    return 1\n")
+        cache = ParsedModuleCache()
+
+        first = cache.get(path)
+        second = cache.get(path)
+
+        assert first is second
+        assert first.tree is second.tree
+        assert first.lines[0] == "def f():"
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_invalidated_when_file_changes(self) -> None:
+        """测试文件 mtime/size 变化后重新读取"""
+        path = self._write("a.py", "x = 1\n")
+        cache = ParsedModuleCache()
+        first = cache.get(path)
+
+        path.write_text("x = 1\ny = 2\n", encoding="utf-8")
+        stat_result = path.stat()
+        os.utime(path, ns=(stat_result.st_atime_ns, first.mtime_ns + 1_000_000))
+
+        second = cache.get(path)
+        assert second is not first
+        assert "y = 2" in second.text
+
+    def test_explicit_invalidate(self) -> None:
+        """测试手动失效"""
+        path = self._write("a.py", "x = 1\n")
+        cache = ParsedModuleCache()
+        first = cache.get(path)
+
+        cache.invalidate(path)
+
+        assert cache.get(path) is not first
+        assert cache.get_stats()["misses"] == 2
+
+    def test_lru_eviction_under_memory_cap(self) -> None:
+        """测试超出内存上限时淘汰最久未使用的模块"""
+        paths = [self._write(f"m{i}.py", "x = 1\n" * 10) for i in range(3)]
+        single = ParsedModuleCache().get(paths[0]).estimated_memory
+        cache = ParsedModuleCache(max_memory_bytes=single * 2)
+
+        cache.get(paths[0])
+        cache.get(paths[1])
+        cache.get(paths[0])  # 使 m0 成为最近使用
+        cache.get(paths[2])
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 1
+        assert stats["estimated_memory_bytes"] <= single * 2
+
+        hits_before = cache.get_stats()["hits"]
+        cache.get(paths[0])
+        assert cache.get_stats()["hits"] == hits_before + 1
+
+    def test_syntax_error_yields_no_tree(self) -> None:
+        """测试语法错误的文件仍可读取文本，但AST为None"""
+        path = self._write("broken.py", "def f(:\n")
+        module = ParsedModuleCache().get(path)
+
+        assert module is not None
+        assert module.tree is None
+        assert isinstance(module.syntax_error, SyntaxError)
+        assert module.lines == ["def f(:", ""]
+
+    def test_unreadable_files_return_none(self) -> None:
+        """测试非UTF-8或不存在的文件返回None"""
+        binary = self.temp_path / "binary.py"
+        binary.write_bytes(b"\xff\xfe\x00invalid")
+        cache = ParsedModuleCache()
+
+        assert cache.get(binary) is None
+        assert cache.get(self.temp_path / "missing.py") is None
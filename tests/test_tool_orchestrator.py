@@ -0,0 +1,210 @@
+"""
+测试模块: aiculture.tool_orchestrator
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import click
+import pytest
+
+from aiculture import tool_orchestrator
+from aiculture.cli_commands import run_orchestrator
+from aiculture.core import QualityTools
+from aiculture.culture_enforcer import CultureEnforcer
+from aiculture.tool_orchestrator import (
+    ToolOrchestrator,
+    ToolSpec,
+    default_tool_specs,
+)
+
+
+def _script_spec(name: str, script: str, timeout: float = 30.0, **parsers) -> ToolSpec:
+    """以Python脚本模拟外部工具"""
+    return ToolSpec(name, [sys.executable, "-c", script], timeout, **parsers)
+
+
+class TestToolOrchestrator:
+    """测试外部工具编排器"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_tools_run_concurrently(self) -> None:
+        """测试总耗时接近最慢的工具而不是耗时之和"""
+        specs = {
+            name: _script_spec(name, "import time; time.sleep(0.5)")
+            for name in ("a", "b", "c")
+        }
+        orchestrator = ToolOrchestrator(self.temp_path, specs=specs)
+
+        start = time.perf_counter()
+        results = orchestrator.run(["a", "b", "c"])
+        elapsed = time.perf_counter() - start
+
+        assert all(result.success for result in results.values())
+        assert elapsed < 1.2
+
+    def test_timeout_and_missing_tool(self) -> None:
+        """测试超时终止进程，未安装的工具标记为不可用"""
+        specs = {
+            "slow": _script_spec("slow", "import time; time.sleep(10)", timeout=0.2),
+            "missing": ToolSpec("missing", ["aiculture-no-such-tool"], 5.0),
+        }
+        results = ToolOrchestrator(self.temp_path, specs=specs).run(["slow", "missing"])
+
+        assert results["slow"].timed_out
+        assert not results["slow"].success
+        assert not results["missing"].available
+        assert not results["missing"].success
+
+    def test_output_is_parsed_into_violations(self) -> None:
+        """测试逐行解析输出"""
+        specs = default_tool_specs()
+        script = (
+            "import sys\n"
+            "print('./a.py:3:1: E302 expected 2 blank lines')\n"
+            "print('./b.py:7:80: W505 doc line too long')\n"
+            "print('noise')\n"
+            "sys.exit(1)\n"
+        )
+        specs["flake8"].command = [sys.executable, "-c", script]
+        result = ToolOrchestrator(self.temp_path, specs=specs).run(["flake8"])["flake8"]
+
+        assert result.returncode == 1
+        assert [(v.file_path, v.line_number, v.code, v.severity) for v in result.violations] == [
+            ("./a.py", 3, "E302", "error"),
+            ("./b.py", 7, "W505", "warning"),
+        ]
+
+    def test_duplicate_requests_run_once(self) -> None:
+        """测试同一编排器内相同命令只执行一次，包括执行中的请求"""
+        counter = self.temp_path / "count.txt"
+        script = (
+            "import time\n"
+            f"open({str(counter)!r}, 'a').write('x')\n"
+            "time.sleep(0.3)\n"
+        )
+        orchestrator = ToolOrchestrator(self.temp_path, specs={"t": _script_spec("t", script)})
+
+        pending = orchestrator.submit(["t"])
+        first = orchestrator.run(["t"])["t"]
+        second = orchestrator.run(["t", "t"])["t"]
+
+        assert pending.result(timeout=10)["t"] is first
+        assert second is first
+        assert counter.read_text() == "x"
+
+        orchestrator.reset()
+        orchestrator.run(["t"])
+        assert counter.read_text() == "xx"
+
+    def test_overlong_output_line(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """测试超过单行上限的输出被跳过，同批次的其他工具不受影响"""
+        monkeypatch.setattr(tool_orchestrator, "STREAM_LIMIT_BYTES", 1024)
+        specs = default_tool_specs()
+        script = "print('x' * 5000)\nprint('./a.py:3:1: E302 expected 2 blank lines')\n"
+        specs["flake8"].command = [sys.executable, "-c", script]
+        specs["black"].command = [sys.executable, "-c", "print('would reformat b.py')"]
+
+        results = ToolOrchestrator(self.temp_path, specs=specs).run(["flake8", "black"])
+
+        assert results["flake8"].success
+        assert [v.code for v in results["flake8"].violations] == ["E302"]
+        assert [v.file_path for v in results["black"].violations] == ["b.py"]
+
+    def test_unknown_tool(self) -> None:
+        """测试未知工具名"""
+        with pytest.raises(KeyError):
+            ToolOrchestrator(self.temp_path, specs={}).run(["nope"])
+
+
+class TestParsers:
+    """测试各工具的输出解析"""
+
+    def test_mypy_line(self) -> None:
+        """测试mypy输出解析"""
+        parser = default_tool_specs()["mypy"].line_parser
+        violation = parser('pkg/a.py:12:5: error: Incompatible types  [assignment]')
+
+        assert (violation.file_path, violation.line_number, violation.column) == ("pkg/a.py", 12, 5)
+        assert violation.code == "assignment"
+        assert violation.message == "Incompatible types"
+        assert parser("Success: no issues found in 3 source files") is None
+
+    def test_black_and_pytest_lines(self) -> None:
+        """测试black和pytest输出解析"""
+        specs = default_tool_specs()
+
+        black = specs["black"].line_parser("would reformat src/app.py")
+        assert black.file_path == "src/app.py"
+
+        failure = specs["pytest"].line_parser("FAILED tests/test_a.py::test_x - AssertionError")
+        assert failure.file_path == "tests/test_a.py"
+        assert failure.code == "failed"
+
+    def test_bandit_output(self) -> None:
+        """测试bandit JSON输出解析"""
+        parser = default_tool_specs()["bandit"].output_parser
+        output = (
+            '{"results": [{"filename": "a.py", "line_number": 2, "col_offset": 4,'
+            ' "issue_text": "exec used", "issue_severity": "HIGH", "test_id": "B102"}]}'
+        )
+
+        [violation] = parser(output)
+        assert (violation.severity, violation.code, violation.column) == ("high", "B102", 4)
+        assert parser("not json") == []
+
+    def test_timeouts_override(self) -> None:
+        """测试覆盖默认超时时间"""
+        assert default_tool_specs({"mypy": 5})["mypy"].timeout == 5
+
+
+def test_quality_tools_share_orchestrator() -> None:
+    """测试QualityTools通过编排器并发执行检查"""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        specs = {
+            "black": _script_spec("black", "pass"),
+            "flake8": _script_spec("flake8", "raise SystemExit(1)"),
+            "mypy": _script_spec("mypy", "pass"),
+        }
+        orchestrator = ToolOrchestrator(Path(temp_dir), specs=specs)
+        tools = QualityTools(temp_dir, orchestrator=orchestrator)
+
+        assert tools.run_quality_check() == {"black": True, "flake8": False, "mypy": True}
+        assert tools.run_tools(["flake8"])["flake8"] is orchestrator.run(["flake8"])["flake8"]
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_enforcer_and_cli_share_orchestrator() -> None:
+    """测试CultureEnforcer的QualityTools以及同一次CLI运行中的命令共用编排器"""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        temp_path = Path(temp_dir)
+        counter = temp_path / "count.txt"
+        script = f"open({str(counter)!r}, 'a').write('x')"
+        specs = {"flake8": _script_spec("flake8", script)}
+        orchestrator = ToolOrchestrator(temp_path, specs=specs)
+        enforcer = CultureEnforcer(temp_path, tools=orchestrator)
+
+        enforcer.tools.run(["flake8"])
+        enforcer.quality_tools.run_tools(["flake8"])
+        assert counter.read_text() == "x"
+
+        with click.Context(click.Command("check")):
+            assert run_orchestrator(temp_path) is run_orchestrator(temp_path / ".")
+        with click.Context(click.Command("check")):
+            assert run_orchestrator(temp_path) is not orchestrator
+    finally:
+        shutil.rmtree(temp_dir)
@@ -0,0 +1,158 @@
+"""
+测试模块: aiculture.accessibility_culture 翻译完整性的增量计算
+"""
+
+import json
+import os
+import pickle
+import random
+import shutil
+import tempfile
+from pathlib import Path
+
+from aiculture.accessibility_culture import InternationalizationChecker
+
+
+def _flatten(obj: dict, prefix: str = "") -> set:
+    """递归展开（优化前的实现），用于对照"""
+    keys = set()
+    for key, value in obj.items():
+        full_key = f"{prefix}.{key}" if prefix else key
+        keys.add(full_key)
+        if isinstance(value, dict):
+            keys.update(_flatten(value, full_key))
+    return keys
+
+
+def _translations(rng: random.Random, drop: float) -> dict:
+    """生成嵌套翻译，按比例随机丢弃键"""
+    data = {}
+    for section in range(8):
+        group = {}
+        for item in range(12):
+            if rng.random() >= drop:
+                group[f"item{item}"] = {"label": "x", "hint": "y"} if item % 3 == 0 else "z"
+        data[f"section{section}"] = group
+    return data
+
+
+class TestTranslationCompleteness:
+    """测试键集合缓存、按文件差异重新计算和迭代展开"""
+
+    def setup_method(self) -> None:
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.locale_dir = Path(self.temp_dir) / "locales"
+        self.locale_dir.mkdir()
+        rng = random.Random(9)
+        for i, locale in enumerate(["en", "zh", "ja", "de", "fr"]):
+            self._write(locale, _translations(rng, 0 if i == 0 else 0.2))
+
+        self.checker = InternationalizationChecker()
+        self.flattened = []
+        collect = self.checker._collect_translation_keys
+
+        def recording_collect(obj: dict, prefix: str = "") -> set:
+            self.flattened.append(prefix)
+            return collect(obj, prefix)
+
+        self.checker._collect_translation_keys = recording_collect
+
+    def teardown_method(self) -> None:
+        """清理测试环境"""
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, locale: str, data: dict) -> Path:
+        path = self.locale_dir / f"{locale}.json"
+        path.write_text(json.dumps(data), encoding="utf-8")
+        return path
+
+    def _expected(self) -> dict:
+        """逐个文件重新展开（优化前的算法）"""
+        base_keys = set()
+        locale_keys = {}
+        for json_file in self.locale_dir.glob("*.json"):
+            keys = _flatten(json.loads(json_file.read_text(encoding="utf-8")))
+            locale_keys[json_file.stem] = keys
+            if not base_keys:
+                base_keys = keys
+        missing = {
+            locale: sorted(base_keys - keys)
+            for locale, keys in locale_keys.items()
+            if base_keys - keys
+        }
+        return {
+            "total_locales": len(locale_keys),
+            "total_keys": len(base_keys),
+            "missing_translations": missing,
+            "completeness_rate": {
+                locale: (len(base_keys) - len(missing.get(locale, []))) / len(base_keys) * 100
+                for locale in locale_keys
+            },
+        }
+
+    def test_matches_full_recomputation(self) -> None:
+        """测试结果与全部重新展开计算相同"""
+        result = self.checker.check_translation_completeness(self.locale_dir)
+
+        assert result == self._expected()
+        assert result["missing_translations"]
+        assert len(self.flattened) == 5
+
+    def test_unchanged_files_reuse_key_sets(self) -> None:
+        """测试未变化的文件不再解析，只更新时间戳的文件按内容哈希沿用键集合"""
+        first = self.checker.check_translation_completeness(self.locale_dir)
+        self.flattened.clear()
+
+        assert self.checker.check_translation_completeness(self.locale_dir) == first
+        zh = self.locale_dir / "zh.json"
+        os.utime(zh, ns=(1, 1))
+        assert self.checker.check_translation_completeness(self.locale_dir) == first
+        assert self.flattened == []
+
+    def test_changed_files_are_recomputed(self) -> None:
+        """测试修改翻译文件或基准文件后结果随之更新"""
+        self.checker.check_translation_completeness(self.locale_dir)
+        self.flattened.clear()
+
+        base_file = next(self.locale_dir.glob("*.json"))
+        other_file = [path for path in self.locale_dir.glob("*.json") if path != base_file][0]
+        other = json.loads(other_file.read_text(encoding="utf-8"))
+        other["section0"]["item1"] = "filled"
+        other_file.write_text(json.dumps(other), encoding="utf-8")
+        os.utime(other_file, ns=(2, 2))
+        assert self.checker.check_translation_completeness(self.locale_dir) == self._expected()
+        assert len(self.flattened) == 1
+
+        base = json.loads(base_file.read_text(encoding="utf-8"))
+        base["extra"] = {"new_key": "v"}
+        base_file.write_text(json.dumps(base), encoding="utf-8")
+        os.utime(base_file, ns=(3, 3))
+        result = self.checker.check_translation_completeness(self.locale_dir)
+        assert result == self._expected()
+        missing_translations = result["missing_translations"].values()
+        assert all("extra.new_key" in missing for missing in missing_translations)
+
+    def test_invalid_file_is_skipped(self) -> None:
+        """测试无法解析的文件被跳过"""
+        (self.locale_dir / "broken.json").write_text("{", encoding="utf-8")
+
+        result = self.checker.check_translation_completeness(self.locale_dir)
+
+        assert result["total_locales"] == 5
+        assert "broken" not in result["completeness_rate"]
+
+    def test_deep_nesting_and_pickling(self) -> None:
+        """测试超过递归深度的嵌套可以展开，检查器序列化时不携带缓存"""
+        checker = InternationalizationChecker()
+        deep = leaf = {}
+        for _ in range(5000):
+            leaf["n"] = {}
+            leaf = leaf["n"]
+
+        assert len(checker._collect_translation_keys(deep)) == 5000
+
+        checker.check_translation_completeness(self.locale_dir)
+        restored = pickle.loads(pickle.dumps(checker))
+        assert checker._locale_keys and restored._locale_keys == {}
+        assert restored.check_translation_completeness(self.locale_dir) == self._expected()